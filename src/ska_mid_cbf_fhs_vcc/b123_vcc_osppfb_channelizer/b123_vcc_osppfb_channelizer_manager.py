@@ -6,6 +6,13 @@ from dataclasses_json import DataClassJsonMixin
 from ska_mid_cbf_fhs_common import BaseIPBlockManager
 
 from ska_mid_cbf_fhs_vcc.b123_vcc_osppfb_channelizer.b123_vcc_osppfb_channelizer_simulator import B123VccOsppfbChannelizerSimulator
+from ska_mid_cbf_fhs_vcc.helpers.ip_block_properties import parse_bool_property
+
+GAIN_WRITE_RTOL = 1e-6
+"""Relative tolerance within which a gain is considered unchanged, and is not rewritten (gains are float32 registers)."""
+
+GAIN_DELTA_WRITE_MAX_FRACTION = 0.25
+"""The largest fraction of the gain vector written entry by entry; larger changes are written as a whole vector."""
 
 
 @dataclass
@@ -16,6 +23,12 @@ class B123VccOsppfbChannelizerConfig(DataClassJsonMixin):
     gain: np.float32
 
 
+@dataclass
+class B123VccOsppfbChannelizerGainsConfig(DataClassJsonMixin):
+    sample_rate: np.uint64
+    gains: list[np.float32]  # [ch0_polX, ..., chN_polX, ch0_polY, ..., chN_polY]
+
+
 ##
 # status class that will be populated by the APIs and returned to provide the status of the Frequency Slice Selection
 ##
@@ -58,7 +71,11 @@ class B123VccOsppfbChannelizerConfigureArgin(DataClassJsonMixin):
 
 
 class B123VccOsppfbChannelizerManager(BaseIPBlockManager[B123VccOsppfbChannelizerConfig, B123VccOsppfbChannelizerStatus]):
-    """B123 VCC IP block manager."""
+    """B123 VCC IP block manager.
+
+    Gains are written one channel and polarisation at a time, unless the ``bulk_gain_writes`` property of the IP block
+    declares that the driver accepts the complete gain vector in a single write.
+    """
 
     @property
     def config_dataclass(self) -> type[B123VccOsppfbChannelizerConfig]:
@@ -75,37 +92,152 @@ class B123VccOsppfbChannelizerManager(BaseIPBlockManager[B123VccOsppfbChannelize
         """:obj:`type[B123VccOsppfbChannelizerSimulator]`: The simulator API class for the B123 VCC."""
         return B123VccOsppfbChannelizerSimulator
 
+    def _manager_specific_setup(self, **kwargs):
+        # Only drivers known to program the whole gain vector in one write are sent one, since a driver which ignores
+        # the unknown gain vector would leave the gains unprogrammed without failing
+        self._bulk_gains_supported = parse_bool_property(kwargs.get("bulk_gain_writes"))
+        # Shadow copy of the gains currently programmed in the firmware, None when unknown.
+        # Entries whose write failed are NaN, so that they are always rewritten
+        self._programmed_sample_rate: int | None = None
+        self._programmed_gains: np.ndarray | None = None
+
+    @property
+    def bulk_gains_supported(self) -> bool:
+        """:obj:`bool`: Whether the gain vector is written in a single write, which is disabled if the firmware rejects one."""
+        return self._bulk_gains_supported
+
+    @property
+    def programmed_gains(self) -> np.ndarray | None:
+        """:obj:`np.ndarray | None`: Read-only copy of the gain vector currently programmed in the firmware, or None if unknown."""
+        if self._programmed_gains is None:
+            return None
+        gains = self._programmed_gains.copy()
+        gains.setflags(write=False)
+        return gains
+
     def configure(self, config: B123VccOsppfbChannelizerConfigureArgin) -> int:
         """Configure the B123 VCC."""
-        return self._generate_and_configure(config, super().configure)
+        return self.configure_gains(config.sample_rate, np.asarray(config.gains, dtype=np.float32), config.transaction_id)
 
     def deconfigure(self, config: B123VccOsppfbChannelizerConfigureArgin | None = None) -> int:
         """Deconfigure the B123 VCC."""
         if config is None:
             config = B123VccOsppfbChannelizerConfigureArgin()
-        return self._generate_and_configure(config, super().deconfigure)
+        self._programmed_gains = None
+        gains = np.asarray(config.gains, dtype=np.float32)
+        result = self._configure_gains(config.sample_rate, gains, config.transaction_id, super().deconfigure)
+        if result != 1:
+            self._set_programmed_gains(config.sample_rate, gains)
+        return result
+
+    def recover(self) -> int:
+        """Recover the B123 VCC."""
+        # The firmware state is unknown after a recovery, so the next gains are written in full
+        self._programmed_gains = None
+        return super().recover()
+
+    def configure_gains(self, sample_rate: int, gains: np.ndarray, transaction_id: str | None = None) -> int:
+        """Program the gain vector of the B123 VCC, only writing the entries which differ from the programmed gains.
+
+        A small change is written entry by entry; otherwise, the complete vector is written in a single operation if
+        bulk writes are supported (see :obj:`bulk_gains_supported`), falling back to one write per channel and polarisation
+        if the firmware rejects it, and is written one channel and polarisation at a time otherwise.
+
+        Args:
+            sample_rate (:obj:`int`): The input sample rate.
+            gains (:obj:`np.ndarray`): The float32 gain vector, in the format
+                [ch0_polX, ch1_polX, ..., chN_polX, ch0_polY, ch1_polY, ..., chN_polY].
+            transaction_id (:obj:`str | None`, optional): The transaction ID to include in log messages. Default is None.
+
+        Returns:
+            :obj:`int`: 0 on success, 1 on failure.
+        """
+        gains = np.asarray(gains, dtype=np.float32)
+        changed = self._changed_gain_indexes(sample_rate, gains)
+        if changed is not None and changed.size == 0:
+            self.log_debug("VCC gains unchanged, nothing to write", transaction_id)
+            return 0
+
+        if changed is not None and changed.size <= GAIN_DELTA_WRITE_MAX_FRACTION * gains.size:
+            self.log_info(f"Writing {changed.size} changed VCC gain(s) of {gains.size}", transaction_id)
+            return self._write_gain_entries(sample_rate, gains, changed, transaction_id, super().configure)
+
+        self._programmed_gains = None
+        result = self._configure_gains(sample_rate, gains, transaction_id, super().configure)
+        if result != 1:
+            self._set_programmed_gains(sample_rate, gains)
+        return result
+
+    def _changed_gain_indexes(self, sample_rate: int, gains: np.ndarray) -> np.ndarray | None:
+        """Get the indexes of the gain vector entries which differ from the programmed gains, or None if all must be written."""
+        if self._programmed_gains is None or self._programmed_sample_rate != sample_rate or self._programmed_gains.shape != gains.shape:
+            return None
+        return np.flatnonzero(~np.isclose(gains, self._programmed_gains, rtol=GAIN_WRITE_RTOL, atol=0.0))
+
+    def _set_programmed_gains(self, sample_rate: int, gains: np.ndarray) -> None:
+        self._programmed_sample_rate = sample_rate
+        self._programmed_gains = np.array(gains, dtype=np.float32)
+
+    def _configure_gains(
+        self,
+        sample_rate: int,
+        gains: np.ndarray,
+        transaction_id: str | None,
+        configure_fn: Callable[[B123VccOsppfbChannelizerConfig | B123VccOsppfbChannelizerGainsConfig], int],
+    ) -> int:
+        if self._bulk_gains_supported:
+            try:
+                result = configure_fn(B123VccOsppfbChannelizerGainsConfig(sample_rate=sample_rate, gains=gains.tolist()))
+            except Exception as ex:
+                self.logger.warning(f"Bulk gain write rejected by the B123 VCC: {repr(ex)}")
+                result = 1
+
+            if result != 1:
+                self.log_info(f"VCC gains configured in bulk: sample_rate={sample_rate}, num_gains={gains.size}", transaction_id)
+                return result
+
+            self.logger.warning("Falling back to per-channel gain writes for the B123 VCC.")
+            self._bulk_gains_supported = False
+
+        return self._configure_gains_per_channel(sample_rate, gains, transaction_id, configure_fn)
+
+    def _configure_gains_per_channel(
+        self,
+        sample_rate: int,
+        gains: np.ndarray,
+        transaction_id: str | None,
+        configure_fn: Callable[[B123VccOsppfbChannelizerConfig], int],
+    ) -> int:
+        return self._write_gain_entries(sample_rate, gains, np.arange(gains.size), transaction_id, configure_fn)
 
-    def _generate_and_configure(
+    def _write_gain_entries(
         self,
-        vcc_config_argin: B123VccOsppfbChannelizerConfigureArgin,
+        sample_rate: int,
+        gains: np.ndarray,
+        indexes: np.ndarray,
+        transaction_id: str | None,
         configure_fn: Callable[[B123VccOsppfbChannelizerConfig], int],
     ) -> int:
         # Channels are dual-polarized i.e. 2 gain values per channel[x, y]
-        num_channels = len(vcc_config_argin.gains) // 2
-        transaction_id = vcc_config_argin.transaction_id
-        for polarization in (0, 1):
-            for i in range(num_channels):
-                vcc_config = B123VccOsppfbChannelizerConfig(
-                    sample_rate=vcc_config_argin.sample_rate,
-                    gain=vcc_config_argin.gains[i + polarization * num_channels],
-                    channel=i,
-                    pol=polarization,
-                )
-
-                self.log_info(f"VCC JSON CONFIG channel={i} pol={polarization}: {vcc_config}", transaction_id)
-
-                result = configure_fn(vcc_config)
-                if result == 1:
-                    self.log_error("Configuring VCC failed.", transaction_id)
-                    return result
+        num_channels = gains.size // 2
+        # Only track the written entries if the rest of the programmed gains are known
+        track = self._programmed_gains is not None and self._programmed_gains.shape == gains.shape and self._programmed_sample_rate == sample_rate
+        result = 0
+        for index in indexes.tolist():
+            polarization, i = divmod(index, num_channels)
+            vcc_config = B123VccOsppfbChannelizerConfig(
+                sample_rate=sample_rate,
+                gain=float(gains[index]),
+                channel=i,
+                pol=polarization,
+            )
+
+            self.log_debug(f"VCC JSON CONFIG channel={i} pol={polarization}: {vcc_config}", transaction_id)
+
+            result = configure_fn(vcc_config)
+            if track:
+                self._programmed_gains[index] = gains[index] if result != 1 else np.nan
+            if result == 1:
+                self.log_error("Configuring VCC failed.", transaction_id)
+                return result
         return result
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+__all__ = ["BoundedLRUCache"]
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class BoundedLRUCache(Generic[KeyT, ValueT]):
+    """Thread-safe cache holding at most a fixed number of entries, evicting the least recently used entry first."""
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Args:
+            max_entries (:obj:`int`): The maximum number of entries to hold.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[KeyT, ValueT] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: KeyT) -> bool:
+        return key in self._entries
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """Look up an entry, marking it as the most recently used.
+
+        Args:
+            key (:obj:`KeyT`): The key of the entry.
+
+        Returns:
+            :obj:`ValueT | None`: The cached value, or None if the key is not cached.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: KeyT, value: ValueT) -> None:
+        """Insert or replace an entry, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (:obj:`KeyT`): The key of the entry.
+            value (:obj:`ValueT`): The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def values(self) -> list[ValueT]:
+        """Get all cached values, from least to most recently used."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
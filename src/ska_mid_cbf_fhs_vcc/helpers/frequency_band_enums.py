@@ -26,3 +26,12 @@ def freq_band_dict():
         "5b": FrequencyBandEnum(5),
     }
     return band_map
+
+
+def band_group(frequency_band: FrequencyBandEnum) -> VCCBandGroup:
+    """Get the band group processing a frequency band, e.g. to find its pre-channelizer power meter."""
+    if frequency_band in (FrequencyBandEnum._1, FrequencyBandEnum._2, FrequencyBandEnum._3):
+        return VCCBandGroup.B123
+    if frequency_band in (FrequencyBandEnum._4, FrequencyBandEnum._5A):
+        return VCCBandGroup.B45A
+    return VCCBandGroup.B5B
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ["parse_bool_property"]
+
+TRUE_PROPERTY_VALUES = ("true", "yes", "on", "1")
+"""The case-insensitive string values of a boolean IP block property meaning true."""
+
+FALSE_PROPERTY_VALUES = ("false", "no", "off", "0", "")
+"""The case-insensitive string values of a boolean IP block property meaning false."""
+
+
+def parse_bool_property(value: Any, default: bool = False) -> bool:
+    """Parse a boolean IP block property, which is usually given as a string, e.g. "true" in values.yaml.
+
+    Args:
+        value (:obj:`Any`): The property value, a string or a boolean, or None if the property is not set.
+        default (:obj:`bool`, optional): The value of a property which is not set. Default is False.
+
+    Returns:
+        :obj:`bool`: The property value.
+
+    Raises:
+        :obj:`ValueError`: If the value is not a boolean.
+    """
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    normalized = str(value).strip().lower()
+    if normalized in TRUE_PROPERTY_VALUES:
+        return True
+    if normalized in FALSE_PROPERTY_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean property value {value!r}, expected one of {TRUE_PROPERTY_VALUES + FALSE_PROPERTY_VALUES}")
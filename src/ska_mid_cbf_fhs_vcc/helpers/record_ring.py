@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Sequence
+
+import numpy as np
+
+__all__ = ["RecordRing", "decode_records", "dtype_from_descr", "encode_records", "read_record_ring", "ring_dtype"]
+
+RING_FIELDS = [("sequence", "<u8"), ("timestamp", "<f8")]
+"""The fields prepended to every record of a :obj:`RecordRing`: a 1-based write sequence number (0 for an empty slot),
+and the time the record was written, as a POSIX timestamp."""
+
+
+def ring_dtype(fields: Sequence[tuple]) -> np.dtype:
+    """Build the fixed-width record type of a :obj:`RecordRing`.
+
+    Args:
+        fields (:obj:`Sequence[tuple]`): The numpy structured array fields of each record, e.g. ``[("gains", "<f8", (52,))]``.
+
+    Returns:
+        :obj:`np.dtype`: The record type, with the :obj:`RING_FIELDS` prepended.
+    """
+    return np.dtype([*RING_FIELDS, *fields])
+
+
+class RecordRing:
+    """Thread-safe, fixed-size ring of fixed-width numpy records, evicting the oldest record first.
+
+    Records are written in place into a single preallocated structured array, or into a memory-mapped file
+    if a path is given, so that appending never allocates and the records survive a restart of the process.
+    Since every record carries its write sequence number, a ring file needs no header: it can be read by
+    another process with :obj:`read_record_ring`, and is resumed where it left off when reopened.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[tuple],
+        capacity: int,
+        path: str | None = None,
+        defaults: dict[str, Any] | None = None,
+        resume: bool = True,
+    ) -> None:
+        """
+        Args:
+            fields (:obj:`Sequence[tuple]`): The numpy structured array fields of each record (see :obj:`ring_dtype`).
+            capacity (:obj:`int`): The number of most recent records to keep.
+            path (:obj:`str | None`, optional): The file to keep the records in. An existing file is only resumed if it
+                holds exactly ``capacity`` records of the same type, and is overwritten otherwise. Default is None,
+                keeping the records in memory.
+            defaults (:obj:`dict[str, Any] | None`, optional): The value of the fields, or parts of array fields, not given
+                when appending a record, e.g. NaN. Default is None, zeroing them.
+            resume (:obj:`bool`, optional): Whether an existing file may be resumed, e.g. False if it is known to hold
+                records of other fields of the same size. Default is True.
+        """
+        self.dtype = ring_dtype(fields)
+        self._template = np.zeros((), dtype=self.dtype)
+        for name, value in (defaults or {}).items():
+            self._template[name] = value
+        self.capacity = capacity
+        self.path = path
+        if path is None:
+            self._records = np.zeros(capacity, dtype=self.dtype)
+        else:
+            resume = resume and os.path.exists(path) and os.path.getsize(path) == capacity * self.dtype.itemsize
+            self._records = np.memmap(path, dtype=self.dtype, mode="r+" if resume else "w+", shape=(capacity,))
+        self._lock = threading.Lock()
+
+        newest = int(np.argmax(self._records["sequence"]))
+        self._sequence = int(self._records["sequence"][newest])
+        self._next = (newest + 1) % capacity if self._sequence else 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._records["sequence"]))
+
+    @property
+    def sequence(self) -> int:
+        """:obj:`int`: The sequence number of the most recent record, or 0 if none were written."""
+        return self._sequence
+
+    def append(self, timestamp: float | None = None, **values: Any) -> int:
+        """Write a record over the oldest record.
+
+        Args:
+            timestamp (:obj:`float | None`, optional): The time of the record, as a POSIX timestamp. Default is None, using the current time.
+            **values (:obj:`Any`): The value of each field to set; fields not given are set to their default. Array fields accept
+                shorter values, which are written from the start of the field over its default.
+
+        Returns:
+            :obj:`int`: The sequence number of the record.
+        """
+        with self._lock:
+            self._records[self._next] = self._template
+            for name, value in values.items():
+                field = self._records[name]
+                if field.ndim > 1:
+                    value = np.asarray(value)
+                    field[self._next][tuple(slice(0, n) for n in value.shape)] = value
+                else:
+                    field[self._next] = value
+            self._sequence += 1
+            self._records["timestamp"][self._next] = time.time() if timestamp is None else timestamp
+            # The sequence is written last, so that a reader never sees a partially written record as valid
+            self._records["sequence"][self._next] = self._sequence
+            self._next = (self._next + 1) % self.capacity
+            return self._sequence
+
+    def records(self, since: float | None = None, until: float | None = None, limit: int | None = None) -> np.ndarray:
+        """Get a copy of the records held, from oldest to newest.
+
+        Args:
+            since (:obj:`float | None`, optional): Only return records from this POSIX timestamp on. Default is None.
+            until (:obj:`float | None`, optional): Only return records up to this POSIX timestamp. Default is None.
+            limit (:obj:`int | None`, optional): Only return the most recent ``limit`` matching records. Default is None.
+
+        Returns:
+            :obj:`np.ndarray`: The records, as a structured array of :obj:`dtype`.
+        """
+        with self._lock:
+            return _select(self._records, since, until, limit)
+
+    def flush(self) -> None:
+        """Write the records to the ring file, if any."""
+        if isinstance(self._records, np.memmap):
+            with self._lock:
+                self._records.flush()
+
+    def clear(self) -> None:
+        """Drop all records, keeping the sequence numbering."""
+        with self._lock:
+            self._records["sequence"] = 0
+            self._next = 0
+
+
+def read_record_ring(path: str, fields: Sequence[tuple], since: float | None = None, until: float | None = None, limit: int | None = None) -> np.ndarray:
+    """Read the records of a ring file, e.g. one written by another process.
+
+    Args:
+        path (:obj:`str`): The ring file.
+        fields (:obj:`Sequence[tuple]`): The fields of the records, as given to the :obj:`RecordRing` that wrote the file.
+        since (:obj:`float | None`, optional): Only return records from this POSIX timestamp on. Default is None.
+        until (:obj:`float | None`, optional): Only return records up to this POSIX timestamp. Default is None.
+        limit (:obj:`int | None`, optional): Only return the most recent ``limit`` matching records. Default is None.
+
+    Returns:
+        :obj:`np.ndarray`: The records, from oldest to newest.
+    """
+    return _select(np.memmap(path, dtype=ring_dtype(fields), mode="r"), since, until, limit)
+
+
+def encode_records(name: str, records: np.ndarray) -> tuple[str, bytes]:
+    """Pack records into a self-describing DevEncoded value.
+
+    Args:
+        name (:obj:`str`): The name of the record format, e.g. "gain_history".
+        records (:obj:`np.ndarray`): The records.
+
+    Returns:
+        :obj:`tuple[str, bytes]`: The encoded format, "<name>;<JSON numpy dtype description>", and the packed records.
+    """
+    return f"{name};{json.dumps(records.dtype.descr)}", np.ascontiguousarray(records).tobytes()
+
+
+def decode_records(encoded: tuple[str, bytes]) -> tuple[str, np.ndarray]:
+    """Unpack records packed by :obj:`encode_records`.
+
+    Args:
+        encoded (:obj:`tuple[str, bytes]`): The DevEncoded value.
+
+    Returns:
+        :obj:`tuple[str, np.ndarray]`: The name of the record format, and the records.
+    """
+    encoded_format, data = encoded
+    name, _, descr = encoded_format.partition(";")
+    return name, np.frombuffer(bytes(data), dtype=dtype_from_descr(json.loads(descr)))
+
+
+def dtype_from_descr(descr: list) -> np.dtype:
+    """Rebuild a structured record type from its JSON-decoded numpy dtype description, e.g. as written by :obj:`encode_records`.
+
+    Args:
+        descr (:obj:`list`): The dtype description, with JSON lists in place of tuples.
+
+    Returns:
+        :obj:`np.dtype`: The record type.
+    """
+    return np.dtype([tuple(tuple(part) if isinstance(part, list) else part for part in field) for field in descr])
+
+
+def _select(records: np.ndarray, since: float | None, until: float | None, limit: int | None) -> np.ndarray:
+    mask = records["sequence"] > 0
+    if since is not None:
+        mask &= records["timestamp"] >= since
+    if until is not None:
+        mask &= records["timestamp"] <= until
+    selected = records[mask]
+    selected = selected[np.argsort(selected["sequence"], kind="stable")]
+    if limit is not None:
+        selected = selected[-limit:] if limit > 0 else selected[:0]
+    return np.array(selected)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from ska_control_model import HealthState
+
+__all__ = ["AdaptivePollInterval", "worst_health_state"]
+
+ADAPTIVE_POLL_BACKOFF = 2.0
+"""The default factor the poll interval grows by each time it backs off."""
+
+ADAPTIVE_POLL_SETTLE_POLLS = 3
+"""The default number of consecutive unchanged healthy polls before the poll interval starts backing off."""
+
+HEALTH_STATE_SEVERITY: dict[HealthState, int] = {
+    HealthState.OK: 0,
+    HealthState.UNKNOWN: 1,
+    HealthState.DEGRADED: 2,
+    HealthState.FAILED: 3,
+}
+"""The order of severity of health states, from healthiest to least healthy."""
+
+
+def worst_health_state(health_states: Iterable[HealthState]) -> HealthState:
+    """Roll up health states into the least healthy one.
+
+    Args:
+        health_states (:obj:`Iterable[HealthState]`): The health states.
+
+    Returns:
+        :obj:`HealthState`: The least healthy state, or OK if there are none.
+    """
+    return max(health_states, key=HEALTH_STATE_SEVERITY.__getitem__, default=HealthState.OK)
+
+
+class AdaptivePollInterval:
+    """Poll interval policy for health monitoring, polling slowly while steadily healthy and quickly while something is changing.
+
+    The interval drops to ``min_interval`` whenever the health state changes or a monitored counter jumps,
+    and stays there while unhealthy. Once healthy and unchanged for ``settle_polls`` polls, it grows by
+    ``backoff`` on every further poll, up to ``max_interval``.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = ADAPTIVE_POLL_BACKOFF,
+        settle_polls: int = ADAPTIVE_POLL_SETTLE_POLLS,
+    ) -> None:
+        """
+        Args:
+            min_interval (:obj:`float`): The shortest time between polls, in seconds.
+            max_interval (:obj:`float`): The longest time between polls, in seconds.
+            backoff (:obj:`float`, optional): The factor the interval grows by each time it backs off. Default is :obj:`ADAPTIVE_POLL_BACKOFF`.
+            settle_polls (:obj:`int`, optional): The number of unchanged healthy polls before backing off. Default is :obj:`ADAPTIVE_POLL_SETTLE_POLLS`.
+
+        Raises:
+            :obj:`ValueError`: If the intervals are not positive and ordered, or the backoff is less than 1.
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(f"Expected 0 < min_interval <= max_interval, got {min_interval} and {max_interval}")
+        if backoff < 1:
+            raise ValueError(f"Expected a backoff of at least 1, got {backoff}")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.settle_polls = settle_polls
+        self._interval = min_interval
+        self._health_state: HealthState | None = None
+        self._steady_polls = 0
+
+    @property
+    def interval(self) -> float:
+        """:obj:`float`: The current time between polls, in seconds."""
+        return self._interval
+
+    def reset(self) -> float:
+        """Poll quickly again, e.g. after the monitored block is started or reconfigured.
+
+        Returns:
+            :obj:`float`: The new poll interval, in seconds.
+        """
+        self._interval = self.min_interval
+        self._steady_polls = 0
+        return self._interval
+
+    def update(self, health_state: HealthState, counters_jumped: bool = False) -> float:
+        """Compute the time until the next poll from the outcome of a poll.
+
+        Args:
+            health_state (:obj:`HealthState`): The health state rolled up from the poll.
+            counters_jumped (:obj:`bool`, optional): Whether an error counter increased since the previous poll. Default is False.
+
+        Returns:
+            :obj:`float`: The time until the next poll, in seconds.
+        """
+        changed = health_state != self._health_state
+        self._health_state = health_state
+
+        if changed or counters_jumped or health_state != HealthState.OK:
+            self.reset()
+        else:
+            self._steady_polls += 1
+            if self._steady_polls >= self.settle_polls:
+                self._interval = min(self._interval * self.backoff, self.max_interval)
+        return self._interval
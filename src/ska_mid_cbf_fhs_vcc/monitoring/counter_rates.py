@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.incremental_health import HealthCheck
+
+__all__ = ["CounterRateEngine", "RateThreshold", "parse_rate_thresholds", "rate_health_check"]
+
+COUNTER_RATE_WINDOW = 10.0
+"""The default time window, in seconds, over which counter rates are computed."""
+
+COUNTER_RATE_CAPACITY = 256
+"""The default number of counter samples kept by a :obj:`CounterRateEngine`, which bounds the samples in a window."""
+
+COUNTER_BITS = 32
+"""The default width, in bits, of the hardware counters, beyond which they wrap around to 0."""
+
+
+@dataclass(frozen=True)
+class RateThreshold:
+    """Health thresholds on the rate of a counter, in counts per second."""
+
+    degraded: float | None = None
+    """:obj:`float | None`: The rate above which the health is DEGRADED, or None to never degrade."""
+
+    failed: float | None = None
+    """:obj:`float | None`: The rate above which the health is FAILED, or None to never fail."""
+
+    def health_state(self, rate: float) -> HealthState:
+        """Get the health state of a rate. An unknown (NaN) rate is healthy.
+
+        Args:
+            rate (:obj:`float`): The rate, in counts per second.
+
+        Returns:
+            :obj:`HealthState`: The health state.
+        """
+        if self.failed is not None and rate > self.failed:
+            return HealthState.FAILED
+        if self.degraded is not None and rate > self.degraded:
+            return HealthState.DEGRADED
+        return HealthState.OK
+
+
+def parse_rate_thresholds(value: str | Mapping[str, Any] | None, defaults: Mapping[str, RateThreshold]) -> dict[str, RateThreshold]:
+    """Parse rate thresholds, e.g. from an IP block property, overriding the default thresholds.
+
+    Args:
+        value (:obj:`str | Mapping[str, Any] | None`): JSON object, or mapping, of counter name to its
+            ``[degraded, failed]`` or ``{"degraded": ..., "failed": ...}`` thresholds, where null disables a threshold.
+        defaults (:obj:`Mapping[str, RateThreshold]`): The default thresholds, mapped by counter name.
+
+    Returns:
+        :obj:`dict[str, RateThreshold]`: The thresholds, mapped by counter name.
+
+    Raises:
+        :obj:`ValueError`: If the thresholds cannot be parsed, or name an unknown counter.
+    """
+    thresholds = dict(defaults)
+    if not value:
+        return thresholds
+    try:
+        overrides = json.loads(value) if isinstance(value, str) else value
+        for name, threshold in overrides.items():
+            if name not in defaults:
+                raise ValueError(f"Unknown counter {name!r}, expected one of {list(defaults)}")
+            thresholds[name] = RateThreshold(**threshold) if isinstance(threshold, Mapping) else RateThreshold(*threshold)
+    except (TypeError, AttributeError, json.JSONDecodeError) as ex:
+        raise ValueError(f"Invalid rate thresholds {value!r}: {ex}") from ex
+    return thresholds
+
+
+class CounterRateEngine:
+    """Computes the rates of a set of free-running hardware counters from successive status samples.
+
+    The difference between consecutive samples of each counter is taken modulo the counter width, so that a counter
+    which wraps around between samples still advances, and accumulated into a running total. The rate of a counter is
+    the increase in its total over the most recent ``window`` seconds, divided by the time between the samples spanning
+    the window. A reset of the counters (e.g. when clearing them on configuration) must be signalled with :obj:`reset`,
+    as it is otherwise indistinguishable from a wraparound.
+    """
+
+    def __init__(
+        self,
+        counters: Sequence[str],
+        window: float = COUNTER_RATE_WINDOW,
+        bits: int = COUNTER_BITS,
+        capacity: int = COUNTER_RATE_CAPACITY,
+    ) -> None:
+        """
+        Args:
+            counters (:obj:`Sequence[str]`): The names of the counters, e.g. the status fields holding them.
+            window (:obj:`float`, optional): The time window, in seconds, over which rates are computed. Default is :obj:`COUNTER_RATE_WINDOW`.
+            bits (:obj:`int`, optional): The width of the counters, in bits. Default is :obj:`COUNTER_BITS`.
+            capacity (:obj:`int`, optional): The number of samples kept. Default is :obj:`COUNTER_RATE_CAPACITY`.
+        """
+        self.counters = tuple(counters)
+        self.window = window
+        self._modulus = 1 << bits
+        self._capacity = capacity
+        self._timestamps = np.full(capacity, np.nan)
+        self._totals = np.zeros((capacity, len(self.counters)), dtype=np.int64)
+        self._last_values: np.ndarray | None = None
+        self._next = 0
+        self._count = 0
+        self._rates = np.full(len(self.counters), np.nan)
+        self._lock = threading.Lock()
+
+    @property
+    def rates(self) -> np.ndarray:
+        """:obj:`np.ndarray`: The rate of each counter, in counts per second, in the order of :obj:`counters`,
+        or NaN until two samples have been taken."""
+        return self._rates.copy()
+
+    def rates_by_counter(self) -> dict[str, float]:
+        """Get the rate of each counter, mapped by counter name.
+
+        Returns:
+            :obj:`dict[str, float]`: The rates, in counts per second.
+        """
+        return dict(zip(self.counters, self._rates.tolist()))
+
+    def update(self, sample: Any, timestamp: float | None = None) -> np.ndarray:
+        """Add a sample of the counters and recompute their rates.
+
+        Args:
+            sample (:obj:`Any`): The counter values, either as attributes (e.g. a status dataclass) or as a mapping.
+            timestamp (:obj:`float | None`, optional): The monotonic time of the sample, in seconds. Default is None, using the current time.
+
+        Returns:
+            :obj:`np.ndarray`: The rate of each counter, in counts per second, in the order of :obj:`counters`.
+        """
+        if isinstance(sample, Mapping):
+            values = np.fromiter((int(sample[name]) for name in self.counters), dtype=np.int64, count=len(self.counters))
+        else:
+            values = np.fromiter((int(getattr(sample, name)) for name in self.counters), dtype=np.int64, count=len(self.counters))
+        timestamp = time.monotonic() if timestamp is None else timestamp
+
+        with self._lock:
+            previous = (self._next - 1) % self._capacity
+            if self._last_values is None:
+                totals = np.zeros(len(self.counters), dtype=np.int64)
+            else:
+                totals = self._totals[previous] + (values - self._last_values) % self._modulus
+            self._last_values = values
+            self._timestamps[self._next] = timestamp
+            self._totals[self._next] = totals
+            self._next = (self._next + 1) % self._capacity
+            self._count = min(self._count + 1, self._capacity)
+            self._rates = self._compute_rates(timestamp, totals)
+            return self._rates.copy()
+
+    def reset(self) -> None:
+        """Forget every sample, e.g. after the counters were cleared."""
+        with self._lock:
+            self._timestamps.fill(np.nan)
+            self._totals.fill(0)
+            self._last_values = None
+            self._next = 0
+            self._count = 0
+            self._rates = np.full(len(self.counters), np.nan)
+
+    def health_states(self, thresholds: Mapping[str, RateThreshold]) -> dict[str, HealthState]:
+        """Get the health state of the rate of each counter which has thresholds.
+
+        Args:
+            thresholds (:obj:`Mapping[str, RateThreshold]`): The thresholds, mapped by counter name.
+
+        Returns:
+            :obj:`dict[str, HealthState]`: The health states, mapped by counter name.
+        """
+        rates = self.rates_by_counter()
+        return {name: threshold.health_state(rates[name]) for name, threshold in thresholds.items()}
+
+    def _compute_rates(self, timestamp: float, totals: np.ndarray) -> np.ndarray:
+        if self._count < 2:
+            return np.full(len(self.counters), np.nan)
+        # The oldest sample within the window, or the previous sample if it is older than the window
+        in_window = np.flatnonzero(self._timestamps >= timestamp - self.window)
+        oldest = in_window[np.argmin(self._timestamps[in_window])]
+        elapsed = timestamp - self._timestamps[oldest]
+        if elapsed <= 0:
+            oldest = (self._next - 2) % self._capacity
+            elapsed = timestamp - self._timestamps[oldest]
+        if elapsed <= 0:
+            return np.full(len(self.counters), np.nan)
+        return (totals - self._totals[oldest]) / elapsed
+
+
+def rate_health_check(engine: CounterRateEngine, name: str, threshold: RateThreshold) -> HealthCheck:
+    """Build a health check of the rate of a counter, for an :obj:`IncrementalHealthEvaluator`.
+
+    The check is only re-evaluated, and its health state change logged, when the rate crosses a threshold.
+
+    Args:
+        engine (:obj:`CounterRateEngine`): The rate engine, updated with each status before the check is evaluated.
+        name (:obj:`str`): The name of the counter.
+        threshold (:obj:`RateThreshold`): The thresholds on the rate of the counter.
+
+    Returns:
+        :obj:`HealthCheck`: The health check, named ``<name>_rate``.
+    """
+
+    def evaluate(status: Any) -> tuple[HealthState, str | None]:
+        rate = engine.rates_by_counter()[name]
+        health_state = threshold.health_state(rate)
+        limit = threshold.failed if health_state == HealthState.FAILED else threshold.degraded
+        return health_state, None if health_state == HealthState.OK else f"{name} rate {rate:.3g}/s above {limit:.3g}/s"
+
+    return HealthCheck(f"{name}_rate", lambda status: threshold.health_state(engine.rates_by_counter()[name]), evaluate)
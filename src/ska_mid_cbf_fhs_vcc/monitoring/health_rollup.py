@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import worst_health_state
+
+__all__ = ["HealthRollup"]
+
+
+class HealthRollup:
+    """Rolls up the health states reported by several monitored sources (e.g. IP blocks) into a single health state,
+    reported to a callback when it changes.
+
+    A source only contributes once it has reported a health state.
+    """
+
+    def __init__(self, callback: Callable[[HealthState], None] | None) -> None:
+        """
+        Args:
+            callback (:obj:`Callable[[HealthState], None] | None`): Callback called with the rolled up health state when it changes.
+        """
+        self._callback = callback
+        self._health_states: dict[str, HealthState] = {}
+        self._health_state: HealthState | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def health_state(self) -> HealthState:
+        """:obj:`HealthState`: The health state of the least healthy source, or OK if none has reported yet."""
+        return self._health_state if self._health_state is not None else HealthState.OK
+
+    @property
+    def health_states(self) -> dict[str, HealthState]:
+        """:obj:`dict[str, HealthState]`: The most recent health state of each source, mapped by source name."""
+        return dict(self._health_states)
+
+    def update(self, source: str, health_state: HealthState) -> HealthState:
+        """Set the health state of a source, calling the callback if the rolled up health state changed.
+
+        Args:
+            source (:obj:`str`): The name of the source.
+            health_state (:obj:`HealthState`): The health state of the source.
+
+        Returns:
+            :obj:`HealthState`: The rolled up health state.
+        """
+        with self._lock:
+            self._health_states[source] = health_state
+            rolled_up = worst_health_state(self._health_states.values())
+            if rolled_up != self._health_state:
+                self._health_state = rolled_up
+                # Called under the lock, so that concurrent updates are reported in order
+                if self._callback is not None:
+                    self._callback(rolled_up)
+            return rolled_up
+
+    def callback(self, source: str) -> Callable[[HealthState], None]:
+        """Get a health state callback for a source, e.g. to pass to its IP block manager.
+
+        Args:
+            source (:obj:`str`): The name of the source.
+
+        Returns:
+            :obj:`Callable[[HealthState], None]`: Sets the health state of the source.
+        """
+        return lambda health_state: self.update(source, health_state)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Sequence
+
+from ska_control_model import HealthState
+
+__all__ = ["HealthCheck", "IncrementalHealthEvaluator"]
+
+HEALTH_SUMMARY_INTERVAL = 60.0
+"""The default time, in seconds, between the summaries of the health states of the status fields logged by an :obj:`IncrementalHealthEvaluator`."""
+
+_UNEVALUATED = object()
+
+
+@dataclass(frozen=True)
+class HealthCheck:
+    """A health check of a single status field of an IP block."""
+
+    name: str
+    """:obj:`str`: The name of the check, usually the name of the status field."""
+
+    inputs: Callable[[Any], Hashable]
+    """:obj:`Callable[[Any], Hashable]`: Gets everything the check depends on from a status, including any expected values,
+    so that the check is only re-evaluated when its inputs change."""
+
+    evaluate: Callable[[Any], tuple[HealthState, str | None]]
+    """:obj:`Callable[[Any], tuple[HealthState, str | None]]`: Evaluates the check on a status, returning its health state
+    and, if unhealthy, a message describing why."""
+
+
+class IncrementalHealthEvaluator:
+    """Evaluates the health of the status fields of an IP block poll after poll, only re-evaluating the checks
+    whose inputs changed since the previous poll.
+
+    A log message is only emitted when the health state of a check changes, along with a summary of the
+    health state of every check at most once per ``summary_interval``.
+    """
+
+    def __init__(self, checks: Sequence[HealthCheck], logger: logging.Logger, summary_interval: float = HEALTH_SUMMARY_INTERVAL) -> None:
+        """
+        Args:
+            checks (:obj:`Sequence[HealthCheck]`): The health checks.
+            logger (:obj:`logging.Logger`): Logger for health state transitions and summaries.
+            summary_interval (:obj:`float`, optional): The time, in seconds, between summaries. Default is :obj:`HEALTH_SUMMARY_INTERVAL`.
+        """
+        self.checks = tuple(checks)
+        self.summary_interval = summary_interval
+        self._logger = logger
+        self._inputs: dict[str, Any] = {}
+        self._health_states: dict[str, HealthState] = {}
+        self._next_summary = 0.0
+        self._polls = 0
+        self._evaluations = 0
+        self._transitions = 0
+
+    @property
+    def health_states(self) -> dict[str, HealthState]:
+        """:obj:`dict[str, HealthState]`: The health state of each check as of the most recent poll, mapped by check name."""
+        return dict(self._health_states)
+
+    def evaluate(self, status: Any) -> dict[str, HealthState]:
+        """Evaluate the checks whose inputs changed since the previous poll.
+
+        Args:
+            status (:obj:`Any`): The status of the IP block.
+
+        Returns:
+            :obj:`dict[str, HealthState]`: The health state of each check, mapped by check name.
+        """
+        self._polls += 1
+        for check in self.checks:
+            inputs = check.inputs(status)
+            if inputs == self._inputs.get(check.name, _UNEVALUATED):
+                continue
+            self._inputs[check.name] = inputs
+            self._evaluations += 1
+
+            health_state, message = check.evaluate(status)
+            previous = self._health_states.get(check.name)
+            if health_state != previous:
+                self._health_states[check.name] = health_state
+                self._log_transition(check.name, previous, health_state, message)
+
+        if (now := time.monotonic()) >= self._next_summary:
+            self._next_summary = now + self.summary_interval
+            self._log_summary()
+        return dict(self._health_states)
+
+    def reset(self) -> None:
+        """Forget the previous poll, so that every check is re-evaluated and logged on the next poll."""
+        self._inputs.clear()
+        self._health_states.clear()
+        self._next_summary = 0.0
+
+    def _log_transition(self, name: str, previous: HealthState | None, health_state: HealthState, message: str | None) -> None:
+        self._transitions += 1
+        if previous is None and health_state == HealthState.OK:
+            return
+        text = f"{name} health changed from {previous.name if previous is not None else 'UNKNOWN'} to {health_state.name}"
+        if message and health_state != HealthState.OK:
+            text += f": {message}"
+        if health_state == HealthState.FAILED:
+            self._logger.error(text)
+        elif health_state == HealthState.OK:
+            self._logger.info(text)
+        else:
+            self._logger.warning(text)
+
+    def _log_summary(self) -> None:
+        self._logger.info(
+            f"REGISTER_STATUSES={self._health_states} "
+            f"({self._polls} polls, {self._evaluations} checks evaluated and {self._transitions} transitions since the last summary)"
+        )
+        self._polls = self._evaluations = self._transitions = 0
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+__all__ = ["PollJob", "PollScheduler"]
+
+POLL_SCHEDULER_MAX_WORKERS = 4
+"""The maximum number of polls run concurrently by the process-wide :obj:`PollScheduler`."""
+
+POLL_SCHEDULER_JITTER = 0.1
+"""The default fraction by which each poll deadline is randomly moved earlier or later, so that jobs polling
+at the same interval spread out over time rather than all coming due together."""
+
+POLL_SCHEDULER_LAG_WARNING = 1.0
+"""The default poll lag, in seconds, above which a poll is logged as late."""
+
+POLL_LAG_SAMPLES = 1024
+"""The number of most recent poll lags kept by a :obj:`PollScheduler` for its lag statistics."""
+
+
+class PollJob:
+    """A function polled repeatedly by a :obj:`PollScheduler`, each poll returning the delay until the next one."""
+
+    def __init__(self, scheduler: PollScheduler, poll: Callable[[], float], name: str, logger: logging.Logger) -> None:
+        """
+        Args:
+            scheduler (:obj:`PollScheduler`): The scheduler running the job.
+            poll (:obj:`Callable[[], float]`): Polls once, returning the time until the next poll, in seconds.
+            name (:obj:`str`): The name of the job, used in lag reports and log messages.
+            logger (:obj:`logging.Logger`): Logger for poll failures and late polls.
+        """
+        self.name = name
+        self.logger = logger
+        self.polls = 0
+        """:obj:`int`: The number of polls run."""
+        self.last_lag = 0.0
+        """:obj:`float`: The time, in seconds, between when the most recent poll was due and when it started."""
+        self.max_lag = 0.0
+        """:obj:`float`: The longest poll lag of the job, in seconds."""
+        self.cancelled = False
+        self._scheduler = scheduler
+        self._poll = poll
+        self._delay = 0.0
+        self._entry: int | None = None
+        self._in_flight = False
+        self._poll_again = False
+        self._poll_thread: threading.Thread | None = None
+
+    def cancel(self, wait: bool = True) -> None:
+        """Stop polling. A poll which is already running completes, but is not followed by another.
+
+        Args:
+            wait (:obj:`bool`, optional): Wait for a running poll to complete, unless cancelled from the poll itself. Default is True.
+        """
+        self._scheduler._cancel(self, wait)
+
+    def poll_now(self) -> None:
+        """Run the next poll as soon as possible, rather than when it is due."""
+        self._scheduler._schedule(self, 0.0, jitter=False)
+
+
+class PollScheduler:
+    """Runs the repeated polls of many jobs, e.g. the health monitoring of every IP block manager in the process,
+    from a single heap of poll deadlines on a small bounded pool of worker threads.
+
+    Each poll returns the delay until the next poll of its job, which is randomly jittered before the job is
+    put back on the heap. The lag between when each poll was due and when it started is recorded, as a measure
+    of whether the pool keeps up with the polling load.
+    """
+
+    _shared: PollScheduler | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = POLL_SCHEDULER_MAX_WORKERS,
+        jitter: float = POLL_SCHEDULER_JITTER,
+        lag_warning: float = POLL_SCHEDULER_LAG_WARNING,
+        name: str = "poll_scheduler",
+    ) -> None:
+        """
+        Args:
+            max_workers (:obj:`int`, optional): The maximum number of polls run concurrently. Default is :obj:`POLL_SCHEDULER_MAX_WORKERS`.
+            jitter (:obj:`float`, optional): The fraction by which poll deadlines are randomly moved. Default is :obj:`POLL_SCHEDULER_JITTER`.
+            lag_warning (:obj:`float`, optional): The poll lag, in seconds, above which a poll is logged as late.
+                Default is :obj:`POLL_SCHEDULER_LAG_WARNING`.
+            name (:obj:`str`, optional): The name prefix of the scheduler threads. Default is "poll_scheduler".
+        """
+        self.max_workers = max_workers
+        self.jitter = jitter
+        self.lag_warning = lag_warning
+        self._name = name
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._heap: list[tuple[float, int, PollJob]] = []
+        self._counter = itertools.count()
+        self._jobs: set[PollJob] = set()
+        self._lags: deque[float] = deque(maxlen=POLL_LAG_SAMPLES)
+        self._polls = 0
+        self._condition = threading.Condition()
+        self._dispatcher: threading.Thread | None = None
+
+    @classmethod
+    def shared(cls) -> PollScheduler:
+        """Get the scheduler shared by every IP block manager of the process, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def schedule(self, poll: Callable[[], float], name: str, logger: logging.Logger, initial_delay: float = 0.0) -> PollJob:
+        """Start polling a function repeatedly.
+
+        Args:
+            poll (:obj:`Callable[[], float]`): Polls once, returning the time until the next poll, in seconds.
+                If it raises, the failure is logged and the previous delay is used again.
+            name (:obj:`str`): The name of the job, used in lag reports and log messages.
+            logger (:obj:`logging.Logger`): Logger for poll failures and late polls.
+            initial_delay (:obj:`float`, optional): The time until the first poll, in seconds. Default is 0.0.
+
+        Returns:
+            :obj:`PollJob`: The job, which can be cancelled.
+        """
+        job = PollJob(self, poll, name, logger)
+        with self._condition:
+            self._jobs.add(job)
+            self._start_dispatcher()
+        self._schedule(job, initial_delay, jitter=initial_delay > 0)
+        return job
+
+    @property
+    def num_jobs(self) -> int:
+        """:obj:`int`: The number of jobs currently polled."""
+        return len(self._jobs)
+
+    def lag_report(self) -> dict:
+        """Summarise how late recent polls started relative to their deadlines.
+
+        Returns:
+            :obj:`dict`: The number of jobs and their names, the number of workers and polls run, the mean, p95 and max
+            lag of the most recent polls in milliseconds, and the name and max lag of the job with the largest lag.
+        """
+        with self._condition:
+            lags = np.fromiter(self._lags, dtype=float) * 1e3
+            jobs = list(self._jobs)
+            polls = self._polls
+        report = {"jobs": len(jobs), "job_names": sorted(job.name for job in jobs), "workers": self.max_workers, "polls": polls}
+        if lags.size:
+            report |= {"lag_mean_ms": float(lags.mean()), "lag_p95_ms": float(np.percentile(lags, 95)), "lag_max_ms": float(lags.max())}
+        if jobs:
+            latest = max(jobs, key=lambda job: job.max_lag)
+            report |= {"max_lag_job": latest.name, "max_lag_job_ms": latest.max_lag * 1e3}
+        return report
+
+    def _start_dispatcher(self) -> None:
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(target=self._dispatch, name=f"{self._name}_dispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def _schedule(self, job: PollJob, delay: float, jitter: bool = True) -> None:
+        with self._condition:
+            if job.cancelled:
+                return
+            if job._in_flight:
+                # Rescheduled from outside the poll, e.g. by poll_now; poll again as soon as the running poll completes
+                job._poll_again = True
+                return
+            if jitter and self.jitter:
+                delay *= 1 + random.uniform(-self.jitter, self.jitter)
+            job._entry = next(self._counter)
+            heapq.heappush(self._heap, (time.monotonic() + max(delay, 0.0), job._entry, job))
+            self._condition.notify()
+
+    def _cancel(self, job: PollJob, wait: bool) -> None:
+        with self._condition:
+            job.cancelled = True
+            job._entry = None
+            self._jobs.discard(job)
+            if wait and job._poll_thread is not threading.current_thread():
+                self._condition.wait_for(lambda: not job._in_flight)
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._condition.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                due, entry, job = heapq.heappop(self._heap)
+                # Skip deadlines superseded by a later reschedule or cancellation of the job
+                if entry != job._entry:
+                    continue
+                job._entry = None
+                job._in_flight = True
+            self._pool.submit(self._run, job, due)
+
+    def _run(self, job: PollJob, due: float) -> None:
+        job._poll_thread = threading.current_thread()
+        lag = max(time.monotonic() - due, 0.0)
+        job.last_lag = lag
+        job.max_lag = max(job.max_lag, lag)
+        if lag > self.lag_warning:
+            job.logger.warning(f"{job.name} poll started {lag:.3f}s late")
+        try:
+            job._delay = job._poll()
+        except Exception as ex:
+            job.logger.exception(f"{job.name} poll failed: {ex!r}")
+        finally:
+            job.polls += 1
+            with self._condition:
+                self._polls += 1
+                self._lags.append(lag)
+                job._in_flight = False
+                job._poll_thread = None
+                poll_again, job._poll_again = job._poll_again, False
+                self._condition.notify_all()
+            self._schedule(job, 0.0 if poll_again else job._delay, jitter=not poll_again)
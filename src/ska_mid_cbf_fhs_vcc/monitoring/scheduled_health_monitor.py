@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Sequence
+
+from ska_control_model import HealthState
+from ska_mid_cbf_fhs_common import BaseMonitoringIPBlockManager
+
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import AdaptivePollInterval, worst_health_state
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollJob, PollScheduler
+
+__all__ = ["ScheduledHealthMonitor"]
+
+
+class ScheduledHealthMonitor:
+    """Polls the health of a monitoring IP block manager as a job of a :obj:`PollScheduler`, in place of the
+    fixed-interval health monitor thread of the manager.
+
+    Each poll reads the status of the manager, rolls up its :obj:`get_status_healthstates` into a single health state,
+    and calls the health state callback when it changes. The time until the next poll is chosen by an
+    :obj:`AdaptivePollInterval`, which also speeds up polling when one of the given status counters increases.
+    """
+
+    def __init__(
+        self,
+        manager: BaseMonitoringIPBlockManager,
+        poll_interval: AdaptivePollInterval,
+        update_health_state_callback: Callable[[HealthState], None] | None = None,
+        counters: Sequence[str] = (),
+        scheduler: PollScheduler | None = None,
+        name: str | None = None,
+    ) -> None:
+        """
+        Args:
+            manager (:obj:`BaseMonitoringIPBlockManager`): The IP block manager to monitor.
+            poll_interval (:obj:`AdaptivePollInterval`): The poll interval policy.
+            update_health_state_callback (:obj:`Callable[[HealthState], None] | None`, optional): Callback called with the
+                new health state when it changes. Default is None.
+            counters (:obj:`Sequence[str]`, optional): The names of the status fields holding error counters whose increase
+                speeds up polling. Default is none.
+            scheduler (:obj:`PollScheduler | None`, optional): The scheduler to poll on. Default is None, using the shared scheduler.
+            name (:obj:`str | None`, optional): The name of the poll job. Default is None, using the IP block ID of the manager.
+        """
+        self.manager = manager
+        self.poll_interval = poll_interval
+        self.counters = tuple(counters)
+        self._callback = update_health_state_callback
+        self._scheduler = scheduler
+        self._name = name
+        self._health_state = HealthState.UNKNOWN
+        self._last_counters: dict[str, int] | None = None
+        self._job: PollJob | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def health_state(self) -> HealthState:
+        """:obj:`HealthState`: The health state as of the most recent poll."""
+        return self._health_state
+
+    @property
+    def running(self) -> bool:
+        """:obj:`bool`: Whether the health is being polled."""
+        return self._job is not None
+
+    @property
+    def job(self) -> PollJob | None:
+        """:obj:`PollJob | None`: The poll job, while running."""
+        return self._job
+
+    def start(self) -> None:
+        """Start polling, with an immediate first poll, taking over from the health monitor of the manager."""
+        self._stop_manager_health_monitor()
+        with self._lock:
+            self._last_counters = None
+            self.poll_interval.reset()
+            if self._job is None:
+                scheduler = self._scheduler or PollScheduler.shared()
+                name = self._name or getattr(self.manager, "ip_block_id", type(self.manager).__name__)
+                self._job = scheduler.schedule(self.poll, f"{name}_health", self.manager.logger)
+            else:
+                self._job.poll_now()
+
+    def stop(self) -> None:
+        """Stop polling, waiting for a running poll to complete."""
+        with self._lock:
+            job, self._job = self._job, None
+        if job is not None:
+            job.cancel()
+
+    def poll(self) -> float:
+        """Poll the status of the manager once, updating its health state.
+
+        Returns:
+            :obj:`float`: The time until the next poll, in seconds.
+        """
+        self._stop_manager_health_monitor()
+        status = self.manager.status(clear=False)
+        health_state = worst_health_state(self.manager.get_status_healthstates(status).values())
+        return self.poll_interval.update(self.update(health_state, status), counters_jumped=self._counters_jumped(status))
+
+    def update(self, health_state: HealthState, status: Any = None) -> HealthState:
+        """Set the health state, calling the callback if it changed.
+
+        Args:
+            health_state (:obj:`HealthState`): The new health state.
+            status (:obj:`Any`, optional): The status the health state was derived from. Default is None.
+
+        Returns:
+            :obj:`HealthState`: The new health state.
+        """
+        if health_state != self._health_state:
+            self.manager.logger.info(f"Health state changed from {self._health_state.name} to {health_state.name}")
+            self._health_state = health_state
+            if self._callback is not None:
+                self._callback(health_state)
+        return health_state
+
+    def _counters_jumped(self, status: Any) -> bool:
+        counters = {name: int(getattr(status, name)) for name in self.counters}
+        last_counters, self._last_counters = self._last_counters, counters
+        return last_counters is not None and any(value > last_counters[name] for name, value in counters.items())
+
+    def _stop_manager_health_monitor(self) -> None:
+        if self.manager.health_monitor.is_polling():
+            self.manager.health_monitor.stop_polling()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import dataclasses
+import types
+import typing
+from typing import Any, Callable, Mapping
+
+from dataclasses_json import DataClassJsonMixin
+
+__all__ = ["CompiledDecoderMixin", "compile_status_decoder"]
+
+_CONVERTED_TYPES = (bool, int, float, str)
+
+_UNSUPPORTED = object()
+
+
+def _field_conversion(field_type: Any) -> Any:
+    """Get the type a value of a field is converted to on decoding, None if it is kept as is,
+    or :obj:`_UNSUPPORTED` if the field type is not supported by a compiled decoder."""
+    if typing.get_origin(field_type) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+        return _field_conversion(args[0]) if len(args) == 1 else _UNSUPPORTED
+    if not isinstance(field_type, type) or dataclasses.is_dataclass(field_type):
+        return _UNSUPPORTED
+    # Like DataClassJsonMixin.from_dict, values of builtin scalar types (and their subclasses, e.g. np.float64)
+    # are converted, while values of other numpy types (e.g. np.uint32) are kept as decoded from the driver
+    if issubclass(field_type, _CONVERTED_TYPES):
+        return field_type
+    if field_type.__module__ == "numpy":
+        return None
+    return _UNSUPPORTED
+
+
+def compile_status_decoder(status_dataclass: type) -> Callable[[Mapping[str, Any]], Any] | None:
+    """Compile a decoder of the status dataclass of an IP block from a driver status dict.
+
+    The decoder gives the same result as :obj:`DataClassJsonMixin.from_dict` for flat status dataclasses, but resolves
+    the fields and their types once here rather than on every call, and builds the status with a single constructor call.
+
+    Args:
+        status_dataclass (:obj:`type`): The status dataclass.
+
+    Returns:
+        :obj:`Callable[[Mapping[str, Any]], Any] | None`: The decoder, or None if the dataclass has fields which are
+        not supported (e.g. nested dataclasses, lists, field default factories or dataclasses-json field overrides).
+    """
+    if getattr(status_dataclass, "dataclass_json_config", None):
+        return None
+    try:
+        hints = typing.get_type_hints(status_dataclass)
+    except Exception:
+        return None
+
+    namespace: dict[str, Any] = {"cls": status_dataclass}
+    args = []
+    for i, field in enumerate(dataclasses.fields(status_dataclass)):
+        if not field.init:
+            continue
+        if field.default_factory is not dataclasses.MISSING or field.metadata.get("dataclasses_json"):
+            return None
+        if (convert_type := _field_conversion(hints.get(field.name, field.type))) is _UNSUPPORTED:
+            return None
+
+        if field.default is dataclasses.MISSING:
+            value = f"kvs[{field.name!r}]"
+        else:
+            namespace[f"d{i}"] = field.default
+            value = f"kvs.get({field.name!r}, d{i})"
+        if convert_type is not None:
+            # None is passed through as is, like DataClassJsonMixin.from_dict does (with a warning if not optional)
+            namespace[f"t{i}"] = convert_type
+            value = f"v if (v := {value}) is None or isinstance(v, t{i}) else t{i}(v)"
+        args.append(f"        {field.name}=({value}),")
+
+    source = "\n".join(["def decode(kvs):", "    return cls(", *args, "    )"])
+    exec(compile(source, f"<{status_dataclass.__qualname__} status decoder>", "exec"), namespace)  # pylint: disable=exec-used
+    return namespace["decode"]
+
+
+class CompiledDecoderMixin(DataClassJsonMixin):
+    """Mixin for status dataclasses decoded on every poll of the health monitoring, replacing the field reflection of
+    :obj:`DataClassJsonMixin.from_dict` with a decoder compiled once per class (see :obj:`compile_status_decoder`).
+
+    Dataclasses whose fields are not supported by a compiled decoder, and decoding with ``infer_missing``, fall back to
+    :obj:`DataClassJsonMixin.from_dict`.
+    """
+
+    @classmethod
+    def from_dict(cls, kvs: Any, *, infer_missing: bool = False) -> Any:
+        decoder = cls.__dict__.get("_compiled_decoder", False)
+        if decoder is False:
+            decoder = compile_status_decoder(cls)
+            cls._compiled_decoder = decoder
+        if decoder is None or infer_missing or not isinstance(kvs, Mapping):
+            return super().from_dict(kvs, infer_missing=infer_missing)
+        return decoder(kvs)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import sys
+import threading
+import types
+import typing
+from datetime import datetime
+from typing import Any, Callable
+
+import numpy as np
+
+from ska_mid_cbf_fhs_vcc.helpers.record_ring import RecordRing, dtype_from_descr, read_record_ring
+
+__all__ = ["StatusRecorder", "main", "read_status_records", "status_record_fields"]
+
+STATUS_RECORD_CAPACITY = 4096
+"""The default number of most recent status records kept for each IP block type."""
+
+STATUS_INSTANCE_LENGTH = 16
+"""The number of bytes of the instance name kept in each status record, e.g. "FS 12"."""
+
+STATUS_STRING_LENGTH = 64
+"""The number of bytes of each string status field kept in a status record."""
+
+STATUS_RING_SUFFIX = ".ring"
+"""The file name suffix of a status ring file, which is named after its IP block type."""
+
+STATUS_FIELDS_SUFFIX = ".fields.json"
+"""The file name suffix of the description of the record fields of a status ring file."""
+
+
+def _field_format(field_type: Any) -> Any | None:
+    if typing.get_origin(field_type) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+        return _field_format(args[0]) if len(args) == 1 else None
+    if field_type is bool or field_type is np.bool_:
+        return "?"
+    if field_type is int:
+        return "<i8"
+    if field_type is float:
+        return "<f8"
+    if field_type is str:
+        return f"S{STATUS_STRING_LENGTH}"
+    if isinstance(field_type, type) and issubclass(field_type, np.number):
+        return np.dtype(field_type).str
+    return None
+
+
+def status_record_fields(status_dataclass: type) -> list[tuple[str, str]]:
+    """Derive the fixed-width record fields of a status dataclass, for recording its statuses in a :obj:`RecordRing`.
+
+    Boolean, numeric and string fields are kept, preceded by the name of the IP block instance; fields of any other
+    type (e.g. lists) are not recorded.
+
+    Args:
+        status_dataclass (:obj:`type`): The status dataclass, e.g. :obj:`WidebandInputBufferStatus`.
+
+    Returns:
+        :obj:`list[tuple[str, str]]`: The numpy structured array fields.
+    """
+    try:
+        hints = typing.get_type_hints(status_dataclass)
+    except Exception:
+        hints = {}
+    fields = [("instance", f"S{STATUS_INSTANCE_LENGTH}")]
+    for field in dataclasses.fields(status_dataclass):
+        if (field_format := _field_format(hints.get(field.name, field.type))) is not None:
+            fields.append((field.name, field_format))
+    return fields
+
+
+class StatusRecorder:
+    """Always-on recorder of the IP block statuses read by the monitoring polls, for diagnosing what led up to a fault.
+
+    The statuses of each IP block type are written as fixed-width records into a :obj:`RecordRing` of their own, which
+    is memory-mapped to ``<directory>/<block type>.ring`` if a directory is given, along with a description of its record
+    fields, so that the records can be read by another process (see :obj:`read_status_records`) after the fault.
+    """
+
+    def __init__(self, directory: str | None = None, capacity: int = STATUS_RECORD_CAPACITY) -> None:
+        """
+        Args:
+            directory (:obj:`str | None`, optional): The directory to keep the ring files in. Default is None, keeping the records in memory.
+            capacity (:obj:`int`, optional): The default number of most recent records kept for each IP block type.
+                Default is :obj:`STATUS_RECORD_CAPACITY`.
+        """
+        self.directory = directory
+        self.capacity = capacity
+        self._rings: dict[str, RecordRing] = {}
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def block_types(self) -> list[str]:
+        """:obj:`list[str]`: The IP block types recorded."""
+        return sorted(self._rings)
+
+    def channel(self, block_type: str, status_dataclass: type, instance: str = "", capacity: int | None = None) -> Callable[[Any], int]:
+        """Get a function recording the statuses of an IP block.
+
+        The names of the recorded fields are resolved once here, so that recording a status only copies its values.
+
+        Args:
+            block_type (:obj:`str`): The IP block type, e.g. "wideband_input_buffer", naming its ring.
+            status_dataclass (:obj:`type`): The status dataclass of the IP block type.
+            instance (:obj:`str`, optional): The name of the IP block instance, for IP block types with several instances. Default is "".
+            capacity (:obj:`int | None`, optional): The number of records kept for the IP block type, if its ring does not exist yet.
+                Default is None, using :obj:`capacity`.
+
+        Returns:
+            :obj:`Callable[[Any], int]`: Records a status of the IP block, returning the sequence number of its record.
+        """
+        ring = self._ring(block_type, status_record_fields(status_dataclass), capacity or self.capacity)
+        status_fields = {field.name for field in dataclasses.fields(status_dataclass)}
+        names = [name for name in ring.dtype.names if name in status_fields]
+        instance_name = instance.encode("utf-8")[:STATUS_INSTANCE_LENGTH]
+
+        def record(status: Any) -> int:
+            values = {name: value for name in names if (value := getattr(status, name)) is not None}
+            return ring.append(instance=instance_name, **values)
+
+        return record
+
+    def records(self, block_type: str, since: float | None = None, until: float | None = None, limit: int | None = None) -> np.ndarray:
+        """Get the recorded statuses of an IP block type, from oldest to newest.
+
+        Args:
+            block_type (:obj:`str`): The IP block type.
+            since (:obj:`float | None`, optional): Only return statuses recorded from this POSIX timestamp on. Default is None.
+            until (:obj:`float | None`, optional): Only return statuses recorded up to this POSIX timestamp. Default is None.
+            limit (:obj:`int | None`, optional): Only return the most recent ``limit`` matching records. Default is None.
+
+        Returns:
+            :obj:`np.ndarray`: The records.
+
+        Raises:
+            :obj:`KeyError`: If the IP block type is not recorded.
+        """
+        return self._rings[block_type].records(since, until, limit)
+
+    def flush(self) -> None:
+        """Write every ring to its file, if any."""
+        for ring in list(self._rings.values()):
+            ring.flush()
+
+    def _ring(self, block_type: str, fields: list[tuple[str, str]], capacity: int) -> RecordRing:
+        with self._lock:
+            if (ring := self._rings.get(block_type)) is not None:
+                return ring
+            path = None
+            resume = True
+            if self.directory is not None:
+                path = os.path.join(self.directory, block_type + STATUS_RING_SUFFIX)
+                # Records of other fields can have the same size, so the ring file is only resumed if it was written with the same fields
+                description = {"fields": json.loads(json.dumps(fields)), "capacity": capacity}
+                resume = _read_fields_description(self.directory, block_type) == description
+                with open(os.path.join(self.directory, block_type + STATUS_FIELDS_SUFFIX), "w") as f:
+                    json.dump(description, f)
+            ring = self._rings[block_type] = RecordRing(fields, capacity, path=path, resume=resume)
+            return ring
+
+
+def _read_fields_description(directory: str, block_type: str) -> dict[str, Any] | None:
+    try:
+        with open(os.path.join(directory, block_type + STATUS_FIELDS_SUFFIX)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_status_records(directory: str, block_type: str, since: float | None = None, until: float | None = None, limit: int | None = None) -> np.ndarray:
+    """Read the statuses of an IP block type from the ring files of a :obj:`StatusRecorder`, e.g. after a fault.
+
+    Args:
+        directory (:obj:`str`): The directory of the ring files.
+        block_type (:obj:`str`): The IP block type.
+        since (:obj:`float | None`, optional): Only return statuses recorded from this POSIX timestamp on. Default is None.
+        until (:obj:`float | None`, optional): Only return statuses recorded up to this POSIX timestamp. Default is None.
+        limit (:obj:`int | None`, optional): Only return the most recent ``limit`` matching records. Default is None.
+
+    Returns:
+        :obj:`np.ndarray`: The records, from oldest to newest.
+    """
+    with open(os.path.join(directory, block_type + STATUS_FIELDS_SUFFIX)) as f:
+        fields = dtype_from_descr(json.load(f)["fields"]).descr
+    return read_record_ring(os.path.join(directory, block_type + STATUS_RING_SUFFIX), fields, since, until, limit)
+
+
+def _parse_time(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main(args: list[str] | None = None) -> None:
+    """Print the statuses of an IP block type recorded in a time window, one JSON object per line."""
+    parser = argparse.ArgumentParser(description="Extract IP block statuses recorded by a VCC status recorder.")
+    parser.add_argument("directory", help="directory of the status ring files")
+    parser.add_argument("block_type", nargs="?", help="IP block type, e.g. wideband_input_buffer; lists the recorded types if omitted")
+    parser.add_argument("--since", type=_parse_time, help="start of the window, as a POSIX timestamp or ISO 8601 time")
+    parser.add_argument("--until", type=_parse_time, help="end of the window, as a POSIX timestamp or ISO 8601 time")
+    parser.add_argument("--limit", type=int, help="only print the most recent records of the window")
+    parsed = parser.parse_args(args)
+
+    if parsed.block_type is None:
+        for name in sorted(os.listdir(parsed.directory)):
+            if name.endswith(STATUS_FIELDS_SUFFIX):
+                print(name.removesuffix(STATUS_FIELDS_SUFFIX))
+        return
+
+    records = read_status_records(parsed.directory, parsed.block_type, parsed.since, parsed.until, parsed.limit)
+    for record in records.tolist():
+        values = [value.decode("utf-8", "replace") if isinstance(value, bytes) else value for value in record]
+        sys.stdout.write(json.dumps(dict(zip(records.dtype.names, values))) + "\n")
@@ -1,11 +1,44 @@
 from dataclasses import dataclass
+from typing import Any, Callable
 
 import numpy as np
 from dataclasses_json import DataClassJsonMixin
-from ska_mid_cbf_fhs_common import BaseIPBlockManager, non_blocking
+from ska_control_model import HealthState
+from ska_mid_cbf_fhs_common import BaseMonitoringIPBlockManager, non_blocking
 
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import AdaptivePollInterval
+from ska_mid_cbf_fhs_vcc.monitoring.counter_rates import CounterRateEngine, RateThreshold, parse_rate_thresholds, rate_health_check
+from ska_mid_cbf_fhs_vcc.monitoring.incremental_health import HEALTH_SUMMARY_INTERVAL, IncrementalHealthEvaluator
+from ska_mid_cbf_fhs_vcc.monitoring.scheduled_health_monitor import ScheduledHealthMonitor
+from ska_mid_cbf_fhs_vcc.monitoring.status_decoder import CompiledDecoderMixin
 from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_simulator import PacketValidationSimulator
 
+PACKET_VALIDATION_COUNTERS = (
+    "egress_cnt",
+    "ingress_error_cnt",
+    "size_error_cnt",
+    "wrong_dst_mac_cnt",
+    "wrong_src_mac_cnt",
+    "wrong_ethertype_cnt",
+    "wrong_antenna_id_cnt",
+)
+"""The status counters of the Packet Validation block whose rates are published."""
+
+PACKET_VALIDATION_HEALTH_MONITOR_POLL_INTERVAL = 3.0
+"""The default time, in seconds, between the health polls of the Packet Validation block, which sample its counters, while started,
+unless the ``health_monitor_poll_interval`` property of the IP block is set."""
+
+PACKET_VALIDATION_COUNTER_RATE_THRESHOLDS = {
+    "ingress_error_cnt": RateThreshold(degraded=1.0, failed=1000.0),
+    "size_error_cnt": RateThreshold(degraded=1.0, failed=1000.0),
+    "wrong_dst_mac_cnt": RateThreshold(degraded=1.0, failed=1000.0),
+    "wrong_src_mac_cnt": RateThreshold(degraded=1.0, failed=1000.0),
+    "wrong_ethertype_cnt": RateThreshold(degraded=1.0, failed=1000.0),
+    "wrong_antenna_id_cnt": RateThreshold(degraded=1.0, failed=1000.0),
+}
+"""The default health thresholds on the rates of the Packet Validation error counters, in counts per second,
+which can be overridden by the ``health_rate_thresholds`` property of the IP block."""
+
 
 @dataclass
 class PacketValidationConfig(DataClassJsonMixin):
@@ -24,7 +57,7 @@ class PacketValidationConfig(DataClassJsonMixin):
 # status class that will be populated by the APIs and returned to provide the status of Packet Validation
 ##
 @dataclass
-class PacketValidationStatus(DataClassJsonMixin):
+class PacketValidationStatus(CompiledDecoderMixin):
     drop_dst_mac: bool = True
     drop_src_mac: bool = True
     drop_ethertype: bool = True
@@ -46,8 +79,19 @@ class PacketValidationStatus(DataClassJsonMixin):
     wrong_antenna_id_cnt: np.uint32 = 0
 
 
-class PacketValidationManager(BaseIPBlockManager[PacketValidationConfig, PacketValidationStatus]):
-    """Packet Validation IP block manager."""
+class PacketValidationManager(BaseMonitoringIPBlockManager[PacketValidationConfig, PacketValidationStatus]):
+    """Packet Validation IP block manager.
+
+    While started, the health of the block is polled on the process-wide :obj:`PollScheduler` every
+    ``health_monitor_poll_interval`` seconds, rather than by its own health monitor thread. Each poll samples the counters of
+    the block, and the health is derived from the rates of its error counters rather than from their absolute values,
+    so that errors counted before a scan do not keep the block unhealthy.
+    """
+
+    def __init__(self, *args, update_health_state_callback: Callable[[HealthState], None] | None = None, **kwargs):
+        self._update_health_state_callback = update_health_state_callback
+        self._health_monitor_poll_interval = kwargs.get("health_monitor_poll_interval")
+        super().__init__(*args, update_health_state_callback=update_health_state_callback, **kwargs)
 
     @property
     def config_dataclass(self) -> type[PacketValidationConfig]:
@@ -64,6 +108,34 @@ class PacketValidationManager(BaseIPBlockManager[PacketValidationConfig, PacketV
         """:obj:`type[PacketValidationSimulator]`: The simulator API class for the Packet Validation block."""
         return PacketValidationSimulator
 
+    def _manager_specific_setup(self, **kwargs):
+        self.counter_rates = CounterRateEngine(PACKET_VALIDATION_COUNTERS)
+        self.rate_thresholds = parse_rate_thresholds(kwargs.get("health_rate_thresholds"), PACKET_VALIDATION_COUNTER_RATE_THRESHOLDS)
+        self.record_status: Callable[[PacketValidationStatus], Any] | None = None
+        """:obj:`Callable[[PacketValidationStatus], Any] | None`: Records each status read by the health polls, if set."""
+        self.last_status: PacketValidationStatus | None = None
+        """:obj:`PacketValidationStatus | None`: The status read by the most recent health poll, if any."""
+        self.health_evaluator = IncrementalHealthEvaluator(
+            [rate_health_check(self.counter_rates, name, threshold) for name, threshold in self.rate_thresholds.items()],
+            self.logger,
+            summary_interval=float(kwargs.get("health_summary_interval", HEALTH_SUMMARY_INTERVAL)),
+        )
+        poll_interval = PACKET_VALIDATION_HEALTH_MONITOR_POLL_INTERVAL
+        if self._health_monitor_poll_interval is not None:
+            poll_interval = float(self._health_monitor_poll_interval)
+        self.scheduled_health_monitor = ScheduledHealthMonitor(
+            self,
+            AdaptivePollInterval(poll_interval, poll_interval),
+            update_health_state_callback=self._update_health_state_callback,
+        )
+
+    def configure(self, config: PacketValidationConfig) -> int:
+        """Configure the Packet Validation."""
+        result = super().configure(config)
+        if config.clr_cnt:
+            self.counter_rates.reset()
+        return result
+
     def deconfigure(self, config: PacketValidationConfig | None):
         """Deconfigure the Packet Validation."""
         if config is None:
@@ -72,8 +144,64 @@ class PacketValidationManager(BaseIPBlockManager[PacketValidationConfig, PacketV
 
     @non_blocking
     def start(self) -> int:
-        return super().start()
+        result = super().start()
+        if result == 0:
+            self.health_evaluator.reset()
+            self.counter_rates.reset()
+            self.scheduled_health_monitor.start()
+        return result
 
     @non_blocking
     def stop(self) -> int:
+        self.scheduled_health_monitor.stop()
         return super().stop()
+
+    def get_health_state(self) -> HealthState:
+        """Get the health state of the Packet Validation block, as of its most recent health poll.
+
+        Returns:
+            :obj:`HealthState`: The health state.
+        """
+        return self.scheduled_health_monitor.health_state
+
+    def get_status_healthstates(self, status: PacketValidationStatus) -> dict[str, HealthState]:
+        """Get the health state of the rate of each error counter, updating the rates with the counters of the status.
+
+        Health state changes are logged when a rate crosses a threshold rather than on every poll, along with a periodic
+        summary of the health state of every rate.
+        """
+        self.last_status = status
+        if self.record_status is not None:
+            self.record_status(status)
+        self.counter_rates.update(status)
+        return self.health_evaluator.evaluate(status)
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Describe the packets most recently dropped by each check of the Packet Validation block, as of its most recent health poll.
+
+        Returns:
+            :obj:`dict[str, Any]`: For each of the "dst_mac", "src_mac", "ethertype" and "antenna_id" checks, the "expected"
+            value, the "last_wrong" value received and the "count" of packets which failed the check; empty before the first poll.
+        """
+        status = self.last_status
+        if status is None:
+            return {}
+        return {
+            "dst_mac": _check_diagnostics(status.exp_dst_mac, status.last_wrong_dst_mac, status.wrong_dst_mac_cnt, _format_mac),
+            "src_mac": _check_diagnostics(status.exp_src_mac, status.last_wrong_src_mac, status.wrong_src_mac_cnt, _format_mac),
+            "ethertype": _check_diagnostics(status.exp_ethertype, status.last_wrong_ethertype, status.wrong_ethertype_cnt, "0x{:04x}".format),
+            "antenna_id": _check_diagnostics(status.exp_antenna_id, status.last_wrong_antenna_id, status.wrong_antenna_id_cnt, int),
+        }
+
+
+def _format_mac(value: int) -> str:
+    return ":".join(f"{byte:02x}" for byte in (int(value) & 0xFFFFFFFFFFFF).to_bytes(6, "big"))
+
+
+def _check_diagnostics(expected: Any, last_wrong: Any, count: Any, format_value: Callable[[int], Any]) -> dict[str, Any]:
+    # The last wrong value is only meaningful once a packet failed the check
+    return {
+        "expected": format_value(int(expected)),
+        "last_wrong": format_value(int(last_wrong)) if int(count) else None,
+        "count": int(count),
+    }
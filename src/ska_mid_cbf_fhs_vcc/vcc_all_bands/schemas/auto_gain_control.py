@@ -0,0 +1,14 @@
+vcc_all_bands_auto_gain_control_schema = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "VCC All Bands Start Auto Gain Control Command Schema",
+    "description": "Schema object for the StartAutoGainControl command describing what properties the command can have and which ones are required",
+    "type": "object",
+    "properties": {
+        "headrooms": {"type": "array", "items": {"type": "number"}, "minItems": 1},
+        "period": {"type": "number", "exclusiveMinimum": 0},
+        "hysteresis_db": {"type": "number", "minimum": 0},
+        "min_update_interval": {"type": "number", "minimum": 0},
+        "transaction_id": {"type": "string"},
+    },
+    "required": [],
+}
@@ -5,6 +5,8 @@ vcc_all_bands_auto_set_filter_gains_schema = {
     "type": "object",
     "properties": {
         "headrooms": {"type": "list[float]"},
+        "power_statistic": {"type": "string", "enum": ["mean", "median", "percentile"]},
+        "power_window": {"type": "number", "exclusiveMinimum": 0},
         "transaction_id": {"type": "string"},
     },
     "required": [],
@@ -0,0 +1,14 @@
+vcc_all_bands_auto_set_fleet_filter_gains_schema = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "VCC All Bands Auto Set Fleet Filter Gains Command Schema",
+    "description": "Schema object for the AutoSetFleetFilterGains command describing what properties the command can have and which ones are required",
+    "type": "object",
+    "properties": {
+        "headrooms": {"type": "array", "items": {"type": "number"}, "minItems": 1},
+        "power_statistic": {"type": "string", "enum": ["mean", "median", "percentile"]},
+        "power_window": {"type": "number", "exclusiveMinimum": 0},
+        "require_all": {"type": "boolean"},
+        "transaction_id": {"type": "string"},
+    },
+    "required": [],
+}
@@ -27,6 +27,7 @@ vcc_all_bands_configure_scan_schema = {
         "vcc_gain": {"type": "array", "items": {"type": "number"}},
         "noise_diode_transition_holdoff_seconds": {"type": "integer", "minimum": 0, "maximum": 65535},
         "band_5_tuning": {"type": "number"},
+        "force_full_configure": {"type": "boolean"},
         "b123_pwrm": {"type": "object", "properties": {"averaging_time": {"type": "integer"}, "flagging": {"type": "integer"}}},
         "b45a_pwrm": {"type": "object", "properties": {"averaging_time": {"type": "integer"}, "flagging": {"type": "integer"}}},
         "b5b_pwrm": {"type": "object", "properties": {"averaging_time": {"type": "integer"}, "flagging": {"type": "integer"}}},
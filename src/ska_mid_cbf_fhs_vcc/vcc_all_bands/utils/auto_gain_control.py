@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Generic, TypeVar
+
+import numpy as np
+
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollJob, PollScheduler
+
+__all__ = ["AutoGainControlLoop", "apply_gain_hysteresis"]
+
+ConfigT = TypeVar("ConfigT")
+
+
+def apply_gain_hysteresis(current: list[float] | np.ndarray, proposed: list[float] | np.ndarray, hysteresis_db: float) -> tuple[np.ndarray, np.ndarray]:
+    """Keep the current gains of every channel whose proposed gain is within the hysteresis band.
+
+    Args:
+        current (:obj:`list[float] | np.ndarray`): The currently applied gain multipliers.
+        proposed (:obj:`list[float] | np.ndarray`): The newly computed gain multipliers, in the same format.
+        hysteresis_db (:obj:`float`): The change in gain, in decibels (dB), a channel must exceed to be updated.
+
+    Returns:
+        :obj:`tuple[np.ndarray, np.ndarray]`: The gains to apply, and a boolean mask of the channels whose gain changed.
+    """
+    current = np.asarray(current, dtype=np.float64)
+    proposed = np.asarray(proposed, dtype=np.float64)
+    if current.shape != proposed.shape:
+        # Nothing sensible to hold on to, e.g. before the first configuration
+        return proposed, np.ones(proposed.shape, dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_db = np.abs(20.0 * np.log10(proposed / current))
+    # Non-positive current gains give a NaN/inf change, and are always replaced
+    changed = ~(change_db <= hysteresis_db)
+    return np.where(changed, proposed, current), changed
+
+
+class AutoGainControlLoop(Generic[ConfigT]):
+    """Periodically runs an automatic gain control step while a condition holds, as a job of a :obj:`PollScheduler`
+    rather than on a thread of its own.
+
+    The step is run every ``period`` seconds of the active configuration, and returns whether it wrote new
+    gains; after a write, the loop waits at least ``min_update_interval`` seconds before running the step again,
+    which bounds the rate of channelizer writes.
+    """
+
+    def __init__(
+        self,
+        step: Callable[[ConfigT], bool],
+        should_run: Callable[[], bool],
+        logger: logging.Logger,
+        name: str = "auto_gain_control",
+        scheduler: PollScheduler | None = None,
+    ) -> None:
+        """
+        Args:
+            step (:obj:`Callable[[ConfigT], bool]`): Samples the power meters and applies new gains if needed,
+                returning whether gains were written.
+            should_run (:obj:`Callable[[], bool]`): Whether the step should currently be run, e.g. while scanning.
+            logger (:obj:`logging.Logger`): Logger for step failures.
+            name (:obj:`str`, optional): The name of the poll job. Default is "auto_gain_control".
+            scheduler (:obj:`PollScheduler | None`, optional): The scheduler running the loop. Default is None,
+                using the process-wide :obj:`PollScheduler.shared` scheduler.
+        """
+        self._step = step
+        self._should_run = should_run
+        self._logger = logger
+        self._name = name
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._job: PollJob | None = None
+        self._config: ConfigT | None = None
+        self._last_write: float | None = None
+        self.samples = 0
+        self.updates = 0
+        self.errors = 0
+        self.last_update_at: float | None = None
+
+    @property
+    def running(self) -> bool:
+        """:obj:`bool`: Whether the loop is started."""
+        return self._job is not None
+
+    @property
+    def config(self) -> ConfigT | None:
+        """:obj:`ConfigT | None`: The configuration of the running loop, if any."""
+        return self._config if self.running else None
+
+    def start(self, config: ConfigT) -> None:
+        """Start the loop, restarting it with the new configuration if it is already running.
+
+        Args:
+            config (:obj:`ConfigT`): The loop configuration, which must provide ``period`` and ``min_update_interval``, in seconds.
+        """
+        with self._lock:
+            self._stop_locked()
+            self._config = config
+            self._last_write = None
+            scheduler = self._scheduler if self._scheduler is not None else PollScheduler.shared()
+            self._job = scheduler.schedule(functools.partial(self._poll, config), self._name, self._logger)
+
+    def stop(self) -> bool:
+        """Stop the loop, waiting for an in-progress step to complete.
+
+        Returns:
+            :obj:`bool`: Whether the loop was running.
+        """
+        with self._lock:
+            return self._stop_locked()
+
+    def status(self) -> dict[str, Any]:
+        """Describe the state of the loop as a JSON-serializable dict."""
+        return {
+            "running": self.running,
+            "samples": self.samples,
+            "updates": self.updates,
+            "errors": self.errors,
+            "last_update_at": self.last_update_at,
+        }
+
+    def _stop_locked(self) -> bool:
+        if self._job is None:
+            return False
+        self._job.cancel()
+        self._job = None
+        return True
+
+    def _poll(self, config: ConfigT) -> float:
+        if not self._should_run():
+            return config.period
+
+        # Poll deadlines are jittered, so the minimum update interval is enforced here rather than by the delay alone
+        if self._last_write is not None:
+            remaining = self._last_write + config.min_update_interval - time.monotonic()
+            if remaining > 0:
+                return remaining
+
+        self.samples += 1
+        try:
+            wrote = self._step(config)
+        except Exception as ex:
+            self.errors += 1
+            self._logger.exception(f"Automatic gain control step failed: {ex!r}")
+            return config.period
+
+        if not wrote:
+            return config.period
+        self.updates += 1
+        self.last_update_at = time.time()
+        self._last_write = time.monotonic()
+        return max(config.period, config.min_update_interval)
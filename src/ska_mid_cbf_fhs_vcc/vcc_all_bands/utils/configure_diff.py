@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+__all__ = ["configuration_diff"]
+
+
+def configuration_diff(previous: Any, current: Any, path: str = "") -> set[str]:
+    """Compute the field-level differences between two configuration dataclasses.
+
+    Nested dataclasses are compared field by field, and lists of dataclasses element by element,
+    so that e.g. a changed flagging value on the fourth FS lane is reported as ``fs_lanes.3.flagging``.
+    Lists of plain values (such as the gain vector) are reported as a whole, and lists whose lengths
+    differ are reported by the path of the list itself.
+
+    Args:
+        previous (:obj:`Any`): The previously applied configuration.
+        current (:obj:`Any`): The new configuration.
+        path (:obj:`str`, optional): The dotted path of the values being compared. Default is "" (the root).
+
+    Returns:
+        :obj:`set[str]`: The dotted paths of all fields whose values differ.
+    """
+    if dataclasses.is_dataclass(previous) and type(previous) is type(current):
+        changed = set()
+        for field in dataclasses.fields(previous):
+            changed |= configuration_diff(getattr(previous, field.name), getattr(current, field.name), _join(path, field.name))
+        return changed
+
+    if isinstance(previous, list) and isinstance(current, list) and len(previous) == len(current):
+        if any(dataclasses.is_dataclass(item) for item in previous):
+            changed = set()
+            for i, (previous_item, current_item) in enumerate(zip(previous, current)):
+                changed |= configuration_diff(previous_item, current_item, _join(path, str(i)))
+            return changed
+
+    return set() if previous == current else {path}
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
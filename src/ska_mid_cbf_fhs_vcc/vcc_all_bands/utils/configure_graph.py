@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable
+
+__all__ = ["ConfigureStep", "ConfigureStepResult", "ConfigureGraphReport", "ConfigureGraphExecutor", "rollback_steps", "select_steps"]
+
+
+@dataclass(frozen=True)
+class ConfigureStep:
+    """A single IP block programming step, modelled as a node in a configuration graph."""
+
+    name: str
+    """:obj:`str`: Unique name of the step within its graph."""
+
+    description: str
+    """:obj:`str`: Human-readable name of the block(s) programmed by this step, used in log and error messages."""
+
+    run: Callable[[], int]
+    """:obj:`Callable[[], int]`: Function performing the step, returning 0 on success or 1 on failure."""
+
+    depends_on: tuple[str, ...] = ()
+    """:obj:`tuple[str, ...]`: Names of the steps which must complete successfully before this step may start."""
+
+
+@dataclass
+class ConfigureStepResult:
+    """The outcome of running a single :obj:`ConfigureStep`."""
+
+    step: ConfigureStep
+    result: int
+    duration: float
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """:obj:`bool`: Whether the step completed without raising and without returning a failure code."""
+        return self.error is None and self.result != 1
+
+
+@dataclass
+class ConfigureGraphReport:
+    """The outcome of running a full configuration graph."""
+
+    results: dict[str, ConfigureStepResult] = field(default_factory=dict)
+    """:obj:`dict[str, ConfigureStepResult]`: Results of every step that was run, mapped by step name."""
+
+    failed: ConfigureStepResult | None = None
+    """:obj:`ConfigureStepResult | None`: The first step to fail, or None if all steps succeeded."""
+
+    skipped: list[str] = field(default_factory=list)
+    """:obj:`list[str]`: Names of the steps that were never started because an earlier step failed."""
+
+    duration: float = 0.0
+    """:obj:`float`: Wall-clock duration of the whole graph, in seconds."""
+
+    @property
+    def succeeded(self) -> bool:
+        """:obj:`bool`: Whether every step in the graph succeeded."""
+        return self.failed is None
+
+    @property
+    def failures(self) -> list[ConfigureStepResult]:
+        """:obj:`list[ConfigureStepResult]`: Results of every step that failed, in completion order."""
+        return [result for result in self.results.values() if not result.succeeded]
+
+    def timings(self) -> dict[str, float]:
+        """Get the duration of every step that was run.
+
+        Returns:
+            :obj:`dict[str, float]`: Step durations in seconds, mapped by step name, in completion order.
+        """
+        return {name: result.duration for name, result in self.results.items()}
+
+    def format_timings(self) -> str:
+        """Format the step timings as a compact single-line string suitable for logging."""
+        step_timings = ", ".join(f"{name}={duration * 1000:.1f}ms" for name, duration in self.timings().items())
+        return f"total={self.duration * 1000:.1f}ms [{step_timings}]"
+
+
+def select_steps(steps: list[ConfigureStep], names: set[str]) -> list[ConfigureStep]:
+    """Extract the subgraph containing only the named steps.
+
+    Dependencies on steps outside of the subgraph are dropped, since those steps are
+    not being re-run and are therefore already in their required state.
+
+    Args:
+        steps (:obj:`list[ConfigureStep]`): The steps making up the full graph.
+        names (:obj:`set[str]`): The names of the steps to keep.
+
+    Returns:
+        :obj:`list[ConfigureStep]`: The steps making up the subgraph.
+    """
+    return [
+        dataclasses.replace(step, depends_on=tuple(dependency for dependency in step.depends_on if dependency in names)) for step in steps if step.name in names
+    ]
+
+
+def rollback_steps(report: ConfigureGraphReport, undo_steps: dict[str, ConfigureStep]) -> list[ConfigureStep]:
+    """Build the graph undoing every step which was run in a (failed) configuration graph.
+
+    Every step that was started is undone, including a step which failed part-way through, while
+    steps that never started are left alone. Dependencies are reversed, so that a step is only undone
+    once all of the steps which depended on it have been undone; undo steps without such a relationship
+    can run concurrently.
+
+    Args:
+        report (:obj:`ConfigureGraphReport`): The report of the configuration graph to undo.
+        undo_steps (:obj:`dict[str, ConfigureStep]`): The step undoing each configuration step, mapped by the name
+            of the configuration step. Any dependencies declared on these steps are ignored.
+
+    Returns:
+        :obj:`list[ConfigureStep]`: The steps making up the rollback graph, named after the steps they undo.
+    """
+    touched = [name for name in report.results if name in undo_steps]
+    dependents: dict[str, list[str]] = {name: [] for name in touched}
+    for name in touched:
+        for dependency in report.results[name].step.depends_on:
+            if dependency in dependents:
+                dependents[dependency].append(name)
+
+    return [dataclasses.replace(undo_steps[name], name=name, depends_on=tuple(dependents[name])) for name in touched]
+
+
+class ConfigureGraphExecutor:
+    """Runs a graph of :obj:`ConfigureStep` nodes, executing independent steps concurrently
+    on a bounded thread pool while respecting the dependencies between them.
+
+    Execution is fail-fast: once any step fails, no further steps are started, while steps
+    already in flight are allowed to finish (driver calls cannot be safely interrupted).
+    """
+
+    def __init__(self, max_workers: int = 8, thread_name_prefix: str = "configure_graph") -> None:
+        """
+        Args:
+            max_workers (:obj:`int`, optional): The maximum number of steps to run concurrently. Default is 8.
+            thread_name_prefix (:obj:`str`, optional): Prefix for the names of the worker threads. Default is "configure_graph".
+        """
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+    def run(self, steps: list[ConfigureStep], fail_fast: bool = True) -> ConfigureGraphReport:
+        """Run all steps in the graph.
+
+        Args:
+            steps (:obj:`list[ConfigureStep]`): The steps making up the graph.
+            fail_fast (:obj:`bool`, optional): Whether to stop starting new steps once any step fails. Default is True.
+                When False (e.g. for best-effort rollback), a failed step releases its dependents as if it had succeeded.
+
+        Returns:
+            :obj:`ConfigureGraphReport`: A report containing the result and timing of every step run.
+
+        Raises:
+            :obj:`ValueError`: If step names are not unique, a dependency refers to an unknown step,
+                or the graph contains a cycle.
+        """
+        steps_by_name = {step.name: step for step in steps}
+        if len(steps_by_name) != len(steps):
+            raise ValueError("Configure step names must be unique")
+
+        remaining_dependencies: dict[str, set[str]] = {}
+        dependents: dict[str, list[str]] = {name: [] for name in steps_by_name}
+        for step in steps:
+            for dependency in step.depends_on:
+                if dependency not in steps_by_name:
+                    raise ValueError(f"Configure step {step.name} depends on unknown step {dependency}")
+                dependents[dependency].append(step.name)
+            remaining_dependencies[step.name] = set(step.depends_on)
+
+        report = ConfigureGraphReport()
+        ready = [name for name, dependencies in remaining_dependencies.items() if not dependencies]
+        in_flight: dict[Future, str] = {}
+        start_time = time.monotonic()
+
+        while ready or in_flight:
+            if report.failed is None or not fail_fast:
+                for name in ready:
+                    in_flight[self._pool.submit(self._run_step, steps_by_name[name])] = name
+            ready = []
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = in_flight.pop(future)
+                result = future.result()
+                report.results[name] = result
+
+                if not result.succeeded:
+                    if report.failed is None:
+                        report.failed = result
+                    if fail_fast:
+                        continue
+
+                for dependent in dependents[name]:
+                    remaining_dependencies[dependent].discard(name)
+                    if not remaining_dependencies[dependent]:
+                        ready.append(dependent)
+
+        report.duration = time.monotonic() - start_time
+        report.skipped = [name for name in steps_by_name if name not in report.results]
+
+        if report.skipped and (report.failed is None or not fail_fast):
+            raise ValueError(f"Configure graph contains a dependency cycle between steps {report.skipped}")
+
+        return report
+
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for steps in flight, cancelling any queued steps."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run_step(step: ConfigureStep) -> ConfigureStepResult:
+        start_time = time.monotonic()
+        try:
+            result = step.run()
+            return ConfigureStepResult(step=step, result=result, duration=time.monotonic() - start_time)
+        except Exception as ex:
+            return ConfigureStepResult(step=step, result=1, duration=time.monotonic() - start_time, error=ex)
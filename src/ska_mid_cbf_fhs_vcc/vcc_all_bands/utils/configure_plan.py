@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import numpy as np
+from ska_mid_cbf_fhs_common import WidebandPowerMeterConfig
+
+from ska_mid_cbf_fhs_vcc.b123_vcc_osppfb_channelizer.b123_vcc_osppfb_channelizer_manager import B123VccOsppfbChannelizerConfigureArgin
+from ska_mid_cbf_fhs_vcc.frequency_slice_selection.frequency_slice_selection_manager import FrequencySliceSelectionConfig
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup, freq_band_dict
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import VCCAllBandsConfigureScanConfig
+from ska_mid_cbf_fhs_vcc.vcc_stream_merge.vcc_stream_merge_manager import LANE_TABLE_DTYPE
+from ska_mid_cbf_fhs_vcc.wideband_frequency_shifter.wideband_frequency_shifter_manager import WidebandFrequencyShifterConfig
+from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_manager import WidebandInputBufferConfig
+
+__all__ = ["ConfigurePlan", "StagedConfiguration", "build_configure_plan"]
+
+LANES_PER_STREAM_MERGE = 13
+"""The number of FS lanes routed through each of the two VCC Stream Merges."""
+
+
+@dataclass(frozen=True)
+class ConfigurePlan:
+    """An immutable, compiled ConfigureScan: the exact per-block configurations sent to the IP block managers.
+
+    Plans are shared between ConfigureScan calls through the cache of a :obj:`ConfigureScanParser`, so none of the
+    configurations held by a plan may be modified; use :obj:`with_transaction_id` to re-target a plan.
+    """
+
+    fingerprint: str
+    """:obj:`str`: Fingerprint of the ConfigureScan configuration the plan was compiled from."""
+
+    configuration: VCCAllBandsConfigureScanConfig
+    """:obj:`VCCAllBandsConfigureScanConfig`: The decoded ConfigureScan configuration."""
+
+    channelizer: B123VccOsppfbChannelizerConfigureArgin
+    """:obj:`B123VccOsppfbChannelizerConfigureArgin`: The B123 channelizer sample rate and gains."""
+
+    wideband_frequency_shifter: WidebandFrequencyShifterConfig
+    """:obj:`WidebandFrequencyShifterConfig`: The Wideband Frequency Shifter configuration."""
+
+    frequency_slice_selection: FrequencySliceSelectionConfig
+    """:obj:`FrequencySliceSelectionConfig`: The FS Selection configuration."""
+
+    wideband_input_buffer: WidebandInputBufferConfig
+    """:obj:`WidebandInputBufferConfig`: The WIB configuration."""
+
+    pre_channelizer_power_meters: Mapping[VCCBandGroup, WidebandPowerMeterConfig]
+    """:obj:`Mapping[VCCBandGroup, WidebandPowerMeterConfig]`: The pre-channelizer power meter configurations, mapped by band group."""
+
+    fs_power_meters: Mapping[int, WidebandPowerMeterConfig]
+    """:obj:`Mapping[int, WidebandPowerMeterConfig]`: The post-channelizer power meter configurations, mapped by FS index."""
+
+    lane_tables: Mapping[int, np.ndarray]
+    """:obj:`Mapping[int, np.ndarray]`: The read-only lane tables (see :obj:`LANE_TABLE_DTYPE`), mapped by stream merge index (1 or 2)."""
+
+    compiled_at: float = field(default_factory=time.time)
+    """:obj:`float`: The time at which the plan was compiled, as a POSIX timestamp."""
+
+    @property
+    def config_id(self) -> str:
+        """:obj:`str`: The config ID of the configuration the plan was compiled from."""
+        return self.configuration.config_id
+
+    @property
+    def transaction_id(self) -> str | None:
+        """:obj:`str | None`: The transaction ID the plan's block configurations are tagged with."""
+        return self.configuration.transaction_id
+
+    def with_transaction_id(self, transaction_id: str | None) -> ConfigurePlan:
+        """Get a copy of the plan with every block configuration tagged with a new transaction ID.
+
+        Only the small per-block configuration objects are copied; gains, lane tables and other
+        compiled values are shared with the original plan.
+
+        Args:
+            transaction_id (:obj:`str | None`): The transaction ID of the ConfigureScan applying the plan.
+
+        Returns:
+            :obj:`ConfigurePlan`: The re-targeted plan, or this plan if the transaction ID is unchanged.
+        """
+        if transaction_id == self.transaction_id:
+            return self
+
+        def retag(config):
+            return dataclasses.replace(config, transaction_id=transaction_id)
+
+        return dataclasses.replace(
+            self,
+            configuration=retag(self.configuration),
+            channelizer=retag(self.channelizer),
+            wideband_frequency_shifter=retag(self.wideband_frequency_shifter),
+            frequency_slice_selection=retag(self.frequency_slice_selection),
+            wideband_input_buffer=retag(self.wideband_input_buffer),
+            pre_channelizer_power_meters=MappingProxyType({key: retag(config) for key, config in self.pre_channelizer_power_meters.items()}),
+            fs_power_meters=MappingProxyType({key: retag(config) for key, config in self.fs_power_meters.items()}),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the plan as a JSON-serializable dict, for debugging.
+
+        Returns:
+            :obj:`dict[str, Any]`: The plan summary and every block configuration it would send.
+        """
+        return {
+            "fingerprint": self.fingerprint,
+            "config_id": self.config_id,
+            "compiled_at": self.compiled_at,
+            "channelizer": _block_config_dict(self.channelizer),
+            "wideband_frequency_shifter": _block_config_dict(self.wideband_frequency_shifter),
+            "frequency_slice_selection": _block_config_dict(self.frequency_slice_selection),
+            "wideband_input_buffer": _block_config_dict(self.wideband_input_buffer),
+            "pre_channelizer_power_meters": {key.value: _block_config_dict(config) for key, config in self.pre_channelizer_power_meters.items()},
+            "fs_power_meters": {str(key): _block_config_dict(config) for key, config in self.fs_power_meters.items()},
+            "lane_tables": {str(key): [dict(zip(LANE_TABLE_DTYPE.names, row)) for row in table.tolist()] for key, table in self.lane_tables.items()},
+        }
+
+
+@dataclass(frozen=True)
+class StagedConfiguration:
+    """A configuration prepared ahead of its ConfigureScan by the PrepareConfiguration command,
+    so that the ConfigureScan only needs to program the IP blocks.
+    """
+
+    plan: ConfigurePlan
+    """:obj:`ConfigurePlan`: The compiled plan for the prepared configuration."""
+
+    base_configuration: VCCAllBandsConfigureScanConfig | None
+    """:obj:`VCCAllBandsConfigureScanConfig | None`: The configuration that was applied when the plan was
+    staged, which :obj:`changed_steps` is relative to."""
+
+    changed_steps: frozenset[str] | None
+    """:obj:`frozenset[str] | None`: The ConfigureScan steps to run when committing the plan on top of
+    :obj:`base_configuration`, or None if a full configuration is required."""
+
+    staged_at: float = field(default_factory=time.time)
+    """:obj:`float`: The time at which the configuration was staged, as a POSIX timestamp."""
+
+
+def build_configure_plan(configuration: VCCAllBandsConfigureScanConfig, fingerprint: str, vcc_id: int) -> ConfigurePlan:
+    """Compile a ConfigureScan configuration into the per-block configurations sent to the IP block managers.
+
+    Args:
+        configuration (:obj:`VCCAllBandsConfigureScanConfig`): The decoded ConfigureScan configuration.
+        fingerprint (:obj:`str`): The fingerprint of the configuration.
+        vcc_id (:obj:`int`): The ID of the VCC being configured, written into the stream merge lane tables.
+
+    Returns:
+        :obj:`ConfigurePlan`: The compiled plan.
+    """
+    transaction_id = configuration.transaction_id
+    band_index = freq_band_dict()[configuration.frequency_band].value + 1  # FW Drivers rely on integer indexes, that are 1-based
+
+    def power_meter_config(config) -> WidebandPowerMeterConfig:
+        return WidebandPowerMeterConfig(transaction_id=transaction_id, averaging_time=config.averaging_time, flagging=config.flagging)
+
+    lane_tables = {}
+    for i in range(1, 3):
+        lanes = configuration.fs_lanes[LANES_PER_STREAM_MERGE * (i - 1) : LANES_PER_STREAM_MERGE * i]
+        lane_table = np.array([(lane.vlan_id, vcc_id, lane.fs_id) for lane in lanes], dtype=LANE_TABLE_DTYPE)
+        lane_table.setflags(write=False)
+        lane_tables[i] = lane_table
+
+    return ConfigurePlan(
+        fingerprint=fingerprint,
+        configuration=configuration,
+        channelizer=B123VccOsppfbChannelizerConfigureArgin(
+            sample_rate=configuration.dish_sample_rate,
+            gains=configuration.vcc_gain,
+            transaction_id=transaction_id,
+        ),
+        wideband_frequency_shifter=WidebandFrequencyShifterConfig(
+            shift_frequency=configuration.frequency_band_offset_stream_1,
+            transaction_id=transaction_id,
+        ),
+        frequency_slice_selection=FrequencySliceSelectionConfig(
+            band_select=band_index,
+            band_start_channel=[0, 1],
+            transaction_id=transaction_id,
+        ),
+        wideband_input_buffer=WidebandInputBufferConfig(
+            transaction_id=transaction_id,
+            expected_sample_rate=configuration.dish_sample_rate,
+            noise_diode_transition_holdoff_seconds=configuration.noise_diode_transition_holdoff_seconds,
+            expected_dish_band=band_index,
+        ),
+        pre_channelizer_power_meters=MappingProxyType(
+            {
+                VCCBandGroup.B123: power_meter_config(configuration.b123_pwrm),
+                VCCBandGroup.B45A: power_meter_config(configuration.b45a_pwrm),
+                VCCBandGroup.B5B: power_meter_config(configuration.b5b_pwrm),
+            }
+        ),
+        fs_power_meters=MappingProxyType({int(lane.fs_id): power_meter_config(lane) for lane in configuration.fs_lanes}),
+        lane_tables=MappingProxyType(lane_tables),
+    )
+
+
+def _block_config_dict(config: Any) -> dict[str, Any]:
+    return {key: value.item() if isinstance(value, np.generic) else value for key, value in dataclasses.asdict(config).items()}
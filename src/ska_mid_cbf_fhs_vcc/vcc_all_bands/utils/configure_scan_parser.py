@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+
+import jsonschema
+from pydantic import TypeAdapter
+
+from ska_mid_cbf_fhs_vcc.helpers.bounded_lru_cache import BoundedLRUCache
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.schemas.configure_scan import vcc_all_bands_configure_scan_schema
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import VCCAllBandsConfigureScanConfig
+
+__all__ = ["ConfigureScanParser", "configure_scan_fingerprint"]
+
+CONFIGURE_SCAN_PARSER_CACHE_SIZE = 16
+"""The default number of parsed ConfigureScan configurations kept by a :obj:`ConfigureScanParser`."""
+
+PlanT = TypeVar("PlanT")
+
+# Built once at import: checking the schema and resolving the validator class
+# are the expensive parts of jsonschema.validate()
+_configure_scan_validator_class = jsonschema.validators.validator_for(vcc_all_bands_configure_scan_schema)
+_configure_scan_validator_class.check_schema(vcc_all_bands_configure_scan_schema)
+_configure_scan_validator = _configure_scan_validator_class(vcc_all_bands_configure_scan_schema)
+
+# Decodes the nested dict straight into the (pydantic) configuration dataclasses in a single
+# validation pass, rather than walking the document again in DataClassJsonMixin.from_dict
+_configure_scan_decoder = TypeAdapter(VCCAllBandsConfigureScanConfig)
+
+
+def configure_scan_fingerprint(document: dict[str, Any]) -> str:
+    """Compute a fingerprint of a ConfigureScan document which is independent of key order and of the transaction ID.
+
+    Args:
+        document (:obj:`dict[str, Any]`): The decoded ConfigureScan argin.
+
+    Returns:
+        :obj:`str`: The hex digest identifying the configuration.
+    """
+    canonical = json.dumps({key: value for key, value in document.items() if key != "transaction_id"}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class _ParsedConfiguration(Generic[PlanT]):
+    """A cache entry of a :obj:`ConfigureScanParser`: a decoded configuration and, once compiled, its plan."""
+
+    configuration: VCCAllBandsConfigureScanConfig
+    plan: PlanT | None = None
+
+
+class ConfigureScanParser(Generic[PlanT]):
+    """Validates and decodes ConfigureScan argins, caching the decoded configurations in a bounded LRU.
+
+    A resubmitted configuration which only differs in its transaction ID (or key order) skips
+    schema validation and decoding entirely, and is returned with the new transaction ID applied.
+    Cached configurations are shared between calls, so callers must treat them as immutable.
+
+    Each configuration can also be compiled into a plan by the ``compile_plan`` function, which is
+    compiled once and kept in the same cache entry as the configuration (see :obj:`plan`).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CONFIGURE_SCAN_PARSER_CACHE_SIZE,
+        compile_plan: Callable[[VCCAllBandsConfigureScanConfig, str], PlanT] | None = None,
+    ) -> None:
+        """
+        Args:
+            max_entries (:obj:`int`, optional): The maximum number of parsed configurations to cache.
+                Default is :obj:`CONFIGURE_SCAN_PARSER_CACHE_SIZE`.
+            compile_plan (:obj:`Callable[[VCCAllBandsConfigureScanConfig, str], PlanT] | None`, optional): Compiles
+                a decoded configuration and its fingerprint into a plan. Default is None, in which case :obj:`plan`
+                is not available.
+        """
+        self._compile_plan = compile_plan
+        self._cache: BoundedLRUCache[str, _ParsedConfiguration[PlanT]] = BoundedLRUCache(max_entries)
+
+    @property
+    def hits(self) -> int:
+        """:obj:`int`: The number of argins served from the cache."""
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        """:obj:`int`: The number of argins which had to be validated and decoded."""
+        return self._cache.misses
+
+    def parse(self, argin: str) -> VCCAllBandsConfigureScanConfig:
+        """Validate and decode a ConfigureScan argin.
+
+        Args:
+            argin (:obj:`str`): The ConfigureScan JSON string.
+
+        Returns:
+            :obj:`VCCAllBandsConfigureScanConfig`: The decoded configuration.
+
+        Raises:
+            :obj:`jsonschema.ValidationError`: If the argin does not match the ConfigureScan schema.
+            :obj:`pydantic.ValidationError`: If the argin cannot be decoded into the configuration dataclass.
+        """
+        return self.parse_with_fingerprint(argin)[1]
+
+    def parse_with_fingerprint(self, argin: str) -> tuple[str, VCCAllBandsConfigureScanConfig]:
+        """Validate and decode a ConfigureScan argin, also returning its fingerprint.
+
+        Args:
+            argin (:obj:`str`): The ConfigureScan JSON string.
+
+        Returns:
+            :obj:`tuple[str, VCCAllBandsConfigureScanConfig]`: The configuration fingerprint
+            (see :obj:`configure_scan_fingerprint`) and the decoded configuration.
+
+        Raises:
+            :obj:`jsonschema.ValidationError`: If the argin does not match the ConfigureScan schema.
+            :obj:`pydantic.ValidationError`: If the argin cannot be decoded into the configuration dataclass.
+        """
+        fingerprint, document = self.identify(argin)
+        return fingerprint, self.decode(fingerprint, document)
+
+    @staticmethod
+    def identify(argin: str) -> tuple[str, dict[str, Any]]:
+        """Load a ConfigureScan argin and compute its fingerprint, without validating or decoding it.
+
+        Args:
+            argin (:obj:`str`): The ConfigureScan JSON string.
+
+        Returns:
+            :obj:`tuple[str, dict[str, Any]]`: The configuration fingerprint and the loaded JSON document.
+
+        Raises:
+            :obj:`jsonschema.ValidationError`: If the argin is not a JSON object.
+        """
+        document = json.loads(argin)
+        if not isinstance(document, dict):
+            # Let the validator produce the appropriate error for non-object documents
+            _configure_scan_validator.validate(document)
+        return configure_scan_fingerprint(document), document
+
+    def decode(self, fingerprint: str, document: dict[str, Any]) -> VCCAllBandsConfigureScanConfig:
+        """Validate and decode a loaded ConfigureScan document, using the cached configuration if there is one.
+
+        Args:
+            fingerprint (:obj:`str`): The configuration fingerprint, as returned by :obj:`identify`.
+            document (:obj:`dict[str, Any]`): The loaded JSON document, as returned by :obj:`identify`.
+
+        Returns:
+            :obj:`VCCAllBandsConfigureScanConfig`: The decoded configuration.
+
+        Raises:
+            :obj:`jsonschema.ValidationError`: If the document does not match the ConfigureScan schema.
+            :obj:`pydantic.ValidationError`: If the document cannot be decoded into the configuration dataclass.
+        """
+        configuration = self._entry(fingerprint, document).configuration
+        transaction_id = document.get("transaction_id")
+        if configuration.transaction_id != transaction_id:
+            configuration = dataclasses.replace(configuration, transaction_id=transaction_id)
+        return configuration
+
+    def plan(self, fingerprint: str, document: dict[str, Any]) -> PlanT:
+        """Get the plan compiled from a loaded ConfigureScan document, validating, decoding and compiling it
+        if its configuration is not cached or its plan was not yet compiled.
+
+        The plan is re-targeted to the document's transaction ID with its ``with_transaction_id`` method.
+
+        Args:
+            fingerprint (:obj:`str`): The configuration fingerprint, as returned by :obj:`identify`.
+            document (:obj:`dict[str, Any]`): The loaded JSON document, as returned by :obj:`identify`.
+
+        Returns:
+            :obj:`PlanT`: The compiled plan.
+
+        Raises:
+            :obj:`jsonschema.ValidationError`: If the document does not match the ConfigureScan schema.
+            :obj:`pydantic.ValidationError`: If the document cannot be decoded into the configuration dataclass.
+        """
+        entry = self._entry(fingerprint, document)
+        if entry.plan is None:
+            entry.plan = self._compile_plan(entry.configuration, fingerprint)
+        return entry.plan.with_transaction_id(document.get("transaction_id"))
+
+    def plans(self) -> list[PlanT]:
+        """Get the compiled plans of the cached configurations, from least to most recently used."""
+        return [entry.plan for entry in self._cache.values() if entry.plan is not None]
+
+    def clear(self) -> None:
+        """Drop all cached configurations."""
+        self._cache.clear()
+
+    def _entry(self, fingerprint: str, document: dict[str, Any]) -> _ParsedConfiguration[PlanT]:
+        entry = self._cache.get(fingerprint)
+        if entry is None:
+            _configure_scan_validator.validate(document)
+            entry = _ParsedConfiguration(_configure_scan_decoder.validate_python(document))
+            self._cache.put(fingerprint, entry)
+        return entry
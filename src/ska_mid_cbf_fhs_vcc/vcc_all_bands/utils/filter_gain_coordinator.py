@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Protocol
+
+import numpy as np
+from ska_control_model import ResultCode
+
+__all__ = ["FilterGainCoordinator", "FilterGainMember", "FilterGainUpdate", "FleetFilterGainsReport"]
+
+FILTER_GAIN_COORDINATOR_MAX_WORKERS = 16
+"""The maximum number of VCCs read or updated concurrently by the process-wide :obj:`FilterGainCoordinator`."""
+
+
+@dataclass
+class FilterGainUpdate:
+    """The outcome of computing, then applying, the filter gains of a single VCC."""
+
+    transaction_id: str | None
+    """:obj:`str | None`: The transaction ID of the command computing the gains."""
+
+    headrooms: list[float]
+    """:obj:`list[float]`: The requested RFI headrooms, in decibels (dB)."""
+
+    gains: list[float] | None = None
+    """:obj:`list[float] | None`: The computed gain multipliers, or None if they could not be computed."""
+
+    powers: np.ndarray | None = None
+    """:obj:`np.ndarray | None`: The (num_fs x 2) power matrix the gains were computed from."""
+
+    result_code: ResultCode = ResultCode.OK
+    """:obj:`ResultCode`: The result of the last phase run for the VCC."""
+
+    message: str = ""
+    """:obj:`str`: An informative message describing the result."""
+
+    @property
+    def ready(self) -> bool:
+        """:obj:`bool`: Whether gains were computed and can be applied."""
+        return self.result_code == ResultCode.OK and self.gains is not None
+
+
+class FilterGainMember(Protocol):
+    """A VCC whose filter gains can be levelled by a :obj:`FilterGainCoordinator`."""
+
+    @property
+    def filter_gains_allowed(self) -> bool:
+        """:obj:`bool`: Whether the VCC is currently configured, so that its filter gains can be set."""
+
+    def prepare_filter_gains(self, request: Any, transaction_id: str | None) -> FilterGainUpdate:
+        """Read the power meters of the VCC and compute its new filter gains, without applying them."""
+
+    def apply_filter_gains(self, update: FilterGainUpdate) -> FilterGainUpdate:
+        """Apply filter gains computed by :obj:`prepare_filter_gains`."""
+
+
+@dataclass
+class FleetFilterGainsReport:
+    """The aggregated outcome of levelling the filter gains of several VCCs."""
+
+    updates: dict[int, FilterGainUpdate] = field(default_factory=dict)
+    """:obj:`dict[int, FilterGainUpdate]`: The outcome for each VCC whose gains were computed, mapped by VCC ID."""
+
+    skipped: list[int] = field(default_factory=list)
+    """:obj:`list[int]`: The VCCs skipped because they are not configured."""
+
+    @property
+    def applied(self) -> list[int]:
+        """:obj:`list[int]`: The VCCs whose new gains were applied."""
+        return sorted(vcc_id for vcc_id, update in self.updates.items() if update.ready)
+
+    @property
+    def failures(self) -> dict[int, FilterGainUpdate]:
+        """:obj:`dict[int, FilterGainUpdate]`: The outcome of each VCC whose gains were not applied, mapped by VCC ID."""
+        return {vcc_id: update for vcc_id, update in sorted(self.updates.items()) if not update.ready}
+
+    @property
+    def result_code(self) -> ResultCode:
+        """:obj:`ResultCode`: OK if the gains of every levelled VCC were applied, REJECTED if there was no VCC to level, FAILED otherwise."""
+        if not self.updates:
+            return ResultCode.REJECTED
+        return ResultCode.FAILED if self.failures else ResultCode.OK
+
+    def describe(self) -> str:
+        """Describe the outcome in a single message suitable for returning to a client."""
+        if not self.updates:
+            return f"No configured VCC to auto-set gains of (skipped VCCs {self.skipped})"
+        if failures := self.failures:
+            details = "; ".join(f"VCC {vcc_id}: {update.message}" for vcc_id, update in failures.items())
+            return f"Failed to auto-set gains of {len(failures)} of {len(self.updates)} VCC(s), applied to VCCs {self.applied}: {details}"
+        return f"AutoSetFleetFilterGains completed OK for VCCs {self.applied}" + (f" (skipped VCCs {self.skipped})" if self.skipped else "")
+
+
+class FilterGainCoordinator:
+    """Levels the filter gains of every VCC hosted by the device server process.
+
+    The gains of all members are computed concurrently from their power meters on a pool shared by the process,
+    and only then applied concurrently, so that every VCC is levelled from readings taken at about the same time.
+    """
+
+    _shared: FilterGainCoordinator | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = FILTER_GAIN_COORDINATOR_MAX_WORKERS) -> None:
+        """
+        Args:
+            max_workers (:obj:`int`, optional): The maximum number of VCCs read or updated concurrently.
+                Default is :obj:`FILTER_GAIN_COORDINATOR_MAX_WORKERS`.
+        """
+        self._members: weakref.WeakValueDictionary[int, FilterGainMember] = weakref.WeakValueDictionary()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="filter_gain_coordinator")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> FilterGainCoordinator:
+        """Get the coordinator shared by every VCC of the process, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def register(self, vcc_id: int, member: FilterGainMember) -> None:
+        """Add a VCC to the fleet, replacing any VCC registered with the same ID.
+
+        Members are held weakly, so that a VCC which is deleted leaves the fleet.
+
+        Args:
+            vcc_id (:obj:`int`): The ID of the VCC.
+            member (:obj:`FilterGainMember`): The VCC.
+        """
+        self._members[vcc_id] = member
+
+    def unregister(self, vcc_id: int) -> None:
+        """Remove a VCC from the fleet, if registered.
+
+        Args:
+            vcc_id (:obj:`int`): The ID of the VCC.
+        """
+        self._members.pop(vcc_id, None)
+
+    @property
+    def vcc_ids(self) -> list[int]:
+        """:obj:`list[int]`: The IDs of the VCCs in the fleet."""
+        return sorted(self._members.keys())
+
+    def level(self, request: Any, transaction_id: str | None = None, require_all: bool = False) -> FleetFilterGainsReport:
+        """Compute, then apply, the filter gains of every configured VCC in the fleet.
+
+        Only one levelling runs at a time; a concurrent call waits for the running one to complete.
+
+        Args:
+            request (:obj:`Any`): The gain request passed to every member, e.g. the AutoSetFilterGains arguments.
+            transaction_id (:obj:`str | None`, optional): The transaction ID of the command. Default is None.
+            require_all (:obj:`bool`, optional): Only apply any gains if the gains of every configured VCC were
+                computed. Default is False, applying the gains of each VCC whose gains were computed.
+
+        Returns:
+            :obj:`FleetFilterGainsReport`: The outcome for each VCC.
+        """
+        with self._lock:
+            report = FleetFilterGainsReport()
+            members = {}
+            for vcc_id, member in sorted(self._members.items()):
+                if member.filter_gains_allowed:
+                    members[vcc_id] = member
+                else:
+                    report.skipped.append(vcc_id)
+
+            # Read phase: compute the gains of every VCC before changing any of them
+            report.updates = self._run_all(
+                members,
+                lambda vcc_id, member: member.prepare_filter_gains(request, transaction_id),
+                lambda vcc_id: FilterGainUpdate(transaction_id=transaction_id, headrooms=[]),
+            )
+
+            ready = {vcc_id: members[vcc_id] for vcc_id, update in report.updates.items() if update.ready}
+            if require_all and len(ready) < len(members):
+                for update in (report.updates[vcc_id] for vcc_id in ready):
+                    update.gains = None
+                    update.result_code = ResultCode.ABORTED
+                    update.message = "Gains not applied, as the gains of another VCC could not be computed"
+                return report
+
+            # Apply phase
+            report.updates |= self._run_all(
+                ready,
+                lambda vcc_id, member: member.apply_filter_gains(report.updates[vcc_id]),
+                lambda vcc_id: report.updates[vcc_id],
+            )
+            return report
+
+    def _run_all(
+        self,
+        members: dict[int, FilterGainMember],
+        call: Callable[[int, FilterGainMember], FilterGainUpdate],
+        fallback: Callable[[int], FilterGainUpdate],
+    ) -> dict[int, FilterGainUpdate]:
+        futures = {vcc_id: self._pool.submit(call, vcc_id, member) for vcc_id, member in members.items()}
+        updates = {}
+        for vcc_id, future in futures.items():
+            try:
+                updates[vcc_id] = future.result()
+            except Exception as ex:
+                update = updates[vcc_id] = fallback(vcc_id)
+                update.gains = None
+                update.result_code = ResultCode.FAILED
+                update.message = f"An unexpected exception occurred: {ex!r}"
+        return updates
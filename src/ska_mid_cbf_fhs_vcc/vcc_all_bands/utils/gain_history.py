@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Sequence
+
+import numpy as np
+
+from ska_mid_cbf_fhs_vcc.helpers.record_ring import RecordRing, decode_records, encode_records
+
+__all__ = ["GAIN_HISTORY_FIELDS", "GainHistory", "GainSource", "decode_gain_history"]
+
+GAIN_HISTORY_CAPACITY = 1024
+"""The default number of applied gain vectors kept by a :obj:`GainHistory`."""
+
+GAIN_HISTORY_FORMAT = "gain_history"
+"""The name of the record format of an encoded gain history (see :obj:`encode_records`)."""
+
+MAX_NUM_FS = 26
+"""The maximum number of frequency slices of a VCC, across all frequency bands."""
+
+TRANSACTION_ID_LENGTH = 64
+"""The number of bytes of the transaction ID kept in each gain history record."""
+
+GAIN_HISTORY_FIELDS = [
+    ("source", "u1"),
+    ("transaction_id", f"S{TRANSACTION_ID_LENGTH}"),
+    ("num_fs", "u1"),
+    ("num_headrooms", "u1"),
+    ("gains", "<f8", (2 * MAX_NUM_FS,)),
+    ("headrooms", "<f8", (MAX_NUM_FS,)),
+    ("powers", "<f8", (MAX_NUM_FS, 2)),
+]
+"""The fields of each gain history record, after the sequence number and timestamp (see :obj:`ring_dtype`).
+Only the first ``2 * num_fs`` gains, ``num_headrooms`` headrooms and ``num_fs`` powers are set; the rest are NaN,
+as are the powers of gains which were not computed from power measurements."""
+
+
+class GainSource(IntEnum):
+    """What applied a gain vector."""
+
+    CONFIGURE_SCAN = 1
+    AUTO_SET_FILTER_GAINS = 2
+    AUTO_GAIN_CONTROL = 3
+
+
+class GainHistory:
+    """Bounded history of every gain vector applied to the VCC coarse channels, along with what applied it
+    and the power measurements it was computed from, kept as fixed-width records of a :obj:`RecordRing`.
+    """
+
+    def __init__(self, capacity: int = GAIN_HISTORY_CAPACITY, path: str | None = None) -> None:
+        """
+        Args:
+            capacity (:obj:`int`, optional): The number of most recent gain vectors to keep. Default is :obj:`GAIN_HISTORY_CAPACITY`.
+            path (:obj:`str | None`, optional): The file to spill the history to, so that it survives a restart of the device
+                server. Default is None, keeping the history in memory.
+        """
+        self._ring = RecordRing(GAIN_HISTORY_FIELDS, capacity, path=path, defaults={"gains": np.nan, "headrooms": np.nan, "powers": np.nan})
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def record(
+        self,
+        gains: Sequence[float] | np.ndarray,
+        source: GainSource,
+        transaction_id: str | None = None,
+        headrooms: Sequence[float] | np.ndarray | None = None,
+        powers: np.ndarray | None = None,
+    ) -> int:
+        """Record an applied gain vector.
+
+        Args:
+            gains (:obj:`Sequence[float] | np.ndarray`): The gain multipliers, in the format
+                [ch0_polX, ch1_polX, ..., chN_polX, ch0_polY, ch1_polY, ..., chN_polY].
+            source (:obj:`GainSource`): What applied the gains.
+            transaction_id (:obj:`str | None`, optional): The transaction ID of the command which applied the gains,
+                truncated to :obj:`TRANSACTION_ID_LENGTH` bytes. Default is None.
+            headrooms (:obj:`Sequence[float] | np.ndarray | None`, optional): The requested RFI headrooms the gains
+                were computed for, in decibels (dB). Default is None.
+            powers (:obj:`np.ndarray | None`, optional): The (num_fs x 2) power matrix the gains were computed from. Default is None.
+
+        Returns:
+            :obj:`int`: The sequence number of the record.
+        """
+        values = {
+            "source": source,
+            "transaction_id": (transaction_id or "").encode("utf-8")[:TRANSACTION_ID_LENGTH],
+            "num_fs": len(gains) // 2,
+            "gains": gains,
+        }
+        if headrooms is not None:
+            values["num_headrooms"] = len(headrooms)
+            values["headrooms"] = headrooms
+        if powers is not None:
+            values["powers"] = powers
+        return self._ring.append(**values)
+
+    def query(
+        self,
+        since: float | None = None,
+        until: float | None = None,
+        source: GainSource | None = None,
+        limit: int | None = None,
+    ) -> np.ndarray:
+        """Get the recorded gain vectors, from oldest to newest.
+
+        Args:
+            since (:obj:`float | None`, optional): Only return gains applied from this POSIX timestamp on. Default is None.
+            until (:obj:`float | None`, optional): Only return gains applied up to this POSIX timestamp. Default is None.
+            source (:obj:`GainSource | None`, optional): Only return gains applied by this source. Default is None.
+            limit (:obj:`int | None`, optional): Only return the most recent ``limit`` matching records. Default is None.
+
+        Returns:
+            :obj:`np.ndarray`: The records, as a structured array with the :obj:`GAIN_HISTORY_FIELDS`.
+        """
+        if source is None:
+            return self._ring.records(since, until, limit)
+        records = self._ring.records(since, until)
+        records = records[records["source"] == source]
+        return records if limit is None else records[len(records) - min(limit, len(records)) :]
+
+    def encode(self, **query) -> tuple[str, bytes]:
+        """Get the recorded gain vectors packed for a DevEncoded value.
+
+        Args:
+            **query: The filters of :obj:`query`.
+
+        Returns:
+            :obj:`tuple[str, bytes]`: The packed records, which can be unpacked with :obj:`decode_gain_history`.
+        """
+        return encode_records(GAIN_HISTORY_FORMAT, self.query(**query))
+
+    def flush(self) -> None:
+        """Write the history to its spill file, if any."""
+        self._ring.flush()
+
+
+def decode_gain_history(encoded: tuple[str, bytes]) -> np.ndarray:
+    """Unpack a gain history packed by :obj:`GainHistory.encode`.
+
+    Args:
+        encoded (:obj:`tuple[str, bytes]`): The DevEncoded value.
+
+    Returns:
+        :obj:`np.ndarray`: The records, as a structured array with the :obj:`GAIN_HISTORY_FIELDS`.
+
+    Raises:
+        :obj:`ValueError`: If the value is not an encoded gain history.
+    """
+    name, records = decode_records(encoded)
+    if name != GAIN_HISTORY_FORMAT:
+        raise ValueError(f"Expected an encoded {GAIN_HISTORY_FORMAT}, got {name!r}")
+    return records
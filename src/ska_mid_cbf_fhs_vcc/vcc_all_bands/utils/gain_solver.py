@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from numbers import Real
+from typing import Any, Sequence
+
+import numpy as np
+
+__all__ = ["POLARIZATIONS", "InvalidPowerMeasurementError", "invalid_power_mask", "solve_filter_gains"]
+
+POLARIZATIONS = ("X", "Y")
+"""The polarizations of the columns of a power matrix."""
+
+
+class InvalidPowerMeasurementError(ValueError):
+    """Raised when a power matrix holds a measurement which cannot be used to compute a gain."""
+
+    def __init__(self, fs_index: int, polarization: str) -> None:
+        """
+        Args:
+            fs_index (:obj:`int`): The 1-based index of the first frequency slice with an invalid measurement.
+            polarization (:obj:`str`): The polarization ("X" or "Y") of the invalid measurement.
+        """
+        super().__init__(f"The FS {fs_index} power meter failed to provide a valid power measurement for polarization {polarization}.")
+        self.fs_index = fs_index
+        self.polarization = polarization
+
+
+def invalid_power_mask(powers: Sequence[Sequence[Any]] | np.ndarray) -> np.ndarray:
+    """Find the measurements of a power matrix which cannot be used to compute a gain.
+
+    A measurement is valid if it is a (non-boolean) real number in the range (0, 1].
+
+    Args:
+        powers (:obj:`Sequence[Sequence[Any]] | np.ndarray`): The (num_fs x 2) matrix of the average power
+            measured for each frequency slice, in polarization X and Y.
+
+    Returns:
+        :obj:`np.ndarray`: A (num_fs x 2) boolean array, True where the measurement is invalid.
+    """
+    return _invalid_mask(*_as_power_matrix(powers))
+
+
+def solve_filter_gains(
+    powers: Sequence[Sequence[Any]] | np.ndarray,
+    headrooms: Sequence[float] | np.ndarray,
+    target_power_db: float = 0.0,
+) -> np.ndarray:
+    """Compute the VCC coarse channel gain multipliers bringing every frequency slice to the target power
+    minus its requested RFI headroom.
+
+    Equivalent to calling :obj:`calculate_gain_multiplier` for each polarization of each frequency slice.
+
+    Args:
+        powers (:obj:`Sequence[Sequence[Any]] | np.ndarray`): The (num_fs x 2) matrix of the average power
+            measured for each frequency slice, in polarization X and Y.
+        headrooms (:obj:`Sequence[float] | np.ndarray`): The requested RFI headrooms, in decibels (dB); either a single
+            value applied to all frequency slices, or one value per frequency slice.
+        target_power_db (:obj:`float`, optional): The target power, in decibels (dB). Default is 0.0.
+
+    Returns:
+        :obj:`np.ndarray`: The 2 x num_fs gain multipliers, in the format
+        [ch0_polX, ch1_polX, ..., chN_polX, ch0_polY, ch1_polY, ..., chN_polY].
+
+    Raises:
+        :obj:`InvalidPowerMeasurementError`: If any power measurement is invalid (see :obj:`invalid_power_mask`).
+        :obj:`ValueError`: If the number of headrooms is neither 1 nor the number of frequency slices.
+    """
+    values, numeric = _as_power_matrix(powers)
+    invalid = _invalid_mask(values, numeric)
+    if invalid.any():
+        fs_index, pol_index = np.argwhere(invalid)[0]
+        raise InvalidPowerMeasurementError(int(fs_index) + 1, POLARIZATIONS[pol_index])
+
+    num_fs = values.shape[0]
+    headrooms = np.asarray(headrooms, dtype=np.float64).ravel()
+    if headrooms.size not in (1, num_fs):
+        raise ValueError(f"Expected 1 or {num_fs} headrooms, got {headrooms.size}")
+
+    # Amplitude gain for each FS, broadcast over both polarizations
+    amplitude = np.power(10.0, (target_power_db - np.resize(headrooms, num_fs)) / 20.0)
+    return (amplitude[:, np.newaxis] / np.sqrt(values)).T.ravel()
+
+
+def _as_power_matrix(powers: Sequence[Sequence[Any]] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a power matrix to floats, with a mask of the measurements which were real numbers."""
+    # Readings taken from power meter statuses may hold None or non-numeric values; keep them as
+    # objects so that they do not coerce the valid readings to strings
+    matrix = powers if isinstance(powers, np.ndarray) else np.array(powers, dtype=object)
+    if matrix.ndim != 2 or matrix.shape[1] != len(POLARIZATIONS):
+        raise ValueError(f"Expected a (num_fs x {len(POLARIZATIONS)}) power matrix, got shape {matrix.shape}")
+
+    if matrix.dtype.kind in "fiu":
+        return matrix.astype(np.float64, copy=False), np.ones(matrix.shape, dtype=bool)
+
+    matrix = matrix.astype(object, copy=False)
+    numeric = np.frompyfunc(lambda value: isinstance(value, Real) and not isinstance(value, (bool, np.bool_)), 1, 1)(matrix).astype(bool)
+    values = np.where(numeric, matrix, np.nan).astype(np.float64)
+    return values, numeric
+
+
+def _invalid_mask(values: np.ndarray, numeric: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        return ~(numeric & (values > 0) & (values <= 1))
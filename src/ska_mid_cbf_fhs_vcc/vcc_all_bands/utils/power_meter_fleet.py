@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from numbers import Real
+from typing import Any, Callable, Iterable
+
+import numpy as np
+from ska_mid_cbf_fhs_common import WidebandPowerMeterConfig, WidebandPowerMeterManager, WidebandPowerMeterStatus
+
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup
+
+__all__ = ["PowerMeterKey", "PowerMeterFleetReport", "PowerSnapshot", "WidebandPowerMeterFleet", "power_meter_name"]
+
+POWER_SNAPSHOT_DEADLINE = 5.0
+"""The default time, in seconds, allowed for a whole power snapshot to be read."""
+
+POWER_METER_READ_TIMEOUT = 2.0
+"""The default time, in seconds, allowed for the status of a single power meter to be read."""
+
+PowerMeterKey = VCCBandGroup | int
+"""Key identifying a Wideband Power Meter, either by band group (pre-channelizer) or by FS index (post-channelizer)."""
+
+
+def power_meter_name(key: PowerMeterKey) -> str:
+    """Get the human-readable name of a Wideband Power Meter, as used in log and error messages.
+
+    Args:
+        key (:obj:`PowerMeterKey`): The power meter key.
+
+    Returns:
+        :obj:`str`: The power meter name, e.g. "b123" or "FS 3".
+    """
+    return key.value if isinstance(key, VCCBandGroup) else f"FS {key}"
+
+
+@dataclass
+class PowerMeterFleetReport:
+    """The aggregated outcome of running an operation across multiple Wideband Power Meters."""
+
+    action: str
+    """:obj:`str`: The operation that was run, e.g. "Configuration"."""
+
+    succeeded_keys: list[PowerMeterKey] = field(default_factory=list)
+    """:obj:`list[PowerMeterKey]`: The power meters for which the operation succeeded."""
+
+    failures: dict[PowerMeterKey, str] = field(default_factory=dict)
+    """:obj:`dict[PowerMeterKey, str]`: Failure reasons, mapped by power meter."""
+
+    @property
+    def succeeded(self) -> bool:
+        """:obj:`bool`: Whether the operation succeeded for every power meter."""
+        return not self.failures
+
+    def describe_failures(self) -> str:
+        """Describe all failures in a single message suitable for logging or returning to a client."""
+        details = ", ".join(f"{power_meter_name(key)} ({reason})" for key, reason in self.failures.items())
+        return f"{self.action} of {len(self.failures)} Wideband Power Meter(s) failed: {details}"
+
+
+@dataclass(frozen=True)
+class PowerSnapshot:
+    """Average power readings taken concurrently from a set of Wideband Power Meters."""
+
+    keys: tuple[PowerMeterKey, ...]
+    """:obj:`tuple[PowerMeterKey, ...]`: The power meters read, in the order of the rows of :obj:`powers`."""
+
+    powers: np.ndarray
+    """:obj:`np.ndarray`: Read-only (num_meters x 2) matrix of the average power measured in polarization X and Y,
+    NaN where a power meter could not be read or returned a non-numeric value."""
+
+    read_at: np.ndarray
+    """:obj:`np.ndarray`: Read-only array of the time at which each power meter was read, as a POSIX timestamp, NaN where it could not be read."""
+
+    started_at: float
+    """:obj:`float`: The time at which the snapshot was started, as a POSIX timestamp."""
+
+    completed_at: float
+    """:obj:`float`: The time at which the snapshot was completed, as a POSIX timestamp."""
+
+    report: PowerMeterFleetReport
+    """:obj:`PowerMeterFleetReport`: The power meters read, and the reasons the others could not be."""
+
+    @property
+    def succeeded(self) -> bool:
+        """:obj:`bool`: Whether every power meter was read."""
+        return self.report.succeeded
+
+    @property
+    def skew(self) -> float:
+        """:obj:`float`: The time, in seconds, between the first and the last successful reading."""
+        if np.isnan(self.read_at).all():
+            return 0.0
+        return float(np.nanmax(self.read_at) - np.nanmin(self.read_at))
+
+
+class WidebandPowerMeterFleet:
+    """Runs operations across a set of Wideband Power Meters concurrently on a bounded worker pool,
+    aggregating failures into a single report rather than stopping at the first one.
+    """
+
+    def __init__(
+        self,
+        power_meters: dict[PowerMeterKey, WidebandPowerMeterManager],
+        max_workers: int = 8,
+        thread_name_prefix: str = "power_meter_fleet",
+        read_workers: int | None = None,
+    ) -> None:
+        """
+        Args:
+            power_meters (:obj:`dict[PowerMeterKey, WidebandPowerMeterManager]`): The power meter managers, mapped by key.
+            max_workers (:obj:`int`, optional): The maximum number of power meters to operate on concurrently. Default is 8.
+            thread_name_prefix (:obj:`str`, optional): Prefix for the names of the worker threads. Default is "power_meter_fleet".
+            read_workers (:obj:`int | None`, optional): The maximum number of power meters to read concurrently in a snapshot,
+                on a pool of their own. Default is None, giving every power meter a read worker.
+        """
+        self.power_meters = power_meters
+        self.status_recorders: dict[PowerMeterKey, Callable[[WidebandPowerMeterStatus], Any]] = {}
+        """:obj:`dict[PowerMeterKey, Callable[[WidebandPowerMeterStatus], Any]]`: Functions recording each status read, mapped by power meter."""
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        # A separate read pool keeps snapshot reads from being queued behind configuration, and with a worker
+        # per power meter, a power meter whose reads never return cannot hold up the reads of the others
+        self._read_pool = ThreadPoolExecutor(max_workers=read_workers or max(len(power_meters), 1), thread_name_prefix=f"{thread_name_prefix}_read")
+        self._reads_lock = threading.Lock()
+        self._reads_in_flight: dict[PowerMeterKey, tuple[Future, float]] = {}
+
+    def configure(self, configs: dict[PowerMeterKey, WidebandPowerMeterConfig]) -> PowerMeterFleetReport:
+        """Configure power meters concurrently.
+
+        Args:
+            configs (:obj:`dict[PowerMeterKey, WidebandPowerMeterConfig]`): The configuration to apply, mapped by power meter.
+
+        Returns:
+            :obj:`PowerMeterFleetReport`: The aggregated result.
+        """
+        return self._run_all("Configuration", {key: (lambda key=key: self.power_meters[key].configure(configs[key])) for key in configs})
+
+    def deconfigure(self, keys: Iterable[PowerMeterKey]) -> PowerMeterFleetReport:
+        """Deconfigure power meters concurrently.
+
+        Args:
+            keys (:obj:`Iterable[PowerMeterKey]`): The power meters to deconfigure.
+
+        Returns:
+            :obj:`PowerMeterFleetReport`: The aggregated result.
+        """
+        return self._run_all("Deconfiguration", {key: self.power_meters[key].deconfigure for key in keys})
+
+    def recover(self, keys: Iterable[PowerMeterKey]) -> PowerMeterFleetReport:
+        """Recover power meters concurrently.
+
+        Args:
+            keys (:obj:`Iterable[PowerMeterKey]`): The power meters to recover.
+
+        Returns:
+            :obj:`PowerMeterFleetReport`: The aggregated result.
+        """
+        return self._run_all("Recovery", {key: self.power_meters[key].recover for key in keys})
+
+    def read_powers(
+        self,
+        keys: Iterable[PowerMeterKey],
+        deadline: float = POWER_SNAPSHOT_DEADLINE,
+        timeout: float = POWER_METER_READ_TIMEOUT,
+    ) -> PowerSnapshot:
+        """Read the average power measured by a set of power meters concurrently.
+
+        A power meter which raises, returns no status, or has not returned by the end of the per-meter timeout
+        or of the deadline is reported as a failure, without affecting the other readings. Both are counted from
+        the start of the snapshot, as every power meter is read at once given a read worker each. A power meter
+        whose read from an earlier snapshot is still running past its timeout is not read again until it returns,
+        so that it cannot take up more than one read worker.
+
+        Args:
+            keys (:obj:`Iterable[PowerMeterKey]`): The power meters to read, e.g. the FS indexes of the post-channelizer power meters.
+            deadline (:obj:`float`, optional): The time, in seconds, allowed for the whole snapshot.
+                Default is :obj:`POWER_SNAPSHOT_DEADLINE`.
+            timeout (:obj:`float`, optional): The time, in seconds, allowed for each power meter to be read.
+                Default is :obj:`POWER_METER_READ_TIMEOUT`.
+
+        Returns:
+            :obj:`PowerSnapshot`: The power readings.
+        """
+        keys = tuple(keys)
+        report = PowerMeterFleetReport(action="Power readout")
+        powers = np.full((len(keys), 2), np.nan)
+        read_at = np.full(len(keys), np.nan)
+
+        started_at = time.time()
+        start_time = time.monotonic()
+        futures = self._submit_reads(keys, start_time, timeout)
+
+        # Readings are due by the per-meter timeout, unless the deadline of the whole snapshot comes first
+        due_at = start_time + min(timeout, deadline)
+        missed = f"no reading within the {timeout}s timeout" if timeout < deadline else f"no reading within the {deadline}s deadline"
+
+        for row, (key, future) in enumerate(zip(keys, futures)):
+            if future is None:
+                report.failures[key] = "previous reading still in progress"
+                continue
+            try:
+                status, timestamp = future.result(timeout=max(due_at - time.monotonic(), 0.0))
+            except FutureTimeoutError:
+                future.cancel()
+                report.failures[key] = missed
+                continue
+            except Exception as ex:
+                report.failures[key] = repr(ex)
+                continue
+            if status is None:
+                report.failures[key] = "no status returned"
+            else:
+                powers[row] = (_as_power(status.avg_power_pol_x), _as_power(status.avg_power_pol_y))
+                read_at[row] = timestamp
+                report.succeeded_keys.append(key)
+                if (record_status := self.status_recorders.get(key)) is not None:
+                    record_status(status)
+
+        powers.setflags(write=False)
+        read_at.setflags(write=False)
+        return PowerSnapshot(
+            keys=keys,
+            powers=powers,
+            read_at=read_at,
+            started_at=started_at,
+            completed_at=time.time(),
+            report=report,
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pools, cancelling any queued operations."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._read_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_reads(self, keys: tuple[PowerMeterKey, ...], start_time: float, timeout: float) -> list[Future | None]:
+        # Skips power meters whose previous read is stuck, i.e. still running past its timeout
+        futures = []
+        with self._reads_lock:
+            for key in keys:
+                in_flight = self._reads_in_flight.get(key)
+                if in_flight is not None and not in_flight[0].done() and start_time - in_flight[1] >= timeout:
+                    futures.append(None)
+                    continue
+                future = self._read_pool.submit(self._timed_read, key)
+                self._reads_in_flight[key] = (future, start_time)
+                futures.append(future)
+        return futures
+
+    def _timed_read(self, key: PowerMeterKey) -> tuple[WidebandPowerMeterStatus | None, float]:
+        status = self._read_status(key)
+        return status, time.time()
+
+    def _read_status(self, key: PowerMeterKey) -> WidebandPowerMeterStatus | None:
+        return self.power_meters[key].status()
+
+    def _run_all(self, action: str, calls: dict[PowerMeterKey, Callable[[], int]]) -> PowerMeterFleetReport:
+        report = PowerMeterFleetReport(action=action)
+        futures = {key: self._pool.submit(call) for key, call in calls.items()}
+        for key, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as ex:
+                report.failures[key] = repr(ex)
+                continue
+            if result == 1:
+                report.failures[key] = "driver returned failure"
+            else:
+                report.succeeded_keys.append(key)
+        return report
+
+
+def _as_power(value: Any) -> float:
+    # Non-numeric readings are kept as NaN, so that they are rejected along with out of range readings
+    return float(value) if isinstance(value, Real) and not isinstance(value, (bool, np.bool_)) else np.nan
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+import threading
+from enum import IntEnum
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import worst_health_state
+from ska_mid_cbf_fhs_vcc.monitoring.incremental_health import HEALTH_SUMMARY_INTERVAL, HealthCheck, IncrementalHealthEvaluator
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_solver import POLARIZATIONS
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet import PowerMeterKey, PowerSnapshot, power_meter_name
+
+__all__ = ["PowerFlag", "PowerMeterHealthMonitor", "power_flags"]
+
+POWER_METER_HEALTHY_RANGE = (1e-4, 1.0)
+"""The default range of healthy average power, relative to full scale: below it the input is too weak to level
+(-40 dB), and above it the input is saturating."""
+
+
+class PowerFlag(IntEnum):
+    """The health of the average power measured by a Wideband Power Meter in one polarization."""
+
+    OK = 0
+    """Within the healthy range."""
+
+    NAN = 1
+    """No valid reading, e.g. the power meter could not be read in time, which says nothing about the input power."""
+
+    ZERO = 2
+    """No power at all, e.g. a dead frequency slice."""
+
+    LOW = 3
+    """Below the healthy range."""
+
+    HIGH = 4
+    """Above the healthy range, e.g. a saturating input."""
+
+
+POWER_FLAG_HEALTH_STATES = {
+    PowerFlag.OK: HealthState.OK,
+    PowerFlag.NAN: HealthState.UNKNOWN,
+    PowerFlag.ZERO: HealthState.FAILED,
+    PowerFlag.LOW: HealthState.DEGRADED,
+    PowerFlag.HIGH: HealthState.DEGRADED,
+}
+"""The health state of each power flag."""
+
+
+def power_flags(powers: np.ndarray, healthy_range: tuple[float, float] = POWER_METER_HEALTHY_RANGE) -> np.ndarray:
+    """Flag the unhealthy readings of a power matrix.
+
+    Args:
+        powers (:obj:`np.ndarray`): The (num_meters x 2) matrix of the average power measured in polarization X and Y.
+        healthy_range (:obj:`tuple[float, float]`, optional): The range of healthy power. Default is :obj:`POWER_METER_HEALTHY_RANGE`.
+
+    Returns:
+        :obj:`np.ndarray`: The (num_meters x 2) :obj:`PowerFlag` of each reading.
+    """
+    powers = np.asarray(powers, dtype=np.float64)
+    low, high = healthy_range
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [np.isnan(powers), powers == 0, powers < low, powers > high],
+            [PowerFlag.NAN, PowerFlag.ZERO, PowerFlag.LOW, PowerFlag.HIGH],
+            default=PowerFlag.OK,
+        ).astype(np.int8)
+
+
+class PowerMeterHealthMonitor:
+    """Derives the health of a set of Wideband Power Meters from the power snapshots of a single batched sweep,
+    e.g. of a :obj:`PowerStatisticsSampler`, rather than by polling each power meter.
+
+    Each reading of a snapshot is flagged (see :obj:`power_flags`), and the health of a power meter is that of its least
+    healthy polarization. A power meter is only re-evaluated, and its health state change logged, when its flags change.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[PowerMeterKey],
+        logger: logging.Logger,
+        healthy_range: tuple[float, float] = POWER_METER_HEALTHY_RANGE,
+        update_health_state_callback: Callable[[HealthState], None] | None = None,
+        summary_interval: float = HEALTH_SUMMARY_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            keys (:obj:`Sequence[PowerMeterKey]`): The power meters which may be monitored.
+            logger (:obj:`logging.Logger`): Logger for health state transitions and summaries.
+            healthy_range (:obj:`tuple[float, float]`, optional): The range of healthy power. Default is :obj:`POWER_METER_HEALTHY_RANGE`.
+            update_health_state_callback (:obj:`Callable[[HealthState], None] | None`, optional): Callback called with the
+                health state of the power meters when it changes. Default is None.
+            summary_interval (:obj:`float`, optional): The time, in seconds, between summaries of the health state of every
+                power meter. Default is :obj:`HEALTH_SUMMARY_INTERVAL`.
+        """
+        self.keys = tuple(keys)
+        self.healthy_range = healthy_range
+        self._callback = update_health_state_callback
+        self._evaluator = IncrementalHealthEvaluator([self._health_check(key) for key in self.keys], logger, summary_interval)
+        self._flags: dict[PowerMeterKey, tuple[PowerFlag, PowerFlag]] = {}
+        self._powers: dict[PowerMeterKey, np.ndarray] = {}
+        self._health_state = HealthState.OK
+        self._lock = threading.Lock()
+
+    @property
+    def health_state(self) -> HealthState:
+        """:obj:`HealthState`: The health state of the least healthy power meter, as of the most recent snapshot."""
+        return self._health_state
+
+    @property
+    def flags(self) -> dict[PowerMeterKey, tuple[PowerFlag, PowerFlag]]:
+        """:obj:`dict[PowerMeterKey, tuple[PowerFlag, PowerFlag]]`: The flags of the X and Y readings of each power meter
+        monitored in the most recent snapshot, mapped by power meter."""
+        return dict(self._flags)
+
+    def update(self, snapshot: PowerSnapshot, keys: Iterable[PowerMeterKey] | None = None) -> HealthState:
+        """Evaluate the health of the power meters from a snapshot of their readings.
+
+        Args:
+            snapshot (:obj:`PowerSnapshot`): The snapshot.
+            keys (:obj:`Iterable[PowerMeterKey] | None`, optional): The power meters to monitor, e.g. those of the current
+                frequency band; the others are healthy. Default is None, monitoring every power meter of the snapshot.
+
+        Returns:
+            :obj:`HealthState`: The health state of the least healthy power meter.
+        """
+        rows = {key: row for row, key in enumerate(snapshot.keys)}
+        monitored = [key for key in (snapshot.keys if keys is None else keys) if key in rows]
+        powers = np.asarray(snapshot.powers)[[rows[key] for key in monitored]].reshape(-1, 2)
+        flags = power_flags(powers, self.healthy_range)
+
+        with self._lock:
+            self._flags = {key: (PowerFlag(x), PowerFlag(y)) for key, (x, y) in zip(monitored, flags.tolist())}
+            self._powers = dict(zip(monitored, powers))
+            health_states = self._evaluator.evaluate(self._flags)
+            return self._update(worst_health_state(health_states.values()))
+
+    def reset(self) -> None:
+        """Forget the previous snapshots, e.g. when the power meters stop being monitored, making the power meters healthy."""
+        with self._lock:
+            self._flags = {}
+            self._powers = {}
+            self._evaluator.reset()
+            self._update(HealthState.OK)
+
+    def _update(self, health_state: HealthState) -> HealthState:
+        if health_state != self._health_state:
+            self._health_state = health_state
+            if self._callback is not None:
+                self._callback(health_state)
+        return health_state
+
+    def _health_check(self, key: PowerMeterKey) -> HealthCheck:
+        name = power_meter_name(key)
+
+        def evaluate(flags: dict[PowerMeterKey, tuple[PowerFlag, PowerFlag]]) -> tuple[HealthState, str | None]:
+            if key not in flags:
+                return HealthState.OK, None
+            health_state = worst_health_state(POWER_FLAG_HEALTH_STATES[flag] for flag in flags[key])
+            problems = [
+                f"polarization {polarization} power {power:.3g} is {flag.name}"
+                for polarization, flag, power in zip(POLARIZATIONS, flags[key], self._powers[key].tolist())
+                if flag != PowerFlag.OK
+            ]
+            return health_state, f"{name} power meter: {', '.join(problems)} (healthy range {self.healthy_range})" if problems else None
+
+        return HealthCheck(f"{name}_power", lambda flags: flags.get(key), evaluate)
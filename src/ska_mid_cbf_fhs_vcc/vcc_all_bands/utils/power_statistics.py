@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import warnings
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence
+
+import numpy as np
+
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollJob, PollScheduler
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet import PowerMeterKey, PowerSnapshot, WidebandPowerMeterFleet
+
+__all__ = ["PowerStatistics", "PowerStatisticsBuffer", "PowerStatisticsSampler"]
+
+POWER_STATISTICS_CAPACITY = 600
+"""The default number of power snapshots kept by a :obj:`PowerStatisticsBuffer`."""
+
+POWER_STATISTICS_WINDOW = 10.0
+"""The default time window, in seconds, over which power statistics are computed."""
+
+POWER_STATISTICS_PERCENTILE = 95.0
+"""The default percentile reported in power statistics."""
+
+POWER_STATISTICS = ("mean", "median", "percentile")
+"""The statistics available from :obj:`PowerStatistics`, in the order they are published in :obj:`PowerStatistics.to_spectrum`."""
+
+
+@dataclass(frozen=True)
+class PowerStatistics:
+    """Windowed statistics of the average power measured by a set of Wideband Power Meters.
+
+    All arrays are (num_meters x 2), with one row per power meter and one column per polarization (X, Y).
+    Statistics are NaN for power meters without any valid sample in the window.
+    """
+
+    keys: tuple[PowerMeterKey, ...]
+    """:obj:`tuple[PowerMeterKey, ...]`: The power meters, in the order of the rows of the statistics."""
+
+    count: np.ndarray
+    """:obj:`np.ndarray`: The number of valid samples in the window."""
+
+    mean: np.ndarray
+    """:obj:`np.ndarray`: The mean power."""
+
+    median: np.ndarray
+    """:obj:`np.ndarray`: The median power."""
+
+    percentile: np.ndarray
+    """:obj:`np.ndarray`: The power at :obj:`percentile_q`."""
+
+    percentile_q: float
+    """:obj:`float`: The percentile reported in :obj:`percentile`."""
+
+    window: float | None
+    """:obj:`float | None`: The time window, in seconds, the statistics cover, or None for all samples held."""
+
+    computed_at: float
+    """:obj:`float`: The time at which the statistics were computed, as a POSIX timestamp."""
+
+    def statistic(self, name: str) -> np.ndarray:
+        """Get a statistic by name.
+
+        Args:
+            name (:obj:`str`): One of :obj:`POWER_STATISTICS`.
+
+        Returns:
+            :obj:`np.ndarray`: The (num_meters x 2) statistic.
+
+        Raises:
+            :obj:`ValueError`: If the statistic is unknown.
+        """
+        if name not in POWER_STATISTICS:
+            raise ValueError(f"Unknown power statistic {name!r}, expected one of {POWER_STATISTICS}")
+        return getattr(self, name)
+
+    def select(self, keys: Iterable[PowerMeterKey]) -> PowerStatistics:
+        """Get the statistics of a subset of the power meters, in the given order.
+
+        Args:
+            keys (:obj:`Iterable[PowerMeterKey]`): The power meters to keep.
+
+        Returns:
+            :obj:`PowerStatistics`: The statistics of the selected power meters.
+        """
+        keys = tuple(keys)
+        rows = [self.keys.index(key) for key in keys]
+        return PowerStatistics(
+            keys=keys,
+            count=self.count[rows],
+            mean=self.mean[rows],
+            median=self.median[rows],
+            percentile=self.percentile[rows],
+            percentile_q=self.percentile_q,
+            window=self.window,
+            computed_at=self.computed_at,
+        )
+
+    def to_spectrum(self) -> list[float]:
+        """Flatten the statistics for publishing as a spectrum attribute.
+
+        Returns:
+            :obj:`list[float]`: For each power meter in order, its [mean_x, mean_y, median_x, median_y, percentile_x, percentile_y].
+        """
+        return np.stack([self.mean, self.median, self.percentile], axis=1).reshape(-1).tolist()
+
+
+class PowerStatisticsBuffer:
+    """Fixed-size ring buffer of power snapshots, holding the average power of every power meter and polarization.
+
+    Samples are stored in a single preallocated (num_meters x capacity x 2) array, with NaN for
+    power meters which were not read, or could not be read, in a snapshot.
+    """
+
+    def __init__(self, keys: Sequence[PowerMeterKey], capacity: int = POWER_STATISTICS_CAPACITY) -> None:
+        """
+        Args:
+            keys (:obj:`Sequence[PowerMeterKey]`): The power meters to keep samples for.
+            capacity (:obj:`int`, optional): The number of most recent snapshots to keep. Default is :obj:`POWER_STATISTICS_CAPACITY`.
+        """
+        self.keys = tuple(keys)
+        self.capacity = capacity
+        self._rows = {key: row for row, key in enumerate(self.keys)}
+        self._powers = np.full((len(self.keys), capacity, 2), np.nan)
+        self._timestamps = np.full(capacity, np.nan)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, snapshot: PowerSnapshot) -> None:
+        """Add the readings of a power snapshot as the most recent sample, evicting the oldest sample if the buffer is full.
+
+        Args:
+            snapshot (:obj:`PowerSnapshot`): The snapshot. Readings of power meters not held by the buffer are ignored.
+        """
+        rows = [self._rows.get(key) for key in snapshot.keys]
+        held = [i for i, row in enumerate(rows) if row is not None]
+        with self._lock:
+            self._powers[:, self._next, :] = np.nan
+            self._powers[[rows[i] for i in held], self._next, :] = snapshot.powers[held]
+            self._timestamps[self._next] = snapshot.completed_at
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def statistics(self, window: float | None = POWER_STATISTICS_WINDOW, percentile_q: float = POWER_STATISTICS_PERCENTILE) -> PowerStatistics:
+        """Compute the statistics of the samples in a time window, ignoring missing readings.
+
+        Args:
+            window (:obj:`float | None`, optional): The time window, in seconds, ending now. None to use all samples held.
+                Default is :obj:`POWER_STATISTICS_WINDOW`.
+            percentile_q (:obj:`float`, optional): The percentile to compute. Default is :obj:`POWER_STATISTICS_PERCENTILE`.
+
+        Returns:
+            :obj:`PowerStatistics`: The statistics of every power meter.
+        """
+        now = time.time()
+        with self._lock:
+            in_window = ~np.isnan(self._timestamps)
+            if window is not None:
+                in_window &= self._timestamps >= now - window
+            samples = self._powers[:, in_window, :]
+
+        with warnings.catch_warnings():
+            # Power meters without any samples give NaN statistics
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return PowerStatistics(
+                keys=self.keys,
+                count=np.count_nonzero(~np.isnan(samples), axis=1),
+                mean=np.nanmean(samples, axis=1),
+                median=np.nanmedian(samples, axis=1),
+                percentile=np.nanpercentile(samples, percentile_q, axis=1),
+                percentile_q=percentile_q,
+                window=window,
+                computed_at=now,
+            )
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._powers.fill(np.nan)
+            self._timestamps.fill(np.nan)
+            self._next = 0
+            self._count = 0
+
+
+class PowerStatisticsSampler:
+    """Periodically reads a set of power meters into a :obj:`PowerStatisticsBuffer`, as a job of a :obj:`PollScheduler`."""
+
+    def __init__(
+        self,
+        fleet: WidebandPowerMeterFleet,
+        buffer: PowerStatisticsBuffer,
+        keys: Callable[[], Iterable[PowerMeterKey]],
+        should_run: Callable[[], bool],
+        logger: logging.Logger,
+        period: float = 1.0,
+        name: str = "power_statistics",
+        scheduler: PollScheduler | None = None,
+        on_sample: Callable[[PowerSnapshot], Any] | None = None,
+    ) -> None:
+        """
+        Args:
+            fleet (:obj:`WidebandPowerMeterFleet`): The power meters.
+            buffer (:obj:`PowerStatisticsBuffer`): The buffer to add the readings to.
+            keys (:obj:`Callable[[], Iterable[PowerMeterKey]]`): The power meters to read, e.g. the currently active ones.
+            should_run (:obj:`Callable[[], bool]`): Whether the power meters should currently be read, e.g. while configured.
+            logger (:obj:`logging.Logger`): Logger for read failures.
+            period (:obj:`float`, optional): The time, in seconds, between readings. Default is 1.0.
+            name (:obj:`str`, optional): The name of the sampler poll job. Default is "power_statistics".
+            scheduler (:obj:`PollScheduler | None`, optional): The scheduler to sample on. Default is None, using the shared scheduler.
+            on_sample (:obj:`Callable[[PowerSnapshot], Any] | None`, optional): Callback called with the readings of each
+                sample, e.g. to evaluate the health of the power meters without reading them again. Default is None.
+        """
+        self.fleet = fleet
+        self.buffer = buffer
+        self.period = period
+        self._keys = keys
+        self._should_run = should_run
+        self._logger = logger
+        self._name = name
+        self._scheduler = scheduler
+        self._on_sample = on_sample
+        self._job: PollJob | None = None
+
+    @property
+    def running(self) -> bool:
+        """:obj:`bool`: Whether the sampler is started."""
+        return self._job is not None
+
+    def start(self) -> None:
+        """Start the sampler, if not already started."""
+        if self.running:
+            return
+        self._job = (self._scheduler or PollScheduler.shared()).schedule(self._poll, self._name, self._logger)
+
+    def stop(self) -> None:
+        """Stop the sampler, waiting for an in-progress reading to complete."""
+        job, self._job = self._job, None
+        if job is not None:
+            job.cancel()
+
+    def sample(self) -> PowerSnapshot:
+        """Read the power meters once and add the readings to the buffer.
+
+        Returns:
+            :obj:`PowerSnapshot`: The readings.
+        """
+        snapshot = self.fleet.read_powers(self._keys(), deadline=self.period)
+        self.buffer.append(snapshot)
+        if self._on_sample is not None:
+            self._on_sample(snapshot)
+        return snapshot
+
+    def _poll(self) -> float:
+        started = time.monotonic()
+        if self._should_run():
+            try:
+                snapshot = self.sample()
+                if not snapshot.succeeded:
+                    self._logger.debug(f"Power statistics sample incomplete: {snapshot.report.describe_failures()}")
+            except Exception as ex:
+                self._logger.exception(f"Power statistics sample failed: {ex!r}")
+        return max(self.period - (time.monotonic() - started), 0.0)
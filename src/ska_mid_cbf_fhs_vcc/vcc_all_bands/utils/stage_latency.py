@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator
+
+import numpy as np
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_graph import ConfigureGraphReport
+
+__all__ = ["StageLatencyRecorder", "StageLatencySample"]
+
+STAGE_LATENCY_MAX_SAMPLES = 2048
+"""The default number of stage latency samples kept by a :obj:`StageLatencyRecorder`."""
+
+
+@dataclass(frozen=True)
+class StageLatencySample:
+    """The duration of a single stage of an observing command."""
+
+    command: str
+    """:obj:`str`: The command the stage belongs to, e.g. "ConfigureScan"."""
+
+    stage: str
+    """:obj:`str`: The stage of the command, e.g. "validation" or the name of an IP block step."""
+
+    duration: float
+    """:obj:`float`: The duration of the stage, in seconds."""
+
+    transaction_id: str | None
+    """:obj:`str | None`: The transaction ID of the command call, if any."""
+
+    timestamp: float
+    """:obj:`float`: The time at which the stage completed, as a POSIX timestamp."""
+
+
+class StageLatencyRecorder:
+    """Keeps the most recent stage latency samples of the observing commands in a fixed-size ring buffer,
+    and summarises them per command and stage.
+    """
+
+    def __init__(self, max_samples: int = STAGE_LATENCY_MAX_SAMPLES) -> None:
+        """
+        Args:
+            max_samples (:obj:`int`, optional): The number of most recent samples to keep.
+                Default is :obj:`STAGE_LATENCY_MAX_SAMPLES`.
+        """
+        self._samples: deque[StageLatencySample] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def record(self, command: str, stage: str, duration: float, transaction_id: str | None = None) -> None:
+        """Record the duration of a stage.
+
+        Args:
+            command (:obj:`str`): The command the stage belongs to.
+            stage (:obj:`str`): The stage of the command.
+            duration (:obj:`float`): The duration of the stage, in seconds.
+            transaction_id (:obj:`str | None`, optional): The transaction ID of the command call. Default is None.
+        """
+        sample = StageLatencySample(command=command, stage=stage, duration=duration, transaction_id=transaction_id, timestamp=time.time())
+        with self._lock:
+            self._samples.append(sample)
+
+    @contextmanager
+    def measure(self, command: str, stage: str, transaction_id: str | None = None) -> Iterator[None]:
+        """Context manager recording the duration of the enclosed block as a stage, whether or not it raises.
+
+        Args:
+            command (:obj:`str`): The command the stage belongs to.
+            stage (:obj:`str`): The stage of the command.
+            transaction_id (:obj:`str | None`, optional): The transaction ID of the command call. Default is None.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(command, stage, time.perf_counter() - start_time, transaction_id)
+
+    def record_report(self, command: str, report: ConfigureGraphReport, transaction_id: str | None = None, prefix: str = "") -> None:
+        """Record the duration of every step run in a configuration graph as a stage.
+
+        Args:
+            command (:obj:`str`): The command the graph was run for.
+            report (:obj:`ConfigureGraphReport`): The report of the graph.
+            transaction_id (:obj:`str | None`, optional): The transaction ID of the command call. Default is None.
+            prefix (:obj:`str`, optional): Prefix for the stage names, e.g. "rollback:". Default is "".
+        """
+        for name, duration in report.timings().items():
+            self.record(command, f"{prefix}{name}", duration, transaction_id)
+
+    def samples(self) -> list[StageLatencySample]:
+        """Get all samples currently held, from oldest to newest."""
+        with self._lock:
+            return list(self._samples)
+
+    def summary(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Summarise the samples currently held.
+
+        Returns:
+            :obj:`dict[str, dict[str, dict[str, Any]]]`: For each command and stage, the number of samples,
+            the p50, p95 and max durations in milliseconds, and the transaction ID of the slowest sample.
+        """
+        durations: dict[tuple[str, str], list[StageLatencySample]] = {}
+        for sample in self.samples():
+            durations.setdefault((sample.command, sample.stage), []).append(sample)
+
+        summary: dict[str, dict[str, dict[str, Any]]] = {}
+        for (command, stage), samples in durations.items():
+            values = np.fromiter((sample.duration for sample in samples), dtype=np.float64, count=len(samples)) * 1000
+            p50, p95 = np.percentile(values, [50, 95])
+            slowest = int(np.argmax(values))
+            summary.setdefault(command, {})[stage] = {
+                "count": len(samples),
+                "p50_ms": round(float(p50), 3),
+                "p95_ms": round(float(p95), 3),
+                "max_ms": round(float(values[slowest]), 3),
+                "max_transaction_id": samples[slowest].transaction_id,
+            }
+        return summary
+
+    def dump(self) -> list[dict[str, Any]]:
+        """Get all samples currently held as JSON-serializable dicts, from oldest to newest."""
+        return [asdict(sample) for sample in self.samples()]
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._samples.clear()
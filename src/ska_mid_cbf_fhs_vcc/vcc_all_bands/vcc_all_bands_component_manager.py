@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-import copy
+import dataclasses
 import functools
 import json
 import logging
+import os
 import textwrap
-from math import isnan
+import threading
+import time
 from threading import Event
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Mapping, Optional
 
 import jsonschema
+import numpy as np
+import pydantic
 from ska_control_model import CommunicationStatus, HealthState, ObsState, ResultCode, SimulationMode, TaskStatus
 from ska_control_model.faults import StateModelError
 from ska_mid_cbf_common.enums.command_type import CommandType
-from ska_mid_cbf_fhs_common import FtileEthernetManager, NonBlockingFunction, WidebandPowerMeterConfig, WidebandPowerMeterManager, calculate_gain_multiplier
+from ska_mid_cbf_fhs_common import FtileEthernetManager, NonBlockingFunction, WidebandPowerMeterConfig, WidebandPowerMeterManager, WidebandPowerMeterStatus
 from ska_mid_cbf_fhs_common.base_classes.device.controller.fhs_controller_base_dataclasses import (
     FhsControllerBaseEndScanSchema,
     FhsControllerBaseGoToIdleSchema,
@@ -30,15 +34,107 @@ from ska_mid_cbf_fhs_vcc.b123_vcc_osppfb_channelizer.b123_vcc_osppfb_channelizer
     B123VccOsppfbChannelizerConfigureArgin,
     B123VccOsppfbChannelizerManager,
 )
-from ska_mid_cbf_fhs_vcc.frequency_slice_selection.frequency_slice_selection_manager import FrequencySliceSelectionConfig, FrequencySliceSelectionManager
-from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import FrequencyBandEnum, VCCBandGroup, freq_band_dict
-from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_manager import PacketValidationManager
+from ska_mid_cbf_fhs_vcc.frequency_slice_selection.frequency_slice_selection_manager import FrequencySliceSelectionManager
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import FrequencyBandEnum, VCCBandGroup, band_group, freq_band_dict
+from ska_mid_cbf_fhs_vcc.helpers.record_ring import encode_records
+from ska_mid_cbf_fhs_vcc.monitoring.health_rollup import HealthRollup
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollScheduler
+from ska_mid_cbf_fhs_vcc.monitoring.status_recorder import StatusRecorder
+from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_manager import PacketValidationManager, PacketValidationStatus
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.schemas.auto_gain_control import vcc_all_bands_auto_gain_control_schema
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.schemas.auto_set_fleet_filter_gains import vcc_all_bands_auto_set_fleet_filter_gains_schema
 from ska_mid_cbf_fhs_vcc.vcc_all_bands.schemas.configure_scan import vcc_all_bands_configure_scan_schema
 from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.admin_online import VccAdminOnline
-from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import VCCAllBandsAutoSetFilterGainsSchema, VCCAllBandsConfigureScanConfig
-from ska_mid_cbf_fhs_vcc.vcc_stream_merge.vcc_stream_merge_manager import VCCStreamMergeConfig, VCCStreamMergeConfigureArgin, VCCStreamMergeManager
-from ska_mid_cbf_fhs_vcc.wideband_frequency_shifter.wideband_frequency_shifter_manager import WidebandFrequencyShifterConfig, WidebandFrequencyShifterManager
-from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_manager import WidebandInputBufferConfig, WidebandInputBufferManager
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.auto_gain_control import AutoGainControlLoop, apply_gain_hysteresis
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_diff import configuration_diff
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_graph import ConfigureGraphExecutor, ConfigureGraphReport, ConfigureStep, rollback_steps, select_steps
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_plan import ConfigurePlan, StagedConfiguration, build_configure_plan
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_scan_parser import ConfigureScanParser, configure_scan_fingerprint
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.filter_gain_coordinator import FilterGainCoordinator, FilterGainUpdate
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_history import GainHistory, GainSource
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_solver import POLARIZATIONS, invalid_power_mask, solve_filter_gains
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet import PowerMeterFleetReport, PowerSnapshot, WidebandPowerMeterFleet, power_meter_name
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_health import PowerMeterHealthMonitor
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_statistics import POWER_STATISTICS, POWER_STATISTICS_WINDOW, PowerStatisticsBuffer, PowerStatisticsSampler
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.stage_latency import StageLatencyRecorder
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import (
+    VCCAllBandsAutoGainControlSchema,
+    VCCAllBandsAutoSetFilterGainsSchema,
+    VCCAllBandsAutoSetFleetFilterGainsSchema,
+    VCCAllBandsConfigureScanConfig,
+)
+from ska_mid_cbf_fhs_vcc.vcc_stream_merge.vcc_stream_merge_manager import VCCStreamMergeManager, VCCStreamMergeStatus
+from ska_mid_cbf_fhs_vcc.wideband_frequency_shifter.wideband_frequency_shifter_manager import WidebandFrequencyShifterManager
+from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_manager import (
+    WidebandInputBufferConfig,
+    WidebandInputBufferManager,
+    WidebandInputBufferStatus,
+)
+
+CONFIGURE_SCAN_MAX_WORKERS = 8
+"""The maximum number of IP blocks programmed concurrently during ConfigureScan."""
+
+NUM_FS_BY_FREQUENCY_BAND: dict[FrequencyBandEnum, int] = {
+    FrequencyBandEnum._1: 10,
+    FrequencyBandEnum._2: 10,
+    FrequencyBandEnum._3: 15,
+    FrequencyBandEnum._4: 15,
+    FrequencyBandEnum._5A: 26,
+    FrequencyBandEnum._5B: 26,
+}
+"""The number of frequency slices (VCC coarse channels) produced in each frequency band."""
+
+POWER_METER_FLEET_MAX_WORKERS = 8
+"""The maximum number of Wideband Power Meters operated on concurrently."""
+
+POWER_STATISTICS_PERIOD = 1.0
+"""The time, in seconds, between the power meter readings kept for power statistics."""
+
+STREAM_MERGE_STATUS_PERIOD = 3.0
+"""The time, in seconds, between the VCC Stream Merge status readings recorded while scanning."""
+
+CONFIGURE_STEPS_BY_FIELD: dict[str, tuple[str, ...]] = {
+    "config_id": (),
+    "transaction_id": (),
+    "force_full_configure": (),
+    "samples_per_frame": (),
+    "frequency_band_offset_stream_2": (),
+    "band_5_tuning": (),
+    "dish_sample_rate": ("b123_vcc", "wideband_input_buffer"),
+    "vcc_gain": ("b123_vcc",),
+    "frequency_band_offset_stream_1": ("wideband_frequency_shifter",),
+    "expected_dish_id": ("wideband_input_buffer",),
+    "noise_diode_transition_holdoff_seconds": ("wideband_input_buffer",),
+    "b123_pwrm": ("pre_channelizer_power_meters",),
+    "b45a_pwrm": ("pre_channelizer_power_meters",),
+    "b5b_pwrm": ("pre_channelizer_power_meters",),
+}
+"""ConfigureScan steps that must be re-run when a given top-level configuration field changes.
+Fields mapping to an empty tuple do not affect any IP block. Changes to any field not listed here
+(e.g. the frequency band) require a full configuration."""
+
+FS_LANE_CONFIGURE_STEPS_BY_FIELD: dict[str, tuple[str, ...]] = {
+    "averaging_time": ("fs_power_meters",),
+    "flagging": ("fs_power_meters",),
+    "fs_id": ("fs_power_meters", "vcc_stream_merge_{merge}"),
+    "vlan_id": ("vcc_stream_merge_{merge}",),
+}
+"""ConfigureScan steps that must be re-run when a field of a single FS lane changes.
+The stream merge placeholder is resolved from the index of the lane (13 lanes per merge block)."""
+
+
+class ConfigureScanRolledBackError(RuntimeError):
+    """Raised when a ConfigureScan fails after every IP block it touched was rolled back."""
+
+    def __init__(self, message: str, restored: bool) -> None:
+        """
+        Args:
+            message (:obj:`str`): The error message.
+            restored (:obj:`bool`): Whether the blocks were restored to the previous configuration,
+                rather than deconfigured.
+        """
+        super().__init__(message)
+        self.restored = restored
 
 
 class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceComponentManager):
@@ -68,6 +164,9 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
     last_requested_headrooms: list[float]
     """:obj:`list[float]`: The requested headrooms from the most recent call to AutoSetFilterGains."""
 
+    gain_history: GainHistory
+    """:obj:`GainHistory`: Every gain vector applied to the VCC coarse channels, and what applied it."""
+
     ethernet_200g: FtileEthernetManager
     """:obj:`FtileEthernetManager`: The IP block manager for the F-tile Ethernet block."""
 
@@ -93,6 +192,9 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
     """:obj:`dict[VCCBandGroup | int, WidebandPowerMeterManager]`: Dictionary containing the IP block managers
     for all Wideband Power Meters, mapped by either band group (B123, etc) or FS index (1 to 26)."""
 
+    power_meter_fleet: WidebandPowerMeterFleet
+    """:obj:`WidebandPowerMeterFleet`: Runs operations across all Wideband Power Meters concurrently."""
+
     @property
     def config_schema(self) -> dict[str, Any]:
         """The ConfigureScan input JSON schema for the VCC All Bands Controller."""
@@ -192,20 +294,136 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
         self.vcc_gains: list[float] = []
         self.last_requested_headrooms: list[float] = []
 
+        # Every gain vector applied, optionally spilled to a file so that it survives a restart
+        self.gain_history = GainHistory(path=self.device.gain_history_path or None)
+
+        # Lets AutoSetFleetFilterGains level the gains of every VCC hosted by this device server process
+        self._filter_gain_coordinator = FilterGainCoordinator.shared()
+        self._filter_gain_coordinator.register(self._vcc_id, self)
+
+        # Last configuration successfully programmed into the IP blocks, used to
+        # only reprogram the blocks whose inputs change on a subsequent ConfigureScan
+        self._applied_configuration: VCCAllBandsConfigureScanConfig | None = None
+
+        # Validated and decoded ConfigureScan configurations along with their compiled per-block configurations,
+        # so that re-applying a configuration skips parsing and goes straight to programming
+        self._configure_scan_parser: ConfigureScanParser[ConfigurePlan] = ConfigureScanParser(
+            compile_plan=functools.partial(build_configure_plan, vcc_id=self._vcc_id)
+        )
+
+        # Plan of the configuration decoded by the running ConfigureScan, for its controller implementation
+        self._decoded_configure_plan: ConfigurePlan | None = None
+
+        # Durations of each stage of the observing commands, for diagnosing slow commands
+        self.stage_latencies = StageLatencyRecorder()
+
+        # Next configuration compiled by PrepareConfiguration, committed by a matching ConfigureScan
+        self._staged_configuration: StagedConfiguration | None = None
+
+        # Serialises every change of the gains: ConfigureScan, GoToIdle, the reset, AutoSetFilterGains,
+        # AutoSetFleetFilterGains and the automatic gain control loop. Re-entrant, as a failed ConfigureScan resets
+        self._gains_lock = threading.RLock()
+
+        # Automatic gain control, re-applying the requested headrooms in the background while scanning
+        self.auto_gain_control: AutoGainControlLoop[VCCAllBandsAutoGainControlSchema] = AutoGainControlLoop(
+            step=self._auto_gain_control_step,
+            should_run=lambda: self.obs_state == ObsState.SCANNING,
+            logger=self.logger,
+            name=f"vcc{self._vcc_id}_auto_gain_control",
+        )
+
+        # Independent IP blocks are programmed concurrently during ConfigureScan
+        self._configure_executor = ConfigureGraphExecutor(max_workers=CONFIGURE_SCAN_MAX_WORKERS, thread_name_prefix=f"vcc{self._vcc_id}_configure")
+
     def _init_ip_block_managers(self) -> list[BaseIPBlockManager]:
         """Instantiate all the IP block managers for the VCC controller."""
 
         self.ethernet_200g = FtileEthernetManager(**self._ip_block_props("Ethernet200Gb", additional_props=["ethernet_mode"]))
-        self.b123_vcc = B123VccOsppfbChannelizerManager(**self._ip_block_props("B123VccOsppfbChannelizer"))
+        self.b123_vcc = B123VccOsppfbChannelizerManager(**self._ip_block_props("B123VccOsppfbChannelizer", additional_props=["bulk_gain_writes"]))
         self.frequency_slice_selection = FrequencySliceSelectionManager(**self._ip_block_props("FrequencySliceSelection"))
-        self.packet_validation = PacketValidationManager(**self._ip_block_props("PacketValidation"))
         self.wideband_frequency_shifter = WidebandFrequencyShifterManager(**self._ip_block_props("WidebandFrequencyShifter"))
-        self.wideband_input_buffer = WidebandInputBufferManager(**self._ip_block_props("WidebandInputBuffer"))
-        self.vcc_stream_merges: dict[int, VCCStreamMergeManager] = {i: VCCStreamMergeManager(**self._ip_block_props(f"VCCStreamMerge{i}")) for i in range(1, 3)}
+        wideband_input_buffer_props = self._ip_block_props(
+            "WidebandInputBuffer",
+            additional_props=[
+                "health_monitor_min_poll_interval",
+                "health_monitor_max_poll_interval",
+                "health_summary_interval",
+                "health_rate_thresholds",
+            ],
+        )
+        # The health of the Wideband Input Buffer, the Packet Validation and the power meters is rolled up into a single health state
+        self.health_rollup = HealthRollup(wideband_input_buffer_props.get("update_health_state_callback"))
+        self.wideband_input_buffer = WidebandInputBufferManager(
+            **{**wideband_input_buffer_props, "update_health_state_callback": self.health_rollup.callback("wideband_input_buffer")}
+        )
+        self.packet_validation = PacketValidationManager(
+            **{
+                **self._ip_block_props(
+                    "PacketValidation",
+                    additional_props=["health_summary_interval", "health_rate_thresholds"],
+                ),
+                "update_health_state_callback": self.health_rollup.callback("packet_validation"),
+            }
+        )
+        self.vcc_stream_merges: dict[int, VCCStreamMergeManager] = {
+            i: VCCStreamMergeManager(**self._ip_block_props(f"VCCStreamMerge{i}", additional_props=["bulk_lane_writes"])) for i in range(1, 3)
+        }
         self.wideband_power_meters: dict[VCCBandGroup | int, WidebandPowerMeterManager] = {
             **{band_group: WidebandPowerMeterManager(**self._ip_block_props(f"{band_group.value.upper()}WidebandPowerMeter")) for band_group in VCCBandGroup},
             **{i: WidebandPowerMeterManager(**self._ip_block_props(f"FS{i}WidebandPowerMeter")) for i in range(1, 27)},
         }
+        self.power_meter_fleet = WidebandPowerMeterFleet(
+            self.wideband_power_meters,
+            max_workers=POWER_METER_FLEET_MAX_WORKERS,
+            thread_name_prefix=f"vcc{self.device.device_id}_power_meters",
+        )
+
+        # Health of the power meters of the current frequency band, evaluated from the power statistics samples while scanning
+        self.power_meter_health = PowerMeterHealthMonitor(
+            list(self.wideband_power_meters),
+            self.logger,
+            healthy_range=tuple(self.device.power_meter_healthy_range),
+            update_health_state_callback=self.health_rollup.callback("wideband_power_meters"),
+        )
+
+        # Recent power readings of the active power meters, sampled in the background while configured
+        self.power_statistics = PowerStatisticsBuffer(list(self.wideband_power_meters))
+        self.power_statistics_sampler = PowerStatisticsSampler(
+            self.power_meter_fleet,
+            self.power_statistics,
+            keys=lambda: [*VCCBandGroup, *range(1, self._num_fs + 1)],
+            should_run=lambda: not self.simulation_mode and self.obs_state in (ObsState.READY, ObsState.SCANNING),
+            logger=self.logger,
+            period=POWER_STATISTICS_PERIOD,
+            name=f"vcc{self.device.device_id}_power_statistics",
+            on_sample=self._update_power_meter_health,
+        )
+        self.power_statistics_sampler.start()
+
+        # Every status read by the monitoring polls, optionally kept in ring files for diagnosing faults, in a directory
+        # of each VCC since the VCCs of a device server may share the same status record path
+        status_record_directory = None
+        if self.device.status_record_path:
+            status_record_directory = os.path.join(self.device.status_record_path, f"vcc{self._vcc_id}")
+        self.status_recorder = StatusRecorder(status_record_directory)
+        self.wideband_input_buffer.record_status = self.status_recorder.channel("wideband_input_buffer", WidebandInputBufferStatus)
+        self.packet_validation.record_status = self.status_recorder.channel("packet_validation", PacketValidationStatus)
+        self.power_meter_fleet.status_recorders = {
+            key: self.status_recorder.channel(
+                "wideband_power_meter",
+                WidebandPowerMeterStatus,
+                power_meter_name(key),
+                capacity=len(self.wideband_power_meters) * self.status_recorder.capacity,
+            )
+            for key in self.wideband_power_meters
+        }
+        self._record_stream_merge_status = {
+            i: self.status_recorder.channel("vcc_stream_merge", VCCStreamMergeStatus, str(i), capacity=2 * self.status_recorder.capacity)
+            for i in self.vcc_stream_merges
+        }
+        self._stream_merge_status_job = PollScheduler.shared().schedule(
+            self._poll_stream_merge_status, f"vcc{self.device.device_id}_stream_merge_status", self.logger
+        )
 
         return [
             self.ethernet_200g,
@@ -218,6 +436,33 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             *self.wideband_power_meters.values(),
         ]
 
+    def _update_power_meter_health(self, snapshot: PowerSnapshot) -> None:
+        # Only the power meters of the current frequency band see any signal, and only while scanning
+        if self.obs_state == ObsState.SCANNING:
+            self.power_meter_health.update(snapshot, [band_group(self.frequency_band), *range(1, self._num_fs + 1)])
+        else:
+            self.power_meter_health.reset()
+
+    def _poll_stream_merge_status(self) -> float:
+        # The stream merges have no health monitoring of their own, so their status is only read to be recorded
+        if not self.simulation_mode and self.obs_state == ObsState.SCANNING:
+            for i, stream_merge in self.vcc_stream_merges.items():
+                self._record_stream_merge_status[i](stream_merge.status())
+        return STREAM_MERGE_STATUS_PERIOD
+
+    def close(self) -> None:
+        """Stop the background work of the component manager, such as its jobs on the shared :obj:`PollScheduler`,
+        so that it can be discarded when the device is deleted or re-initialised."""
+        self.auto_gain_control.stop()
+        self.power_statistics_sampler.stop()
+        self.wideband_input_buffer.scheduled_health_monitor.stop()
+        self.packet_validation.scheduled_health_monitor.stop()
+        self._stream_merge_status_job.cancel()
+        self._configure_executor.close()
+        self.power_meter_fleet.close()
+        self.status_recorder.flush()
+        self._filter_gain_coordinator.unregister(self._vcc_id)
+
     def update_subarray_membership(
         self: VCCAllBandsComponentManager,
         argin: int,
@@ -264,6 +509,39 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
 
         return self.is_allowed(error_msg, [ObsState.READY])
 
+    def is_prepare_configuration_allowed(self) -> bool:
+        """Determine whether the PrepareConfiguration command is allowed from the current ObsState.
+
+        Returns:
+            :obj:`bool`: True if the PrepareConfiguration command is allowed, False otherwise.
+        """
+        self.logger.debug("Checking if PrepareConfiguration is allowed...")
+        error_msg = f"PrepareConfiguration not allowed in ObsState {self.obs_state}; must be in ObsState.IDLE, ObsState.READY or ObsState.SCANNING"
+
+        return self.is_allowed(error_msg, [ObsState.IDLE, ObsState.READY, ObsState.SCANNING])
+
+    def is_start_auto_gain_control_allowed(self) -> bool:
+        """Determine whether the StartAutoGainControl command is allowed from the current ObsState.
+
+        Returns:
+            :obj:`bool`: True if the StartAutoGainControl command is allowed, False otherwise.
+        """
+        self.logger.debug("Checking if StartAutoGainControl is allowed...")
+        error_msg = f"StartAutoGainControl not allowed in ObsState {self.obs_state}; must be in ObsState.READY or ObsState.SCANNING"
+
+        return self.is_allowed(error_msg, [ObsState.READY, ObsState.SCANNING])
+
+    def is_auto_set_fleet_filter_gains_allowed(self) -> bool:
+        """Determine whether the AutoSetFleetFilterGains command is allowed from the current ObsState.
+
+        Returns:
+            :obj:`bool`: True if the AutoSetFleetFilterGains command is allowed, False otherwise.
+        """
+        self.logger.debug("Checking if AutoSetFleetFilterGains is allowed...")
+        error_msg = f"AutoSetFleetFilterGains not allowed in ObsState {self.obs_state}; must be in ObsState.READY or ObsState.SCANNING"
+
+        return self.is_allowed(error_msg, [ObsState.READY, ObsState.SCANNING])
+
     def is_obs_reset_allowed(self) -> bool:
         """Determine whether the ObsReset command is allowed from the current ObsState.
 
@@ -344,6 +622,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             :obj:`tuple[TaskStatus, str]`: The status of the task and an informative message string.
         """
         self._obs_state_action_callback(FhsObsStateMachine.ABORT_INVOKED)
+        self.auto_gain_control.stop()
         task_status, msg = super().abort_commands(task_callback)
         self._obs_state_action_callback(FhsObsStateMachine.ABORT_COMPLETED)
         return task_status, msg
@@ -356,11 +635,30 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
     ) -> None:
         """Wrapper for the ConfigureScan command implementation for all controllers,
         to handle task and ObsState management as well as error handling.
+
+        Replaces the parsing step of the base ConfigureScan flow: the argin is validated and decoded only by
+        the cached :obj:`ConfigureScanParser`, so a resubmitted configuration is not validated again.
         """
+        start_time = time.perf_counter()
         try:
             self._obs_state_action_callback(FhsObsStateMachine.CONFIGURE_INVOKED)
-            super()._configure_scan(argin, task_callback, task_abort_event)
+            task_callback(status=TaskStatus.IN_PROGRESS)
+
+            plan = self._configure_scan_parser.plan(*self._configure_scan_parser.identify(argin))
+            transaction_id = plan.transaction_id
+            self.transaction_ids_per_command[CommandType.CONFIGURESCAN] = transaction_id
+            self.stage_latencies.record("ConfigureScan", "validation", time.perf_counter() - start_time, transaction_id)
+            self.log_info(f"Received Command ConfigureScan for Config ID: {plan.config_id}", transaction_id)
+
+            if self.task_abort_event_is_set("ConfigureScan", task_callback, task_abort_event):
+                return
+
+            self._decoded_configure_plan = plan
+            self._configure_scan_controller_impl(plan.configuration, task_callback)
             self._obs_state_action_callback(FhsObsStateMachine.CONFIGURE_COMPLETED)
+
+            self._set_task_callback(task_callback, TaskStatus.COMPLETED, ResultCode.OK, "ConfigureScan completed OK")
+            self.long_running_command_result_buffer.insert(command_type=CommandType.CONFIGURESCAN, result_code=ResultCode.OK, transaction_id=transaction_id)
         except StateModelError as ex:
             transaction_id = self.transaction_ids_per_command.get(CommandType.CONFIGURESCAN, None)
             self.log_error("Attempted to call ConfigureScan command from an incorrect state", transaction_id)
@@ -374,7 +672,19 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             self.long_running_command_result_buffer.insert(
                 command_type=CommandType.CONFIGURESCAN, result_code=ResultCode.REJECTED, transaction_id=transaction_id
             )
-        except jsonschema.ValidationError as ex:
+        except ConfigureScanRolledBackError as ex:
+            transaction_id = self.transaction_ids_per_command.get(CommandType.CONFIGURESCAN, None)
+            self.logger.exception(ex)
+            # The IP blocks are in a known state: still configured if the previous configuration was restored, otherwise deconfigured
+            self._obs_state_action_callback(FhsObsStateMachine.CONFIGURE_COMPLETED if ex.restored else FhsObsStateMachine.GO_TO_IDLE)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.FAILED,
+                textwrap.shorten(f"ConfigureScan failed: {ex}", width=400),
+            )
+            self.long_running_command_result_buffer.insert(command_type=CommandType.CONFIGURESCAN, result_code=ResultCode.FAILED, transaction_id=transaction_id)
+        except (jsonschema.ValidationError, pydantic.ValidationError) as ex:
             transaction_id = self.transaction_ids_per_command.get(CommandType.CONFIGURESCAN, None)
             self.log_error("Invalid json provided for ConfigureScan", transaction_id)
             self.logger.exception(ex)
@@ -396,6 +706,10 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             )
             self.long_running_command_result_buffer.insert(command_type=CommandType.CONFIGURESCAN, result_code=ResultCode.FAILED, transaction_id=transaction_id)
         finally:
+            self._decoded_configure_plan = None
+            self.stage_latencies.record(
+                "ConfigureScan", "total", time.perf_counter() - start_time, self.transaction_ids_per_command.get(CommandType.CONFIGURESCAN, None)
+            )
             # Reset the ID so it's not used in a different Command call
             self.transaction_ids_per_command[CommandType.CONFIGURESCAN] = None
 
@@ -408,6 +722,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
         """Wrapper for the Scan command implementation for all controllers,
         to handle task management as well as error handling.
         """
+        start_time = time.perf_counter()
         try:
             self._obs_state_action_callback(FhsObsStateMachine.START_INVOKED)
             super()._scan(argin, task_callback, task_abort_event)
@@ -435,6 +750,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             )
             self.long_running_command_result_buffer.insert(command_type=CommandType.SCAN, result_code=ResultCode.FAILED, transaction_id=transaction_id)
         finally:
+            self.stage_latencies.record("Scan", "total", time.perf_counter() - start_time, self.transaction_ids_per_command.get(CommandType.SCAN, None))
             # Reset the ID so it's not used in a different Command call
             self.transaction_ids_per_command[CommandType.SCAN] = None
 
@@ -447,6 +763,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
         """Wrapper for the EndScan command implementation for all controllers,
         to handle task management as well as error handling.
         """
+        start_time = time.perf_counter()
         try:
             self._obs_state_action_callback(FhsObsStateMachine.STOP_INVOKED)
             super()._end_scan(argin, task_callback, task_abort_event)
@@ -474,6 +791,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             )
             self.long_running_command_result_buffer.insert(command_type=CommandType.ENDSCAN, result_code=ResultCode.FAILED, transaction_id=transaction_id)
         finally:
+            self.stage_latencies.record("EndScan", "total", time.perf_counter() - start_time, self.transaction_ids_per_command.get(CommandType.ENDSCAN, None))
             # Reset the ID so it's not used in a different Command call
             self.transaction_ids_per_command[CommandType.ENDSCAN] = None
 
@@ -484,6 +802,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
         task_abort_event: Optional[Event] = None,
     ) -> None:
         """GoToIdle command implementation for all controllers."""
+        start_time = time.perf_counter()
         try:
             super()._go_to_idle(argin, task_callback, task_abort_event)
         except StateModelError as ex:
@@ -508,6 +827,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             )
             self.long_running_command_result_buffer.insert(command_type=CommandType.GOTOIDLE, result_code=ResultCode.FAILED, transaction_id=transaction_id)
         finally:
+            self.stage_latencies.record("GoToIdle", "total", time.perf_counter() - start_time, self.transaction_ids_per_command.get(CommandType.GOTOIDLE, None))
             # Reset the ID so it's not used in a different Command call
             self.transaction_ids_per_command[CommandType.GOTOIDLE] = None
 
@@ -519,6 +839,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
         from_state=ObsState.ABORTED,
     ) -> None:
         """ObsReset command implementation for all controllers."""
+        start_time = time.perf_counter()
         try:
             task_callback(status=TaskStatus.IN_PROGRESS)
             self.log_info("Received Command ObsReset", transaction_id)
@@ -527,7 +848,7 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
 
             # If in FAULT state, devices may still be running, so make sure they are stopped
             if from_state is ObsState.FAULT:
-                self._stop_ip_blocks()
+                self._timed("ObsReset", "stop_ip_blocks", transaction_id, self._stop_ip_blocks)
 
             self._reset()
             self._recover_all_ip_blocks()
@@ -555,296 +876,853 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             )
             self.long_running_command_result_buffer.insert(command_type=CommandType.OBSRESET, result_code=ResultCode.FAILED, transaction_id=transaction_id)
         finally:
+            self.stage_latencies.record("ObsReset", "total", time.perf_counter() - start_time, transaction_id)
             # Reset the ID so it's not used in a different Command call
             self.transaction_ids_per_command[CommandType.OBSRESET] = None
 
-    def auto_set_filter_gains(
+    def prepare_configuration(
         self: VCCAllBandsComponentManager,
         argin: str,
         task_callback: Optional[Callable] = None,
     ) -> tuple[TaskStatus, str]:
-        """Submit the task to start running the AutoSetFilterGains command implementation.
+        """Submit the task to start running the PrepareConfiguration command implementation.
 
         Args:
-            argin (:obj:`str`): JSON String following the auto set filter gains command schema
-                Requested RFI headroom, in decibels (dB).
-                Must be a list containing either a single value to apply to all frequency slices,
-                or a value per frequency slice to be applied separately.
+            argin (:obj:`str`): JSON string following the ConfigureScan schema, containing the next configuration.
             task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
 
         Returns:
             :obj:`tuple[TaskStatus, str]`: The status of the task and an informative message string.
         """
         return self.submit_task(
-            func=self._auto_set_filter_gains,
+            func=self._prepare_configuration,
             args=[argin],
             task_callback=task_callback,
+            is_cmd_allowed=self.is_prepare_configuration_allowed,
         )
 
-    def _configure_scan_controller_impl(
-        self,
-        configuration: VCCAllBandsConfigureScanConfig,
+    def auto_set_fleet_filter_gains(
+        self: VCCAllBandsComponentManager,
+        argin: str | None = None,
         task_callback: Optional[Callable] = None,
-    ) -> None:
-        """VCC-specific implementation for the ConfigureScan command.
+    ) -> tuple[TaskStatus, str]:
+        """Submit the task to start running the AutoSetFleetFilterGains command implementation.
 
         Args:
-            configuration (:obj:`dict[str, Any]`): The configuration JSON string from the command's input argument.
+            argin (:obj:`str | None`): JSON string following the auto set fleet filter gains command schema.
             task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
-        """
-        self._sample_rate = configuration.dish_sample_rate
-        self._samples_per_frame = configuration.samples_per_frame
-        self.frequency_band = freq_band_dict()[configuration.frequency_band]
-        self.expected_dish_id = configuration.expected_dish_id
-        self._config_id = configuration.config_id
-        self.frequency_band_offset[0] = configuration.frequency_band_offset_stream_1
-        self.frequency_band_offset[1] = configuration.frequency_band_offset_stream_2
 
-        transaction_id = self.transaction_ids_per_command.get(CommandType.CONFIGURESCAN, None)
+        Returns:
+            :obj:`tuple[TaskStatus, str]`: The status of the task and an informative message string.
+        """
+        return self.submit_task(
+            func=self._auto_set_fleet_filter_gains,
+            args=[argin],
+            task_callback=task_callback,
+            is_cmd_allowed=self.is_auto_set_fleet_filter_gains_allowed,
+        )
 
-        self.log_info(f"Configuring VCC {self._vcc_id} - Config ID: {self._config_id}, Freq Band: {self.frequency_band.value}", transaction_id)
+    def start_auto_gain_control(
+        self: VCCAllBandsComponentManager,
+        argin: str | None = None,
+        task_callback: Optional[Callable] = None,
+    ) -> tuple[TaskStatus, str]:
+        """Submit the task to start running the StartAutoGainControl command implementation.
 
-        # Only used if the configuration fails and go to idle deconfigure needs to be called
-        # It is being initialised here so we dont need to initialise it in every if failed block
-        failure_go_to_idle_schema = FhsControllerBaseGoToIdleSchema(subarray_id=self.subarray_id, transaction_id=transaction_id)
+        Args:
+            argin (:obj:`str | None`): JSON string following the auto gain control command schema.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
 
-        match self.frequency_band:
-            case FrequencyBandEnum._1 | FrequencyBandEnum._2:
-                self._num_fs = 10
-            case FrequencyBandEnum._3 | FrequencyBandEnum._4:
-                self._reset()
-                raise ValueError("Bands 3/4 not implemented")
-                # self._num_fs = 15
-            case _:
-                self._reset()
-                raise ValueError("Bands 5A/B not implemented")
-                # self._num_fs = 26
+        Returns:
+            :obj:`tuple[TaskStatus, str]`: The status of the task and an informative message string.
+        """
+        return self.submit_task(
+            func=self._start_auto_gain_control,
+            args=[argin],
+            task_callback=task_callback,
+            is_cmd_allowed=self.is_start_auto_gain_control_allowed,
+        )
 
-        # number of channels * number of polarizations
-        self._num_vcc_gains = self._num_fs * 2
+    def stop_auto_gain_control(
+        self: VCCAllBandsComponentManager,
+        argin: str | None = None,
+        task_callback: Optional[Callable] = None,
+    ) -> tuple[TaskStatus, str]:
+        """Submit the task to start running the StopAutoGainControl command implementation.
 
-        self.vcc_gains = configuration.vcc_gain
+        Args:
+            argin (:obj:`str | None`): Optional JSON string containing the transaction_id of the command.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
 
-        if len(self.vcc_gains) != self._num_vcc_gains:
-            self._reset()
-            raise ValueError(f"Incorrect number of gain values supplied: {self.vcc_gains} != {self._num_vcc_gains}")
+        Returns:
+            :obj:`tuple[TaskStatus, str]`: The status of the task and an informative message string.
+        """
+        return self.submit_task(
+            func=self._stop_auto_gain_control,
+            args=[argin],
+            task_callback=task_callback,
+        )
 
-        if not self.simulation_mode:
-            # VCC123 Channelizer Configuration
-            self.log_debug("VCC123 Channelizer Configuring..", transaction_id)
-            if self.frequency_band in {FrequencyBandEnum._1, FrequencyBandEnum._2}:
-                result = self.b123_vcc.configure(
-                    B123VccOsppfbChannelizerConfigureArgin(sample_rate=self._sample_rate, gains=self.vcc_gains, transaction_id=transaction_id)
-                )
+    @property
+    def power_statistics_spectrum(self) -> list[float]:
+        """:obj:`list[float]`: The windowed statistics of the recently sampled power of every power meter
+        (see :obj:`PowerStatistics.to_spectrum`), computed without reading the power meters."""
+        return self.power_statistics.statistics().to_spectrum()
 
-                if result == 1:
-                    self.log_error("Configuration of VCC123 Channelizer failed.", transaction_id)
-                    self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                    self._reset()
-                    raise RuntimeError("Configuration of VCC123 failed.")
+    @property
+    def auto_gain_control_status(self) -> str:
+        """:obj:`str`: JSON description of the automatic gain control loop: whether it is running, its configuration and its counters."""
+        config = self.auto_gain_control.config
+        return json.dumps(self.auto_gain_control.status() | {"config": config.to_dict() if config is not None else None})
 
-            else:
-                # TODO: Implement routing to the 5 Channelizer once outlined
-                self._reset()
-                raise ValueError(f"ConfigureScan failed unsupported band specified: {self.frequency_band}")
+    @property
+    def wideband_input_buffer_counter_rates(self) -> list[float]:
+        """:obj:`list[float]`: The rates of the Wideband Input Buffer error counters, in counts per second, over the last 10 seconds."""
+        return self.wideband_input_buffer.counter_rates.rates.tolist()
 
-            # WFS Configuration
-            self.log_debug("Wideband Frequency Shifter Configuring..", transaction_id)
-            result = self.wideband_frequency_shifter.configure(
-                WidebandFrequencyShifterConfig(shift_frequency=self.frequency_band_offset[0], transaction_id=transaction_id)
-            )
-            if result == 1:
-                self.log_error("Configuration of Wideband Frequency Shifter failed.", transaction_id)
-                self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                self._reset()
-                raise RuntimeError("Configuration of Wideband Frequency Shifter failed.")
-
-            # FSS Configuration
-            result = self.frequency_slice_selection.configure(
-                FrequencySliceSelectionConfig(
-                    band_select=self.frequency_band.value + 1,
-                    band_start_channel=[0, 1],
-                    transaction_id=transaction_id,
-                )
-            )
+    @property
+    def packet_validation_counter_rates(self) -> list[float]:
+        """:obj:`list[float]`: The rates of the Packet Validation counters, in counts per second, over the last 10 seconds."""
+        return self.packet_validation.counter_rates.rates.tolist()
 
-            if result == 1:
-                self.log_error("Configuration of FS Selection failed.", transaction_id)
-                self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                self._reset()
-                raise RuntimeError("Configuration of FS Selection failed.")
-
-            # WIB Configuration
-            self.log_debug("Wideband Input Buffer Configuring..", transaction_id)
-            result = self.wideband_input_buffer.configure(
-                WidebandInputBufferConfig(
-                    transaction_id=transaction_id,
-                    expected_sample_rate=self._sample_rate,
-                    noise_diode_transition_holdoff_seconds=configuration.noise_diode_transition_holdoff_seconds,
-                    expected_dish_band=self.frequency_band.value + 1,  # FW Drivers rely on integer indexes, that are 1-based
-                )
-            )
+    @property
+    def packet_validation_diagnostics(self) -> str:
+        """:obj:`str`: JSON description of the packets most recently dropped by each check of the Packet Validation block
+        (see :obj:`PacketValidationManager.diagnostics`)."""
+        return json.dumps(self.packet_validation.diagnostics())
 
-            if result == 1:
-                self.log_error("Configuration of WIB failed.", transaction_id)
-                self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                self._reset()
-                raise RuntimeError("Configuration of WIB failed.")
+    @property
+    def poll_scheduler_status(self) -> str:
+        """:obj:`str`: JSON summary of the process-wide status polling scheduler: its jobs, workers, polls run and recent poll lag."""
+        return json.dumps(PollScheduler.shared().lag_report())
 
-            self.wideband_input_buffer.expected_dish_id = self.expected_dish_id
+    @property
+    def stage_latency_summary(self) -> str:
+        """:obj:`str`: JSON summary (count, p50, p95 and max duration) of the recent samples of every observing command stage."""
+        return json.dumps(self.stage_latencies.summary())
 
-            # Pre-channelizer WPM Configuration
-            self.log_debug("Pre-channelizer Wideband Power Meters Configuring..", transaction_id)
-            self._pre_channelizer_power_meter_configs = {
-                VCCBandGroup.B123: configuration.b123_pwrm,
-                VCCBandGroup.B45A: configuration.b45a_pwrm,
-                VCCBandGroup.B5B: configuration.b5b_pwrm,
-            }
+    def dump_stage_latencies(self) -> str:
+        """Dump every recent observing command stage latency sample.
 
-            for band_group in VCCBandGroup:
-                config = self._pre_channelizer_power_meter_configs.get(band_group)
-                self.log_debug(f"Configuring {band_group.value} power meter with {config}", transaction_id)
-                result = self.wideband_power_meters[band_group].configure(
-                    WidebandPowerMeterConfig(
-                        transaction_id=transaction_id,
-                        averaging_time=config.averaging_time,
-                        flagging=config.flagging,
-                    )
-                )
-                if result == 1:
-                    self.log_error(f"Configuration of {band_group.value} Wideband Power Meter failed.", transaction_id)
-                    self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                    self._reset()
-                    raise RuntimeError(f"Configuration of {band_group.value} Wideband Power Meter failed.")
+        Returns:
+            :obj:`str`: JSON list of the samples, from oldest to newest.
+        """
+        return json.dumps(self.stage_latencies.dump())
 
-            # Post-channelizer WPM Configuration
-            self.log_debug("Post-channelizer Wideband Power Meters Configuring..", transaction_id)
-            self._fs_lanes = configuration.fs_lanes
+    def get_gain_history(self, argin: str | None = None) -> tuple[str, bytes]:
+        """Get the history of the gain vectors applied to the VCC coarse channels.
 
-            # Verify vlan_id is within range
-            # ((config.vid >= 2 && config.vid <= 1001) || (config.vid >= 1006 && config.vid <= 4094))
-            for config in self._fs_lanes:
-                if not (2 <= config.vlan_id <= 1001 or 1006 <= config.vlan_id <= 4094):
-                    raise ValueError(f"VLAN ID {config.vlan_id} is not within range")
+        Args:
+            argin (:obj:`str | None`, optional): JSON object with optional "since" and "until" POSIX timestamps,
+                a "source" (a :obj:`GainSource` name, e.g. "AUTO_GAIN_CONTROL") and a "limit" on the number of
+                most recent records to return. Default is None, returning the whole history.
 
-            for config in self._fs_lanes:
-                fs_id = int(config.fs_id)
-                self.log_debug(f"Configuring FS {fs_id} power meter with {config}", transaction_id)
-                result = self.wideband_power_meters[fs_id].configure(
-                    WidebandPowerMeterConfig(
-                        transaction_id=transaction_id,
-                        averaging_time=config.averaging_time,
-                        flagging=config.flagging,
-                    )
-                )
-                if result == 1:
-                    self.log_error(f"Configuration of FS {fs_id} Wideband Power Meter failed.", transaction_id)
-                    self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                    self._reset()
-                    raise RuntimeError(f"Configuration of FS {fs_id} Wideband Power Meter failed.")
+        Returns:
+            :obj:`tuple[str, bytes]`: The records packed as a DevEncoded value (see :obj:`decode_gain_history`).
 
-            # VCC Stream Merge Configuration
-            self.log_debug("VCC Stream Merge Configuring..", transaction_id)
-            for i in range(1, 3):
-                result = self.vcc_stream_merges[i].configure(
-                    VCCStreamMergeConfigureArgin(
-                        transaction_id=transaction_id,
-                        fs_lane_configs=[
-                            VCCStreamMergeConfig(
-                                vid=lane.vlan_id,
-                                vcc_id=self._vcc_id,
-                                fs_id=lane.fs_id,
-                            )
-                            for lane in self._fs_lanes[13 * (i - 1) : 13 * i]
-                        ],
-                    )
-                )
-                if result == 1:
-                    self.log_error("Configuration of VCC Stream Merge failed.", transaction_id)
-                    self._go_to_idle_deconfigure(go_to_idle_schema=failure_go_to_idle_schema)
-                    self._reset()
-                    raise RuntimeError("Configuration of VCC Stream Merge failed.")
+        Raises:
+            :obj:`ValueError`: If the query is invalid.
+        """
+        query = json.loads(argin) if argin else {}
+        if unknown := set(query) - {"since", "until", "source", "limit"}:
+            raise ValueError(f"Unknown gain history query parameters: {sorted(unknown)}")
+        if "source" in query:
+            try:
+                query["source"] = GainSource[query["source"]]
+            except KeyError:
+                raise ValueError(f"Unknown gain source {query['source']!r}, expected one of {[source.name for source in GainSource]}") from None
+        return self.gain_history.encode(**query)
+
+    def get_status_records(self, argin: str) -> tuple[str, bytes]:
+        """Get the recorded statuses of an IP block type.
 
-        self.log_info(f"Sucessfully completed ConfigureScan for Config ID: {self._config_id}", transaction_id)
+        Args:
+            argin (:obj:`str`): JSON object with the "block_type" (e.g. "wideband_input_buffer"), and optional "since" and
+                "until" POSIX timestamps and a "limit" on the number of most recent records to return.
 
-    def _scan_controller_impl(
-        self,
-        scan_schema: FhsControllerBaseScanSchema,
-        task_callback: Optional[Callable] = None,
-    ) -> None:
-        """VCC-specific implementation for the Scan command.
+        Returns:
+            :obj:`tuple[str, bytes]`: The records packed as a DevEncoded value named after the IP block type (see :obj:`decode_records`).
 
-        Args:
-            scan_schema (:obj:`dict[str, Any]`): The scan schema JSON string from the command's input argument.
-            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+        Raises:
+            :obj:`ValueError`: If the query is invalid.
         """
-        self.scan_id = scan_schema.scan_id
-        transaction_id = self.transaction_ids_per_command.get(CommandType.SCAN, None)
-
-        self.log_info("Starting Scanning", transaction_id)
+        query = json.loads(argin) if argin else {}
+        if unknown := set(query) - {"block_type", "since", "until", "limit"}:
+            raise ValueError(f"Unknown status record query parameters: {sorted(unknown)}")
+        block_type = query.pop("block_type", None)
+        if block_type not in self.status_recorder.block_types:
+            raise ValueError(f"Unknown IP block type {block_type!r}, expected one of {self.status_recorder.block_types}")
+        return encode_records(block_type, self.status_recorder.records(block_type, **query))
 
-        if not self.simulation_mode:
-            eth_start_result, pv_start_result, wib_start_result = NonBlockingFunction.await_all(
-                self.ethernet_200g.start(),
-                self.packet_validation.start(),
-                self.wideband_input_buffer.start(),
-            )
-            if eth_start_result == 1 or pv_start_result == 1 or wib_start_result == 1:
-                raise RuntimeError("Failed to start Ethernet, PV and/or WIB")
+    def get_configuration_plans(self) -> str:
+        """Describe the cached ConfigureScan plans, for debugging.
 
-        self.log_info("Scan started", transaction_id)
+        Returns:
+            :obj:`str`: JSON list of the cached plans, from least to most recently used,
+            each containing the block configurations it would send.
+        """
+        return json.dumps([plan.to_dict() for plan in self._configure_scan_parser.plans()])
 
-    def _end_scan_controller_impl(
+    def _prepare_configuration(
         self,
-        end_scan_schema: FhsControllerBaseEndScanSchema,
+        argin: str,
         task_callback: Optional[Callable] = None,
+        task_abort_event: Optional[Event] = None,
     ) -> None:
-        """VCC-specific implementation for the EndScan command.
+        """Validate and compile the configuration for the next ConfigureScan, and work out which IP blocks
+        it will need to reprogram, without touching the IP blocks themselves.
+        This is the implementation for the PrepareConfiguration command.
 
         Args:
+            argin (:obj:`str`): JSON string following the ConfigureScan schema, containing the next configuration.
             task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+            task_abort_event (:obj:`Optional[Event]`, optional): An event representing whether or not the task has aborted.
+                Default is None.
         """
-        transaction_id = self.transaction_ids_per_command.get(CommandType.ENDSCAN, None)
-        self.log_info("Ending Scan", transaction_id)
+        transaction_id = None
+        try:
+            task_callback(status=TaskStatus.IN_PROGRESS)
 
-        if not self.simulation_mode:
-            eth_stop_result, pv_stop_result, wib_stop_result = NonBlockingFunction.await_all(
-                self.ethernet_200g.stop(),
-                self.packet_validation.stop(),
-                self.wideband_input_buffer.stop(),
+            plan = self._configure_scan_parser.plan(*self._configure_scan_parser.identify(argin))
+            transaction_id = plan.transaction_id
+            self.log_info(f"Received Command PrepareConfiguration for Config ID: {plan.config_id}", transaction_id)
+
+            if self.task_abort_event_is_set("PrepareConfiguration", task_callback, task_abort_event):
+                return
+
+            self._validate_configuration(plan.configuration)
+
+            base_configuration = self._applied_configuration
+            changed_steps = self._changed_configure_scan_steps(plan.configuration)
+            self._staged_configuration = StagedConfiguration(
+                plan=plan,
+                base_configuration=base_configuration,
+                changed_steps=frozenset(changed_steps) if changed_steps is not None else None,
+            )
+            self.log_info(
+                f"Prepared configuration for Config ID: {plan.config_id}, steps to program on commit: "
+                f"{sorted(changed_steps) if changed_steps is not None else 'all'}",
+                transaction_id,
             )
-            if eth_stop_result == 1 or pv_stop_result == 1 or wib_stop_result == 1:
-                raise RuntimeError("Failed to stop Ethernet, PV and/or WIB")
 
-        self.log_info("Scan ended", transaction_id)
+            self._set_task_callback(task_callback, TaskStatus.COMPLETED, ResultCode.OK, "PrepareConfiguration completed OK")
+        except (jsonschema.ValidationError, ValueError) as ex:
+            self.log_error(f"Invalid configuration provided for PrepareConfiguration: {ex}", transaction_id)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.REJECTED,
+                textwrap.shorten(f"Arg provided is not a valid configuration for PrepareConfiguration: {ex}", width=400),
+            )
+        except Exception as ex:
+            self.logger.exception(ex)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.FAILED,
+                textwrap.shorten(f"An unexpected exception occurred during PrepareConfiguration: {ex}", width=400),
+            )
 
-    def _update_subarray_membership(
+    def _start_auto_gain_control(
         self,
-        argin: int,
+        argin: str | None = None,
         task_callback: Optional[Callable] = None,
         task_abort_event: Optional[Event] = None,
     ) -> None:
-        """Update subarray membership for this VCC. This is the implementation for the UpdateSubarrayMembership command.
+        """Start (or restart) the automatic gain control loop, which re-applies the requested headrooms while scanning.
+        This is the implementation for the StartAutoGainControl command.
 
         Args:
-            argin (:obj:`int`): Subarray ID to assign to this VCC. Set to 0 to unassign the currently assigned subarray.
+            argin (:obj:`str | None`): JSON string following the auto gain control command schema.
             task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
             task_abort_event (:obj:`Optional[Event]`, optional): An event representing whether or not the task has aborted.
                 Default is None.
         """
+        transaction_id = None
         try:
-            if argin < 0 or argin > 16:
-                self._set_task_callback(
-                    task_callback,
-                    TaskStatus.COMPLETED,
-                    ResultCode.REJECTED,
-                    f"Cannot update subarray membership as the provided ID {self.subarray_id} is not in the range 0-16.",
-                )
-            elif self.subarray_id > 0 and argin > 0:
-                self._set_task_callback(
-                    task_callback,
-                    TaskStatus.COMPLETED,
-                    ResultCode.REJECTED,
+            task_callback(status=TaskStatus.IN_PROGRESS)
+
+            config_dict = json.loads(argin) if argin else {}
+            transaction_id = config_dict.get("transaction_id") if isinstance(config_dict, dict) else None
+            self.log_info("Received Command StartAutoGainControl", transaction_id)
+
+            jsonschema.validate(config_dict, vcc_all_bands_auto_gain_control_schema)
+            config = VCCAllBandsAutoGainControlSchema.from_dict(config_dict)
+            if len(config.headrooms) not in [1, self._num_fs]:
+                raise ValueError(f"Expected 1 or {self._num_fs} headrooms, got {len(config.headrooms)}")
+            if self.frequency_band not in {FrequencyBandEnum._1, FrequencyBandEnum._2}:
+                raise ValueError("Automatic gain control is not supported in the currently selected frequency band")
+
+            if self.task_abort_event_is_set("StartAutoGainControl", task_callback, task_abort_event):
+                return
+
+            self.auto_gain_control.start(config)
+            self.log_info(
+                f"Automatic gain control started with headrooms {config.headrooms}, period {config.period}s, "
+                f"hysteresis {config.hysteresis_db}dB and minimum update interval {config.min_update_interval}s",
+                transaction_id,
+            )
+            self._set_task_callback(task_callback, TaskStatus.COMPLETED, ResultCode.OK, "StartAutoGainControl completed OK")
+        except (jsonschema.ValidationError, ValueError) as ex:
+            self.log_error(f"Invalid configuration provided for StartAutoGainControl: {ex}", transaction_id)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.REJECTED,
+                textwrap.shorten(f"Arg provided is not a valid configuration for StartAutoGainControl: {ex}", width=400),
+            )
+        except Exception as ex:
+            self.logger.exception(ex)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.FAILED,
+                textwrap.shorten(f"An unexpected exception occurred during StartAutoGainControl: {ex}", width=400),
+            )
+
+    def _stop_auto_gain_control(
+        self,
+        argin: str | None = None,
+        task_callback: Optional[Callable] = None,
+        task_abort_event: Optional[Event] = None,
+    ) -> None:
+        """Stop the automatic gain control loop, leaving the last applied gains in place.
+        This is the implementation for the StopAutoGainControl command.
+
+        Args:
+            argin (:obj:`str | None`): Optional JSON string containing the transaction_id of the command.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+            task_abort_event (:obj:`Optional[Event]`, optional): An event representing whether or not the task has aborted.
+                Default is None.
+        """
+        try:
+            task_callback(status=TaskStatus.IN_PROGRESS)
+            transaction_id = json.loads(argin).get("transaction_id") if argin else None
+            self.log_info("Received Command StopAutoGainControl", transaction_id)
+
+            was_running = self.auto_gain_control.stop()
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.OK,
+                "StopAutoGainControl completed OK" if was_running else "StopAutoGainControl completed OK: automatic gain control was not running",
+            )
+        except Exception as ex:
+            self.logger.exception(ex)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.FAILED,
+                textwrap.shorten(f"An unexpected exception occurred during StopAutoGainControl: {ex}", width=400),
+            )
+
+    def _auto_gain_control_step(self, config: VCCAllBandsAutoGainControlSchema) -> bool:
+        """Sample the FS power meters and write the gains of the channels which moved beyond the hysteresis.
+
+        Args:
+            config (:obj:`VCCAllBandsAutoGainControlSchema`): The automatic gain control configuration.
+
+        Returns:
+            :obj:`bool`: Whether new gains were written to the channelizer.
+        """
+        transaction_id = config.transaction_id
+        powers, failures = self._fs_powers("AutoGainControl", transaction_id)
+        if failures:
+            self.logger.warning(f"Automatic gain control skipped: {PowerMeterFleetReport(action='Power readout', failures=failures).describe_failures()}")
+            return False
+        proposed_gains = solve_filter_gains(powers, config.headrooms)
+
+        # Skip the step while a command is changing the gains, so that the command can stop the loop without deadlocking
+        if not self._gains_lock.acquire(blocking=False):
+            return False
+        try:
+            new_gains, changed = apply_gain_hysteresis(self.vcc_gains, proposed_gains, config.hysteresis_db)
+            if not changed.any():
+                return False
+
+            new_gains = new_gains.tolist()
+            result = self._timed(
+                "AutoGainControl",
+                "b123_vcc",
+                transaction_id,
+                self.b123_vcc.configure,
+                B123VccOsppfbChannelizerConfigureArgin(transaction_id=transaction_id, sample_rate=self._sample_rate, gains=new_gains),
+            )
+            if result == 1:
+                self.log_error("Automatic gain control failed to reconfigure VCC123 Channelizer with new gain values.", transaction_id)
+                self.b123_vcc.configure(
+                    B123VccOsppfbChannelizerConfigureArgin(transaction_id=transaction_id, sample_rate=self._sample_rate, gains=self.vcc_gains)
+                )
+                return False
+
+            self._commit_vcc_gains(new_gains, config.headrooms, GainSource.AUTO_GAIN_CONTROL, transaction_id, powers)
+        finally:
+            self._gains_lock.release()
+
+        self.log_info(f"Automatic gain control updated the gains of {int(changed.sum())} channel(s)", transaction_id)
+        return True
+
+    def _commit_vcc_gains(self, gains: list[float], headrooms: list[float], source: GainSource, transaction_id: str | None, powers: np.ndarray) -> None:
+        """Record newly applied gains, the headrooms they were computed for, and the power measurements they were computed from."""
+        self.vcc_gains = gains
+        if self._applied_configuration is not None:
+            self._applied_configuration = dataclasses.replace(self._applied_configuration, vcc_gain=gains)
+        self.last_requested_headrooms = headrooms
+        self.gain_history.record(gains, source, transaction_id, headrooms, powers)
+
+    def _take_staged_configuration(self, plan: ConfigurePlan) -> StagedConfiguration | None:
+        """Take the staged configuration for a ConfigureScan, if one was prepared for the same configuration.
+
+        Any staged configuration is consumed by the call, so that it is only ever committed once.
+
+        Args:
+            plan (:obj:`ConfigurePlan`): The plan of the ConfigureScan being run.
+
+        Returns:
+            :obj:`StagedConfiguration | None`: The staged configuration, or None if no matching configuration was prepared.
+        """
+        staged, self._staged_configuration = self._staged_configuration, None
+        if staged is None:
+            return None
+        if staged.plan.config_id != plan.config_id or staged.plan.fingerprint != plan.fingerprint:
+            self.log_info(
+                f"Discarding configuration prepared for Config ID: {staged.plan.config_id}, "
+                f"as it does not match the ConfigureScan for Config ID: {plan.config_id}",
+                plan.transaction_id,
+            )
+            return None
+        return staged
+
+    def auto_set_filter_gains(
+        self: VCCAllBandsComponentManager,
+        argin: str,
+        task_callback: Optional[Callable] = None,
+    ) -> tuple[TaskStatus, str]:
+        """Submit the task to start running the AutoSetFilterGains command implementation.
+
+        Args:
+            argin (:obj:`str`): JSON String following the auto set filter gains command schema
+                Requested RFI headroom, in decibels (dB).
+                Must be a list containing either a single value to apply to all frequency slices,
+                or a value per frequency slice to be applied separately.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+
+        Returns:
+            :obj:`tuple[TaskStatus, str]`: The status of the task and an informative message string.
+        """
+        return self.submit_task(
+            func=self._auto_set_filter_gains,
+            args=[argin],
+            task_callback=task_callback,
+        )
+
+    def _configure_scan_controller_impl(
+        self,
+        configuration: VCCAllBandsConfigureScanConfig,
+        task_callback: Optional[Callable] = None,
+    ) -> None:
+        """VCC-specific implementation for the ConfigureScan command.
+
+        Args:
+            configuration (:obj:`dict[str, Any]`): The configuration JSON string from the command's input argument.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+        """
+        transaction_id = self.transaction_ids_per_command.get(CommandType.CONFIGURESCAN, None)
+
+        # Use the plan compiled when the configuration was decoded, if it was decoded by this ConfigureScan
+        plan, self._decoded_configure_plan = self._decoded_configure_plan, None
+        if plan is None or plan.configuration is not configuration:
+            plan = build_configure_plan(configuration, configure_scan_fingerprint(configuration.to_dict()), self._vcc_id)
+        staged = self._take_staged_configuration(plan)
+
+        try:
+            self._validate_configuration(configuration)
+        except ValueError:
+            self._reset()
+            raise
+
+        # Gains are written along with the configuration, so other gain updates must wait for it to be applied
+        with self._gains_lock:
+            previous_configuration = self._applied_configuration
+            self._set_configuration_state(configuration)
+
+            self.log_info(f"Configuring VCC {self._vcc_id} - Config ID: {self._config_id}, Freq Band: {self.frequency_band.value}", transaction_id)
+
+            if not self.simulation_mode:
+                steps = self._configure_scan_steps(plan)
+                if staged is not None and staged.base_configuration is self._applied_configuration:
+                    self.log_info(f"Committing prepared configuration for Config ID: {self._config_id}", transaction_id)
+                    changed_steps = staged.changed_steps
+                else:
+                    changed_steps = self._changed_configure_scan_steps(configuration)
+                if changed_steps is not None:
+                    self.log_info(f"Incremental ConfigureScan, reprogramming steps: {sorted(changed_steps)}", transaction_id)
+                    steps = select_steps(steps, changed_steps)
+
+                report = self._configure_executor.run(steps)
+                self.stage_latencies.record_report("ConfigureScan", report, transaction_id)
+                self.log_info(f"ConfigureScan IP block timings: {report.format_timings()}", transaction_id)
+
+                if not report.succeeded:
+                    failed_step = report.failed.step
+                    if report.failed.error is not None:
+                        self.logger.exception(report.failed.error)
+                    self.log_error(f"Configuration of {failed_step.description} failed.", transaction_id)
+                    if previous_configuration is not None and self._rollback_configure_scan(report, previous_configuration, transaction_id):
+                        # The blocks are back in the previous configuration, so the software state must follow
+                        self._set_configuration_state(previous_configuration)
+                        raise ConfigureScanRolledBackError(
+                            f"Configuration of {failed_step.description} failed, restored Config ID: {previous_configuration.config_id}", restored=True
+                        ) from report.failed.error
+
+                    # Nothing to go back to, so leave every block the ConfigureScan touched deconfigured
+                    try:
+                        deconfigured = self._rollback_configure_scan(report, None, transaction_id)
+                    finally:
+                        self._reset()
+                    if deconfigured:
+                        raise ConfigureScanRolledBackError(f"Configuration of {failed_step.description} failed.", restored=False) from report.failed.error
+                    raise RuntimeError(f"Configuration of {failed_step.description} failed, and its rollback failed.") from report.failed.error
+
+                self._applied_configuration = configuration
+
+            self.gain_history.record(self.vcc_gains, GainSource.CONFIGURE_SCAN, transaction_id)
+            self.log_info(f"Sucessfully completed ConfigureScan for Config ID: {self._config_id}", transaction_id)
+
+    def _set_configuration_state(self, configuration: VCCAllBandsConfigureScanConfig) -> None:
+        """Set the software state of the VCC from a ConfigureScan configuration which has been validated.
+
+        Args:
+            configuration (:obj:`VCCAllBandsConfigureScanConfig`): The configuration being, or still, applied.
+        """
+        self._sample_rate = configuration.dish_sample_rate
+        self._samples_per_frame = configuration.samples_per_frame
+        self.frequency_band = freq_band_dict()[configuration.frequency_band]
+        self.expected_dish_id = configuration.expected_dish_id
+        self._config_id = configuration.config_id
+        self.frequency_band_offset[0] = configuration.frequency_band_offset_stream_1
+        self.frequency_band_offset[1] = configuration.frequency_band_offset_stream_2
+
+        self._num_fs = NUM_FS_BY_FREQUENCY_BAND[self.frequency_band]
+
+        # number of channels * number of polarizations
+        self._num_vcc_gains = self._num_fs * 2
+
+        self.vcc_gains = configuration.vcc_gain
+
+        if not self.simulation_mode:
+            self._pre_channelizer_power_meter_configs = {
+                VCCBandGroup.B123: configuration.b123_pwrm,
+                VCCBandGroup.B45A: configuration.b45a_pwrm,
+                VCCBandGroup.B5B: configuration.b5b_pwrm,
+            }
+            self._fs_lanes = configuration.fs_lanes
+
+    def _rollback_configure_scan(
+        self,
+        report: ConfigureGraphReport,
+        previous_configuration: VCCAllBandsConfigureScanConfig | None,
+        transaction_id: str | None,
+    ) -> bool:
+        """Undo a failed ConfigureScan, touching only the IP blocks that the ConfigureScan started programming.
+
+        Each of those blocks is restored to the given previous configuration, or deconfigured if there
+        is none. Blocks are undone in reverse dependency order, concurrently where they are independent.
+
+        Args:
+            report (:obj:`ConfigureGraphReport`): The report of the failed ConfigureScan programming steps.
+            previous_configuration (:obj:`VCCAllBandsConfigureScanConfig | None`): The configuration to restore,
+                or None to deconfigure the blocks.
+            transaction_id (:obj:`str | None`): The transaction ID of the ConfigureScan command.
+
+        Returns:
+            :obj:`bool`: Whether every block was restored or deconfigured.
+        """
+        if previous_configuration is not None:
+            previous_plan = build_configure_plan(
+                dataclasses.replace(previous_configuration, transaction_id=transaction_id),
+                configure_scan_fingerprint(previous_configuration.to_dict()),
+                self._vcc_id,
+            )
+            undo_steps = {
+                step.name: dataclasses.replace(step, description=f"restore of {step.description}") for step in self._configure_scan_steps(previous_plan)
+            }
+        else:
+            undo_steps = self._deconfigure_scan_steps(transaction_id)
+
+        rollback = rollback_steps(report, undo_steps)
+        self.log_info(f"Rolling back ConfigureScan steps: {[step.name for step in rollback]}", transaction_id)
+        rollback_report = self._configure_executor.run(rollback, fail_fast=False)
+        self.stage_latencies.record_report("ConfigureScan", rollback_report, transaction_id, prefix="rollback:")
+        self.stage_latencies.record("ConfigureScan", "rollback", rollback_report.duration, transaction_id)
+        self.log_info(f"ConfigureScan rollback timings: {rollback_report.format_timings()}", transaction_id)
+
+        if not rollback_report.succeeded:
+            failed_descriptions = ", ".join(result.step.description for result in rollback_report.failures)
+            for result in rollback_report.failures:
+                if result.error is not None:
+                    self.logger.exception(result.error)
+            self.log_error(f"Rollback of failed ConfigureScan failed: {failed_descriptions}", transaction_id)
+            return False
+        return True
+
+    def _deconfigure_scan_steps(self, transaction_id: str | None) -> dict[str, ConfigureStep]:
+        """Build the steps deconfiguring the IP blocks programmed by each ConfigureScan step.
+
+        Args:
+            transaction_id (:obj:`str | None`): The transaction ID of the ConfigureScan command.
+
+        Returns:
+            :obj:`dict[str, ConfigureStep]`: The deconfiguration steps, mapped by the name of the ConfigureScan step they undo.
+        """
+        return {
+            step.name: step
+            for step in [
+                ConfigureStep(name="b123_vcc", description="deconfiguration of VCC123 Channelizer", run=self.b123_vcc.deconfigure),
+                ConfigureStep(
+                    name="wideband_frequency_shifter",
+                    description="deconfiguration of Wideband Frequency Shifter",
+                    run=self.wideband_frequency_shifter.deconfigure,
+                ),
+                ConfigureStep(name="frequency_slice_selection", description="deconfiguration of FS Selection", run=self.frequency_slice_selection.deconfigure),
+                ConfigureStep(name="wideband_input_buffer", description="deconfiguration of WIB", run=self.wideband_input_buffer.deconfigure),
+                ConfigureStep(
+                    name="pre_channelizer_power_meters",
+                    description="deconfiguration of Pre-channelizer Wideband Power Meters",
+                    run=functools.partial(self._deconfigure_power_meters, list(VCCBandGroup), transaction_id),
+                ),
+                ConfigureStep(
+                    name="fs_power_meters",
+                    description="deconfiguration of FS Wideband Power Meters",
+                    run=functools.partial(self._deconfigure_power_meters, [int(config.fs_id) for config in self._fs_lanes], transaction_id),
+                ),
+                *[
+                    ConfigureStep(name=f"vcc_stream_merge_{i}", description="deconfiguration of VCC Stream Merge", run=self.vcc_stream_merges[i].deconfigure)
+                    for i in range(1, 3)
+                ],
+            ]
+        }
+
+    def _validate_configuration(self, configuration: VCCAllBandsConfigureScanConfig) -> None:
+        """Check that a ConfigureScan configuration can be applied by this VCC, before any blocks are programmed.
+
+        Args:
+            configuration (:obj:`VCCAllBandsConfigureScanConfig`): The ConfigureScan configuration.
+
+        Raises:
+            :obj:`ValueError`: If the configuration cannot be applied.
+        """
+        frequency_band = freq_band_dict()[configuration.frequency_band]
+        match frequency_band:
+            case FrequencyBandEnum._1 | FrequencyBandEnum._2:
+                pass
+            case FrequencyBandEnum._3 | FrequencyBandEnum._4:
+                raise ValueError("Bands 3/4 not implemented")
+            case _:
+                # TODO: Implement routing to the 5 Channelizer once outlined
+                raise ValueError("Bands 5A/B not implemented")
+
+        # number of channels * number of polarizations
+        num_vcc_gains = NUM_FS_BY_FREQUENCY_BAND[frequency_band] * 2
+        if len(configuration.vcc_gain) != num_vcc_gains:
+            raise ValueError(f"Incorrect number of gain values supplied: {configuration.vcc_gain} != {num_vcc_gains}")
+
+        if not self.simulation_mode:
+            # Verify vlan_id is within range before programming any blocks
+            # ((config.vid >= 2 && config.vid <= 1001) || (config.vid >= 1006 && config.vid <= 4094))
+            for config in configuration.fs_lanes:
+                if not (2 <= config.vlan_id <= 1001 or 1006 <= config.vlan_id <= 4094):
+                    raise ValueError(f"VLAN ID {config.vlan_id} is not within range")
+
+    def _configure_scan_steps(self, plan: ConfigurePlan) -> list[ConfigureStep]:
+        """Build the graph of IP block programming steps for a ConfigureScan.
+
+        Steps without a dependency between them are programmed concurrently; dependencies
+        follow the signal path, so that e.g. the stream merges are only programmed once
+        the frequency slice selection is in place.
+
+        Args:
+            plan (:obj:`ConfigurePlan`): The compiled ConfigureScan plan.
+
+        Returns:
+            :obj:`list[ConfigureStep]`: The programming steps.
+        """
+        return [
+            ConfigureStep(
+                name="b123_vcc",
+                description="VCC123 Channelizer",
+                run=functools.partial(self.b123_vcc.configure, plan.channelizer),
+            ),
+            ConfigureStep(
+                name="wideband_frequency_shifter",
+                description="Wideband Frequency Shifter",
+                run=functools.partial(self.wideband_frequency_shifter.configure, plan.wideband_frequency_shifter),
+            ),
+            ConfigureStep(
+                name="frequency_slice_selection",
+                description="FS Selection",
+                run=functools.partial(self.frequency_slice_selection.configure, plan.frequency_slice_selection),
+                depends_on=("b123_vcc",),
+            ),
+            ConfigureStep(
+                name="wideband_input_buffer",
+                description="WIB",
+                run=functools.partial(self._configure_wideband_input_buffer, plan.wideband_input_buffer, plan.configuration.expected_dish_id),
+            ),
+            ConfigureStep(
+                name="pre_channelizer_power_meters",
+                description="Pre-channelizer Wideband Power Meters",
+                run=functools.partial(self._configure_power_meters, plan.pre_channelizer_power_meters, plan.transaction_id),
+            ),
+            ConfigureStep(
+                name="fs_power_meters",
+                description="FS Wideband Power Meters",
+                run=functools.partial(self._configure_power_meters, plan.fs_power_meters, plan.transaction_id),
+            ),
+            *[
+                ConfigureStep(
+                    name=f"vcc_stream_merge_{i}",
+                    description="VCC Stream Merge",
+                    run=functools.partial(self.vcc_stream_merges[i].configure_lane_table, lane_table, plan.transaction_id),
+                    depends_on=("frequency_slice_selection",),
+                )
+                for i, lane_table in plan.lane_tables.items()
+            ],
+        ]
+
+    def _changed_configure_scan_steps(self, configuration: VCCAllBandsConfigureScanConfig) -> set[str] | None:
+        """Determine which ConfigureScan steps need to be re-run to go from the currently
+        applied configuration to the given one.
+
+        Args:
+            configuration (:obj:`VCCAllBandsConfigureScanConfig`): The new ConfigureScan configuration.
+
+        Returns:
+            :obj:`set[str] | None`: The names of the steps whose inputs have changed, or None
+            if a full configuration is required.
+        """
+        if configuration.force_full_configure or self._applied_configuration is None:
+            return None
+
+        changed_steps = set()
+        for path in configuration_diff(self._applied_configuration, configuration):
+            field_name, _, sub_path = path.partition(".")
+            if field_name == "fs_lanes" and sub_path:
+                lane_index, _, lane_field = sub_path.partition(".")
+                lane_steps = FS_LANE_CONFIGURE_STEPS_BY_FIELD.get(lane_field)
+                if lane_steps is None:
+                    return None
+                changed_steps.update(step.format(merge=int(lane_index) // 13 + 1) for step in lane_steps)
+            elif (field_steps := CONFIGURE_STEPS_BY_FIELD.get(field_name)) is not None:
+                changed_steps.update(field_steps)
+            else:
+                return None
+        return changed_steps
+
+    def _configure_wideband_input_buffer(self, config: WidebandInputBufferConfig, expected_dish_id: str) -> int:
+        """Configure the WIB and set the dish ID it should expect to receive data from."""
+        result = self.wideband_input_buffer.configure(config)
+        if result != 1:
+            self.wideband_input_buffer.expected_dish_id = expected_dish_id
+        return result
+
+    def _configure_power_meters(self, configs: Mapping[VCCBandGroup | int, WidebandPowerMeterConfig], transaction_id: str | None) -> int:
+        """Configure a set of Wideband Power Meters concurrently, logging all failures in a single message."""
+        self.log_debug(f"Configuring power meters with {configs}", transaction_id)
+        report = self.power_meter_fleet.configure(configs)
+        if not report.succeeded:
+            self.log_error(report.describe_failures(), transaction_id)
+            return 1
+        return 0
+
+    def _deconfigure_power_meters(self, keys: list[VCCBandGroup | int], transaction_id: str | None) -> int:
+        """Deconfigure a set of Wideband Power Meters concurrently, logging all failures in a single message."""
+        report = self.power_meter_fleet.deconfigure(keys)
+        if not report.succeeded:
+            self.log_error(report.describe_failures(), transaction_id)
+            return 1
+        return 0
+
+    def _scan_controller_impl(
+        self,
+        scan_schema: FhsControllerBaseScanSchema,
+        task_callback: Optional[Callable] = None,
+    ) -> None:
+        """VCC-specific implementation for the Scan command.
+
+        Args:
+            scan_schema (:obj:`dict[str, Any]`): The scan schema JSON string from the command's input argument.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+        """
+        self.scan_id = scan_schema.scan_id
+        transaction_id = self.transaction_ids_per_command.get(CommandType.SCAN, None)
+
+        self.log_info("Starting Scanning", transaction_id)
+
+        if not self.simulation_mode:
+            with self.stage_latencies.measure("Scan", "start_ethernet_pv_wib", transaction_id):
+                eth_start_result, pv_start_result, wib_start_result = NonBlockingFunction.await_all(
+                    self.ethernet_200g.start(),
+                    self.packet_validation.start(),
+                    self.wideband_input_buffer.start(),
+                )
+            if eth_start_result == 1 or pv_start_result == 1 or wib_start_result == 1:
+                raise RuntimeError("Failed to start Ethernet, PV and/or WIB")
+
+        self.log_info("Scan started", transaction_id)
+
+    def _end_scan_controller_impl(
+        self,
+        end_scan_schema: FhsControllerBaseEndScanSchema,
+        task_callback: Optional[Callable] = None,
+    ) -> None:
+        """VCC-specific implementation for the EndScan command.
+
+        Args:
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+        """
+        transaction_id = self.transaction_ids_per_command.get(CommandType.ENDSCAN, None)
+        self.log_info("Ending Scan", transaction_id)
+
+        if not self.simulation_mode:
+            with self.stage_latencies.measure("EndScan", "stop_ethernet_pv_wib", transaction_id):
+                eth_stop_result, pv_stop_result, wib_stop_result = NonBlockingFunction.await_all(
+                    self.ethernet_200g.stop(),
+                    self.packet_validation.stop(),
+                    self.wideband_input_buffer.stop(),
+                )
+            if eth_stop_result == 1 or pv_stop_result == 1 or wib_stop_result == 1:
+                raise RuntimeError("Failed to stop Ethernet, PV and/or WIB")
+
+        self.log_info("Scan ended", transaction_id)
+
+    def _update_subarray_membership(
+        self,
+        argin: int,
+        task_callback: Optional[Callable] = None,
+        task_abort_event: Optional[Event] = None,
+    ) -> None:
+        """Update subarray membership for this VCC. This is the implementation for the UpdateSubarrayMembership command.
+
+        Args:
+            argin (:obj:`int`): Subarray ID to assign to this VCC. Set to 0 to unassign the currently assigned subarray.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+            task_abort_event (:obj:`Optional[Event]`, optional): An event representing whether or not the task has aborted.
+                Default is None.
+        """
+        try:
+            if argin < 0 or argin > 16:
+                self._set_task_callback(
+                    task_callback,
+                    TaskStatus.COMPLETED,
+                    ResultCode.REJECTED,
+                    f"Cannot update subarray membership as the provided ID {self.subarray_id} is not in the range 0-16.",
+                )
+            elif self.subarray_id > 0 and argin > 0:
+                self._set_task_callback(
+                    task_callback,
+                    TaskStatus.COMPLETED,
+                    ResultCode.REJECTED,
                     f"Cannot update subarray membership as this VCC is already assigned to subarray {self.subarray_id}.",
                 )
             else:
@@ -884,78 +1762,176 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
             task_abort_event (:obj:`Optional[Event]`, optional): An event representing whether or not the task has aborted.
                 Default is None.
         """
+        start_time = time.perf_counter()
         try:
-            headrooms = [3.0]
             transaction_id = None
+            auto_set_filter_gains_schema = VCCAllBandsAutoSetFilterGainsSchema()
 
             if argin:
                 auto_set_filter_gains_schema_dict = json.loads(argin)
                 transaction_id = auto_set_filter_gains_schema_dict.get("transaction_id", None)
                 self.transaction_ids_per_command[CommandType.AUTOSETFILTERGAINS] = transaction_id
                 auto_set_filter_gains_schema = VCCAllBandsAutoSetFilterGainsSchema.from_dict(auto_set_filter_gains_schema_dict)
-                headrooms = auto_set_filter_gains_schema.headrooms
 
             self.log_info("Received Command AutoSetFilterGains", transaction_id)
 
-            if (num_headrooms := len(headrooms)) not in [1, self._num_fs]:
-                self._set_task_callback(
-                    task_callback,
-                    TaskStatus.COMPLETED,
-                    ResultCode.REJECTED,
-                    f"Cannot auto-set gains as the input headroom {headrooms} is invalid.",
-                )
-                self.long_running_command_result_buffer.insert(
-                    command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.REJECTED, transaction_id=transaction_id
-                )
+            update = self.prepare_filter_gains(auto_set_filter_gains_schema, transaction_id)
+            if update.ready:
+                update = self.apply_filter_gains(update)
+
+            self._set_task_callback(task_callback, TaskStatus.COMPLETED, update.result_code, update.message)
+            self.long_running_command_result_buffer.insert(
+                command_type=CommandType.AUTOSETFILTERGAINS, result_code=update.result_code, transaction_id=transaction_id
+            )
+        except Exception as ex:
+            transaction_id = self.transaction_ids_per_command.get(CommandType.AUTOSETFILTERGAINS, None)
+            self.logger.exception(ex)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.FAILED,
+                textwrap.shorten(f"An unexpected exception occurred during AutoSetFilterGains: {ex}", width=400),
+            )
+            self.long_running_command_result_buffer.insert(
+                command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.FAILED, transaction_id=transaction_id
+            )
+        finally:
+            self.stage_latencies.record(
+                "AutoSetFilterGains", "total", time.perf_counter() - start_time, self.transaction_ids_per_command.get(CommandType.AUTOSETFILTERGAINS, None)
+            )
+            # Reset the ID so it's not used in a different Command call
+            self.transaction_ids_per_command[CommandType.AUTOSETFILTERGAINS] = None
+
+    def _auto_set_fleet_filter_gains(
+        self,
+        argin: str | None = None,
+        task_callback: Optional[Callable] = None,
+        task_abort_event: Optional[Event] = None,
+    ) -> None:
+        """Calculate and apply optimal gain multipliers for the coarse channels of every configured VCC hosted by this
+        device server process, reading the power meters of all VCCs before applying the gains of any.
+        This is the implementation for the AutoSetFleetFilterGains command.
+
+        Args:
+            argin (:obj:`str | None`): JSON string following the auto set fleet filter gains command schema.
+            task_callback (:obj:`Optional[Callable]`, optional): A callback to run when the task status changes. Default is None.
+            task_abort_event (:obj:`Optional[Event]`, optional): An event representing whether or not the task has aborted.
+                Default is None.
+        """
+        start_time = time.perf_counter()
+        transaction_id = None
+        try:
+            task_callback(status=TaskStatus.IN_PROGRESS)
+
+            request_dict = json.loads(argin) if argin else {}
+            transaction_id = request_dict.get("transaction_id") if isinstance(request_dict, dict) else None
+            self.log_info("Received Command AutoSetFleetFilterGains", transaction_id)
+
+            jsonschema.validate(request_dict, vcc_all_bands_auto_set_fleet_filter_gains_schema)
+            request = VCCAllBandsAutoSetFleetFilterGainsSchema.from_dict(request_dict)
+
+            if self.task_abort_event_is_set("AutoSetFleetFilterGains", task_callback, task_abort_event):
                 return
 
-            new_gains = copy.copy(self.vcc_gains)
-
-            # Read all power meters
-            for i in range(self._num_fs):
-                # Read power
-                status = self.wideband_power_meters[i + 1].status()
-                if status is None:
-                    self._set_task_callback(
-                        task_callback,
-                        TaskStatus.COMPLETED,
-                        ResultCode.FAILED,
-                        (f"Failed to auto-set gains: Failed to retrieve status from the FS {i + 1} power meter."),
-                    )
-                    self.long_running_command_result_buffer.insert(
-                        command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.FAILED, transaction_id=transaction_id
-                    )
-                    return
-                measured_power_pol_x = status.avg_power_pol_x
-                measured_power_pol_y = status.avg_power_pol_y
-
-                for power, pol in (measured_power_pol_x, "X"), (measured_power_pol_y, "Y"):
-                    if not isinstance(power, (int, float)) or isinstance(power, bool) or isnan(power) or power <= 0 or power > 1:
-                        self._set_task_callback(
-                            task_callback,
-                            TaskStatus.COMPLETED,
-                            ResultCode.FAILED,
-                            (f"Failed to auto-set gains: The FS {i + 1} power meter failed to provide a valid power measurement for polarization {pol}."),
-                        )
-                        self.long_running_command_result_buffer.insert(
-                            command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.FAILED, transaction_id=transaction_id
-                        )
-                        return
+            report = self._filter_gain_coordinator.level(request, transaction_id, require_all=request.require_all)
+            self.log_info(
+                f"AutoSetFleetFilterGains applied gains to VCCs {report.applied}, "
+                f"failed for VCCs {list(report.failures)} and skipped VCCs {report.skipped}",
+                transaction_id,
+            )
+            self._set_task_callback(task_callback, TaskStatus.COMPLETED, report.result_code, textwrap.shorten(report.describe(), width=400))
+        except (jsonschema.ValidationError, ValueError) as ex:
+            self.log_error(f"Invalid arguments provided for AutoSetFleetFilterGains: {ex}", transaction_id)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.REJECTED,
+                textwrap.shorten(f"Arg provided is not valid for AutoSetFleetFilterGains: {ex}", width=400),
+            )
+        except Exception as ex:
+            self.logger.exception(ex)
+            self._set_task_callback(
+                task_callback,
+                TaskStatus.COMPLETED,
+                ResultCode.FAILED,
+                textwrap.shorten(f"An unexpected exception occurred during AutoSetFleetFilterGains: {ex}", width=400),
+            )
+        finally:
+            self.stage_latencies.record("AutoSetFleetFilterGains", "total", time.perf_counter() - start_time, transaction_id)
 
-                headroom = headrooms[i % num_headrooms]
+    @property
+    def filter_gains_allowed(self) -> bool:
+        """:obj:`bool`: Whether this VCC is configured, so that its filter gains can be set by AutoSetFleetFilterGains."""
+        return self.obs_state in (ObsState.READY, ObsState.SCANNING)
+
+    def prepare_filter_gains(self, request: VCCAllBandsAutoSetFilterGainsSchema, transaction_id: str | None) -> FilterGainUpdate:
+        """Read the power meters and compute the optimal gain multipliers for the VCC coarse channels, without applying them.
+        This is the first phase of the AutoSetFilterGains and AutoSetFleetFilterGains commands.
+
+        Args:
+            request (:obj:`VCCAllBandsAutoSetFilterGainsSchema`): The requested headrooms and power statistic.
+            transaction_id (:obj:`str | None`): The transaction ID of the command.
+
+        Returns:
+            :obj:`FilterGainUpdate`: The computed gains, or the reason they could not be computed.
+        """
+        headrooms = request.headrooms
+        update = FilterGainUpdate(transaction_id=transaction_id, headrooms=headrooms)
+
+        if len(headrooms) not in [1, self._num_fs]:
+            update.result_code = ResultCode.REJECTED
+            update.message = f"Cannot auto-set gains as the input headroom {headrooms} is invalid."
+            return update
+
+        if request.power_statistic not in (None, *POWER_STATISTICS):
+            update.result_code = ResultCode.REJECTED
+            update.message = f"Cannot auto-set gains as the power statistic {request.power_statistic!r} is not one of {POWER_STATISTICS}."
+            return update
+
+        # Read all power meters, or use their recent statistics
+        powers, failures = self._fs_powers("AutoSetFilterGains", transaction_id, request.power_statistic, request.power_window)
+        if failures:
+            update.result_code = ResultCode.FAILED
+            update.message = f"Failed to auto-set gains: {PowerMeterFleetReport(action='Power readout', failures=failures).describe_failures()}"
+            return update
+
+        # Convert to multipliers
+        update.gains = solve_filter_gains(powers, headrooms).tolist()
+        update.powers = powers
+        return update
+
+    def apply_filter_gains(self, update: FilterGainUpdate) -> FilterGainUpdate:
+        """Apply gain multipliers computed by :obj:`prepare_filter_gains` to the VCC coarse channels.
+        This is the second phase of the AutoSetFilterGains and AutoSetFleetFilterGains commands.
+
+        Args:
+            update (:obj:`FilterGainUpdate`): The computed gains.
+
+        Returns:
+            :obj:`FilterGainUpdate`: The update, with the result of applying the gains.
+        """
+        transaction_id = update.transaction_id
+        new_gains = update.gains
 
-                # Convert to multiplier
-                new_gains[i] = float(calculate_gain_multiplier(0.0, measured_power_pol_x, headroom))
-                new_gains[i + self._num_fs] = float(calculate_gain_multiplier(0.0, measured_power_pol_y, headroom))
+        with self._gains_lock:
+            # The VCC may have been deconfigured or reconfigured since the gains were computed
+            if not self.filter_gains_allowed or len(new_gains) != self._num_vcc_gains:
+                update.result_code = ResultCode.REJECTED
+                update.message = "Gains not applied, as the VCC was deconfigured or reconfigured since they were computed."
+                return update
 
             # Reconfigure VCCs
             if self.frequency_band in {FrequencyBandEnum._1, FrequencyBandEnum._2}:
-                result = self.b123_vcc.configure(
+                result = self._timed(
+                    "AutoSetFilterGains",
+                    "b123_vcc",
+                    transaction_id,
+                    self.b123_vcc.configure,
                     B123VccOsppfbChannelizerConfigureArgin(
                         transaction_id=transaction_id,
                         sample_rate=self._sample_rate,
                         gains=new_gains,
-                    )
+                    ),
                 )
 
                 if result == 1:
@@ -967,59 +1943,22 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
                             gains=self.vcc_gains,
                         )
                     )
-                    self._set_task_callback(
-                        task_callback,
-                        TaskStatus.COMPLETED,
-                        ResultCode.FAILED,
-                        "Failed to auto-set gains: failed to reconfigure VCC123 Channelizer with new gain values.",
-                    )
-                    self.long_running_command_result_buffer.insert(
-                        command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.FAILED, transaction_id=transaction_id
-                    )
-                    return
+                    update.result_code = ResultCode.FAILED
+                    update.message = "Failed to auto-set gains: failed to reconfigure VCC123 Channelizer with new gain values."
+                    return update
 
             else:
                 # TODO: Implement routing to the 5 Channelizer once outlined
-                self._set_task_callback(
-                    task_callback,
-                    TaskStatus.COMPLETED,
-                    ResultCode.FAILED,
-                    "Failed to auto-set gains: currently selected frequency band is not supported.",
-                )
-                self.long_running_command_result_buffer.insert(
-                    command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.FAILED, transaction_id=transaction_id
-                )
-                return
+                update.result_code = ResultCode.FAILED
+                update.message = "Failed to auto-set gains: currently selected frequency band is not supported."
+                return update
             # Update vccGains and publish change
-            self.vcc_gains = new_gains
-            self.last_requested_headrooms = headrooms
+            self._commit_vcc_gains(new_gains, update.headrooms, GainSource.AUTO_SET_FILTER_GAINS, transaction_id, update.powers)
 
-            self.log_info(f"Successfully set Autofilter gains with headrooms {headrooms}", transaction_id)
-
-            self._set_task_callback(
-                task_callback,
-                TaskStatus.COMPLETED,
-                ResultCode.OK,
-                "AutoSetFilterGains completed OK",
-            )
-            self.long_running_command_result_buffer.insert(
-                command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.OK, transaction_id=transaction_id
-            )
-        except Exception as ex:
-            transaction_id = self.transaction_ids_per_command.get(CommandType.AUTOSETFILTERGAINS, None)
-            self.logger.exception(ex)
-            self._set_task_callback(
-                task_callback,
-                TaskStatus.COMPLETED,
-                ResultCode.FAILED,
-                textwrap.shorten(f"An unexpected exception occurred during AutoSetFilterGains: {ex}", width=400),
-            )
-            self.long_running_command_result_buffer.insert(
-                command_type=CommandType.AUTOSETFILTERGAINS, result_code=ResultCode.FAILED, transaction_id=transaction_id
-            )
-        finally:
-            # Reset the ID so it's not used in a different Command call
-            self.transaction_ids_per_command[CommandType.AUTOSETFILTERGAINS] = None
+        self.log_info(f"Successfully set Autofilter gains with headrooms {update.headrooms}", transaction_id)
+        update.result_code = ResultCode.OK
+        update.message = "AutoSetFilterGains completed OK"
+        return update
 
     def _stop_ip_blocks(self) -> int:
         """Stop all IP blocks."""
@@ -1035,118 +1974,173 @@ class VCCAllBandsComponentManager(FhsControllerComponentManagerBase, ObsDeviceCo
 
     def _reset(self) -> None:
         """Reset all attributes and other data."""
-        self._config_id = ""
-        self._scan_id = 0
-        self.frequency_band = FrequencyBandEnum._1
-        self.frequency_band_offset = [0, 0]
-        self._sample_rate = 0
-        self._samples_per_frame = 0
-        self._fs_lanes = []
+        self.auto_gain_control.stop()
+        self.power_statistics.clear()
+        self.power_meter_health.reset()
+        with self._gains_lock:
+            self._config_id = ""
+            self._scan_id = 0
+            self.frequency_band = FrequencyBandEnum._1
+            self.frequency_band_offset = [0, 0]
+            self._sample_rate = 0
+            self._samples_per_frame = 0
+            self._num_fs = 0
+            self._num_vcc_gains = 0
+            self.vcc_gains = []
+            self._fs_lanes = []
+            self._applied_configuration = None
 
     def _go_to_idle_deconfigure(self, go_to_idle_schema: FhsControllerBaseGoToIdleSchema) -> None:
         """Deconfigure all ip blocks"""
         transaction_id = self.transaction_ids_per_command.get(CommandType.GOTOIDLE, None)
+        self.auto_gain_control.stop()
+        self.power_statistics.clear()
+        self.power_meter_health.reset()
+        with self._gains_lock:
+            self._applied_configuration = None
+            # Gains computed before now are for the configuration being removed, so they must not be applied
+            self._num_vcc_gains = 0
+
+            # VCC123 Channelizer Deconfiguration
+            b123_vcc_deconfigure_result = self._timed("GoToIdle", "b123_vcc", transaction_id, self.b123_vcc.deconfigure)
+            if b123_vcc_deconfigure_result == 1:
+                self.log_error("Deconfiguration of VCC123 Channelizer failed.", transaction_id)
+                raise RuntimeError("Deconfiguration of VCC123 failed.")
+
+            # WFS Deconfiguration
+            wfs_deconfigure_result = self._timed("GoToIdle", "wideband_frequency_shifter", transaction_id, self.wideband_frequency_shifter.deconfigure)
+            if wfs_deconfigure_result == 1:
+                self.log_error("Deconfiguration of Wideband Frequency Shifter failed.", transaction_id)
+                raise RuntimeError("Deconfiguration of Wideband Frequency Shifter failed.")
+
+            # FSS Deconfiguration
+            fss_deconfigure_result = self._timed("GoToIdle", "frequency_slice_selection", transaction_id, self.frequency_slice_selection.deconfigure)
+            if fss_deconfigure_result == 1:
+                self.log_error("Deconfiguration of FS Selection failed.", transaction_id)
+                raise RuntimeError("Deconfiguration of FS Selection failed.")
+
+            # WIB Deconfiguration
+            wib_deconfigure_result = self._timed("GoToIdle", "wideband_input_buffer", transaction_id, self.wideband_input_buffer.deconfigure)
+            if wib_deconfigure_result == 1:
+                self.log_error("Deconfiguration of WIB failed.", transaction_id)
+                raise RuntimeError("Deconfiguration of WIB failed.")
+
+            # Pre- and post-channelizer WPM Deconfiguration
+            wpm_deconfiguration_report = self._timed(
+                "GoToIdle",
+                "power_meters",
+                transaction_id,
+                self.power_meter_fleet.deconfigure,
+                [*VCCBandGroup, *(int(config.fs_id) for config in self._fs_lanes)],
+            )
+            if not wpm_deconfiguration_report.succeeded:
+                self.log_error(wpm_deconfiguration_report.describe_failures(), transaction_id)
+                raise RuntimeError(wpm_deconfiguration_report.describe_failures())
 
-        # VCC123 Channelizer Deconfiguration
-        b123_vcc_deconfigure_result = self.b123_vcc.deconfigure()
-        if b123_vcc_deconfigure_result == 1:
-            self.log_error("Deconfiguration of VCC123 Channelizer failed.", transaction_id)
-            raise RuntimeError("Deconfiguration of VCC123 failed.")
-
-        # WFS Deconfiguration
-        wfs_deconfigure_result = self.wideband_frequency_shifter.deconfigure()
-        if wfs_deconfigure_result == 1:
-            self.log_error("Deconfiguration of Wideband Frequency Shifter failed.", transaction_id)
-            raise RuntimeError("Deconfiguration of Wideband Frequency Shifter failed.")
-
-        # FSS Deconfiguration
-        fss_deconfigure_result = self.frequency_slice_selection.deconfigure()
-        if fss_deconfigure_result == 1:
-            self.log_error("Deconfiguration of FS Selection failed.", transaction_id)
-            raise RuntimeError("Deconfiguration of FS Selection failed.")
-
-        # WIB Deconfiguration
-        wib_deconfigure_result = self.wideband_input_buffer.deconfigure()
-        if wib_deconfigure_result == 1:
-            self.log_error("Deconfiguration of WIB failed.", transaction_id)
-            raise RuntimeError("Deconfiguration of WIB failed.")
-
-        # Pre-channelizer WPM Deconfiguration
-        for band_group in VCCBandGroup:
-            pre_channelizer_wpm_deconfiguration_result = self.wideband_power_meters[band_group].deconfigure()
-            if pre_channelizer_wpm_deconfiguration_result == 1:
-                self.log_error(f"Deconfiguration of {band_group.value} Wideband Power Meter failed.", transaction_id)
-                raise RuntimeError(f"Deconfiguration of {band_group.value} Wideband Power Meter failed.")
-
-        # Post-channelizer WPM Deconfiguration
-        for config in self._fs_lanes:
-            fs_id = int(config.fs_id)
-            post_channelizer_wpm_deconfiguration_result = self.wideband_power_meters[fs_id].deconfigure()
-            if post_channelizer_wpm_deconfiguration_result == 1:
-                self.log_error(f"Deconfiguration of FS {fs_id} Wideband Power Meter failed.", transaction_id)
-                raise RuntimeError(f"Deconfiguration of FS {fs_id} Wideband Power Meter failed.")
-
-        # VCC Stream Merge Deconfiguration
-        for i in range(1, 3):
-            vcc_stream_merge_deconfiguration_result = self.vcc_stream_merges[i].deconfigure()
-            if vcc_stream_merge_deconfiguration_result == 1:
-                self.log_error("Deconfiguration of VCC Stream Merge failed.", transaction_id)
-                raise RuntimeError("Deconfiguration of VCC Stream Merge failed.")
+            # VCC Stream Merge Deconfiguration
+            for i in range(1, 3):
+                vcc_stream_merge_deconfiguration_result = self._timed(
+                    "GoToIdle", f"vcc_stream_merge_{i}", transaction_id, self.vcc_stream_merges[i].deconfigure
+                )
+                if vcc_stream_merge_deconfiguration_result == 1:
+                    self.log_error("Deconfiguration of VCC Stream Merge failed.", transaction_id)
+                    raise RuntimeError("Deconfiguration of VCC Stream Merge failed.")
 
-        self.log_info("Sucessfully deconfigured all IP Blocks", transaction_id)
+            self.log_info("Sucessfully deconfigured all IP Blocks", transaction_id)
 
     def _recover_all_ip_blocks(self) -> None:
         """Call recover method of all ip blocks"""
         transaction_id = self.transaction_ids_per_command.get(CommandType.OBSRESET, None)
 
         # VCC123 Channelizer Recovery
-        b123_vcc_recover_result = self.b123_vcc.recover()
+        b123_vcc_recover_result = self._timed("ObsReset", "b123_vcc", transaction_id, self.b123_vcc.recover)
         if b123_vcc_recover_result == 1:
             self.log_error("Recovery of VCC123 Channelizer failed.", transaction_id)
             raise RuntimeError("Recovery of VCC123 failed.")
 
         # WFS Recovery
-        wfs_recovery_result = self.wideband_frequency_shifter.recover()
+        wfs_recovery_result = self._timed("ObsReset", "wideband_frequency_shifter", transaction_id, self.wideband_frequency_shifter.recover)
         if wfs_recovery_result == 1:
             self.log_error("Recovery of Wideband Frequency Shifter failed.", transaction_id)
             raise RuntimeError("Recovery of Wideband Frequency Shifter failed.")
 
         # FSS Recovery
-        fss_recovery_result = self.frequency_slice_selection.recover()
+        fss_recovery_result = self._timed("ObsReset", "frequency_slice_selection", transaction_id, self.frequency_slice_selection.recover)
         if fss_recovery_result == 1:
             self.log_error("Recovery of FS Selection failed.", transaction_id)
             raise RuntimeError("Recovery of FS Selection failed.")
 
         # WIB Recovery
-        wib_recover_result = self.wideband_input_buffer.recover()
+        wib_recover_result = self._timed("ObsReset", "wideband_input_buffer", transaction_id, self.wideband_input_buffer.recover)
         if wib_recover_result == 1:
             self.log_error("Recovery of WIB failed.", transaction_id)
             raise RuntimeError("Recovery of WIB failed.")
 
-        # Pre-channelizer WPM Recovery
-        for band_group in VCCBandGroup:
-            pre_channelizer_wpm_recover_result = self.wideband_power_meters[band_group].recover()
-            if pre_channelizer_wpm_recover_result == 1:
-                self.log_error(f"Recovery of {band_group.value} Wideband Power Meter failed.", transaction_id)
-                raise RuntimeError(f"Recovery of {band_group.value} Wideband Power Meter failed.")
-
-        # Post-channelizer WPM Recovery
-        for config in self._fs_lanes:
-            fs_id = int(config.fs_id)
-            post_channelizer_wpm_recover_result = self.wideband_power_meters[fs_id].recover()
-            if post_channelizer_wpm_recover_result == 1:
-                self.log_error(f"Recovery of FS {fs_id} Wideband Power Meter failed.", transaction_id)
-                raise RuntimeError(f"Recovery of FS {fs_id} Wideband Power Meter failed.")
+        # Pre- and post-channelizer WPM Recovery
+        wpm_recovery_report = self._timed(
+            "ObsReset", "power_meters", transaction_id, self.power_meter_fleet.recover, [*VCCBandGroup, *(int(config.fs_id) for config in self._fs_lanes)]
+        )
+        if not wpm_recovery_report.succeeded:
+            self.log_error(wpm_recovery_report.describe_failures(), transaction_id)
+            raise RuntimeError(wpm_recovery_report.describe_failures())
 
         # VCC Stream Merge Recovery
         for i in range(1, 3):
-            vcc_stream_merge_recover_result = self.vcc_stream_merges[i].recover()
+            vcc_stream_merge_recover_result = self._timed("ObsReset", f"vcc_stream_merge_{i}", transaction_id, self.vcc_stream_merges[i].recover)
             if vcc_stream_merge_recover_result == 1:
                 self.log_error("Recovery of VCC Stream Merge failed.", transaction_id)
                 raise RuntimeError("Recovery of VCC Stream Merge failed.")
 
         self.log_info("Sucessfully Recovered all IP Blocks", transaction_id)
 
+    def _fs_powers(
+        self,
+        command: str,
+        transaction_id: str | None,
+        statistic: str | None = None,
+        window: float | None = None,
+    ) -> tuple[np.ndarray, dict[int, str]]:
+        """Get the power measured by each active FS power meter, for computing gains.
+
+        Args:
+            command (:obj:`str`): The command the powers are read for, used for stage latencies.
+            transaction_id (:obj:`str | None`): The transaction ID of the command.
+            statistic (:obj:`str | None`, optional): The statistic (see :obj:`PowerStatistics.statistic`) of the
+                recently sampled powers to use, or None to read the power meters now. Default is None.
+            window (:obj:`float | None`, optional): The time window, in seconds, of the statistic. Default is None,
+                using :obj:`POWER_STATISTICS_WINDOW`.
+
+        Returns:
+            :obj:`tuple[np.ndarray, dict[int, str]]`: The (num_fs x 2) power matrix, and the reason each FS
+            power meter which cannot be used to compute a gain was rejected, mapped by FS index.
+        """
+        fs_indexes = list(range(1, self._num_fs + 1))
+        if statistic is None:
+            snapshot = self._timed(command, "power_meter_snapshot", transaction_id, self.power_meter_fleet.read_powers, fs_indexes)
+            self.log_info(
+                f"Read {len(snapshot.keys)} FS power meters in {(snapshot.completed_at - snapshot.started_at) * 1000:.1f} ms "
+                f"(reading skew {snapshot.skew * 1000:.1f} ms)",
+                transaction_id,
+            )
+            powers, failures = snapshot.powers, dict(snapshot.report.failures)
+        else:
+            window = window if window is not None else POWER_STATISTICS_WINDOW
+            statistics = self.power_statistics.statistics(window).select(fs_indexes)
+            powers = statistics.statistic(statistic)
+            failures = {fs_index: f"no power samples in the last {window}s" for fs_index, count in zip(fs_indexes, statistics.count.min(axis=1)) if count == 0}
+            self.log_info(f"Using the {statistic} FS power over the last {window}s", transaction_id)
+
+        for fs_index, invalid in zip(fs_indexes, invalid_power_mask(powers)):
+            if fs_index not in failures and invalid.any():
+                polarizations = "/".join(pol for pol, is_invalid in zip(POLARIZATIONS, invalid) if is_invalid)
+                failures[fs_index] = f"invalid power measurement for polarization {polarizations}"
+        return powers, failures
+
+    def _timed(self, command: str, stage: str, transaction_id: str | None, func: Callable[..., Any], *args: Any) -> Any:
+        """Call a function, recording its duration as a stage of an observing command."""
+        with self.stage_latencies.measure(command, stage, transaction_id):
+            return func(*args)
+
     def _obs_command_with_callback(
         self,
         *args,
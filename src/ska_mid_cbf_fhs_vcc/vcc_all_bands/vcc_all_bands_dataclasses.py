@@ -42,6 +42,7 @@ class VCCAllBandsConfigureScanConfig(FhsControllerBaseConfig, DataClassJsonMixin
     fs_lanes: list[VCCAllBandsConfigureScanFSLaneConfig]
     frequency_band_offset_stream_2: int = 0
     band_5_tuning: float = 0.0
+    force_full_configure: bool = False
     transaction_id: Optional[str] = None
 
 
@@ -50,4 +51,24 @@ class VCCAllBandsAutoSetFilterGainsSchema(DataClassJsonMixin):
     """Dataclass representing the VCC All Bands AutoSetFilterGains input parameter."""
 
     headrooms: Optional[list[float]] = field(default_factory=lambda: [3.0])
+    power_statistic: Optional[str] = None
+    power_window: Optional[float] = None
+    transaction_id: Optional[str] = None
+
+
+@dataclass
+class VCCAllBandsAutoSetFleetFilterGainsSchema(VCCAllBandsAutoSetFilterGainsSchema):
+    """Dataclass representing the VCC All Bands AutoSetFleetFilterGains input parameter."""
+
+    require_all: bool = False
+
+
+@dataclass
+class VCCAllBandsAutoGainControlSchema(DataClassJsonMixin):
+    """Dataclass representing the VCC All Bands StartAutoGainControl input parameter."""
+
+    headrooms: list[float] = field(default_factory=lambda: [3.0])
+    period: float = 1.0
+    hysteresis_db: float = 0.5
+    min_update_interval: float = 10.0
     transaction_id: Optional[str] = None
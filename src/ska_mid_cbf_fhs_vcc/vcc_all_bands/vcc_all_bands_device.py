@@ -6,9 +6,10 @@ from ska_mid_cbf_fhs_common import FhsControllerBaseDevice
 from ska_mid_cbf_fhs_common.state_model.fhs_obs_state import FhsObsStateMachine, FhsObsStateModel
 from ska_tango_base import SKAObsDevice
 from ska_tango_base.base.base_device import DevVarLongStringArrayType
-from tango.server import attribute, command
+from tango.server import attribute, command, device_property
 
 from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import FrequencyBandEnum
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_health import POWER_METER_HEALTHY_RANGE
 from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_component_manager import VCCAllBandsComponentManager
 
 
@@ -18,6 +19,16 @@ class VCCAllBandsController(
 ):
     """Tango device class for the VCC All Bands Controller."""
 
+    gain_history_path = device_property(dtype=str, default_value="")
+    """Optional file to spill the gain history to, so that it survives a restart of the device server."""
+
+    status_record_path = device_property(dtype=str, default_value="")
+    """Optional directory to keep the IP block status records in, so that they can be read after a fault,
+    in a ``vcc<device ID>`` subdirectory of each VCC."""
+
+    power_meter_healthy_range = device_property(dtype=(float,), default_value=list(POWER_METER_HEALTHY_RANGE))
+    """The lowest and highest healthy average power of the Wideband Power Meters, relative to full scale."""
+
     def set_local_change_events(self) -> None:
         super().set_local_change_events()
         self.set_change_event("subarrayID", True)
@@ -41,6 +52,10 @@ class VCCAllBandsController(
             ("ObsReset", "obs_reset"),
             ("UpdateSubarrayMembership", "update_subarray_membership"),
             ("AutoSetFilterGains", "auto_set_filter_gains"),
+            ("AutoSetFleetFilterGains", "auto_set_fleet_filter_gains"),
+            ("PrepareConfiguration", "prepare_configuration"),
+            ("StartAutoGainControl", "start_auto_gain_control"),
+            ("StopAutoGainControl", "stop_auto_gain_control"),
         ]
 
     @attribute(
@@ -133,6 +148,100 @@ class VCCAllBandsController(
         """
         return self.component_manager.vcc_gains
 
+    @attribute(
+        dtype=str,
+    )
+    def stageLatencySummary(self) -> str:
+        """Read-only Tango attribute summarising the recent durations of each stage of the observing commands.
+
+        Returns:
+            :obj:`str`: JSON object mapping each command and stage to its sample count, p50, p95 and max durations
+            in milliseconds, and the transaction ID of its slowest sample.
+        """
+        return self.component_manager.stage_latency_summary
+
+    @attribute(
+        dtype=(float,),
+        max_dim_x=3,
+    )
+    def widebandInputBufferCounterRates(self) -> list[float]:
+        """Read-only Tango attribute specifying the rates of the Wideband Input Buffer error counters over the last 10 seconds,
+        sampled at each health poll while started.
+
+        Returns:
+            :obj:`list[float]`: The rates, in counts per second, of [packet_error_count, packet_drop_count, loss_of_signal_seconds],
+            or NaN until the counters have been sampled twice.
+        """
+        return self.component_manager.wideband_input_buffer_counter_rates
+
+    @attribute(
+        dtype=(float,),
+        max_dim_x=7,
+    )
+    def packetValidationCounterRates(self) -> list[float]:
+        """Read-only Tango attribute specifying the rates of the Packet Validation counters over the last 10 seconds,
+        sampled at each health poll while started.
+
+        Returns:
+            :obj:`list[float]`: The rates, in counts per second, of [egress_cnt, ingress_error_cnt, size_error_cnt,
+            wrong_dst_mac_cnt, wrong_src_mac_cnt, wrong_ethertype_cnt, wrong_antenna_id_cnt], or NaN until the
+            counters have been sampled twice.
+        """
+        return self.component_manager.packet_validation_counter_rates
+
+    @attribute(
+        dtype=str,
+    )
+    def packetValidationDiagnostics(self) -> str:
+        """Read-only Tango attribute describing the packets most recently dropped by the Packet Validation block,
+        as of its most recent health poll.
+
+        Returns:
+            :obj:`str`: JSON object with, for each of the dst_mac, src_mac, ethertype and antenna_id checks, the expected
+            value, the last wrong value received (null until a packet fails the check) and the count of packets which
+            failed the check; empty until the block has been polled.
+        """
+        return self.component_manager.packet_validation_diagnostics
+
+    @attribute(
+        dtype=str,
+    )
+    def pollSchedulerStatus(self) -> str:
+        """Read-only Tango attribute describing the status polling scheduler shared by every VCC of the device server.
+
+        Returns:
+            :obj:`str`: JSON object containing the number and names of the poll jobs, the number of worker threads and polls
+            run, the mean, p95 and max lag in milliseconds between when recent polls were due and when they started, and the
+            job with the largest lag.
+        """
+        return self.component_manager.poll_scheduler_status
+
+    @attribute(
+        dtype=str,
+    )
+    def autoGainControlStatus(self) -> str:
+        """Read-only Tango attribute describing the automatic gain control loop.
+
+        Returns:
+            :obj:`str`: JSON object containing whether the loop is running, its configuration, the number of
+            samples taken and gain updates written, and the time of the last update.
+        """
+        return self.component_manager.auto_gain_control_status
+
+    @attribute(
+        dtype=(float,),
+        max_dim_x=174,
+    )
+    def powerStatistics(self) -> list[float]:
+        """Read-only Tango attribute specifying the statistics of the power recently measured by each power meter,
+        over the last 10 seconds, sampled once per second while configured.
+
+        Returns:
+            :obj:`list[float]`: For each of the B123, B45A and B5B power meters, then each FS power meter, its
+            [mean_x, mean_y, median_x, median_y, p95_x, p95_y] power; NaN for power meters without recent samples.
+        """
+        return self.component_manager.power_statistics_spectrum
+
     @command(
         dtype_in="DevUShort",
         dtype_out="DevVarLongStringArray",
@@ -183,11 +292,182 @@ class VCCAllBandsController(
         result_code, command_id = command_handler(argin=auto_set_filter_gains_schema)
         return [[result_code], [command_id]]
 
+    @command(
+        dtype_in="DevString",
+        dtype_out="DevVarLongStringArray",
+        doc_in=(
+            "String containing JSON following the AutoSetFleetFilterGains schema: the AutoSetFilterGains arguments, "
+            "applied to every configured VCC hosted by this device server, and whether to require every VCC to succeed."
+        ),
+    )
+    def AutoSetFleetFilterGains(self: VCCAllBandsController, auto_set_fleet_filter_gains_schema: str | None = None) -> DevVarLongStringArrayType:
+        """Tango command to auto-set the filter gains of every configured VCC hosted by this device server at once.
+
+        The power meters of all VCCs are read concurrently before any gains are applied, then the gains are applied
+        concurrently. If "require_all" is set, no gains are applied unless the gains of every configured VCC were computed.
+
+        Args:
+            auto_set_fleet_filter_gains_schema (:obj:`str`): JSON String following the auto set fleet filter gains command schema.
+
+        Returns:
+            :obj:`tuple[list[ResultCode], list[str]]`: The Tango result code and a string
+            message indicating status. The message is for information purpose only.
+        """
+        command_handler = self.get_command_object(command_name="AutoSetFleetFilterGains")
+        # It is important that the argin keyword be provided, as the
+        # component manager method will be overriden in simulation mode
+        result_code, command_id = command_handler(argin=auto_set_fleet_filter_gains_schema)
+        return [[result_code], [command_id]]
+
+    @command(
+        dtype_in="DevString",
+        dtype_out="DevVarLongStringArray",
+        doc_in="String containing JSON following the ConfigureScan schema, for the next configuration.",
+    )
+    def PrepareConfiguration(self: VCCAllBandsController, argin: str) -> DevVarLongStringArrayType:
+        """Tango command to validate and compile the configuration for the next scan ahead of time.
+        Allowed while the current scan is still running; a following ConfigureScan with the same
+        configuration then only needs to program the IP blocks.
+
+        Args:
+            argin (:obj:`str`): JSON string following the ConfigureScan schema.
+
+        Returns:
+            :obj:`tuple[list[ResultCode], list[str]]`: The Tango result code and a string
+            message indicating status. The message is for information purpose only.
+        """
+        command_handler = self.get_command_object(command_name="PrepareConfiguration")
+        # It is important that the argin keyword be provided, as the
+        # component manager method will be overriden in simulation mode
+        result_code, command_id = command_handler(argin=argin)
+        return [[result_code], [command_id]]
+
+    @command(
+        dtype_in="DevString",
+        dtype_out="DevVarLongStringArray",
+        doc_in=(
+            "String containing JSON following the auto gain control schema: requested RFI headrooms in decibels (dB), "
+            "sampling period, hysteresis in dB and minimum interval between gain updates, in seconds."
+        ),
+    )
+    def StartAutoGainControl(self: VCCAllBandsController, argin: str | None = None) -> DevVarLongStringArrayType:
+        """Tango command to start automatic gain control, which periodically re-applies the requested RFI headrooms
+        while scanning, only updating the channels whose gain moved beyond the hysteresis.
+
+        Args:
+            argin (:obj:`str`): JSON string following the auto gain control command schema.
+
+        Returns:
+            :obj:`tuple[list[ResultCode], list[str]]`: The Tango result code and a string
+            message indicating status. The message is for information purpose only.
+        """
+        command_handler = self.get_command_object(command_name="StartAutoGainControl")
+        # It is important that the argin keyword be provided, as the
+        # component manager method will be overriden in simulation mode
+        result_code, command_id = command_handler(argin=argin)
+        return [[result_code], [command_id]]
+
+    @command(
+        dtype_in="DevString",
+        dtype_out="DevVarLongStringArray",
+        doc_in="Optional string containing JSON with the transaction_id of the command.",
+    )
+    def StopAutoGainControl(self: VCCAllBandsController, argin: str | None = None) -> DevVarLongStringArrayType:
+        """Tango command to stop automatic gain control, leaving the last applied gains in place.
+
+        Args:
+            argin (:obj:`str`): Optional JSON string containing the transaction_id of the command.
+
+        Returns:
+            :obj:`tuple[list[ResultCode], list[str]]`: The Tango result code and a string
+            message indicating status. The message is for information purpose only.
+        """
+        command_handler = self.get_command_object(command_name="StopAutoGainControl")
+        # It is important that the argin keyword be provided, as the
+        # component manager method will be overriden in simulation mode
+        result_code, command_id = command_handler(argin=argin)
+        return [[result_code], [command_id]]
+
+    @command(
+        dtype_out="DevString",
+        doc_out="JSON list of the cached ConfigureScan plans.",
+    )
+    def GetConfigurationPlans(self: VCCAllBandsController) -> str:
+        """Tango command to describe the ConfigureScan plans currently cached by this VCC, for debugging.
+
+        Returns:
+            :obj:`str`: JSON list of the cached plans, from least to most recently used, each containing
+            its fingerprint, config ID and the exact block configurations it would send.
+        """
+        return self.component_manager.get_configuration_plans()
+
+    @command(
+        dtype_out="DevString",
+        doc_out="JSON list of the recent observing command stage latency samples.",
+    )
+    def DumpStageLatencies(self: VCCAllBandsController) -> str:
+        """Tango command to dump every recent stage latency sample of the observing commands, for diagnosing slow commands.
+
+        Returns:
+            :obj:`str`: JSON list of the samples, from oldest to newest, each containing its command, stage,
+            duration in seconds, transaction ID and completion timestamp.
+        """
+        return self.component_manager.dump_stage_latencies()
+
+    @command(
+        dtype_in="DevString",
+        dtype_out="DevEncoded",
+        doc_in="Optional JSON query with since/until POSIX timestamps, a source and a limit on the number of records.",
+        doc_out="The matching gain history records, packed as fixed-width binary records.",
+    )
+    def GetGainHistory(self: VCCAllBandsController, query: str) -> tuple[str, bytes]:
+        """Tango command to get the history of the gain vectors applied to the VCC coarse channels,
+        for diagnosing gain oscillation.
+
+        Args:
+            query (:obj:`str`): JSON object with optional "since" and "until" POSIX timestamps, a "source"
+                (CONFIGURE_SCAN, AUTO_SET_FILTER_GAINS or AUTO_GAIN_CONTROL) and a "limit" on the number of
+                most recent records to return; empty for the whole history.
+
+        Returns:
+            :obj:`tuple[str, bytes]`: The encoded format, naming the record format and the numpy record type, and
+            the records from oldest to newest, each with its sequence number, timestamp, source, transaction ID,
+            gains, headrooms and the FS power matrix the gains were computed from.
+        """
+        return self.component_manager.get_gain_history(query)
+
+    @command(
+        dtype_in="DevString",
+        dtype_out="DevEncoded",
+        doc_in="JSON query with a block_type, optional since/until POSIX timestamps and a limit on the number of records.",
+        doc_out="The matching IP block status records, packed as fixed-width binary records.",
+    )
+    def GetStatusRecords(self: VCCAllBandsController, query: str) -> tuple[str, bytes]:
+        """Tango command to get the recent statuses of an IP block type, as read by the monitoring polls,
+        for diagnosing what led up to a fault.
+
+        Args:
+            query (:obj:`str`): JSON object with the "block_type" (wideband_input_buffer, packet_validation, vcc_stream_merge
+                or wideband_power_meter), and optional "since" and "until" POSIX timestamps and a "limit" on the number of
+                most recent records to return.
+
+        Returns:
+            :obj:`tuple[str, bytes]`: The encoded format, naming the IP block type and the numpy record type, and
+            the records from oldest to newest, each with its sequence number, timestamp, IP block instance and status fields.
+        """
+        return self.component_manager.get_status_records(query)
+
     def init_device(self) -> None:
         """Initialize the Tango device after startup."""
         super().init_device()
         self._update_obs_state(ObsState.IDLE)
 
+    def delete_device(self) -> None:
+        """Release the resources of the component manager before the device is deleted or re-initialised."""
+        if hasattr(self, "component_manager"):
+            self.component_manager.close()
+        super().delete_device()
+
     def create_component_manager(self) -> VCCAllBandsComponentManager:
         """Instantiate the component manager for this device.
 
@@ -10,14 +10,18 @@
 
 from __future__ import annotations
 
+import json
 from functools import partial
 from typing import Any
 
+import numpy as np
 from ska_control_model import HealthState
 from ska_mid_cbf_fhs_common.testing.simulation import FhsObsSimMode, SimModeObsCMBase
 from tango.server import run
 
 from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import FrequencyBandEnum
+from ska_mid_cbf_fhs_vcc.helpers.record_ring import encode_records, ring_dtype
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_history import GAIN_HISTORY_FIELDS, GAIN_HISTORY_FORMAT
 from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_device import VCCAllBandsController
 
 __all__ = ["SimVCCAllBandsCM", "SimVCCAllBandsController"]
@@ -33,6 +37,13 @@ VCC_SIM_DEFAULT_ATTRIBUTE_VALUES = {
     "inputSampleRate": 0,
     "frequencyBandOffset": [0],
     "subarrayID": 0,
+    "stageLatencySummary": "{}",
+    "pollSchedulerStatus": "{}",
+    "autoGainControlStatus": '{"running": false}',
+    "powerStatistics": [0.0],
+    "widebandInputBufferCounterRates": [0.0, 0.0, 0.0],
+    "packetValidationCounterRates": [0.0] * 7,
+    "packetValidationDiagnostics": "{}",
 }
 
 # Add any attributes that are configured for change/archive events to these sets
@@ -126,6 +137,34 @@ class SimVCCAllBandsCM(SimModeObsCMBase):
                     "result_code": "OK",
                     "message": "AutoSetFilterGains completed OK",
                 },
+                "AutoSetFleetFilterGains": {
+                    "allowed": True,
+                    "allowed_states": ["ON"],
+                    "allowed_obs_states": ["IDLE", "READY", "SCANNING"],
+                    "result_code": "OK",
+                    "message": "AutoSetFleetFilterGains completed OK",
+                },
+                "PrepareConfiguration": {
+                    "allowed": True,
+                    "allowed_states": ["ON"],
+                    "allowed_obs_states": ["IDLE", "READY", "SCANNING"],
+                    "result_code": "OK",
+                    "message": "PrepareConfiguration completed OK",
+                },
+                "StartAutoGainControl": {
+                    "allowed": True,
+                    "allowed_states": ["ON"],
+                    "allowed_obs_states": ["READY", "SCANNING"],
+                    "result_code": "OK",
+                    "message": "StartAutoGainControl completed OK",
+                },
+                "StopAutoGainControl": {
+                    "allowed": True,
+                    "allowed_states": ["ON"],
+                    "allowed_obs_states": ["IDLE", "READY", "SCANNING", "ABORTED", "FAULT"],
+                    "result_code": "OK",
+                    "message": "StopAutoGainControl completed OK",
+                },
             }
         )
         self.configure_scan = partial(self.sim_command, command_name="ConfigureScan", transaction_id="TEST_CS")
@@ -134,6 +173,26 @@ class SimVCCAllBandsCM(SimModeObsCMBase):
         self.obs_reset = partial(self.sim_command, command_name="ObsReset", transaction_id="TEST_OBS")
         self.update_subarray_membership = partial(self.sim_command, command_name="UpdateSubarrayMembership", transaction_id="TEST_USM")
         self.auto_set_filter_gains = partial(self.sim_command, command_name="AutoSetFilterGains", transaction_id="TEST_ASFG")
+        self.auto_set_fleet_filter_gains = partial(self.sim_command, command_name="AutoSetFleetFilterGains", transaction_id="TEST_ASFFG")
+        self.prepare_configuration = partial(self.sim_command, command_name="PrepareConfiguration", transaction_id="TEST_PC")
+        self.start_auto_gain_control = partial(self.sim_command, command_name="StartAutoGainControl", transaction_id="TEST_SAGC")
+        self.stop_auto_gain_control = partial(self.sim_command, command_name="StopAutoGainControl", transaction_id="TEST_STAGC")
+
+    def close(self: SimVCCAllBandsCM) -> None:
+        # No monitoring polls or worker pools are started in simulation mode, so there is nothing to stop
+        pass
+
+    def get_configuration_plans(self: SimVCCAllBandsCM) -> str:
+        # No ConfigureScan plans are compiled in simulation mode
+        return "[]"
+
+    def dump_stage_latencies(self: SimVCCAllBandsCM) -> str:
+        # No IP blocks are driven in simulation mode, so no stage latencies are recorded
+        return "[]"
+
+    def get_gain_history(self: SimVCCAllBandsCM, argin: str | None = None) -> tuple[str, bytes]:
+        # No gains are applied in simulation mode, so the history is always empty
+        return encode_records(GAIN_HISTORY_FORMAT, np.zeros(0, dtype=ring_dtype(GAIN_HISTORY_FIELDS)))
 
     @property
     def expected_dish_id(self: SimVCCAllBandsCM) -> str:
@@ -163,6 +222,39 @@ class SimVCCAllBandsCM(SimModeObsCMBase):
     def vcc_gains(self: SimVCCAllBandsCM) -> list[int]:
         return self.get_attribute_override("vccGains")
 
+    @property
+    def stage_latency_summary(self: SimVCCAllBandsCM) -> str:
+        return self.get_attribute_override("stageLatencySummary")
+
+    def get_status_records(self: SimVCCAllBandsCM, argin: str) -> tuple[str, bytes]:
+        # No statuses are read in simulation mode, so no status is ever recorded
+        block_type = json.loads(argin).get("block_type", "") if argin else ""
+        return encode_records(block_type, np.zeros(0, dtype=ring_dtype([])))
+
+    @property
+    def wideband_input_buffer_counter_rates(self: SimVCCAllBandsCM) -> list[float]:
+        return self.get_attribute_override("widebandInputBufferCounterRates")
+
+    @property
+    def packet_validation_counter_rates(self: SimVCCAllBandsCM) -> list[float]:
+        return self.get_attribute_override("packetValidationCounterRates")
+
+    @property
+    def packet_validation_diagnostics(self: SimVCCAllBandsCM) -> str:
+        return self.get_attribute_override("packetValidationDiagnostics")
+
+    @property
+    def poll_scheduler_status(self: SimVCCAllBandsCM) -> str:
+        return self.get_attribute_override("pollSchedulerStatus")
+
+    @property
+    def auto_gain_control_status(self: SimVCCAllBandsCM) -> str:
+        return self.get_attribute_override("autoGainControlStatus")
+
+    @property
+    def power_statistics_spectrum(self: SimVCCAllBandsCM) -> list[float]:
+        return self.get_attribute_override("powerStatistics")
+
 
 class SimVCCAllBandsController(VCCAllBandsController, FhsObsSimMode):
     change_event_attributes = VCC_SIM_CHANGE_EVENT_ATTRS
@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 from dataclasses_json import DataClassJsonMixin
 from ska_mid_cbf_fhs_common import BaseIPBlockManager
 
+from ska_mid_cbf_fhs_vcc.helpers.ip_block_properties import parse_bool_property
+from ska_mid_cbf_fhs_vcc.monitoring.status_decoder import CompiledDecoderMixin
 from ska_mid_cbf_fhs_vcc.vcc_stream_merge.vcc_stream_merge_simulator import VCCStreamMergeSimulator
 
 
@@ -15,11 +17,34 @@ class VCCStreamMergeConfig(DataClassJsonMixin):
     fs_id: np.uint16  # Frequency slice identifier.
 
 
+@dataclass
+class VCCStreamMergeLaneTableConfig(DataClassJsonMixin):
+    vid: list[np.uint16]  # VLAN identifier of each lane.
+    vcc_id: list[np.uint16]  # VCC identifier of each lane.
+    fs_id: list[np.uint16]  # Frequency slice identifier of each lane.
+
+
+LANE_TABLE_DTYPE = np.dtype([("vid", np.uint16), ("vcc_id", np.uint16), ("fs_id", np.uint16)])
+"""Record layout of a VCC Stream Merge lane table, one record per FS lane."""
+
+
+def lane_table_from_configs(lane_configs: list[VCCStreamMergeConfig]) -> np.ndarray:
+    """Convert a list of lane configurations into a compact lane table.
+
+    Args:
+        lane_configs (:obj:`list[VCCStreamMergeConfig]`): The lane configurations.
+
+    Returns:
+        :obj:`np.ndarray`: The lane table, a structured array with dtype :obj:`LANE_TABLE_DTYPE`.
+    """
+    return np.array([(lane.vid, lane.vcc_id, lane.fs_id) for lane in lane_configs], dtype=LANE_TABLE_DTYPE)
+
+
 ##
 # status class that will be populated by the APIs and returned to provide the status of VCC Stream Merge
 ##
 @dataclass
-class VCCStreamMergeStatus(DataClassJsonMixin):
+class VCCStreamMergeStatus(CompiledDecoderMixin):
     mac_source_register: np.uint64  # Source MAC Address.
     vid_register: np.uint16  # VLAN identifier.
     flags_register: np.uint16  # Various flags, currently used for noise diode state.
@@ -34,7 +59,11 @@ class VCCStreamMergeConfigureArgin(DataClassJsonMixin):
 
 
 class VCCStreamMergeManager(BaseIPBlockManager[VCCStreamMergeConfig, VCCStreamMergeStatus]):
-    """VCC Stream Merge IP block manager."""
+    """VCC Stream Merge IP block manager.
+
+    Lanes are written one at a time, unless the ``bulk_lane_writes`` property of the IP block declares that the driver
+    accepts a lane table in a single write.
+    """
 
     @property
     def config_dataclass(self) -> type[VCCStreamMergeConfig]:
@@ -51,22 +80,111 @@ class VCCStreamMergeManager(BaseIPBlockManager[VCCStreamMergeConfig, VCCStreamMe
         """:obj:`type[VCCStreamMergeSimulator]`: The simulator API class for the VCC Stream Merge block."""
         return VCCStreamMergeSimulator
 
+    def _manager_specific_setup(self, **kwargs):
+        # Lane table currently programmed into the block, or None if unknown
+        self._programmed_lane_table: np.ndarray | None = None
+        # Only drivers known to program a lane table in one write are sent one, since a driver which ignores the
+        # unknown lane table would leave the lanes unprogrammed without failing
+        self._bulk_lanes_supported = parse_bool_property(kwargs.get("bulk_lane_writes"))
+
+    @property
+    def bulk_lanes_supported(self) -> bool:
+        """:obj:`bool`: Whether lanes are written as a lane table in a single write, which is disabled if the firmware rejects one."""
+        return self._bulk_lanes_supported
+
     def configure(self, config: VCCStreamMergeConfigureArgin) -> int:
         """Configure the VCC Stream Merge."""
-        result = 0
-        for lane_config in config.fs_lane_configs:
-            result = super().configure(lane_config)
-            if result == 1:
-                break
-        return result
+        return self.configure_lane_table(lane_table_from_configs(config.fs_lane_configs), config.transaction_id)
 
     def deconfigure(self, config: VCCStreamMergeConfigureArgin | None = None) -> int:
         """Deconfigure the VCC Stream Merge."""
         if config is None:
+            self._programmed_lane_table = None
             return super().recover()
         result = 0
         for lane_config in config.fs_lane_configs:
             result = super().deconfigure(lane_config)
+            if result == 1:
+                self._programmed_lane_table = None
+                break
+            if self._programmed_lane_table is not None:
+                self._programmed_lane_table = self._programmed_lane_table[self._programmed_lane_table["fs_id"] != lane_config.fs_id]
+        return result
+
+    def recover(self) -> int:
+        """Recover the VCC Stream Merge."""
+        self._programmed_lane_table = None
+        return super().recover()
+
+    def configure_lane_table(self, lane_table: np.ndarray, transaction_id: str | None = None) -> int:
+        """Program a full lane table, rewriting only the lanes that differ from the currently programmed table.
+
+        Lanes are identified by their FS ID. Lanes which are no longer present in the new table are deconfigured,
+        and all new or changed lanes are written in a single operation if bulk writes are supported (see
+        :obj:`bulk_lanes_supported`), falling back to one write per lane if the firmware rejects it, and are written
+        one lane at a time otherwise.
+
+        Args:
+            lane_table (:obj:`np.ndarray`): The lane table, a structured array with dtype :obj:`LANE_TABLE_DTYPE`.
+            transaction_id (:obj:`str | None`, optional): The transaction ID to include in log messages. Default is None.
+
+        Returns:
+            :obj:`int`: 0 on success, 1 on failure.
+        """
+        lane_table = np.asarray(lane_table, dtype=LANE_TABLE_DTYPE)
+
+        if self._programmed_lane_table is None:
+            changed_lanes = lane_table
+        else:
+            unchanged = np.isin(lane_table, self._programmed_lane_table)
+            changed_lanes = lane_table[~unchanged]
+
+            removed_lanes = self._programmed_lane_table[~np.isin(self._programmed_lane_table["fs_id"], lane_table["fs_id"])]
+            for lane in removed_lanes:
+                result = super().deconfigure(VCCStreamMergeConfig(vid=int(lane["vid"]), vcc_id=int(lane["vcc_id"]), fs_id=int(lane["fs_id"])))
+                if result == 1:
+                    self._programmed_lane_table = None
+                    self.log_error(f"Deconfiguring VCC Stream Merge lane for FS {lane['fs_id']} failed.", transaction_id)
+                    return result
+
+        self.log_debug(f"Writing {changed_lanes.size} of {lane_table.size} VCC Stream Merge lanes", transaction_id)
+
+        result = self._write_lanes(changed_lanes, super().configure) if changed_lanes.size else 0
+        if result == 1:
+            self._programmed_lane_table = None
+            self.log_error("Configuring VCC Stream Merge failed.", transaction_id)
+            return result
+
+        self._programmed_lane_table = lane_table.copy()
+        return result
+
+    def _write_lanes(
+        self,
+        lanes: np.ndarray,
+        configure_fn: Callable[[VCCStreamMergeConfig | VCCStreamMergeLaneTableConfig], int],
+    ) -> int:
+        if self._bulk_lanes_supported:
+            try:
+                result = configure_fn(
+                    VCCStreamMergeLaneTableConfig(
+                        vid=lanes["vid"].tolist(),
+                        vcc_id=lanes["vcc_id"].tolist(),
+                        fs_id=lanes["fs_id"].tolist(),
+                    )
+                )
+            except Exception as ex:
+                self.logger.warning(f"Bulk lane write rejected by the VCC Stream Merge: {repr(ex)}")
+                result = 1
+
+            if result != 1:
+                return result
+
+            self.logger.warning("Falling back to per-lane writes for the VCC Stream Merge.")
+            self._bulk_lanes_supported = False
+
+        result = 0
+        for lane in lanes:
+            result = configure_fn(VCCStreamMergeConfig(vid=int(lane["vid"]), vcc_id=int(lane["vcc_id"]), fs_id=int(lane["fs_id"])))
             if result == 1:
                 break
         return result
@@ -7,16 +7,20 @@ from ska_mid_cbf_fhs_common import BaseSimulatorApi
 __all__ = ["VCCStreamMergeSimulator"]
 
 
+VCC_STREAM_MERGE_SIM_STATUS = json.loads(
+    """
+    {
+        "mac_source_register": 0,
+        "vid_register": 0,
+        "flags_register": 0,
+        "psn_register": 0,
+        "packet_count_register": 0
+    }
+    """
+)
+"""The status of the simulated block, parsed once rather than on every status read."""
+
+
 class VCCStreamMergeSimulator(BaseSimulatorApi):
     def status(self, clear: bool = False) -> dict:
-        return json.loads(
-            """
-            {
-                "mac_source_register": 0,
-                "vid_register": 0,
-                "flags_register": 0,
-                "psn_register": 0,
-                "packet_count_register": 0
-            }
-            """
-        )
+        return dict(VCC_STREAM_MERGE_SIM_STATUS)
@@ -1,13 +1,37 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import numpy as np
 from dataclasses_json import DataClassJsonMixin
 from ska_control_model import HealthState
 from ska_mid_cbf_fhs_common import BaseMonitoringIPBlockManager, convert_dish_id_uint16_t_to_mnemonic, non_blocking
 
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import AdaptivePollInterval
+from ska_mid_cbf_fhs_vcc.monitoring.counter_rates import CounterRateEngine, RateThreshold, parse_rate_thresholds, rate_health_check
+from ska_mid_cbf_fhs_vcc.monitoring.incremental_health import HEALTH_SUMMARY_INTERVAL, HealthCheck, IncrementalHealthEvaluator
+from ska_mid_cbf_fhs_vcc.monitoring.scheduled_health_monitor import ScheduledHealthMonitor
+from ska_mid_cbf_fhs_vcc.monitoring.status_decoder import CompiledDecoderMixin
 from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_simulator import WidebandInputBufferSimulator
 
+WIB_HEALTH_MONITOR_MIN_POLL_INTERVAL = 1.0
+"""The default shortest time between health polls of the Wideband Input Buffer, in seconds, used while its health is changing,
+unless the ``health_monitor_poll_interval`` property of the IP block is set."""
+
+WIB_HEALTH_MONITOR_MAX_POLL_INTERVAL = 15.0
+"""The default longest time between health polls of the Wideband Input Buffer, in seconds, used while steadily healthy,
+unless the ``health_monitor_poll_interval`` property of the IP block is longer."""
+
+WIB_HEALTH_MONITOR_COUNTERS = ("packet_error_count", "packet_drop_count", "loss_of_signal_seconds")
+"""The status counters of the Wideband Input Buffer whose increase speeds up health polling, and whose rates are published."""
+
+WIB_COUNTER_RATE_THRESHOLDS = {
+    "packet_error_count": RateThreshold(degraded=1.0, failed=1000.0),
+    "packet_drop_count": RateThreshold(degraded=1.0, failed=1000.0),
+    "loss_of_signal_seconds": RateThreshold(degraded=0.0, failed=0.5),
+}
+"""The default health thresholds on the rates of the Wideband Input Buffer counters, in counts per second,
+which can be overridden by the ``health_rate_thresholds`` property of the IP block."""
+
 
 @dataclass
 class WidebandInputBufferConfig(DataClassJsonMixin):
@@ -21,7 +45,7 @@ class WidebandInputBufferConfig(DataClassJsonMixin):
 # status class that will be populated by the APIs and returned to provide the status of the Wideband Input Buffer
 ##
 @dataclass
-class WidebandInputBufferStatus(DataClassJsonMixin):
+class WidebandInputBufferStatus(CompiledDecoderMixin):
     buffer_overflow: bool
     loss_of_signal: np.uint32
     error: bool
@@ -40,7 +64,20 @@ class WidebandInputBufferStatus(DataClassJsonMixin):
 
 
 class WidebandInputBufferManager(BaseMonitoringIPBlockManager[WidebandInputBufferConfig, WidebandInputBufferStatus]):
-    """Wideband Input Buffer IP block manager."""
+    """Wideband Input Buffer IP block manager.
+
+    While started, i.e. while scanning, the health of the block is polled on the process-wide :obj:`PollScheduler`
+    rather than by its own health monitor thread, and is not polled at all otherwise. It is polled adaptively rather
+    than at the fixed ``health_monitor_poll_interval``: slowly while steadily healthy, and quickly after its health
+    changes or one of its error counters jumps. The interval is bounded by the ``health_monitor_min_poll_interval`` and
+    ``health_monitor_max_poll_interval`` properties of the IP block, which default to the ``health_monitor_poll_interval``
+    and to the longest of it and :obj:`WIB_HEALTH_MONITOR_MAX_POLL_INTERVAL` respectively, if it is set.
+    """
+
+    def __init__(self, *args, update_health_state_callback: Callable[[HealthState], None] | None = None, **kwargs):
+        self._update_health_state_callback = update_health_state_callback
+        self._health_monitor_poll_interval = kwargs.get("health_monitor_poll_interval")
+        super().__init__(*args, update_health_state_callback=update_health_state_callback, **kwargs)
 
     @property
     def config_dataclass(self) -> type[WidebandInputBufferConfig]:
@@ -61,9 +98,33 @@ class WidebandInputBufferManager(BaseMonitoringIPBlockManager[WidebandInputBuffe
         self.expected_sample_rate = None
         self.expected_dish_id = None
 
+        self.record_status: Callable[[WidebandInputBufferStatus], Any] | None = None
+        """:obj:`Callable[[WidebandInputBufferStatus], Any] | None`: Records each status read by the health polls, if set."""
+        self.counter_rates = CounterRateEngine(WIB_HEALTH_MONITOR_COUNTERS)
+        self.rate_thresholds = parse_rate_thresholds(kwargs.get("health_rate_thresholds"), WIB_COUNTER_RATE_THRESHOLDS)
+        self.health_evaluator = IncrementalHealthEvaluator(
+            self._health_checks(),
+            self.logger,
+            summary_interval=float(kwargs.get("health_summary_interval", HEALTH_SUMMARY_INTERVAL)),
+        )
+        min_poll_interval, max_poll_interval = WIB_HEALTH_MONITOR_MIN_POLL_INTERVAL, WIB_HEALTH_MONITOR_MAX_POLL_INTERVAL
+        if self._health_monitor_poll_interval is not None:
+            min_poll_interval = float(self._health_monitor_poll_interval)
+            max_poll_interval = max(min_poll_interval, WIB_HEALTH_MONITOR_MAX_POLL_INTERVAL)
+        self.scheduled_health_monitor = ScheduledHealthMonitor(
+            self,
+            AdaptivePollInterval(
+                float(kwargs.get("health_monitor_min_poll_interval", min_poll_interval)),
+                float(kwargs.get("health_monitor_max_poll_interval", max_poll_interval)),
+            ),
+            update_health_state_callback=self._update_health_state_callback,
+            counters=WIB_HEALTH_MONITOR_COUNTERS,
+        )
+
     def configure(self, config: WidebandInputBufferConfig) -> int:
         """Configure the Wideband Input Buffer."""
         self.expected_sample_rate = config.expected_sample_rate
+        self.counter_rates.reset()
         return super().configure(config)
 
     def deconfigure(self, config: WidebandInputBufferConfig | None = None) -> int:
@@ -74,75 +135,68 @@ class WidebandInputBufferManager(BaseMonitoringIPBlockManager[WidebandInputBuffe
 
     @non_blocking
     def start(self) -> int:
-        return super().start()
+        result = super().start()
+        if result == 0:
+            self.health_evaluator.reset()
+            self.counter_rates.reset()
+            self.scheduled_health_monitor.start()
+        return result
 
     @non_blocking
     def stop(self) -> int:
+        self.scheduled_health_monitor.stop()
         return super().stop()
 
-    def get_status_healthstates(self, status: WidebandInputBufferStatus) -> dict[str, HealthState]:
-        status_healthstates = {}
-
-        meta_dish_id_mnemonic = convert_dish_id_uint16_t_to_mnemonic(status.meta_dish_id)
-        status_healthstates["meta_dish_id"] = self.get_health_state_by_expected_value(
-            self.expected_dish_id,
-            meta_dish_id_mnemonic,
-            failure_msg=f"meta_dish_id mismatch. Expected: {self.expected_dish_id}, Actual: {meta_dish_id_mnemonic} ({status.meta_dish_id})",
-        )
-
-        status_healthstates["rx_sample_rate"] = self.get_health_state_by_expected_value(
-            self.expected_sample_rate,
-            status.rx_sample_rate,
-            failure_msg=f"rx_sample_rate mismatch. Expected {self.expected_sample_rate}, Actual: {status.rx_sample_rate}",
-        )
-
-        status_healthstates["meta_transport_sample_rate"] = self.get_health_state_by_expected_value(
-            self.expected_sample_rate,
-            status.meta_transport_sample_rate,
-            failure_msg=f"meta_transport_sample_rate mismatch. Expected {self.expected_sample_rate}, Actual: {status.meta_transport_sample_rate}",
-        )
-
-        status_healthstates["packet_error"] = self.get_health_state_by_expected_value(
-            False,
-            status.packet_error,
-            health_on_failure=HealthState.DEGRADED,
-        )
-
-        status_healthstates["packet_drop"] = self.get_health_state_by_expected_value(
-            False,
-            status.packet_drop,
-            health_on_failure=HealthState.DEGRADED,
-        )
-
-        status_healthstates["link_failure"] = self.get_health_state_by_expected_value(
-            False,
-            status.link_failure,
-            failure_msg=f"link_failure mismatch. Expected False, Actual: {status.link_failure}",
-        )
+    def get_health_state(self) -> HealthState:
+        """Get the health state of the Wideband Input Buffer, as of its most recent health poll.
 
-        status_healthstates["buffer_overflow"] = self.get_health_state_by_expected_value(
-            False,
-            status.buffer_overflow,
-            failure_msg=f"buffer_overflow mismatch. Expected False, Actual: {status.buffer_overflow}",
-        )
+        Returns:
+            :obj:`HealthState`: The health state.
+        """
+        return self.scheduled_health_monitor.health_state
 
-        self.logger.info(f"REGISTER_STATUSES={status_healthstates}")
-
-        return status_healthstates
-
-    def get_health_state_by_expected_value(
-        self,
-        expected_value: Any,
-        actual_value: Any,
-        success_msg: str = None,
-        failure_msg: str = None,
-        health_on_success: HealthState = HealthState.OK,
-        health_on_failure: HealthState = HealthState.FAILED,
-    ) -> HealthState:
-        if expected_value == actual_value:
-            if success_msg:
-                self.logger.info(success_msg)
-            return health_on_success
-        if failure_msg:
-            self.logger.error(failure_msg)
-        return health_on_failure
+    def get_status_healthstates(self, status: WidebandInputBufferStatus) -> dict[str, HealthState]:
+        """Get the health state of each status field and error counter rate, only re-evaluating the fields which changed
+        since the previous poll.
+
+        Mismatches are logged when the health state of a field changes rather than on every poll, along with a periodic
+        summary of the health state of every field.
+        """
+        if self.record_status is not None:
+            self.record_status(status)
+        self.counter_rates.update(status)
+        return self.health_evaluator.evaluate(status)
+
+    def _health_checks(self) -> list[HealthCheck]:
+        def expected_value_check(
+            name: str,
+            expected: Callable[[], Any],
+            actual: Callable[[WidebandInputBufferStatus], Any] | None = None,
+            health_on_failure: HealthState = HealthState.FAILED,
+        ) -> HealthCheck:
+            actual = actual or (lambda status: getattr(status, name))
+
+            def evaluate(status: WidebandInputBufferStatus) -> tuple[HealthState, str | None]:
+                expected_value, actual_value, raw_value = expected(), actual(status), getattr(status, name)
+                if expected_value == actual_value:
+                    return HealthState.OK, None
+                if actual_value != raw_value:
+                    actual_value = f"{actual_value} ({raw_value})"
+                return health_on_failure, f"{name} mismatch. Expected: {expected_value}, Actual: {actual_value}"
+
+            return HealthCheck(name, lambda status: (expected(), getattr(status, name)), evaluate)
+
+        return [
+            *(rate_health_check(self.counter_rates, name, threshold) for name, threshold in self.rate_thresholds.items()),
+            expected_value_check(
+                "meta_dish_id",
+                lambda: self.expected_dish_id,
+                lambda status: convert_dish_id_uint16_t_to_mnemonic(status.meta_dish_id),
+            ),
+            expected_value_check("rx_sample_rate", lambda: self.expected_sample_rate),
+            expected_value_check("meta_transport_sample_rate", lambda: self.expected_sample_rate),
+            expected_value_check("packet_error", lambda: False, health_on_failure=HealthState.DEGRADED),
+            expected_value_check("packet_drop", lambda: False, health_on_failure=HealthState.DEGRADED),
+            expected_value_check("link_failure", lambda: False),
+            expected_value_check("buffer_overflow", lambda: False),
+        ]
@@ -38,11 +38,14 @@ class WidebandInputBufferSimulator(BaseSimulatorApi):
                 "rx_packet_rate": 1500000,
                 "expected_sample_rate": 3960000000
             }"""
+        # Parsed once per update rather than on every status read, which happens on every health poll
+        self._status = json.loads(self.status_str)
 
         super().__init__(ip_block_name, logger)
 
     def status(self, clear: bool = False) -> dict:
-        return json.loads(self.status_str)
+        return dict(self._status)
 
     def update_status(self, new_status: str):
+        self._status = json.loads(new_status)
         self.status_str = new_status
@@ -0,0 +1,50 @@
+"""Benchmark of the B123 VCC gain programming in simulation mode.
+
+Not part of the unit test suite; run with ``python -m tests.benchmarks.B123VccOsppfbChannelizer_benchmark``.
+"""
+
+import functools
+import time
+
+import numpy as np
+from ska_mid_cbf_fhs_common import BaseIPBlockManager
+
+from ska_mid_cbf_fhs_vcc.b123_vcc_osppfb_channelizer.b123_vcc_osppfb_channelizer_manager import B123VccOsppfbChannelizerManager
+
+
+def benchmark_configure_gains(iterations: int = 50, num_gains: int = 20) -> tuple[float, float]:
+    """Time bulk gain programming against per-channel programming.
+
+    Returns:
+        :obj:`tuple[float, float]`: The per-channel and bulk time per write, in seconds.
+    """
+    manager = B123VccOsppfbChannelizerManager(
+        ip_block_id="B123VccOsppfbChannelizer",
+        controlling_device_name="n/a",
+        bitstream_path="n/a",
+        bitstream_id="n/a",
+        bitstream_version="n/a",
+        firmware_ip_block_id="n/a",
+        bulk_gain_writes="true",
+        create_log_file=False,
+    )
+    # Alternate between two different gain vectors, so that every write programs the complete vector
+    gains_options = [np.ones(num_gains, dtype=np.float32), np.full(num_gains, 2.0, dtype=np.float32)]
+    configure_fn = functools.partial(BaseIPBlockManager.configure, manager)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        manager._configure_gains_per_channel(3960000000, gains_options[0], None, configure_fn)
+    per_channel_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        manager.configure_gains(3960000000, gains_options[i % 2])
+    bulk_time = time.perf_counter() - start
+
+    return per_channel_time / iterations, bulk_time / iterations
+
+
+if __name__ == "__main__":
+    per_channel, bulk = benchmark_configure_gains()
+    print(f"B123 VCC gain programming: per-channel {per_channel * 1000:.3f} ms/op, bulk {bulk * 1000:.3f} ms/op")
@@ -0,0 +1,48 @@
+"""Benchmark of Packet Validation status polls in simulation mode.
+
+Not part of the unit test suite; run with ``python -m tests.benchmarks.PacketValidation_benchmark``.
+"""
+
+import time
+from unittest import mock
+
+from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_manager import PacketValidationManager, PacketValidationStatus
+
+
+def benchmark_status_polls(iterations: int = 2000) -> tuple[float, float]:
+    """Time status polls with the compiled status decoder against the dataclasses-json reflection decoder.
+
+    Returns:
+        :obj:`tuple[float, float]`: The reflection and compiled polls per second.
+    """
+    manager = PacketValidationManager(
+        ip_block_id="PacketValidation",
+        controlling_device_name="n/a",
+        bitstream_path="n/a",
+        bitstream_id="n/a",
+        bitstream_version="n/a",
+        firmware_ip_block_id="n/a",
+        health_monitor_poll_interval=1,
+        update_health_state_callback=lambda *_: None,
+        create_log_file=False,
+    )
+    try:
+        with mock.patch.object(PacketValidationStatus, "_compiled_decoder", None, create=True):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                manager.status(clear=False)
+            reflection_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            manager.status(clear=False)
+        compiled_time = time.perf_counter() - start
+    finally:
+        manager.scheduled_health_monitor.stop()
+
+    return iterations / reflection_time, iterations / compiled_time
+
+
+if __name__ == "__main__":
+    reflection, compiled = benchmark_status_polls()
+    print(f"Packet Validation status polls: reflection {reflection:.0f} polls/s, compiled {compiled:.0f} polls/s")
@@ -1,13 +1,22 @@
+from unittest import mock
+
+import numpy as np
 import pytest
+from ska_mid_cbf_fhs_common import BaseIPBlockManager
 
-from ska_mid_cbf_fhs_vcc.b123_vcc_osppfb_channelizer.b123_vcc_osppfb_channelizer_manager import B123VccOsppfbChannelizerConfigureArgin, B123VccOsppfbChannelizerManager
+from ska_mid_cbf_fhs_vcc.b123_vcc_osppfb_channelizer.b123_vcc_osppfb_channelizer_manager import (
+    B123VccOsppfbChannelizerConfig,
+    B123VccOsppfbChannelizerConfigureArgin,
+    B123VccOsppfbChannelizerGainsConfig,
+    B123VccOsppfbChannelizerManager,
+)
 
 
 class TestB123VccOsppfbChannelizer:
 
     @pytest.fixture(scope="function")
     def b123_vcc(self):
-        """Fixture to set up the B123 VCC."""
+        """Fixture to set up the B123 VCC, with bulk gain writes."""
         manager = B123VccOsppfbChannelizerManager(
             ip_block_id="B123VccOsppfbChannelizer",
             controlling_device_name="n/a",
@@ -15,6 +24,7 @@ class TestB123VccOsppfbChannelizer:
             bitstream_id="n/a",
             bitstream_version="n/a",
             firmware_ip_block_id="n/a",
+            bulk_gain_writes="true",
             create_log_file=False,
         )
         yield manager
@@ -41,3 +51,119 @@ class TestB123VccOsppfbChannelizer:
         """Test the recover method of the B123 VCC."""
         result = b123_vcc.recover()
         assert result == 0, f"Expected return code 0, got {result}"
+
+    def test_configure_gains_single_write(self, b123_vcc: B123VccOsppfbChannelizerManager):
+        """Test that the full gain vector is programmed with a single driver write."""
+        gains = np.linspace(0.5, 1.5, 20, dtype=np.float32)
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, return_value=0) as configure_mock:
+            result = b123_vcc.configure_gains(3960000000, gains)
+
+        assert result == 0, f"Expected return code 0, got {result}"
+        assert configure_mock.call_count == 1
+        config = configure_mock.call_args.args[1]
+        assert isinstance(config, B123VccOsppfbChannelizerGainsConfig)
+        assert np.array_equal(np.asarray(config.gains, dtype=np.float32), gains)
+
+    def test_configure_gains_per_channel_by_default(self):
+        """Test that gains are written per channel and polarisation unless bulk gain writes are declared supported."""
+        manager = B123VccOsppfbChannelizerManager(
+            ip_block_id="B123VccOsppfbChannelizer",
+            controlling_device_name="n/a",
+            bitstream_path="n/a",
+            bitstream_id="n/a",
+            bitstream_version="n/a",
+            firmware_ip_block_id="n/a",
+            create_log_file=False,
+        )
+        assert not manager.bulk_gains_supported
+
+        gains = np.linspace(0.5, 1.5, 20, dtype=np.float32)
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, return_value=0) as configure_mock:
+            assert manager.configure_gains(3960000000, gains) == 0
+
+        configs = [call.args[1] for call in configure_mock.call_args_list]
+        assert all(isinstance(config, B123VccOsppfbChannelizerConfig) for config in configs)
+        assert len(configs) == 20
+
+    @pytest.mark.parametrize("bulk_error", [None, RuntimeError("bulk writes not supported")])
+    def test_configure_gains_per_channel_fallback(self, b123_vcc: B123VccOsppfbChannelizerManager, bulk_error: Exception | None):
+        """Test that gains are written per channel and polarisation when the firmware rejects or fails bulk writes."""
+
+        def reject_bulk(_, config):
+            if not isinstance(config, B123VccOsppfbChannelizerGainsConfig):
+                return 0
+            if bulk_error is not None:
+                raise bulk_error
+            return 1
+
+        gains = np.linspace(0.5, 1.5, 20, dtype=np.float32)
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, side_effect=reject_bulk) as configure_mock:
+            result = b123_vcc.configure_gains(3960000000, gains)
+            assert result == 0, f"Expected return code 0, got {result}"
+            assert configure_mock.call_count == 1 + 20
+
+            configure_mock.reset_mock()
+            result = b123_vcc.configure_gains(3960000000, gains * 2)
+            assert result == 0, f"Expected return code 0, got {result}"
+            assert configure_mock.call_count == 20
+
+        assert not b123_vcc.bulk_gains_supported
+        per_channel_configs = [call.args[1] for call in configure_mock.call_args_list]
+        assert all(isinstance(config, B123VccOsppfbChannelizerConfig) for config in per_channel_configs)
+        assert [(config.pol, config.channel) for config in per_channel_configs] == [(pol, ch) for pol in (0, 1) for ch in range(10)]
+
+    def test_configure_gains_delta_writes(self, b123_vcc: B123VccOsppfbChannelizerManager):
+        """Test that only the gains which differ from the programmed gains are rewritten."""
+        gains = np.linspace(0.5, 1.5, 20, dtype=np.float32)
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, return_value=0) as configure_mock:
+            assert b123_vcc.configure_gains(3960000000, gains) == 0
+            assert configure_mock.call_count == 1
+
+            configure_mock.reset_mock()
+            new_gains = gains.copy()
+            new_gains[[3, 12]] *= 1.5
+            new_gains[5] *= 1 + 1e-8
+            assert b123_vcc.configure_gains(3960000000, new_gains) == 0
+            delta_configs = [call.args[1] for call in configure_mock.call_args_list]
+            assert [(config.pol, config.channel) for config in delta_configs] == [(0, 3), (1, 2)]
+            assert [config.gain for config in delta_configs] == pytest.approx([float(new_gains[3]), float(new_gains[12])])
+
+            configure_mock.reset_mock()
+            assert b123_vcc.configure_gains(3960000000, new_gains) == 0
+            assert configure_mock.call_count == 0
+
+            configure_mock.reset_mock()
+            assert b123_vcc.configure_gains(3960000000 * 2, new_gains) == 0
+            assert configure_mock.call_count == 1
+
+        assert np.array_equal(b123_vcc.programmed_gains, new_gains)
+
+    def test_configure_gains_delta_rollback(self, b123_vcc: B123VccOsppfbChannelizerManager):
+        """Test that rolling back a failed delta write rewrites the entries written and the entry which failed."""
+        gains = np.ones(20, dtype=np.float32)
+        new_gains = gains.copy()
+        new_gains[[1, 2, 3]] = 2.0
+
+        def fail_channel_2(_, config):
+            return 1 if isinstance(config, B123VccOsppfbChannelizerConfig) and config.channel == 2 else 0
+
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, side_effect=fail_channel_2) as configure_mock:
+            assert b123_vcc.configure_gains(3960000000, gains) == 0
+            assert b123_vcc.configure_gains(3960000000, new_gains) == 1
+
+            configure_mock.reset_mock()
+            configure_mock.side_effect = None
+            configure_mock.return_value = 0
+            assert b123_vcc.configure_gains(3960000000, gains) == 0
+
+        assert [call.args[1].channel for call in configure_mock.call_args_list] == [1, 2]
+        assert np.array_equal(b123_vcc.programmed_gains, gains)
+
+    def test_recover_forgets_programmed_gains(self, b123_vcc: B123VccOsppfbChannelizerManager):
+        """Test that gains are written in full after a recovery."""
+        gains = np.ones(20, dtype=np.float32)
+        b123_vcc.configure_gains(3960000000, gains)
+        assert b123_vcc.programmed_gains is not None
+
+        b123_vcc.recover()
+        assert b123_vcc.programmed_gains is None
@@ -0,0 +1,44 @@
+import pytest
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import AdaptivePollInterval, worst_health_state
+
+
+class TestAdaptivePollInterval:
+
+    @pytest.fixture(scope="function")
+    def policy(self) -> AdaptivePollInterval:
+        """Fixture to set up a poll interval policy between 1 and 8 seconds."""
+        return AdaptivePollInterval(1.0, 8.0, backoff=2.0, settle_polls=2)
+
+    def test_backoff(self, policy: AdaptivePollInterval):
+        """The interval should grow up to the maximum once the health has been steady for long enough."""
+        intervals = [policy.update(HealthState.OK) for _ in range(7)]
+
+        assert intervals == [1.0, 1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+
+    def test_speed_up(self, policy: AdaptivePollInterval):
+        """A health state change or counter jump should drop the interval to the minimum, and keep it there while unhealthy."""
+        for _ in range(5):
+            policy.update(HealthState.OK)
+
+        assert policy.update(HealthState.OK, counters_jumped=True) == 1.0
+        for _ in range(3):
+            policy.update(HealthState.OK)
+        assert policy.interval == 4.0
+
+        assert [policy.update(HealthState.DEGRADED) for _ in range(4)] == [1.0] * 4
+        assert [policy.update(HealthState.OK) for _ in range(4)] == [1.0, 1.0, 2.0, 4.0]
+
+    def test_invalid(self):
+        """Unordered intervals should be rejected."""
+        with pytest.raises(ValueError):
+            AdaptivePollInterval(5.0, 1.0)
+
+
+def test_worst_health_state():
+    """The least healthy state should be reported, with no states being healthy."""
+    assert worst_health_state([HealthState.OK, HealthState.FAILED, HealthState.DEGRADED]) == HealthState.FAILED
+    assert worst_health_state([HealthState.OK, HealthState.UNKNOWN]) == HealthState.UNKNOWN
+    assert worst_health_state([]) == HealthState.OK
+
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.counter_rates import CounterRateEngine, RateThreshold, parse_rate_thresholds
+
+
+class TestCounterRateEngine:
+
+    @pytest.fixture(scope="function")
+    def engine(self) -> CounterRateEngine:
+        """Fixture to set up a rate engine of two counters over a 10 second window."""
+        return CounterRateEngine(["drops", "errors"], window=10.0)
+
+    def test_rates(self, engine: CounterRateEngine):
+        """Rates should be unknown until two samples are taken, then computed over the window."""
+        assert np.isnan(engine.update({"drops": 0, "errors": 5}, timestamp=0.0)).all()
+
+        np.testing.assert_allclose(engine.update({"drops": 10, "errors": 5}, timestamp=2.0), [5.0, 0.0])
+        np.testing.assert_allclose(engine.update({"drops": 30, "errors": 9}, timestamp=4.0), [7.5, 1.0])
+        # The first sample leaves the window
+        np.testing.assert_allclose(engine.update({"drops": 30, "errors": 9}, timestamp=11.0), [20 / 9, 4 / 9])
+        assert engine.rates_by_counter() == pytest.approx({"drops": 20 / 9, "errors": 4 / 9})
+
+    def test_sparse_samples(self, engine: CounterRateEngine):
+        """Samples further apart than the window should give the rate since the previous sample."""
+        engine.update({"drops": 0, "errors": 0}, timestamp=0.0)
+
+        np.testing.assert_allclose(engine.update({"drops": 60, "errors": 0}, timestamp=30.0), [2.0, 0.0])
+
+    def test_wraparound(self, engine: CounterRateEngine):
+        """A 32-bit counter wrapping around should still advance."""
+        engine.update({"drops": 2**32 - 5, "errors": 0}, timestamp=0.0)
+
+        np.testing.assert_allclose(engine.update({"drops": 5, "errors": 0}, timestamp=1.0), [10.0, 0.0])
+
+    def test_reset(self, engine: CounterRateEngine):
+        """A reset should forget previous samples, so that cleared counters do not look like a wraparound."""
+        engine.update({"drops": 100, "errors": 0}, timestamp=0.0)
+        engine.reset()
+        engine.update({"drops": 0, "errors": 0}, timestamp=1.0)
+
+        np.testing.assert_allclose(engine.update({"drops": 1, "errors": 0}, timestamp=2.0), [1.0, 0.0])
+
+    def test_health_states(self, engine: CounterRateEngine):
+        """Rates above their thresholds should degrade or fail, and unknown rates should be healthy."""
+        thresholds = {"drops": RateThreshold(degraded=1.0, failed=100.0), "errors": RateThreshold(failed=0.0)}
+        engine.update({"drops": 0, "errors": 0}, timestamp=0.0)
+
+        assert engine.health_states(thresholds) == {"drops": HealthState.OK, "errors": HealthState.OK}
+        engine.update({"drops": 10, "errors": 1}, timestamp=1.0)
+        assert engine.health_states(thresholds) == {"drops": HealthState.DEGRADED, "errors": HealthState.FAILED}
+
+
+def test_parse_rate_thresholds():
+    """Thresholds should override the defaults, given as lists or objects."""
+    defaults = {"drops": RateThreshold(1.0, 10.0), "errors": RateThreshold(1.0, None)}
+
+    thresholds = parse_rate_thresholds('{"drops": [null, 5], "errors": {"degraded": 2}}', defaults)
+
+    assert thresholds == {"drops": RateThreshold(None, 5.0), "errors": RateThreshold(2.0, None)}
+    assert parse_rate_thresholds("", defaults) == defaults
+    with pytest.raises(ValueError):
+        parse_rate_thresholds('{"lost": [1, 2]}', defaults)
+    with pytest.raises(ValueError):
+        parse_rate_thresholds("[1, 2]", defaults)
@@ -0,0 +1,23 @@
+from unittest import mock
+
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.health_rollup import HealthRollup
+
+
+class TestHealthRollup:
+
+    def test_rollup(self):
+        """The rolled up health state should be that of the least healthy source, reported when it changes."""
+        callback = mock.MagicMock()
+        rollup = HealthRollup(callback)
+        wideband_input_buffer, power_meters = rollup.callback("wideband_input_buffer"), rollup.callback("power_meters")
+
+        wideband_input_buffer(HealthState.OK)
+        power_meters(HealthState.FAILED)
+        wideband_input_buffer(HealthState.DEGRADED)
+        power_meters(HealthState.OK)
+
+        assert rollup.health_state == HealthState.DEGRADED
+        assert rollup.health_states == {"wideband_input_buffer": HealthState.DEGRADED, "power_meters": HealthState.OK}
+        assert [call.args[0] for call in callback.call_args_list] == [HealthState.OK, HealthState.FAILED, HealthState.DEGRADED]
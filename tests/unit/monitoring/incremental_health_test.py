@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.incremental_health import HealthCheck, IncrementalHealthEvaluator
+
+
+class TestIncrementalHealthEvaluator:
+
+    @pytest.fixture(scope="function")
+    def evaluate(self) -> mock.MagicMock:
+        """Fixture to set up a check evaluation failing while the error flag is set."""
+        return mock.MagicMock(side_effect=lambda status: (HealthState.FAILED, "error set") if status.error else (HealthState.OK, None))
+
+    @pytest.fixture(scope="function")
+    def evaluator(self, evaluate: mock.MagicMock) -> IncrementalHealthEvaluator:
+        """Fixture to set up an evaluator of a single check, summarising once an hour."""
+        return IncrementalHealthEvaluator([HealthCheck("error", lambda status: status.error, evaluate)], mock.MagicMock(), summary_interval=3600)
+
+    def test_only_changes_evaluated(self, evaluator: IncrementalHealthEvaluator, evaluate: mock.MagicMock):
+        """A check should only be re-evaluated when its inputs change."""
+        for error in (False, False, True, True, False):
+            health_states = evaluator.evaluate(SimpleNamespace(error=error))
+
+        assert health_states == {"error": HealthState.OK}
+        assert evaluate.call_count == 3
+
+    def test_only_transitions_logged(self, evaluator: IncrementalHealthEvaluator):
+        """Only health state transitions should be logged, besides the first summary."""
+        logger = evaluator._logger
+        for error in (False, True, True, True, False, False):
+            evaluator.evaluate(SimpleNamespace(error=error))
+
+        logger.error.assert_called_once_with("error health changed from OK to FAILED: error set")
+        assert logger.info.call_count == 2
+        assert logger.info.call_args_list[1] == mock.call("error health changed from FAILED to OK")
+        assert "REGISTER_STATUSES" in logger.info.call_args_list[0].args[0]
+
+    def test_reset(self, evaluator: IncrementalHealthEvaluator, evaluate: mock.MagicMock):
+        """A reset should re-evaluate every check on the next poll."""
+        evaluator.evaluate(SimpleNamespace(error=False))
+        evaluator.reset()
+        evaluator.evaluate(SimpleNamespace(error=False))
+
+        assert evaluate.call_count == 2
@@ -0,0 +1,99 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollScheduler
+
+
+class TestPollScheduler:
+
+    @pytest.fixture(scope="function")
+    def scheduler(self) -> PollScheduler:
+        """Fixture to set up a scheduler separate from the shared one."""
+        return PollScheduler(max_workers=2, jitter=0.0)
+
+    def test_polls_at_returned_delay(self, scheduler: PollScheduler):
+        """Each job should be polled again after the delay returned by its previous poll."""
+        polled = threading.Event()
+        delays = iter([0.01, 0.01, 60.0])
+
+        def poll():
+            delay = next(delays)
+            if delay == 60.0:
+                polled.set()
+            return delay
+
+        job = scheduler.schedule(poll, "job", mock.MagicMock())
+
+        assert polled.wait(5)
+        assert job.polls == 3
+        job.cancel()
+        assert scheduler.num_jobs == 0
+
+    def test_many_jobs_few_workers(self, scheduler: PollScheduler):
+        """Many jobs should all be polled on the bounded pool, with their lag reported."""
+        counts = [0] * 20
+
+        def make_poll(i):
+            def poll():
+                counts[i] += 1
+                return 0.01
+
+            return poll
+
+        threads_before = threading.active_count()
+        jobs = [scheduler.schedule(make_poll(i), f"job{i}", mock.MagicMock()) for i in range(20)]
+        deadline = time.monotonic() + 5
+        while min(counts) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # One dispatcher thread and at most two workers
+        assert threading.active_count() - threads_before <= 3
+        assert scheduler.lag_report()["job_names"] == sorted(f"job{i}" for i in range(20))
+        for job in jobs:
+            job.cancel()
+
+        assert min(counts) >= 2
+        report = scheduler.lag_report()
+        assert report["jobs"] == 0
+        assert report["job_names"] == []
+        assert report["workers"] == 2
+        assert report["polls"] >= 40
+        assert {"lag_mean_ms", "lag_p95_ms", "lag_max_ms"} <= set(report)
+
+    def test_failed_poll_retried(self, scheduler: PollScheduler):
+        """A poll raising an exception should be logged, and retried after the previous delay."""
+        logger = mock.MagicMock()
+        calls = []
+
+        def poll():
+            calls.append(time.monotonic())
+            if len(calls) == 2:
+                raise RuntimeError("bus error")
+            return 0.01
+
+        job = scheduler.schedule(poll, "job", logger)
+        deadline = time.monotonic() + 5
+        while len(calls) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        job.cancel()
+
+        assert len(calls) >= 3
+        logger.exception.assert_called_once()
+
+    def test_poll_now(self, scheduler: PollScheduler):
+        """Polling now should bring forward a poll which is not due for a long time."""
+        polled = threading.Semaphore(0)
+
+        def poll():
+            polled.release()
+            return 60.0
+
+        job = scheduler.schedule(poll, "job", mock.MagicMock())
+        assert polled.acquire(timeout=5)
+
+        job.poll_now()
+
+        assert polled.acquire(timeout=5)
+        job.cancel()
@@ -0,0 +1,62 @@
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import AdaptivePollInterval
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollScheduler
+from ska_mid_cbf_fhs_vcc.monitoring.scheduled_health_monitor import ScheduledHealthMonitor
+
+
+class FakeManager:
+    """Monitoring IP block manager returning a settable status."""
+
+    def __init__(self):
+        self.logger = mock.MagicMock()
+        self.health_monitor = mock.MagicMock()
+        self.health_monitor.is_polling.return_value = True
+        self.status_value = SimpleNamespace(error_count=0, health=HealthState.OK)
+
+    def status(self, clear=False):
+        return self.status_value
+
+    def get_status_healthstates(self, status):
+        return {"error": status.health}
+
+
+class TestScheduledHealthMonitor:
+
+    def test_poll(self):
+        """Each poll should roll up the health of the manager, calling back on changes and speeding up on counter jumps."""
+        manager = FakeManager()
+        callback = mock.MagicMock()
+        monitor = ScheduledHealthMonitor(
+            manager, AdaptivePollInterval(1.0, 8.0, settle_polls=1), update_health_state_callback=callback, counters=["error_count"]
+        )
+
+        assert monitor.poll() == 1.0
+        assert monitor.poll() == 2.0
+        manager.status_value = SimpleNamespace(error_count=3, health=HealthState.OK)
+        assert monitor.poll() == 1.0
+        manager.status_value = SimpleNamespace(error_count=3, health=HealthState.FAILED)
+        monitor.poll()
+
+        assert monitor.health_state == HealthState.FAILED
+        assert callback.call_args_list == [mock.call(HealthState.OK), mock.call(HealthState.FAILED)]
+        manager.health_monitor.stop_polling.assert_called()
+
+    def test_start_stop(self):
+        """Starting should poll on the scheduler straight away, and stopping should end polling."""
+        manager = FakeManager()
+        polled = threading.Event()
+        monitor = ScheduledHealthMonitor(
+            manager, AdaptivePollInterval(60.0, 60.0), update_health_state_callback=lambda _: polled.set(), scheduler=PollScheduler(max_workers=1)
+        )
+
+        monitor.start()
+        assert polled.wait(5)
+        monitor.stop()
+
+        assert not monitor.running
+        assert monitor.health_state == HealthState.OK
@@ -0,0 +1,79 @@
+import dataclasses
+import logging
+from typing import Optional
+
+import numpy as np
+import pytest
+from dataclasses_json import DataClassJsonMixin, config
+
+from ska_mid_cbf_fhs_vcc.monitoring.status_decoder import CompiledDecoderMixin, compile_status_decoder
+from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_simulator import PACKET_VALIDATION_SIM_STATUS
+from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_manager import PacketValidationStatus
+from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_manager import WidebandInputBufferStatus
+from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_simulator import WidebandInputBufferSimulator
+
+
+@dataclasses.dataclass
+class ExampleStatus(CompiledDecoderMixin):
+    error: bool
+    count: np.uint32
+    rate: float
+    gain: np.float64
+    name: str = "block"
+    mac: np.uint64 = 0
+    temperature: Optional[float] = None
+
+
+@dataclasses.dataclass
+class ListStatus(CompiledDecoderMixin):
+    counts: list[np.uint32]
+
+
+@dataclasses.dataclass
+class OverriddenStatus(CompiledDecoderMixin):
+    count: np.uint32 = dataclasses.field(metadata=config(field_name="cnt"))
+
+
+class TestStatusDecoder:
+
+    @pytest.mark.parametrize(
+        "kvs",
+        [
+            {"error": 1, "count": 7, "rate": 3, "gain": 0.5},
+            {"error": False, "count": 2**32 - 1, "rate": 1.5, "gain": 2, "name": "fs_3", "mac": 2**48 - 1, "temperature": 40, "extra": 1},
+            {"error": True, "count": 0, "rate": 0.0, "gain": 1.0, "temperature": None},
+        ],
+    )
+    def test_matches_from_dict(self, kvs: dict):
+        """A compiled decoder should decode the same values, with the same types, as DataClassJsonMixin.from_dict."""
+        expected = DataClassJsonMixin.from_dict.__func__(ExampleStatus, kvs)
+        decoded = ExampleStatus.from_dict(kvs)
+
+        assert decoded == expected
+        assert [type(value) for value in dataclasses.astuple(decoded)] == [type(value) for value in dataclasses.astuple(expected)]
+
+    def test_missing_field(self):
+        """A missing field without a default should fail to decode, as with DataClassJsonMixin.from_dict."""
+        with pytest.raises(KeyError):
+            ExampleStatus.from_dict({"error": False, "count": 0, "rate": 0.0})
+
+    def test_unsupported_fields(self):
+        """Dataclasses with fields a compiled decoder does not support should fall back to DataClassJsonMixin.from_dict."""
+        assert compile_status_decoder(ExampleStatus) is not None
+        assert compile_status_decoder(ListStatus) is None
+        assert compile_status_decoder(OverriddenStatus) is None
+
+        assert ListStatus.from_dict({"counts": [1, 2]}) == ListStatus([1, 2])
+        assert OverriddenStatus.from_dict({"cnt": 3}) == OverriddenStatus(3)
+
+    @pytest.mark.parametrize(
+        "status_dataclass, kvs",
+        [
+            (WidebandInputBufferStatus, WidebandInputBufferSimulator("WidebandInputBuffer", logging.getLogger(__name__)).status()),
+            (PacketValidationStatus, PACKET_VALIDATION_SIM_STATUS),
+        ],
+    )
+    def test_ip_block_statuses(self, status_dataclass: type, kvs: dict):
+        """The IP block statuses decoded on every health poll should be decoded by a compiled decoder."""
+        assert compile_status_decoder(status_dataclass) is not None
+        assert status_dataclass.from_dict(kvs) == DataClassJsonMixin.from_dict.__func__(status_dataclass, kvs)
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from ska_mid_cbf_fhs_vcc.monitoring.status_recorder import StatusRecorder, main, read_status_records, status_record_fields
+
+
+@dataclass
+class FakeStatus:
+    link_failure: bool
+    packet_count: np.uint32
+    rate: float
+    name: str
+    transaction_id: Optional[str] = None
+    lanes: list[int] = None
+
+
+class TestStatusRecorder:
+
+    def test_fields(self):
+        """Scalar fields should be recorded, after the instance name."""
+        assert status_record_fields(FakeStatus) == [
+            ("instance", "S16"),
+            ("link_failure", "?"),
+            ("packet_count", "<u4"),
+            ("rate", "<f8"),
+            ("name", "S64"),
+            ("transaction_id", "S64"),
+        ]
+
+    def test_record(self):
+        """Each recorded status should keep its values and instance."""
+        recorder = StatusRecorder(capacity=2)
+        record = recorder.channel("fake", FakeStatus, instance="FS 1")
+
+        for i in range(3):
+            record(FakeStatus(link_failure=bool(i % 2), packet_count=np.uint32(i), rate=i / 2, name=f"s{i}"))
+
+        records = recorder.records("fake")
+        assert recorder.block_types == ["fake"]
+        assert records["sequence"].tolist() == [2, 3]
+        assert records["instance"].tolist() == [b"FS 1", b"FS 1"]
+        assert records["link_failure"].tolist() == [True, False]
+        assert records["packet_count"].tolist() == [1, 2]
+        assert records["name"].tolist() == [b"s1", b"s2"]
+        assert records["transaction_id"].tolist() == [b"", b""]
+        with pytest.raises(KeyError):
+            recorder.records("other")
+
+    def test_read_ring_files(self, tmp_path, capsys):
+        """Ring files should be readable without the status dataclass, over a time window."""
+        recorder = StatusRecorder(str(tmp_path))
+        records = [recorder.channel("fake", FakeStatus, instance=str(i)) for i in (1, 2)]
+        for i, record in enumerate(records):
+            record(FakeStatus(link_failure=False, packet_count=np.uint32(7), rate=1.5, name=f"s{i}"))
+        until = recorder.records("fake")["timestamp"][-1]
+
+        assert read_status_records(str(tmp_path), "fake", until=until)["instance"].tolist() == [b"1", b"2"]
+        assert read_status_records(str(tmp_path), "fake", limit=1)["name"].tolist() == [b"s1"]
+
+        main([str(tmp_path)])
+        assert capsys.readouterr().out == "fake\n"
+        main([str(tmp_path), "fake", "--limit", "1"])
+        assert '"instance": "2", "link_failure": false, "packet_count": 7, "rate": 1.5, "name": "s1"' in capsys.readouterr().out
+
+    def test_resume_ring_files(self, tmp_path):
+        """Ring files should only be resumed if they were written with the same record fields."""
+        StatusRecorder(str(tmp_path), capacity=4).channel("fake", FakeStatus)(FakeStatus(link_failure=True, packet_count=np.uint32(7), rate=1.5, name="s"))
+
+        recorder = StatusRecorder(str(tmp_path), capacity=4)
+        recorder.channel("fake", FakeStatus)
+        assert recorder.records("fake")["packet_count"].tolist() == [7]
+
+        # Same record size, other fields
+        @dataclass
+        class OtherStatus:
+            rate: float
+            link_failure: bool
+            packet_count: np.uint32
+            name: str
+            transaction_id: Optional[str] = None
+
+        recorder = StatusRecorder(str(tmp_path), capacity=4)
+        recorder.channel("fake", OtherStatus)
+        assert len(recorder.records("fake")) == 0
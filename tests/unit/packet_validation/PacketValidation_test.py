@@ -1,6 +1,15 @@
+import time
+from unittest import mock
+
 import pytest
+from ska_control_model import HealthState
 
-from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_manager import PacketValidationManager
+from ska_mid_cbf_fhs_vcc.monitoring.adaptive_polling import worst_health_state
+from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_manager import (
+    PACKET_VALIDATION_COUNTERS,
+    PacketValidationManager,
+    PacketValidationStatus,
+)
 
 
 class TestPacketValidation:
@@ -15,9 +24,14 @@ class TestPacketValidation:
             bitstream_id="n/a",
             bitstream_version="n/a",
             firmware_ip_block_id="n/a",
+            health_monitor_poll_interval=1,
+            update_health_state_callback=lambda *_: None,
             create_log_file=False,
         )
         yield manager
+        manager.scheduled_health_monitor.stop()
+        if manager.health_monitor.is_polling():
+            manager.health_monitor.stop_polling()
 
     def test_start(self, packet_validation: PacketValidationManager):
         """Test the start method of the Packet Validation block."""
@@ -39,3 +53,64 @@ class TestPacketValidation:
         """Test the recover method of the Packet Validation block."""
         result = packet_validation.recover()
         assert result == 0, f"Expected return code 0, got {result}"
+
+    @pytest.mark.parametrize("properties, interval", [({}, 3.0), ({"health_monitor_poll_interval": "10"}, 10.0)])
+    def test_poll_interval_properties(self, properties: dict, interval: float):
+        """The health poll interval should be the fixed health monitor poll interval, if set."""
+        manager = PacketValidationManager(
+            ip_block_id="PacketValidation",
+            controlling_device_name="n/a",
+            bitstream_path="n/a",
+            bitstream_id="n/a",
+            bitstream_version="n/a",
+            firmware_ip_block_id="n/a",
+            update_health_state_callback=lambda *_: None,
+            create_log_file=False,
+            **properties,
+        )
+
+        poll_interval = manager.scheduled_health_monitor.poll_interval
+        assert (poll_interval.min_interval, poll_interval.max_interval) == (interval, interval)
+
+    def test_status_decoder(self, packet_validation: PacketValidationManager):
+        """The compiled status decoder should decode the same status as the dataclasses-json reflection decoder."""
+        with mock.patch.object(PacketValidationStatus, "_compiled_decoder", None, create=True):
+            reflection_status = packet_validation.status(clear=False)
+
+        assert packet_validation.status(clear=False) == reflection_status
+        assert PacketValidationStatus._compiled_decoder is not None
+
+    def test_rate_based_health(self, packet_validation: PacketValidationManager):
+        """The health should follow the rates of the error counters rather than their absolute values."""
+        counters = dict.fromkeys(PACKET_VALIDATION_COUNTERS, 0)
+        counters["wrong_antenna_id_cnt"] = 5000
+
+        # Errors counted before monitoring started are not a rate
+        assert worst_health_state(packet_validation.get_status_healthstates(PacketValidationStatus(**counters)).values()) == HealthState.OK
+
+        time.sleep(0.1)
+        counters["wrong_antenna_id_cnt"] += 10
+        health_states = packet_validation.get_status_healthstates(PacketValidationStatus(**counters))
+        assert health_states["wrong_antenna_id_cnt_rate"] == HealthState.DEGRADED
+        assert health_states["wrong_dst_mac_cnt_rate"] == HealthState.OK
+
+    def test_diagnostics(self, packet_validation: PacketValidationManager):
+        """The diagnostics should describe the packets most recently dropped by each check."""
+        assert packet_validation.diagnostics() == {}
+
+        packet_validation.get_status_healthstates(
+            PacketValidationStatus(
+                exp_dst_mac=0x001122334455,
+                last_wrong_dst_mac=0x0011223344FF,
+                wrong_dst_mac_cnt=3,
+                exp_ethertype=0xFEED,
+                exp_antenna_id=12,
+                last_wrong_antenna_id=7,
+                wrong_antenna_id_cnt=1,
+            )
+        )
+
+        diagnostics = packet_validation.diagnostics()
+        assert diagnostics["dst_mac"] == {"expected": "00:11:22:33:44:55", "last_wrong": "00:11:22:33:44:ff", "count": 3}
+        assert diagnostics["ethertype"] == {"expected": "0xfeed", "last_wrong": None, "count": 0}
+        assert diagnostics["antenna_id"] == {"expected": 12, "last_wrong": 7, "count": 1}
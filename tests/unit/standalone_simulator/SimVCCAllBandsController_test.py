@@ -109,6 +109,9 @@ class TestVCCAllBandsSim:
             "inputSampleRate",
             "frequencyBandOffset",
             "subarrayID",
+            "powerStatistics",
+            "widebandInputBufferCounterRates",
+            "packetValidationCounterRates",
         ],
     )
     def test_read_attributes(
@@ -171,6 +174,9 @@ class TestVCCAllBandsSim:
             ("inputSampleRate", 1),
             ("frequencyBandOffset", 2 * [1]),
             ("subarrayID", 1),
+            ("powerStatistics", 174 * [0.5]),
+            ("widebandInputBufferCounterRates", [0.5, 0.0, 0.0]),
+            ("packetValidationCounterRates", 7 * [2.0]),
         ],
     )
     def test_attribute_overrides(
@@ -496,6 +502,10 @@ class TestVCCAllBandsSim:
         [
             ("AutoSetFilterGains", [ObsState.SCANNING], json.dumps({"headrooms": [3.0]})),
             ("UpdateSubarrayMembership", [ObsState.IDLE], 1),
+            ("PrepareConfiguration", [ObsState.IDLE, ObsState.READY, ObsState.SCANNING], ""),
+            ("AutoSetFleetFilterGains", [ObsState.IDLE, ObsState.READY, ObsState.SCANNING], json.dumps({"headrooms": [3.0]})),
+            ("StartAutoGainControl", [ObsState.READY, ObsState.SCANNING], json.dumps({"headrooms": [3.0]})),
+            ("StopAutoGainControl", [ObsState.IDLE, ObsState.READY, ObsState.SCANNING], ""),
         ],
     )
     def test_commands(
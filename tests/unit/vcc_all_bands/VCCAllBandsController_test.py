@@ -1,14 +1,28 @@
 from base64 import b64encode
+import dataclasses
 from collections.abc import Generator
 import json
+import math
+import time
 from unittest import mock
 import pytest
 from assertpy import assert_that
 from ska_mid_cbf_fhs_common.testing.device_test_utils import DeviceTestUtils
 from ska_mid_cbf_fhs_common import MPFloat, DeviceTestUtils, WidebandPowerMeterStatus
-from tango import DevState
-from ska_control_model import AdminMode, HealthState, ObsState, ResultCode
+import tango
+from tango import DevFailed, DevState
+from ska_control_model import AdminMode, HealthState, ObsState, ResultCode, SimulationMode
 from ska_mid_cbf_fhs_common import ConfigurableThreadedTestTangoContextManager
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup
+from ska_mid_cbf_fhs_vcc.helpers.record_ring import decode_records
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollScheduler
+from ska_mid_cbf_fhs_vcc.packet_validation.packet_validation_simulator import PACKET_VALIDATION_SIM_STATUS, PacketValidationSimulator
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils import configure_scan_parser
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.filter_gain_coordinator import FilterGainUpdate
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_history import decode_gain_history
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet import PowerMeterFleetReport
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_component_manager import CONFIGURE_STEPS_BY_FIELD, FS_LANE_CONFIGURE_STEPS_BY_FIELD
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import VCCAllBandsConfigureScanConfig, VCCAllBandsConfigureScanFSLaneConfig
 from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_device import VCCAllBandsController
 from ska_tango_testing.integration import TangoEventTracer
 from ska_tango_testing.harness import TangoTestHarnessContext
@@ -75,6 +89,93 @@ def vcc_all_bands_tango_event_tracer(
     tracer.clear_events()
 
 
+@pytest.fixture(name="ip_block_configure_mocks")
+def ip_block_configure_mocks_fixture(
+    vcc_all_bands_device: VCCAllBandsController,
+) -> Generator[dict[str, mock.Mock], None, None]:
+    """Fixture that takes the component manager of the device under test out of simulation mode,
+    so that ConfigureScan programs the IP blocks, with the configure call of every IP block mocked.
+
+    Args:
+        vcc_all_bands_device (:obj:`DeviceProxy`): Proxy to the device under test.
+
+    Returns:
+        :obj:`dict[str, mock.Mock]`: The mocked configure calls, mapped by the name of the ConfigureScan step making them.
+    """
+    component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+    configure_mocks = {
+        name: mock.Mock(return_value=0)
+        for name in (
+            "b123_vcc",
+            "wideband_frequency_shifter",
+            "frequency_slice_selection",
+            "wideband_input_buffer",
+            "pre_channelizer_power_meters",
+            "fs_power_meters",
+            "vcc_stream_merge_1",
+            "vcc_stream_merge_2",
+        )
+    }
+
+    def configure_power_meters(configs):
+        pre_channelizer = all(isinstance(key, VCCBandGroup) for key in configs)
+        configure_mocks["pre_channelizer_power_meters" if pre_channelizer else "fs_power_meters"](configs)
+        return PowerMeterFleetReport(action="Configuration", succeeded_keys=list(configs))
+
+    with (
+        mock.patch.object(component_manager, "simulation_mode", SimulationMode.FALSE),
+        mock.patch.object(component_manager, "_applied_configuration", None),
+        mock.patch.object(component_manager.b123_vcc, "configure", configure_mocks["b123_vcc"]),
+        mock.patch.object(component_manager.wideband_frequency_shifter, "configure", configure_mocks["wideband_frequency_shifter"]),
+        mock.patch.object(component_manager.frequency_slice_selection, "configure", configure_mocks["frequency_slice_selection"]),
+        mock.patch.object(component_manager.wideband_input_buffer, "configure", configure_mocks["wideband_input_buffer"]),
+        mock.patch.object(component_manager.power_meter_fleet, "configure", side_effect=configure_power_meters),
+        mock.patch.object(component_manager.vcc_stream_merges[1], "configure_lane_table", configure_mocks["vcc_stream_merge_1"]),
+        mock.patch.object(component_manager.vcc_stream_merges[2], "configure_lane_table", configure_mocks["vcc_stream_merge_2"]),
+    ):
+        yield configure_mocks
+
+
+@pytest.fixture(name="ip_block_deconfigure_mocks")
+def ip_block_deconfigure_mocks_fixture(
+    ip_block_configure_mocks: dict[str, mock.Mock],
+) -> Generator[dict[str, mock.Mock], None, None]:
+    """Fixture that additionally mocks the deconfigure call of every IP block programmed by ConfigureScan.
+
+    Args:
+        ip_block_configure_mocks (:obj:`dict[str, mock.Mock]`): The mocked configure calls.
+
+    Returns:
+        :obj:`dict[str, mock.Mock]`: The mocked deconfigure calls, mapped by the name of the ConfigureScan step they undo.
+    """
+    component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+    deconfigure_mocks = {name: mock.Mock(return_value=0) for name in ip_block_configure_mocks}
+
+    def deconfigure_power_meters(keys):
+        pre_channelizer = all(isinstance(key, VCCBandGroup) for key in keys)
+        deconfigure_mocks["pre_channelizer_power_meters" if pre_channelizer else "fs_power_meters"](keys)
+        return PowerMeterFleetReport(action="Deconfiguration", succeeded_keys=list(keys))
+
+    with (
+        mock.patch.object(component_manager.b123_vcc, "deconfigure", deconfigure_mocks["b123_vcc"]),
+        mock.patch.object(component_manager.wideband_frequency_shifter, "deconfigure", deconfigure_mocks["wideband_frequency_shifter"]),
+        mock.patch.object(component_manager.frequency_slice_selection, "deconfigure", deconfigure_mocks["frequency_slice_selection"]),
+        mock.patch.object(component_manager.wideband_input_buffer, "deconfigure", deconfigure_mocks["wideband_input_buffer"]),
+        mock.patch.object(component_manager.power_meter_fleet, "deconfigure", side_effect=deconfigure_power_meters),
+        mock.patch.object(component_manager.vcc_stream_merges[1], "deconfigure", deconfigure_mocks["vcc_stream_merge_1"]),
+        mock.patch.object(component_manager.vcc_stream_merges[2], "deconfigure", deconfigure_mocks["vcc_stream_merge_2"]),
+    ):
+        yield deconfigure_mocks
+
+
+def called_steps(configure_mocks: dict[str, mock.Mock]) -> set[str]:
+    """Get the names of the ConfigureScan steps whose mocked (de)configure call was made, resetting the mocks."""
+    steps = {name for name, configure_mock in configure_mocks.items() if configure_mock.called}
+    for configure_mock in configure_mocks.values():
+        configure_mock.reset_mock()
+    return steps
+
+
 @pytest.mark.forked
 class TestVCCAllBandsController:
 
@@ -94,15 +195,23 @@ class TestVCCAllBandsController:
                 "ethernet_mode": "200GbE",
                 "health_monitor_poll_interval": "60",
             }, 
-            "B123VccOsppfbChannelizer": default_ip_block,
+            "B123VccOsppfbChannelizer": default_ip_block | {"bulk_gain_writes": "false"},
             "FrequencySliceSelection": default_ip_block,
-            "PacketValidation": default_ip_block,
+            "PacketValidation": default_ip_block | {
+                "health_monitor_poll_interval": "3",
+                "health_summary_interval": "60",
+                "health_rate_thresholds": "{}",
+            },
             "WidebandFrequencyShifter": default_ip_block,
             "WidebandInputBuffer": default_ip_block | {
                 "health_monitor_poll_interval": "3",
+                "health_monitor_min_poll_interval": "1",
+                "health_monitor_max_poll_interval": "15",
+                "health_summary_interval": "60",
+                "health_rate_thresholds": "{}",
             }, 
-            "VCCStreamMerge1": default_ip_block,
-            "VCCStreamMerge2": default_ip_block,
+            "VCCStreamMerge1": default_ip_block | {"bulk_lane_writes": "false"},
+            "VCCStreamMerge2": default_ip_block | {"bulk_lane_writes": "false"},
             "B123WidebandPowerMeter": default_ip_block,
             "B45AWidebandPowerMeter": default_ip_block,
             "B5BWidebandPowerMeter": default_ip_block,
@@ -549,17 +658,20 @@ class TestVCCAllBandsController:
             "ConfigureScan",
         )
 
+        # Power meters are read concurrently, so the mocked statuses are looked up by FS index rather than by call order
+        statuses = {
+            i + 1: WidebandPowerMeterStatus(
+                0,
+                measured_power[i],
+                measured_power[i + len(measured_power) // 2],
+                0, 0, 0, 0, 0, 0, False, 0
+            )
+            for i in range(len(measured_power) // 2)
+        }
         with mock.patch(
-            "ska_mid_cbf_fhs_common.ip_blocks.wideband_power_meter.wideband_power_meter_manager.WidebandPowerMeterManager.status",
-            side_effect=[
-                WidebandPowerMeterStatus(
-                    0,
-                    measured_power[i],
-                    measured_power[i + len(measured_power) // 2],
-                    0, 0, 0, 0, 0, 0, False, 0
-                )
-            for i in range(len(measured_power) // 2)],
-            create=True,
+            "ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet.WidebandPowerMeterFleet._read_status",
+            autospec=True,
+            side_effect=lambda fleet, fs_index: statuses[fs_index],
         ):
             requested_headrooms_before = vcc_all_bands_device.read_attribute("requestedRFIHeadroom")
 
@@ -585,3 +697,540 @@ class TestVCCAllBandsController:
                 requested_headroom == expected_headroom
                 for requested_headroom, expected_headroom in zip(requested_headrooms_after.value, expected_headrooms)
             )
+
+    def test_auto_set_fleet_filter_gains(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config_json = f.read()
+
+        vcc_all_bands_device.command_inout("ConfigureScan", config_json)
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+
+        # A power of 10^(-3/10) in every FS gives a gain of 1.0 for a 3 dB headroom
+        status = WidebandPowerMeterStatus(0, 10 ** -0.3, 10 ** -0.3, 0, 0, 0, 0, 0, 0, False, 0)
+        with mock.patch(
+            "ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet.WidebandPowerMeterFleet._read_status",
+            autospec=True,
+            return_value=status,
+        ):
+            vcc_all_bands_device.command_inout("AutoSetFleetFilterGains", json.dumps({"headrooms": [3.0], "require_all": True}))
+
+            DeviceTestUtils.assert_lrc_completed(
+                vcc_all_bands_device,
+                vcc_all_bands_event_tracer,
+                EVENT_TIMEOUT,
+                "AutoSetFleetFilterGains",
+            )
+
+        for multiplier in vcc_all_bands_device.read_attribute("vccGains").value:
+            MPFloat.assert_almosteq(multiplier, MPFloat("1.0"), rel_tolerance=1e-12, abs_tolerance=1e-14)
+
+    def test_apply_filter_gains_rechecked(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+
+        # Gains computed before the VCC was deconfigured or reconfigured are not applied
+        update = FilterGainUpdate(transaction_id=None, headrooms=[3.0], gains=[1.0] * len(config["vcc_gain"]))
+        with mock.patch.object(component_manager.b123_vcc, "configure", return_value=0) as configure_mock:
+            with mock.patch.object(type(component_manager), "filter_gains_allowed", new_callable=mock.PropertyMock, return_value=False):
+                assert component_manager.apply_filter_gains(dataclasses.replace(update)).result_code == ResultCode.REJECTED
+            assert component_manager.apply_filter_gains(dataclasses.replace(update, gains=[1.0] * 30)).result_code == ResultCode.REJECTED
+            configure_mock.assert_not_called()
+
+            assert component_manager.apply_filter_gains(update).result_code == ResultCode.OK
+            configure_mock.assert_called_once()
+
+    def test_auto_set_filter_gains_from_power_statistics(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config_json = f.read()
+
+        vcc_all_bands_device.command_inout("ConfigureScan", config_json)
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+
+        # Power meters are not sampled in simulation mode, so no statistics are available
+        power_statistics = vcc_all_bands_device.read_attribute("powerStatistics").value
+        assert len(power_statistics) == 6 * (len(VCCBandGroup) + 26)
+        assert all(math.isnan(value) for value in power_statistics)
+
+        vcc_all_bands_device.command_inout("AutoSetFilterGains", json.dumps({"headrooms": [3.0], "power_statistic": "max"}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "AutoSetFilterGains",
+            [ResultCode.REJECTED],
+        )
+
+        vcc_all_bands_device.command_inout("AutoSetFilterGains", json.dumps({"headrooms": [3.0], "power_statistic": "median", "power_window": 5.0}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "AutoSetFilterGains",
+            [ResultCode.FAILED],
+        )
+
+    def test_get_configuration_plans(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config_json = f.read()
+        config = json.loads(config_json)
+
+        for transaction_id in ("plan-1", "plan-2"):
+            vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config | {"transaction_id": transaction_id}))
+
+            DeviceTestUtils.assert_lrc_completed(
+                vcc_all_bands_device,
+                vcc_all_bands_event_tracer,
+                EVENT_TIMEOUT,
+                "ConfigureScan",
+            )
+
+        plans = [plan for plan in json.loads(vcc_all_bands_device.command_inout("GetConfigurationPlans")) if plan["config_id"] == config["config_id"]]
+        assert len(plans) == 1
+        assert len(plans[0]["fs_power_meters"]) == len(config["fs_lanes"])
+        assert plans[0]["channelizer"]["gains"] == config["vcc_gain"]
+
+    def test_configure_scan_validated_once(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read()) | {"config_id": "validated-once"}
+
+        with mock.patch.object(
+            configure_scan_parser, "_configure_scan_validator", wraps=configure_scan_parser._configure_scan_validator
+        ) as validator_mock:
+            for transaction_id in ("validate-1", "validate-2"):
+                vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config | {"transaction_id": transaction_id}))
+
+                DeviceTestUtils.assert_lrc_completed(
+                    vcc_all_bands_device,
+                    vcc_all_bands_event_tracer,
+                    EVENT_TIMEOUT,
+                    "ConfigureScan",
+                )
+
+        assert validator_mock.validate.call_count == 1
+
+    def test_stage_latencies(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config | {"transaction_id": "latency-1"}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+
+        summary = json.loads(vcc_all_bands_device.read_attribute("stageLatencySummary").value)
+        assert {"validation", "total"} <= set(summary["ConfigureScan"])
+        assert summary["ConfigureScan"]["total"]["max_transaction_id"] == "latency-1"
+
+        samples = json.loads(vcc_all_bands_device.command_inout("DumpStageLatencies"))
+        assert all(sample["transaction_id"] == "latency-1" for sample in samples if sample["command"] == "ConfigureScan")
+
+    def test_gain_history(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config | {"transaction_id": "history-1"}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+
+        records = decode_gain_history(vcc_all_bands_device.command_inout("GetGainHistory", json.dumps({"source": "CONFIGURE_SCAN", "limit": 1})))
+        assert len(records) == 1
+        assert records[0]["transaction_id"] == b"history-1"
+        assert records[0]["gains"][: 2 * records[0]["num_fs"]].tolist() == config["vcc_gain"]
+
+        assert len(decode_gain_history(vcc_all_bands_device.command_inout("GetGainHistory", json.dumps({"source": "AUTO_GAIN_CONTROL", "since": 0})))) == 0
+
+    def test_prepare_configuration(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+        ip_block_configure_mocks: dict[str, mock.Mock],
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+        next_config = config | {"config_id": "prepared", "transaction_id": "prepare-1", "vcc_gain": [2.0] * len(config["vcc_gain"])}
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+        assert called_steps(ip_block_configure_mocks) == set(ip_block_configure_mocks)
+
+        vcc_all_bands_device.command_inout("PrepareConfiguration", json.dumps(next_config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "PrepareConfiguration",
+        )
+        # Preparing a configuration does not touch the IP blocks
+        assert called_steps(ip_block_configure_mocks) == set()
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(next_config | {"transaction_id": "commit-1"}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+        # Committing the prepared configuration only programs the blocks affected by the changed gains
+        assert called_steps(ip_block_configure_mocks) == {"b123_vcc"}
+
+    def test_prepare_configuration_mismatched(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+        ip_block_configure_mocks: dict[str, mock.Mock],
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+        prepared_config = config | {"config_id": "prepared", "vcc_gain": [2.0] * len(config["vcc_gain"])}
+        next_config = config | {"config_id": "not-prepared", "frequency_band_offset_stream_1": config["frequency_band_offset_stream_1"] + 1}
+
+        for command, argin in (("ConfigureScan", config), ("PrepareConfiguration", prepared_config)):
+            vcc_all_bands_device.command_inout(command, json.dumps(argin))
+
+            DeviceTestUtils.assert_lrc_completed(
+                vcc_all_bands_device,
+                vcc_all_bands_event_tracer,
+                EVENT_TIMEOUT,
+                command,
+            )
+        called_steps(ip_block_configure_mocks)
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(next_config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+        # The prepared configuration is discarded, and the blocks are programmed from the applied configuration instead
+        assert called_steps(ip_block_configure_mocks) == {"wideband_frequency_shifter"}
+
+    @pytest.mark.parametrize(
+        ("changes", "lane_changes", "expected_steps"),
+        [
+            pytest.param({"config_id": "incremental-2"}, {}, set(), id="config_id"),
+            pytest.param({"vcc_gain": [2.0] * 20}, {}, {"b123_vcc"}, id="vcc_gain"),
+            pytest.param({"frequency_band_offset_stream_1": 111}, {}, {"wideband_frequency_shifter"}, id="frequency_band_offset_stream_1"),
+            pytest.param({"expected_dish_id": "MKT002"}, {}, {"wideband_input_buffer"}, id="expected_dish_id"),
+            pytest.param({"b123_pwrm": {"averaging_time": 2, "flagging": 0}}, {}, {"pre_channelizer_power_meters"}, id="b123_pwrm"),
+            pytest.param({}, {"averaging_time": 2}, {"fs_power_meters"}, id="fs_lane_averaging_time"),
+            pytest.param({}, {"vlan_id": 3}, {"vcc_stream_merge_1"}, id="fs_lane_vlan_id"),
+            pytest.param({}, {"fs_id": 11}, {"fs_power_meters", "vcc_stream_merge_1"}, id="fs_lane_fs_id"),
+            pytest.param({"frequency_band": "1"}, {}, None, id="unmapped_field"),
+            pytest.param({"force_full_configure": True}, {}, None, id="force_full_configure"),
+        ],
+    )
+    def test_configure_scan_incremental(
+        self,
+        changes: dict,
+        lane_changes: dict,
+        expected_steps: set[str] | None,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+        ip_block_configure_mocks: dict[str, mock.Mock],
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read()) | {"config_id": "incremental-1"}
+        next_config = config | changes
+        next_config["fs_lanes"] = [config["fs_lanes"][0] | lane_changes, *config["fs_lanes"][1:]]
+
+        for argin in (config, next_config):
+            vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(argin))
+
+            DeviceTestUtils.assert_lrc_completed(
+                vcc_all_bands_device,
+                vcc_all_bands_event_tracer,
+                EVENT_TIMEOUT,
+                "ConfigureScan",
+            )
+            assert vcc_all_bands_device.obsState == ObsState.READY
+            steps = called_steps(ip_block_configure_mocks)
+
+        # Only the blocks depending on the changed fields are reprogrammed, unless a full configuration is required
+        assert steps == (set(ip_block_configure_mocks) if expected_steps is None else expected_steps)
+
+    def test_configure_steps_by_field(self, ip_block_configure_mocks: dict[str, mock.Mock]):
+        # Every mapped field must exist, and map to steps which ConfigureScan actually runs
+        assert set(CONFIGURE_STEPS_BY_FIELD) <= {field.name for field in dataclasses.fields(VCCAllBandsConfigureScanConfig)}
+        assert set(FS_LANE_CONFIGURE_STEPS_BY_FIELD) == {field.name for field in dataclasses.fields(VCCAllBandsConfigureScanFSLaneConfig)}
+        mapped_steps = {step.format(merge=merge) for steps in FS_LANE_CONFIGURE_STEPS_BY_FIELD.values() for step in steps for merge in (1, 2)}
+        mapped_steps.update(step for steps in CONFIGURE_STEPS_BY_FIELD.values() for step in steps)
+        assert mapped_steps <= set(ip_block_configure_mocks)
+
+    def test_configure_scan_failure_restored(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+        ip_block_configure_mocks: dict[str, mock.Mock],
+        ip_block_deconfigure_mocks: dict[str, mock.Mock],
+    ):
+        component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read()) | {"config_id": "restored"}
+        next_config = config | {"config_id": "failed", "frequency_band_offset_stream_1": config["frequency_band_offset_stream_1"] + 1}
+
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+        called_steps(ip_block_configure_mocks)
+
+        # The shifter fails to take the new configuration, then takes the previous one back
+        ip_block_configure_mocks["wideband_frequency_shifter"].side_effect = [1, 0]
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(next_config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+            [ResultCode.FAILED],
+        )
+
+        assert ip_block_configure_mocks["wideband_frequency_shifter"].call_count == 2
+        assert called_steps(ip_block_configure_mocks) == {"wideband_frequency_shifter"}
+        assert called_steps(ip_block_deconfigure_mocks) == set()
+        assert vcc_all_bands_device.obsState == ObsState.READY
+        assert component_manager._config_id == "restored"
+        assert component_manager._applied_configuration.config_id == "restored"
+
+    def test_configure_scan_failure_not_restored(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+        ip_block_configure_mocks: dict[str, mock.Mock],
+        ip_block_deconfigure_mocks: dict[str, mock.Mock],
+    ):
+        component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read()) | {"config_id": "not-restored"}
+
+        # With no previous configuration to restore, the blocks touched before the FS Selection failed are deconfigured
+        ip_block_configure_mocks["frequency_slice_selection"].return_value = 1
+        vcc_all_bands_device.command_inout("ConfigureScan", json.dumps(config))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+            [ResultCode.FAILED],
+        )
+
+        untouched_steps = {"vcc_stream_merge_1", "vcc_stream_merge_2"}
+        assert called_steps(ip_block_configure_mocks) == set(ip_block_configure_mocks) - untouched_steps
+        assert called_steps(ip_block_deconfigure_mocks) == set(ip_block_deconfigure_mocks) - untouched_steps
+        assert vcc_all_bands_device.obsState == ObsState.IDLE
+        assert component_manager._config_id == ""
+        assert component_manager._applied_configuration is None
+
+    def test_prepare_configuration_invalid(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+
+        vcc_all_bands_device.command_inout("PrepareConfiguration", json.dumps(config | {"frequency_band": "5a"}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "PrepareConfiguration",
+            [ResultCode.REJECTED],
+        )
+
+    def test_auto_gain_control(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+        vcc_all_bands_event_tracer: TangoEventTracer,
+    ):
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config_json = f.read()
+
+        vcc_all_bands_device.command_inout("ConfigureScan", config_json)
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "ConfigureScan",
+        )
+
+        vcc_all_bands_device.command_inout("StartAutoGainControl", json.dumps({"headrooms": [3.0, 6.0], "period": 60.0}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "StartAutoGainControl",
+            [ResultCode.REJECTED],
+        )
+
+        vcc_all_bands_device.command_inout("StartAutoGainControl", json.dumps({"headrooms": [3.0], "period": 60.0, "hysteresis_db": 1.0}))
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "StartAutoGainControl",
+        )
+
+        status = json.loads(vcc_all_bands_device.read_attribute("autoGainControlStatus").value)
+        assert status["running"]
+        assert status["config"]["hysteresis_db"] == 1.0
+
+        vcc_all_bands_device.command_inout("StopAutoGainControl", "")
+
+        DeviceTestUtils.assert_lrc_completed(
+            vcc_all_bands_device,
+            vcc_all_bands_event_tracer,
+            EVENT_TIMEOUT,
+            "StopAutoGainControl",
+        )
+
+        assert not json.loads(vcc_all_bands_device.read_attribute("autoGainControlStatus").value)["running"]
+
+    def test_poll_scheduler_status(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+    ):
+        # The power statistics sampler of the device is always polled on the shared scheduler, and the Wideband Input
+        # Buffer and Packet Validation health while they are started
+        component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+        health_monitors = [
+            component_manager.wideband_input_buffer.scheduled_health_monitor,
+            component_manager.packet_validation.scheduled_health_monitor,
+        ]
+        for health_monitor in health_monitors:
+            health_monitor.start()
+        try:
+            status = json.loads(vcc_all_bands_device.read_attribute("pollSchedulerStatus").value)
+            assert {"WidebandInputBuffer_health", "PacketValidation_health", "vcc1_power_statistics"} <= set(status["job_names"])
+            assert status["jobs"] == len(status["job_names"])
+            assert status["workers"] == 4
+
+            deadline = time.monotonic() + EVENT_TIMEOUT
+            while json.loads(vcc_all_bands_device.read_attribute("pollSchedulerStatus").value)["polls"] <= status["polls"]:
+                assert time.monotonic() < deadline, "The shared scheduler did not poll"
+                time.sleep(0.1)
+        finally:
+            for health_monitor in health_monitors:
+                health_monitor.stop()
+
+    def test_packet_validation_diagnostics(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+    ):
+        # The Packet Validation block is only polled while scanning, outside of simulation mode
+        assert json.loads(vcc_all_bands_device.read_attribute("packetValidationDiagnostics").value) == {}
+
+        status = PACKET_VALIDATION_SIM_STATUS | {
+            "exp_dst_mac": 0x001122334455,
+            "last_wrong_dst_mac": 0x0011223344FF,
+            "wrong_dst_mac_cnt": 3,
+            "exp_ethertype": 0xFEED,
+        }
+        component_manager = tango.Util.instance().get_device_by_name("test/vccallbands/1").component_manager
+        with mock.patch.object(PacketValidationSimulator, "status", return_value=status):
+            component_manager.packet_validation.scheduled_health_monitor.poll()
+
+        diagnostics = json.loads(vcc_all_bands_device.read_attribute("packetValidationDiagnostics").value)
+        assert diagnostics["dst_mac"] == {"expected": "00:11:22:33:44:55", "last_wrong": "00:11:22:33:44:ff", "count": 3}
+        assert diagnostics["ethertype"] == {"expected": "0xfeed", "last_wrong": None, "count": 0}
+
+    def test_status_records(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+    ):
+        name, records = decode_records(vcc_all_bands_device.command_inout("GetStatusRecords", json.dumps({"block_type": "packet_validation"})))
+        assert name == "packet_validation"
+        assert {"sequence", "timestamp", "instance", "egress_cnt", "wrong_antenna_id_cnt"} <= set(records.dtype.names)
+
+        with pytest.raises(DevFailed):
+            vcc_all_bands_device.command_inout("GetStatusRecords", json.dumps({"block_type": "unknown"}))
+
+    def test_init_releases_poll_jobs(
+        self,
+        vcc_all_bands_device: VCCAllBandsController,
+    ):
+        # Re-initialising the device replaces its component manager, which must stop its polls on the shared scheduler
+        num_jobs = PollScheduler.shared().num_jobs
+        vcc_all_bands_device.command_inout("Init")
+        assert PollScheduler.shared().num_jobs == num_jobs
@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ska_mid_cbf_fhs_vcc.monitoring.poll_scheduler import PollScheduler
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.auto_gain_control import AutoGainControlLoop, apply_gain_hysteresis
+
+
+class TestApplyGainHysteresis:
+
+    def test_only_channels_beyond_hysteresis_change(self):
+        """Channels whose gain moves by no more than the hysteresis should keep their current gain."""
+        current = [1.0, 1.0, 1.0, 1.0]
+        proposed = [1.01, 10 ** (1.5 / 20), 10 ** (-0.4 / 20), 0.5]
+
+        gains, changed = apply_gain_hysteresis(current, proposed, hysteresis_db=0.5)
+
+        assert changed.tolist() == [False, True, False, True]
+        np.testing.assert_allclose(gains, [1.0, proposed[1], 1.0, 0.5])
+
+    def test_unusable_current_gains_replaced(self):
+        """Non-positive current gains, or a gain vector of a different size, should be replaced entirely."""
+        gains, changed = apply_gain_hysteresis([0.0, 1.0], [1.0, 1.0], hysteresis_db=0.5)
+        assert changed.tolist() == [True, False]
+
+        gains, changed = apply_gain_hysteresis([], [1.0, 1.0], hysteresis_db=0.5)
+        assert changed.all()
+        assert gains.tolist() == [1.0, 1.0]
+
+
+class TestAutoGainControlLoop:
+
+    @pytest.fixture(scope="function")
+    def logger(self) -> logging.Logger:
+        """Fixture to set up a logger for the loop."""
+        return logging.getLogger("auto_gain_control_test")
+
+    def test_steps_only_while_condition_holds(self, logger: logging.Logger):
+        """The step should only run while the condition holds, and stop running once the loop is stopped."""
+        scanning = threading.Event()
+        stepped = threading.Event()
+
+        def step(config) -> bool:
+            stepped.set()
+            return False
+
+        loop = AutoGainControlLoop(step=step, should_run=scanning.is_set, logger=logger)
+        loop.start(SimpleNamespace(period=0.01, min_update_interval=0.0))
+        try:
+            time.sleep(0.1)
+            assert not stepped.is_set()
+
+            scanning.set()
+            assert stepped.wait(5)
+            assert loop.running
+        finally:
+            assert loop.stop()
+
+        samples = loop.samples
+        time.sleep(0.05)
+        assert loop.samples == samples
+        assert not loop.running
+        assert not loop.stop()
+
+    def test_updates_rate_limited(self, logger: logging.Logger):
+        """After writing new gains, the step should not run again before the minimum update interval."""
+        calls = []
+
+        loop = AutoGainControlLoop(step=lambda config: calls.append(time.monotonic()) or True, should_run=lambda: True, logger=logger)
+        loop.start(SimpleNamespace(period=0.01, min_update_interval=0.2))
+        time.sleep(0.5)
+        loop.stop()
+
+        assert 2 <= len(calls) <= 3
+        assert all(later - earlier >= 0.19 for earlier, later in zip(calls, calls[1:]))
+        assert loop.updates == len(calls)
+
+    def test_step_failure_does_not_stop_loop(self, logger: logging.Logger):
+        """A failing step should be counted and retried on the next period."""
+        attempts = threading.Semaphore(0)
+
+        def step(config) -> bool:
+            attempts.release()
+            raise RuntimeError("power meter error")
+
+        loop = AutoGainControlLoop(step=step, should_run=lambda: True, logger=logger)
+        loop.start(SimpleNamespace(period=0.01, min_update_interval=0.0))
+        try:
+            assert attempts.acquire(timeout=5) and attempts.acquire(timeout=5)
+        finally:
+            loop.stop()
+
+        assert loop.errors >= 2
+        assert loop.updates == 0
+
+    def test_runs_as_scheduler_job(self, logger: logging.Logger):
+        """The loop should be polled by the scheduler as a single job, which a restart replaces and stopping cancels."""
+        scheduler = PollScheduler(max_workers=1)
+        stepped = threading.Event()
+
+        loop = AutoGainControlLoop(step=lambda config: stepped.set() or False, should_run=lambda: True, logger=logger, name="vcc1_agc", scheduler=scheduler)
+        loop.start(SimpleNamespace(period=0.01, min_update_interval=0.0))
+        loop.start(SimpleNamespace(period=0.02, min_update_interval=0.0))
+        try:
+            assert stepped.wait(5)
+            assert scheduler.num_jobs == 1
+            assert loop.config.period == 0.02
+        finally:
+            loop.stop()
+
+        assert scheduler.num_jobs == 0
+        assert loop.config is None
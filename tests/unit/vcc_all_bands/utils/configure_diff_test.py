@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_diff import configuration_diff
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import VCCAllBandsConfigureScanConfig
+
+
+class TestConfigurationDiff:
+
+    @pytest.fixture(scope="function")
+    def config_dict(self) -> dict:
+        """Fixture to load the ConfigureScan test configuration."""
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            return json.loads(f.read())
+
+    def test_identical_configurations(self, config_dict: dict):
+        """Identical configurations should have no differences."""
+        previous = VCCAllBandsConfigureScanConfig.from_dict(config_dict)
+        current = VCCAllBandsConfigureScanConfig.from_dict(config_dict)
+        assert configuration_diff(previous, current) == set()
+
+    def test_gain_and_config_id_changes(self, config_dict: dict):
+        """Scalar lists and plain fields should be reported by their own path."""
+        previous = VCCAllBandsConfigureScanConfig.from_dict(config_dict)
+        current = VCCAllBandsConfigureScanConfig.from_dict(
+            config_dict | {"config_id": "2", "vcc_gain": [0.5] + config_dict["vcc_gain"][1:]}
+        )
+        assert configuration_diff(previous, current) == {"config_id", "vcc_gain"}
+
+    def test_nested_changes(self, config_dict: dict):
+        """Changes inside nested dataclasses and lists of dataclasses should be reported by their full path."""
+        fs_lanes = [dict(lane) for lane in config_dict["fs_lanes"]]
+        fs_lanes[3]["flagging"] = 1
+        previous = VCCAllBandsConfigureScanConfig.from_dict(config_dict)
+        current = VCCAllBandsConfigureScanConfig.from_dict(
+            config_dict | {"fs_lanes": fs_lanes, "b123_pwrm": {"averaging_time": 2, "flagging": 0}}
+        )
+        assert configuration_diff(previous, current) == {"fs_lanes.3.flagging", "b123_pwrm.averaging_time"}
+
+    def test_lane_count_change(self, config_dict: dict):
+        """A change in the number of FS lanes should be reported as a change to the whole list."""
+        previous = VCCAllBandsConfigureScanConfig.from_dict(config_dict)
+        current = VCCAllBandsConfigureScanConfig.from_dict(config_dict | {"fs_lanes": config_dict["fs_lanes"][:-1]})
+        assert configuration_diff(previous, current) == {"fs_lanes"}
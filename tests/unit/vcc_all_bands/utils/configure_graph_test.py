@@ -0,0 +1,149 @@
+import threading
+
+import pytest
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_graph import ConfigureGraphExecutor, ConfigureStep, rollback_steps
+
+
+class TestConfigureGraphExecutor:
+
+    @pytest.fixture(scope="function")
+    def executor(self):
+        """Fixture to set up the configure graph executor."""
+        yield ConfigureGraphExecutor(max_workers=4)
+
+    def test_independent_steps_run_concurrently(self, executor: ConfigureGraphExecutor):
+        """Independent steps should be in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def step_fn() -> int:
+            barrier.wait()
+            return 0
+
+        report = executor.run([ConfigureStep(name=f"step{i}", description=f"Step {i}", run=step_fn) for i in range(3)])
+
+        assert report.succeeded
+        assert set(report.timings()) == {"step0", "step1", "step2"}
+
+    def test_dependencies_respected(self, executor: ConfigureGraphExecutor):
+        """A step should only start once all of its dependencies have completed."""
+        order = []
+        lock = threading.Lock()
+
+        def step_fn(name: str) -> int:
+            with lock:
+                order.append(name)
+            return 0
+
+        report = executor.run(
+            [
+                ConfigureStep(name="merge", description="Merge", run=lambda: step_fn("merge"), depends_on=("fss", "vcc")),
+                ConfigureStep(name="fss", description="FSS", run=lambda: step_fn("fss"), depends_on=("vcc",)),
+                ConfigureStep(name="vcc", description="VCC", run=lambda: step_fn("vcc")),
+            ]
+        )
+
+        assert report.succeeded
+        assert order == ["vcc", "fss", "merge"]
+
+    def test_failure_stops_dependent_steps(self, executor: ConfigureGraphExecutor):
+        """A failed step should be reported and its dependents should never run."""
+        report = executor.run(
+            [
+                ConfigureStep(name="vcc", description="VCC", run=lambda: 1),
+                ConfigureStep(name="fss", description="FSS", run=lambda: 0, depends_on=("vcc",)),
+            ]
+        )
+
+        assert not report.succeeded
+        assert report.failed.step.name == "vcc"
+        assert report.skipped == ["fss"]
+
+    def test_exception_reported_as_failure(self, executor: ConfigureGraphExecutor):
+        """An exception raised by a step should be captured in the report rather than propagated."""
+
+        def step_fn() -> int:
+            raise RuntimeError("driver error")
+
+        report = executor.run([ConfigureStep(name="wib", description="WIB", run=step_fn)])
+
+        assert not report.succeeded
+        assert isinstance(report.failed.error, RuntimeError)
+
+    def test_cycle_rejected(self, executor: ConfigureGraphExecutor):
+        """A graph containing a dependency cycle should be rejected."""
+        with pytest.raises(ValueError):
+            executor.run(
+                [
+                    ConfigureStep(name="a", description="A", run=lambda: 0, depends_on=("b",)),
+                    ConfigureStep(name="b", description="B", run=lambda: 0, depends_on=("a",)),
+                ]
+            )
+
+    def test_best_effort_run_continues_after_failure(self, executor: ConfigureGraphExecutor):
+        """Without fail-fast, a failed step should not prevent the remaining steps from running."""
+        report = executor.run(
+            [
+                ConfigureStep(name="vcc", description="VCC", run=lambda: 1),
+                ConfigureStep(name="fss", description="FSS", run=lambda: 0, depends_on=("vcc",)),
+            ],
+            fail_fast=False,
+        )
+
+        assert not report.succeeded
+        assert [result.step.name for result in report.failures] == ["vcc"]
+        assert report.results["fss"].succeeded
+        assert report.skipped == []
+
+    def test_rollback_only_touched_steps_in_reverse(self, executor: ConfigureGraphExecutor):
+        """Rollback should undo only the steps that were started, in reverse dependency order."""
+        report = executor.run(
+            [
+                ConfigureStep(name="vcc", description="VCC", run=lambda: 0),
+                ConfigureStep(name="wfs", description="WFS", run=lambda: 0),
+                ConfigureStep(name="fss", description="FSS", run=lambda: 1, depends_on=("vcc",)),
+                ConfigureStep(name="merge", description="Merge", run=lambda: 0, depends_on=("fss",)),
+            ]
+        )
+
+        order = []
+        lock = threading.Lock()
+
+        def undo_fn(name: str) -> int:
+            with lock:
+                order.append(name)
+            return 0
+
+        undo_steps = {name: ConfigureStep(name=f"undo_{name}", description=f"Undo {name}", run=lambda name=name: undo_fn(name)) for name in ("vcc", "wfs", "fss", "merge")}
+        rollback = rollback_steps(report, undo_steps)
+
+        assert {step.name for step in rollback} == {"vcc", "wfs", "fss"}
+        assert next(step for step in rollback if step.name == "vcc").depends_on == ("fss",)
+
+        rollback_report = executor.run(rollback, fail_fast=False)
+
+        assert rollback_report.succeeded
+        assert set(order) == {"vcc", "wfs", "fss"}
+        assert order.index("fss") < order.index("vcc")
+
+    def test_close_does_not_wait(self, executor: ConfigureGraphExecutor):
+        """Closing should not wait for a step in flight, and no further steps should be accepted."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def step_fn():
+            started.set()
+            release.wait(5)
+            return 0
+
+        runner = threading.Thread(target=executor.run, args=([ConfigureStep(name="wib", description="WIB", run=step_fn)],))
+        runner.start()
+        try:
+            assert started.wait(5)
+            executor.close()
+            assert not release.is_set()
+            with pytest.raises(RuntimeError):
+                executor.run([ConfigureStep(name="wfs", description="WFS", run=lambda: 0)])
+        finally:
+            release.set()
+            runner.join(5)
@@ -0,0 +1,68 @@
+import functools
+import json
+from unittest import mock
+
+import pytest
+
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_plan import ConfigurePlan, build_configure_plan
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_scan_parser import ConfigureScanParser
+
+
+class TestConfigurePlan:
+
+    @pytest.fixture(scope="function")
+    def config_dict(self) -> dict:
+        """Fixture to load the ConfigureScan test configuration."""
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            return json.loads(f.read())
+
+    @pytest.fixture(scope="function")
+    def plan(self, config_dict: dict) -> ConfigurePlan:
+        """Fixture to compile the ConfigureScan test configuration into a plan."""
+        fingerprint, configuration = ConfigureScanParser().parse_with_fingerprint(json.dumps(config_dict | {"transaction_id": "txn-1"}))
+        return build_configure_plan(configuration, fingerprint, vcc_id=3)
+
+    def test_build_plan(self, plan: ConfigurePlan, config_dict: dict):
+        """The plan should hold the block configurations derived from the ConfigureScan configuration."""
+        assert plan.config_id == config_dict["config_id"]
+        assert plan.channelizer.gains == config_dict["vcc_gain"]
+        assert plan.wideband_input_buffer.expected_sample_rate == config_dict["dish_sample_rate"]
+        assert plan.frequency_slice_selection.band_select == int(config_dict["frequency_band"])
+        assert set(plan.pre_channelizer_power_meters) == set(VCCBandGroup)
+        assert sorted(plan.fs_power_meters) == sorted(lane["fs_id"] for lane in config_dict["fs_lanes"])
+        assert plan.lane_tables[1]["vcc_id"].tolist() == [3] * min(len(config_dict["fs_lanes"]), 13)
+
+    def test_plan_immutable(self, plan: ConfigurePlan):
+        """The plan and its lane tables should not be modifiable."""
+        with pytest.raises(AttributeError):
+            plan.fingerprint = "other"
+        with pytest.raises(TypeError):
+            plan.fs_power_meters[1] = None
+        with pytest.raises(ValueError):
+            plan.lane_tables[1]["vid"][0] = 100
+
+    def test_with_transaction_id(self, plan: ConfigurePlan):
+        """Re-targeting a plan should tag every block configuration, sharing the compiled values and leaving the original intact."""
+        retargeted = plan.with_transaction_id("txn-2")
+
+        assert retargeted.transaction_id == "txn-2"
+        assert retargeted.wideband_input_buffer.transaction_id == "txn-2"
+        assert all(config.transaction_id == "txn-2" for config in retargeted.fs_power_meters.values())
+        assert retargeted.lane_tables is plan.lane_tables
+        assert plan.wideband_input_buffer.transaction_id == "txn-1"
+        assert plan.with_transaction_id("txn-1") is plan
+
+    def test_plan_cached_with_configuration(self, config_dict: dict):
+        """Plans should be compiled once, kept with the parsed configuration and described as JSON."""
+        compile_mock = mock.Mock(wraps=functools.partial(build_configure_plan, vcc_id=3))
+        parser = ConfigureScanParser(max_entries=1, compile_plan=compile_mock)
+
+        first = parser.plan(*parser.identify(json.dumps(config_dict | {"transaction_id": "txn-1"})))
+        second = parser.plan(*parser.identify(json.dumps(config_dict | {"transaction_id": "txn-2"})))
+
+        assert compile_mock.call_count == 1
+        assert (parser.hits, parser.misses) == (1, 1)
+        assert second.transaction_id == "txn-2"
+        assert second.lane_tables is first.lane_tables
+        assert json.loads(json.dumps([plan.to_dict() for plan in parser.plans()]))[0]["fingerprint"] == first.fingerprint
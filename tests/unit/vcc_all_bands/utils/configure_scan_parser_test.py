@@ -0,0 +1,73 @@
+import json
+from unittest import mock
+
+import jsonschema
+import pytest
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils import configure_scan_parser
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_scan_parser import ConfigureScanParser
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.vcc_all_bands_dataclasses import VCCAllBandsConfigureScanConfig
+
+
+class TestConfigureScanParser:
+
+    @pytest.fixture(scope="function")
+    def config_dict(self) -> dict:
+        """Fixture to load the ConfigureScan test configuration, extended to a realistic 26 FS lanes."""
+        with open("tests/test_data/device_config/vcc_all_bands.json", "r") as f:
+            config = json.loads(f.read())
+        config["fs_lanes"] = [{"vlan_id": 2 + i, "fs_id": i, "averaging_time": 1, "flagging": 0} for i in range(1, 27)]
+        config["vcc_gain"] = [1.0] * 52
+        return config
+
+    @pytest.fixture(scope="function")
+    def parser(self):
+        """Fixture to set up the ConfigureScan parser."""
+        yield ConfigureScanParser(max_entries=2)
+
+    def test_parse_matches_from_json(self, parser: ConfigureScanParser, config_dict: dict):
+        """The single-pass decoder should produce the same configuration as the dataclass JSON decoder."""
+        argin = json.dumps(config_dict)
+        assert parser.parse(argin) == VCCAllBandsConfigureScanConfig.from_json(argin)
+
+    def test_resubmitted_configuration_cached(self, parser: ConfigureScanParser, config_dict: dict):
+        """A configuration differing only by transaction ID should be served from the cache with the new transaction ID."""
+        first = parser.parse(json.dumps(config_dict | {"transaction_id": "txn-1"}))
+        second = parser.parse(json.dumps(config_dict | {"transaction_id": "txn-2"}))
+
+        assert (parser.hits, parser.misses) == (1, 1)
+        assert first.transaction_id == "txn-1"
+        assert second.transaction_id == "txn-2"
+        assert first.fs_lanes == second.fs_lanes
+
+    def test_cache_bounded(self, parser: ConfigureScanParser, config_dict: dict):
+        """The least recently used configuration should be evicted once the cache is full."""
+        for config_id in ("1", "2", "3", "1"):
+            parser.parse(json.dumps(config_dict | {"config_id": config_id}))
+
+        assert (parser.hits, parser.misses) == (0, 4)
+
+    def test_invalid_configuration_rejected(self, parser: ConfigureScanParser, config_dict: dict):
+        """An argin not matching the schema should raise a validation error and not be cached."""
+        del config_dict["fs_lanes"]
+        for _ in range(2):
+            with pytest.raises(jsonschema.ValidationError):
+                parser.parse(json.dumps(config_dict))
+
+        assert parser.hits == 0
+
+    def test_second_parse_cache_hit(self, parser: ConfigureScanParser, config_dict: dict):
+        """Parsing the same argin twice should validate and decode it once, returning the cached configuration."""
+        argin = json.dumps(config_dict)
+        with (
+            mock.patch.object(configure_scan_parser, "_configure_scan_validator", wraps=configure_scan_parser._configure_scan_validator) as validator_mock,
+            mock.patch.object(configure_scan_parser, "_configure_scan_decoder", wraps=configure_scan_parser._configure_scan_decoder) as decoder_mock,
+        ):
+            first = parser.parse(argin)
+            second = parser.parse(argin)
+
+        assert validator_mock.validate.call_count == 1
+        assert decoder_mock.validate_python.call_count == 1
+        assert second is first
+        assert (parser.hits, parser.misses) == (1, 1)
+
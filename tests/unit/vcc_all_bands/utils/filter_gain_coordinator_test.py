@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+from ska_control_model import ResultCode
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.filter_gain_coordinator import FilterGainCoordinator, FilterGainUpdate
+
+
+class FakeVCC:
+    """Fleet member recording the phases run on it."""
+
+    def __init__(self, allowed: bool = True, prepare_result: ResultCode = ResultCode.OK, barrier: threading.Barrier | None = None):
+        self.filter_gains_allowed = allowed
+        self.prepare_result = prepare_result
+        self.barrier = barrier
+        self.applied = None
+
+    def prepare_filter_gains(self, request, transaction_id):
+        if self.barrier is not None:
+            self.barrier.wait()
+        if self.prepare_result == ResultCode.OK:
+            return FilterGainUpdate(transaction_id=transaction_id, headrooms=request, gains=[1.0, 1.0])
+        return FilterGainUpdate(transaction_id=transaction_id, headrooms=request, result_code=self.prepare_result, message="bad power")
+
+    def apply_filter_gains(self, update):
+        self.applied = update.gains
+        update.message = "AutoSetFilterGains completed OK"
+        return update
+
+
+class TestFilterGainCoordinator:
+
+    @pytest.fixture(scope="function")
+    def coordinator(self) -> FilterGainCoordinator:
+        """Fixture to set up a coordinator separate from the shared one."""
+        return FilterGainCoordinator(max_workers=4)
+
+    def test_level(self, coordinator: FilterGainCoordinator):
+        """Every configured VCC should be read concurrently, then updated."""
+        barrier = threading.Barrier(3, timeout=5)
+        vccs = {i: FakeVCC(barrier=barrier) for i in (1, 2, 3)}
+        vccs[4] = FakeVCC(allowed=False)
+        for vcc_id, vcc in vccs.items():
+            coordinator.register(vcc_id, vcc)
+
+        report = coordinator.level([3.0], "txn-1")
+
+        assert report.result_code == ResultCode.OK
+        assert report.applied == [1, 2, 3]
+        assert report.skipped == [4]
+        assert all(vccs[i].applied == [1.0, 1.0] for i in (1, 2, 3))
+        assert vccs[4].applied is None
+
+    def test_partial_failure(self, coordinator: FilterGainCoordinator):
+        """A VCC whose gains cannot be computed should not prevent the others from being updated, unless all are required."""
+        vccs = {1: FakeVCC(), 2: FakeVCC(prepare_result=ResultCode.FAILED)}
+        for vcc_id, vcc in vccs.items():
+            coordinator.register(vcc_id, vcc)
+
+        report = coordinator.level([3.0])
+
+        assert report.result_code == ResultCode.FAILED
+        assert report.applied == [1]
+        assert list(report.failures) == [2]
+        assert "VCC 2: bad power" in report.describe()
+
+        vccs[1].applied = None
+        report = coordinator.level([3.0], require_all=True)
+
+        assert report.applied == []
+        assert report.failures[1].result_code == ResultCode.ABORTED
+        assert vccs[1].applied is None
+
+    def test_exceptions_reported(self, coordinator: FilterGainCoordinator):
+        """An exception raised by a VCC should be reported as a failure of that VCC."""
+        vcc = FakeVCC()
+        vcc.apply_filter_gains = lambda update: 1 / 0
+        coordinator.register(1, vcc)
+
+        report = coordinator.level([3.0])
+
+        assert report.failures[1].result_code == ResultCode.FAILED
+        assert "ZeroDivisionError" in report.failures[1].message
+
+    def test_no_vccs(self, coordinator: FilterGainCoordinator):
+        """Levelling without any configured VCC should be rejected."""
+        coordinator.register(1, FakeVCC(allowed=False))
+
+        assert coordinator.level([3.0]).result_code == ResultCode.REJECTED
+
+    def test_members_held_weakly(self, coordinator: FilterGainCoordinator):
+        """Deleted VCCs should leave the fleet."""
+        coordinator.register(1, FakeVCC())
+        vcc = FakeVCC()
+        coordinator.register(2, vcc)
+
+        assert coordinator.vcc_ids == [2]
+        coordinator.unregister(2)
+        assert coordinator.vcc_ids == []
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from ska_mid_cbf_fhs_vcc.helpers.record_ring import read_record_ring
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_history import GAIN_HISTORY_FIELDS, GainHistory, GainSource, decode_gain_history
+
+
+class TestGainHistory:
+
+    @pytest.fixture(scope="function")
+    def history(self) -> GainHistory:
+        """Fixture to set up a small in-memory gain history."""
+        return GainHistory(capacity=4)
+
+    def test_record(self, history: GainHistory):
+        """Each record should hold the gains, headrooms and powers given, padded with NaN."""
+        powers = np.array([[0.5, 0.25], [0.125, 1.0]])
+        history.record([1.0, 2.0, 3.0, 4.0], GainSource.AUTO_SET_FILTER_GAINS, "txn-1", headrooms=[3.0], powers=powers)
+
+        (record,) = history.query()
+
+        assert record["sequence"] == 1
+        assert record["source"] == GainSource.AUTO_SET_FILTER_GAINS
+        assert record["transaction_id"] == b"txn-1"
+        assert record["num_fs"] == 2
+        assert record["gains"][:4].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert np.isnan(record["gains"][4:]).all()
+        assert record["num_headrooms"] == 1
+        assert record["headrooms"][0] == 3.0
+        np.testing.assert_array_equal(record["powers"][:2], powers)
+        assert np.isnan(record["powers"][2:]).all()
+
+    def test_bounded(self, history: GainHistory):
+        """Only the most recent records should be kept, in order."""
+        for i in range(6):
+            history.record([float(i)] * 2, GainSource.AUTO_GAIN_CONTROL, f"txn-{i}")
+
+        records = history.query()
+
+        assert len(history) == 4
+        assert records["sequence"].tolist() == [3, 4, 5, 6]
+        assert records["gains"][:, 0].tolist() == [2.0, 3.0, 4.0, 5.0]
+
+    def test_query(self):
+        """Records should be filtered by time, source and count."""
+        history = GainHistory(capacity=8)
+        history.record([1.0] * 2, GainSource.CONFIGURE_SCAN)
+        for i in range(3):
+            history.record([1.0] * 2, GainSource.AUTO_GAIN_CONTROL, f"agc-{i}")
+        history._ring.append(timestamp=0.0, source=GainSource.AUTO_GAIN_CONTROL, transaction_id=b"old")
+
+        assert history.query(source=GainSource.CONFIGURE_SCAN)["sequence"].tolist() == [1]
+        assert history.query(source=GainSource.AUTO_GAIN_CONTROL, limit=2)["transaction_id"].tolist() == [b"agc-2", b"old"]
+        assert history.query(since=1.0, source=GainSource.AUTO_GAIN_CONTROL)["transaction_id"].tolist() == [b"agc-0", b"agc-1", b"agc-2"]
+        assert history.query(until=1.0)["transaction_id"].tolist() == [b"old"]
+
+    def test_encode(self, history: GainHistory):
+        """Encoded records should decode to the same records."""
+        history.record([1.0, 2.0], GainSource.CONFIGURE_SCAN, "txn-1")
+        history.record([3.0, 4.0], GainSource.AUTO_SET_FILTER_GAINS, "txn-2", headrooms=[6.0])
+
+        records = decode_gain_history(history.encode())
+
+        assert records.dtype == history.query().dtype
+        assert records.tobytes() == history.query().tobytes()
+        with pytest.raises(ValueError):
+            decode_gain_history(("stage_latencies;[]", b""))
+
+    def test_spill(self, tmp_path):
+        """A spilled history should be readable from its file, and resumed when reopened."""
+        path = str(tmp_path / "gain_history.bin")
+        history = GainHistory(capacity=3, path=path)
+        for i in range(4):
+            history.record([float(i)] * 2, GainSource.AUTO_GAIN_CONTROL, f"txn-{i}")
+        history.flush()
+
+        assert read_record_ring(path, GAIN_HISTORY_FIELDS, limit=2)["transaction_id"].tolist() == [b"txn-2", b"txn-3"]
+
+        history = GainHistory(capacity=3, path=path)
+        history.record([4.0] * 2, GainSource.AUTO_GAIN_CONTROL, "txn-4")
+
+        assert history.query()["sequence"].tolist() == [3, 4, 5]
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from ska_mid_cbf_fhs_common import calculate_gain_multiplier
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.gain_solver import InvalidPowerMeasurementError, invalid_power_mask, solve_filter_gains
+
+
+class TestGainSolver:
+
+    @pytest.fixture(scope="function")
+    def rng(self) -> np.random.Generator:
+        """Fixture to set up a seeded random number generator."""
+        return np.random.default_rng(seed=1234)
+
+    @pytest.mark.parametrize("num_fs", [10, 15, 26])
+    @pytest.mark.parametrize("per_fs_headrooms", [False, True])
+    def test_matches_calculate_gain_multiplier(self, rng: np.random.Generator, num_fs: int, per_fs_headrooms: bool):
+        """The solved gains should match the mpmath-based calculate_gain_multiplier for every FS and polarization."""
+        powers = rng.uniform(1e-6, 1.0, size=(num_fs, 2))
+        headrooms = rng.uniform(0.0, 20.0, size=num_fs if per_fs_headrooms else 1)
+
+        gains = solve_filter_gains(powers, headrooms)
+
+        expected = [
+            float(calculate_gain_multiplier(0.0, float(powers[i, pol]), float(headrooms[i % len(headrooms)])))
+            for pol in range(2)
+            for i in range(num_fs)
+        ]
+        np.testing.assert_allclose(gains, expected, rtol=1e-12, atol=1e-14)
+
+    def test_invalid_power_mask(self):
+        """Non-numeric, boolean, NaN and out of range readings should all be masked as invalid."""
+        powers = [[0.4, None], [True, "0.4"], [float("nan"), 1.0], [0, 1.5]]
+
+        assert invalid_power_mask(powers).tolist() == [[False, True], [True, True], [True, False], [True, True]]
+
+    def test_first_invalid_power_reported(self):
+        """The first invalid reading should be reported by FS index and polarization."""
+        with pytest.raises(InvalidPowerMeasurementError) as ex:
+            solve_filter_gains([[0.4, 0.4], [0.4, -0.1], [None, 0.4]], [3.0])
+
+        assert (ex.value.fs_index, ex.value.polarization) == (2, "Y")
+
+    def test_invalid_headrooms(self):
+        """A headroom count which is neither 1 nor the number of FS should be rejected."""
+        with pytest.raises(ValueError):
+            solve_filter_gains(np.full((3, 2), 0.4), [3.0, 6.0])
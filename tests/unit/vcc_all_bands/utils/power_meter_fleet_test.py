@@ -0,0 +1,173 @@
+import math
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_fleet import WidebandPowerMeterFleet
+
+
+class TestWidebandPowerMeterFleet:
+
+    @pytest.fixture(scope="function")
+    def power_meters(self) -> dict:
+        """Fixture to set up mock power meter managers for every band group and FS."""
+        return {
+            **{band_group: mock.MagicMock(name=band_group.value) for band_group in VCCBandGroup},
+            **{i: mock.MagicMock(name=f"FS{i}") for i in range(1, 27)},
+        }
+
+    @pytest.fixture(scope="function")
+    def fleet(self, power_meters: dict):
+        """Fixture to set up the power meter fleet."""
+        yield WidebandPowerMeterFleet(power_meters, max_workers=4)
+
+    def test_configure_runs_concurrently(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """Power meters should be configured at the same time, each with its own configuration."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def configure_fn(config) -> int:
+            barrier.wait()
+            return 0
+
+        configs = {i: getattr(mock.sentinel, f"config{i}") for i in range(1, 5)}
+        for i in configs:
+            power_meters[i].configure.side_effect = configure_fn
+
+        report = fleet.configure(configs)
+
+        assert report.succeeded
+        assert sorted(report.succeeded_keys) == [1, 2, 3, 4]
+        for i, config in configs.items():
+            power_meters[i].configure.assert_called_once_with(config)
+
+    def test_failures_aggregated(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """All failures should be reported, and a failure should not prevent other power meters from being operated on."""
+        power_meters[VCCBandGroup.B123].deconfigure.return_value = 1
+        power_meters[3].deconfigure.side_effect = RuntimeError("driver error")
+        for i in (1, 2):
+            power_meters[i].deconfigure.return_value = 0
+
+        report = fleet.deconfigure([VCCBandGroup.B123, 1, 2, 3])
+
+        assert not report.succeeded
+        assert set(report.failures) == {VCCBandGroup.B123, 3}
+        assert sorted(report.succeeded_keys) == [1, 2]
+        assert "b123" in report.describe_failures()
+        assert "FS 3" in report.describe_failures()
+        assert "driver error" in report.describe_failures()
+
+    def test_recover_only_requested(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """Only the requested power meters should be recovered."""
+        for power_meter in power_meters.values():
+            power_meter.recover.return_value = 0
+
+        report = fleet.recover([VCCBandGroup.B45A, 7])
+
+        assert report.succeeded
+        power_meters[VCCBandGroup.B45A].recover.assert_called_once()
+        power_meters[7].recover.assert_called_once()
+        power_meters[8].recover.assert_not_called()
+
+    def test_read_powers_concurrently(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """All power meters of a snapshot should be read at the same time by default, regardless of the configuration pool size."""
+        barrier = threading.Barrier(26, timeout=5)
+
+        def status_fn(i: int):
+            barrier.wait()
+            return SimpleNamespace(avg_power_pol_x=i / 100, avg_power_pol_y=i / 50)
+
+        for i in range(1, 27):
+            power_meters[i].status.side_effect = lambda i=i: status_fn(i)
+
+        snapshot = fleet.read_powers(range(1, 27))
+
+        assert snapshot.succeeded
+        assert snapshot.powers.shape == (26, 2)
+        np.testing.assert_allclose(snapshot.powers[:, 0], np.arange(1, 27) / 100)
+        np.testing.assert_allclose(snapshot.powers[:, 1], np.arange(1, 27) / 50)
+        assert snapshot.started_at <= np.min(snapshot.read_at) <= np.max(snapshot.read_at) <= snapshot.completed_at
+        assert not snapshot.powers.flags.writeable
+
+    def test_read_powers_bounded(self, power_meters: dict):
+        """A snapshot should read at most as many power meters at once as there are read workers."""
+        fleet = WidebandPowerMeterFleet(power_meters, max_workers=8, read_workers=4)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def status_fn():
+            with lock:
+                active.append(None)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return SimpleNamespace(avg_power_pol_x=0.4, avg_power_pol_y=0.4)
+
+        for i in range(1, 27):
+            power_meters[i].status.side_effect = status_fn
+
+        snapshot = fleet.read_powers(range(1, 27))
+
+        assert snapshot.succeeded
+        assert max(peak) <= 4
+
+    def test_read_powers_partial_failures(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """Each failed power meter should be reported by FS, with the other readings kept."""
+        release = threading.Event()
+        power_meters[1].status.return_value = SimpleNamespace(avg_power_pol_x=0.4, avg_power_pol_y="bad")
+        power_meters[2].status.return_value = None
+        power_meters[3].status.side_effect = RuntimeError("driver error")
+        power_meters[4].status.side_effect = lambda: release.wait(5)
+
+        try:
+            snapshot = fleet.read_powers(range(1, 5), deadline=0.5, timeout=0.1)
+        finally:
+            release.set()
+
+        assert not snapshot.succeeded
+        assert snapshot.report.succeeded_keys == [1]
+        assert set(snapshot.report.failures) == {2, 3, 4}
+        assert "driver error" in snapshot.report.failures[3]
+        assert "timeout" in snapshot.report.failures[4]
+        assert snapshot.powers[0, 0] == 0.4
+        assert math.isnan(snapshot.powers[0, 1])
+        assert np.isnan(snapshot.powers[1:]).all()
+        assert snapshot.completed_at - snapshot.started_at < 5
+
+    def test_read_powers_deadline(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """A snapshot should return by its deadline, reporting the power meters which had not returned by then."""
+        release = threading.Event()
+        power_meters[1].status.return_value = SimpleNamespace(avg_power_pol_x=0.4, avg_power_pol_y=0.4)
+        power_meters[2].status.side_effect = lambda: release.wait(5)
+
+        try:
+            snapshot = fleet.read_powers(range(1, 3), deadline=0.1, timeout=1.0)
+        finally:
+            release.set()
+
+        assert snapshot.report.succeeded_keys == [1]
+        assert "deadline" in snapshot.report.failures[2]
+        assert snapshot.completed_at - snapshot.started_at < 1.0
+
+    def test_read_powers_stuck_power_meter(self, fleet: WidebandPowerMeterFleet, power_meters: dict):
+        """A power meter whose read never returns should not be read again, nor hold up the other power meters."""
+        release = threading.Event()
+        for i in range(1, 27):
+            power_meters[i].status.return_value = SimpleNamespace(avg_power_pol_x=0.4, avg_power_pol_y=0.4)
+        power_meters[1].status.side_effect = lambda: release.wait(5)
+
+        try:
+            snapshots = [fleet.read_powers(range(1, 27), deadline=0.5, timeout=0.1) for _ in range(3)]
+        finally:
+            release.set()
+
+        assert power_meters[1].status.call_count == 1
+        assert "timeout" in snapshots[0].report.failures[1]
+        assert all(snapshot.report.failures[1] == "previous reading still in progress" for snapshot in snapshots[1:])
+        assert all(snapshot.report.succeeded_keys == list(range(2, 27)) for snapshot in snapshots)
@@ -0,0 +1,90 @@
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+from ska_control_model import HealthState
+
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_meter_health import PowerFlag, PowerMeterHealthMonitor, power_flags
+
+
+def snapshot(keys: list, powers: list) -> SimpleNamespace:
+    """Build a power snapshot."""
+    return SimpleNamespace(keys=tuple(keys), powers=np.array(powers, dtype=np.float64), completed_at=time.time())
+
+
+class TestPowerFlags:
+
+    def test_power_flags(self):
+        """Readings should be flagged as NaN, zero, or below or above the healthy range."""
+        flags = power_flags(np.array([[0.5, np.nan], [0.0, 1e-6], [1.5, 1.0]]), healthy_range=(1e-4, 1.0))
+
+        np.testing.assert_array_equal(
+            flags, [[PowerFlag.OK, PowerFlag.NAN], [PowerFlag.ZERO, PowerFlag.LOW], [PowerFlag.HIGH, PowerFlag.OK]]
+        )
+
+
+class TestPowerMeterHealthMonitor:
+
+    @pytest.fixture(scope="function")
+    def callback(self) -> mock.MagicMock:
+        """Fixture to set up a health state callback."""
+        return mock.MagicMock()
+
+    @pytest.fixture(scope="function")
+    def monitor(self, callback: mock.MagicMock) -> PowerMeterHealthMonitor:
+        """Fixture to set up a health monitor of the B123 meter and two FS meters."""
+        return PowerMeterHealthMonitor([VCCBandGroup.B123, 1, 2], mock.MagicMock(), update_health_state_callback=callback)
+
+    def test_rolls_up_worst_reading(self, monitor: PowerMeterHealthMonitor, callback: mock.MagicMock):
+        """The health state should be that of the least healthy reading, reported when it changes."""
+        assert monitor.update(snapshot([VCCBandGroup.B123, 1, 2], [[0.5, 0.5], [0.2, 0.3], [0.4, 0.4]])) == HealthState.OK
+        callback.assert_not_called()
+
+        assert monitor.update(snapshot([VCCBandGroup.B123, 1, 2], [[0.5, 0.5], [0.2, 1.2], [0.4, 0.4]])) == HealthState.DEGRADED
+        assert monitor.update(snapshot([VCCBandGroup.B123, 1, 2], [[0.5, 0.5], [0.2, 1.2], [0.0, 0.4]])) == HealthState.FAILED
+        assert monitor.flags[2] == (PowerFlag.ZERO, PowerFlag.OK)
+        assert monitor.update(snapshot([VCCBandGroup.B123, 1, 2], [[0.5, 0.5], [0.2, 0.3], [0.4, 0.4]])) == HealthState.OK
+
+        assert [call.args[0] for call in callback.call_args_list] == [HealthState.DEGRADED, HealthState.FAILED, HealthState.OK]
+
+    def test_only_monitored_keys(self, monitor: PowerMeterHealthMonitor):
+        """Power meters which are not monitored, e.g. those of another band group, should not affect the health state."""
+        readings = snapshot([VCCBandGroup.B123, 1, 2], [[0.5, 0.5], [0.2, 0.3], [np.nan, np.nan]])
+
+        assert monitor.update(readings, keys=[VCCBandGroup.B123, 1]) == HealthState.OK
+        assert monitor.update(readings) == HealthState.UNKNOWN
+
+    def test_unreadable_is_unknown(self, monitor: PowerMeterHealthMonitor):
+        """A power meter which could not be read should be of unknown health, rather than failed like one reading no power."""
+        assert monitor.update(snapshot([1, 2], [[np.nan, np.nan], [0.2, 0.3]])) == HealthState.UNKNOWN
+        assert monitor.update(snapshot([1, 2], [[np.nan, np.nan], [0.2, 1.2]])) == HealthState.DEGRADED
+        assert monitor.update(snapshot([1, 2], [[np.nan, np.nan], [0.0, 0.3]])) == HealthState.FAILED
+
+    def test_healthy_range(self):
+        """Readings should be flagged against the configured healthy range."""
+        monitor = PowerMeterHealthMonitor([1], mock.MagicMock(), healthy_range=(0.01, 0.1))
+
+        assert monitor.update(snapshot([1], [[0.05, 0.005]])) == HealthState.DEGRADED
+        assert monitor.flags[1] == (PowerFlag.OK, PowerFlag.LOW)
+
+    def test_logs_transitions_only(self, monitor: PowerMeterHealthMonitor):
+        """A power meter's health state change should be logged once, rather than on every sweep."""
+        logger = monitor._evaluator._logger
+        for _ in range(3):
+            monitor.update(snapshot([1], [[0.0, 0.3]]))
+
+        assert logger.error.call_count == 1
+        assert "FS 1 power meter: polarization X power 0 is ZERO" in logger.error.call_args.args[0]
+
+    def test_reset(self, monitor: PowerMeterHealthMonitor, callback: mock.MagicMock):
+        """A reset should make the power meters healthy, e.g. when they stop being monitored."""
+        monitor.update(snapshot([1], [[np.nan, np.nan]]))
+
+        monitor.reset()
+
+        assert monitor.health_state == HealthState.OK
+        assert monitor.flags == {}
+        assert callback.call_args.args[0] == HealthState.OK
@@ -0,0 +1,129 @@
+import math
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from ska_mid_cbf_fhs_vcc.helpers.frequency_band_enums import VCCBandGroup
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.power_statistics import PowerStatisticsBuffer, PowerStatisticsSampler
+
+
+def snapshot(keys: list, powers: list, age: float = 0.0) -> SimpleNamespace:
+    """Build a power snapshot taken ``age`` seconds ago."""
+    return SimpleNamespace(keys=tuple(keys), powers=np.array(powers, dtype=np.float64), completed_at=time.time() - age)
+
+
+class TestPowerStatisticsBuffer:
+
+    @pytest.fixture(scope="function")
+    def buffer(self) -> PowerStatisticsBuffer:
+        """Fixture to set up a small buffer for the B123 meter and two FS meters."""
+        return PowerStatisticsBuffer([VCCBandGroup.B123, 1, 2], capacity=4)
+
+    def test_statistics(self, buffer: PowerStatisticsBuffer):
+        """Statistics should be computed per power meter and polarization."""
+        for x, y in [(0.1, 0.4), (0.2, 0.5), (0.6, 0.9)]:
+            buffer.append(snapshot([1, 2], [[x, y], [x / 2, y / 2]]))
+
+        statistics = buffer.statistics(percentile_q=50.0)
+
+        np.testing.assert_array_equal(statistics.count, [[0, 0], [3, 3], [3, 3]])
+        np.testing.assert_allclose(statistics.mean[1:], [[0.3, 0.6], [0.15, 0.3]])
+        np.testing.assert_allclose(statistics.median[1:], [[0.2, 0.5], [0.1, 0.25]])
+        np.testing.assert_allclose(statistics.percentile, statistics.median)
+        assert np.isnan(statistics.mean[0]).all()
+
+    def test_missing_readings_ignored(self, buffer: PowerStatisticsBuffer):
+        """Readings which could not be taken should not count towards the statistics."""
+        buffer.append(snapshot([1, 2], [[0.2, 0.2], [np.nan, 0.4]]))
+        buffer.append(snapshot([1, 2], [[0.4, 0.4], [0.8, np.nan]]))
+        buffer.append(snapshot([1], [[0.6, 0.6]]))
+
+        statistics = buffer.statistics()
+
+        np.testing.assert_array_equal(statistics.count[1:], [[3, 3], [1, 1]])
+        np.testing.assert_allclose(statistics.mean[1:], [[0.4, 0.4], [0.8, 0.4]])
+
+    def test_ring_eviction(self, buffer: PowerStatisticsBuffer):
+        """Only the most recent snapshots should be kept once the buffer is full."""
+        for i in range(1, 7):
+            buffer.append(snapshot([1], [[i / 10, i / 10]]))
+
+        statistics = buffer.statistics(window=None)
+
+        assert len(buffer) == 4
+        np.testing.assert_array_equal(statistics.count[1], [4, 4])
+        np.testing.assert_allclose(statistics.mean[1], [0.45, 0.45])
+
+    def test_window(self, buffer: PowerStatisticsBuffer):
+        """Only the snapshots taken within the window should be used."""
+        buffer.append(snapshot([1], [[0.9, 0.9]], age=30.0))
+        buffer.append(snapshot([1], [[0.1, 0.3]], age=1.0))
+
+        np.testing.assert_allclose(buffer.statistics(window=10.0).mean[1], [0.1, 0.3])
+        np.testing.assert_allclose(buffer.statistics(window=None).mean[1], [0.5, 0.6])
+        np.testing.assert_array_equal(buffer.statistics(window=0.5).count[1], [0, 0])
+
+    def test_select_and_spectrum(self, buffer: PowerStatisticsBuffer):
+        """Selected statistics should follow the requested order, and flatten per power meter."""
+        buffer.append(snapshot([VCCBandGroup.B123, 1, 2], [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]))
+
+        statistics = buffer.statistics().select([2, 1])
+
+        assert statistics.keys == (2, 1)
+        np.testing.assert_allclose(statistics.statistic("median"), [[0.5, 0.6], [0.3, 0.4]])
+        np.testing.assert_allclose(statistics.to_spectrum(), [0.5, 0.6] * 3 + [0.3, 0.4] * 3)
+        with pytest.raises(ValueError):
+            statistics.statistic("max")
+
+    def test_clear(self, buffer: PowerStatisticsBuffer):
+        """Clearing should drop every sample."""
+        buffer.append(snapshot([1], [[0.1, 0.1]]))
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert all(math.isnan(value) for value in buffer.statistics().to_spectrum())
+
+
+class TestPowerStatisticsSampler:
+
+    def test_sample(self):
+        """Each sample should read the current power meters within the sampling period, and keep the readings."""
+        buffer = PowerStatisticsBuffer([1, 2, 3])
+        fleet = mock.MagicMock()
+        fleet.read_powers.return_value = snapshot([1, 2], [[0.1, 0.2], [0.3, 0.4]])
+        sampler = PowerStatisticsSampler(fleet, buffer, keys=lambda: [1, 2], should_run=lambda: True, logger=mock.MagicMock(), period=0.5)
+
+        sampler.sample()
+
+        fleet.read_powers.assert_called_once_with([1, 2], deadline=0.5)
+        np.testing.assert_allclose(buffer.statistics().mean[:2], [[0.1, 0.2], [0.3, 0.4]])
+
+    def test_on_sample(self):
+        """Each sample should be passed on, e.g. to evaluate the health of the power meters from the same readings."""
+        fleet = mock.MagicMock()
+        fleet.read_powers.return_value = snapshot([1], [[0.1, 0.2]])
+        on_sample = mock.MagicMock()
+        sampler = PowerStatisticsSampler(
+            fleet, PowerStatisticsBuffer([1]), keys=lambda: [1], should_run=lambda: True, logger=mock.MagicMock(), on_sample=on_sample
+        )
+
+        sampler.sample()
+
+        on_sample.assert_called_once_with(fleet.read_powers.return_value)
+
+    def test_only_samples_while_allowed(self):
+        """The sampler should not read the power meters while it should not run, and should stop promptly."""
+        fleet = mock.MagicMock()
+        sampler = PowerStatisticsSampler(
+            fleet, PowerStatisticsBuffer([1]), keys=lambda: [1], should_run=lambda: False, logger=mock.MagicMock(), period=0.01
+        )
+
+        sampler.start()
+        time.sleep(0.1)
+        sampler.stop()
+
+        assert not sampler.running
+        fleet.read_powers.assert_not_called()
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.configure_graph import ConfigureGraphExecutor, ConfigureStep
+from ska_mid_cbf_fhs_vcc.vcc_all_bands.utils.stage_latency import StageLatencyRecorder
+
+
+class TestStageLatencyRecorder:
+
+    def test_ring_buffer_bounded(self):
+        """Only the most recent samples should be kept."""
+        recorder = StageLatencyRecorder(max_samples=3)
+        for i in range(5):
+            recorder.record("Scan", "total", float(i), f"txn-{i}")
+
+        assert [sample.transaction_id for sample in recorder.samples()] == ["txn-2", "txn-3", "txn-4"]
+
+    def test_summary(self):
+        """The summary should give the percentiles, max and slowest transaction ID of each command stage."""
+        recorder = StageLatencyRecorder()
+        for i in range(1, 101):
+            recorder.record("ConfigureScan", "validation", i / 1000, f"txn-{i}")
+        recorder.record("EndScan", "total", 0.5)
+
+        summary = recorder.summary()
+        validation = summary["ConfigureScan"]["validation"]
+
+        assert validation["count"] == 100
+        assert validation["p50_ms"] == pytest.approx(50.5)
+        assert validation["p95_ms"] == pytest.approx(95.05)
+        assert validation["max_ms"] == pytest.approx(100.0)
+        assert validation["max_transaction_id"] == "txn-100"
+        assert summary["EndScan"]["total"]["count"] == 1
+        assert json.loads(json.dumps(recorder.dump()))[-1]["command"] == "EndScan"
+
+    def test_measure_records_on_error(self):
+        """A measured stage should be recorded even if it raises."""
+        recorder = StageLatencyRecorder()
+        with pytest.raises(RuntimeError):
+            with recorder.measure("ObsReset", "stop_ip_blocks", "txn-1"):
+                raise RuntimeError("stop failed")
+
+        (sample,) = recorder.samples()
+        assert (sample.command, sample.stage, sample.transaction_id) == ("ObsReset", "stop_ip_blocks", "txn-1")
+        assert sample.duration >= 0
+
+    def test_record_report(self):
+        """Every step run in a configuration graph should be recorded as a stage."""
+        recorder = StageLatencyRecorder()
+        steps = [
+            ConfigureStep(name="a", description="A", run=lambda: 0),
+            ConfigureStep(name="b", description="B", run=lambda: 0, depends_on=("a",)),
+        ]
+        report = ConfigureGraphExecutor(max_workers=2).run(steps)
+        recorder.record_report("ConfigureScan", report, "txn-1", prefix="rollback:")
+
+        assert {sample.stage for sample in recorder.samples()} == {"rollback:a", "rollback:b"}
+        recorder.clear()
+        assert recorder.samples() == []
@@ -1,13 +1,23 @@
+from unittest import mock
+
+import numpy as np
 import pytest
+from ska_mid_cbf_fhs_common import BaseIPBlockManager
 
-from ska_mid_cbf_fhs_vcc.vcc_stream_merge.vcc_stream_merge_manager import VCCStreamMergeConfigureArgin, VCCStreamMergeManager
+from ska_mid_cbf_fhs_vcc.vcc_stream_merge.vcc_stream_merge_manager import (
+    LANE_TABLE_DTYPE,
+    VCCStreamMergeConfig,
+    VCCStreamMergeConfigureArgin,
+    VCCStreamMergeLaneTableConfig,
+    VCCStreamMergeManager,
+)
 
 
 class TestVCCStreamMerge:
 
     @pytest.fixture(scope="function")
     def vcc_stream_merge(self):
-        """Fixture to set up the VCC Stream Merge block."""
+        """Fixture to set up the VCC Stream Merge block, with bulk lane writes."""
         manager = VCCStreamMergeManager(
             ip_block_id="VCCStreamMerge",
             controlling_device_name="n/a",
@@ -15,6 +25,7 @@ class TestVCCStreamMerge:
             bitstream_id="n/a",
             bitstream_version="n/a",
             firmware_ip_block_id="n/a",
+            bulk_lane_writes="true",
             create_log_file=False,
         )
         yield manager
@@ -52,3 +63,64 @@ class TestVCCStreamMerge:
         """Test the recover method of the VCC Stream Merge block."""
         result = vcc_stream_merge.recover()
         assert result == 0, f"Expected return code 0, got {result}"
+
+    def test_configure_lane_table_single_write(self, vcc_stream_merge: VCCStreamMergeManager):
+        """Test that a full lane table is programmed with a single driver write."""
+        lane_table = np.array([(2, 1, fs_id) for fs_id in range(1, 14)], dtype=LANE_TABLE_DTYPE)
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, return_value=0) as configure_mock:
+            result = vcc_stream_merge.configure_lane_table(lane_table)
+
+        assert result == 0, f"Expected return code 0, got {result}"
+        assert configure_mock.call_count == 1
+        config = configure_mock.call_args.args[1]
+        assert isinstance(config, VCCStreamMergeLaneTableConfig)
+        assert config.fs_id == list(range(1, 14))
+
+    def test_configure_lane_table_per_lane_by_default(self):
+        """Test that lanes are written one at a time unless bulk lane writes are declared supported."""
+        manager = VCCStreamMergeManager(
+            ip_block_id="VCCStreamMerge",
+            controlling_device_name="n/a",
+            bitstream_path="n/a",
+            bitstream_id="n/a",
+            bitstream_version="n/a",
+            firmware_ip_block_id="n/a",
+            create_log_file=False,
+        )
+        assert not manager.bulk_lanes_supported
+
+        lane_table = np.array([(2, 1, fs_id) for fs_id in range(1, 14)], dtype=LANE_TABLE_DTYPE)
+        with mock.patch.object(BaseIPBlockManager, "configure", autospec=True, return_value=0) as configure_mock:
+            assert manager.configure_lane_table(lane_table) == 0
+
+        configs = [call.args[1] for call in configure_mock.call_args_list]
+        assert all(isinstance(config, VCCStreamMergeConfig) for config in configs)
+        assert [config.fs_id for config in configs] == list(range(1, 14))
+
+    def test_configure_lane_table_writes_only_changed_lanes(self, vcc_stream_merge: VCCStreamMergeManager):
+        """Test that reprogramming a lane table only rewrites changed lanes and deconfigures removed ones."""
+        lane_table = np.array([(2, 1, fs_id) for fs_id in range(1, 14)], dtype=LANE_TABLE_DTYPE)
+        vcc_stream_merge.configure_lane_table(lane_table)
+
+        new_lane_table = lane_table[:-1].copy()
+        new_lane_table[0]["vid"] = 3
+        with (
+            mock.patch.object(BaseIPBlockManager, "configure", autospec=True, return_value=0) as configure_mock,
+            mock.patch.object(BaseIPBlockManager, "deconfigure", autospec=True, return_value=0) as deconfigure_mock,
+        ):
+            result = vcc_stream_merge.configure_lane_table(new_lane_table)
+            assert result == 0, f"Expected return code 0, got {result}"
+
+            config = configure_mock.call_args.args[1]
+            assert configure_mock.call_count == 1
+            assert (config.vid, config.fs_id) == ([3], [1])
+
+            removed_config = deconfigure_mock.call_args.args[1]
+            assert deconfigure_mock.call_count == 1
+            assert isinstance(removed_config, VCCStreamMergeConfig)
+            assert removed_config.fs_id == 13
+
+            configure_mock.reset_mock()
+            result = vcc_stream_merge.configure_lane_table(new_lane_table)
+            assert result == 0, f"Expected return code 0, got {result}"
+            assert configure_mock.call_count == 0
@@ -1,8 +1,14 @@
 import time
+from unittest import mock
+
 import pytest
 from ska_control_model import HealthState
 
-from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_manager import WidebandInputBufferConfig, WidebandInputBufferManager
+from ska_mid_cbf_fhs_vcc.wideband_input_buffer.wideband_input_buffer_manager import (
+    WidebandInputBufferConfig,
+    WidebandInputBufferManager,
+    WidebandInputBufferStatus,
+)
 
 class TestWidebandInputBuffer:
 
@@ -83,3 +89,36 @@ class TestWidebandInputBuffer:
         wideband_input_buffer.stop().await_result()
 
         assert health_state.value is HealthState.FAILED.value
+
+    def test_status_decoder(self, wideband_input_buffer: WidebandInputBufferManager):
+        """The compiled status decoder should decode the same status as the dataclasses-json reflection decoder."""
+        with mock.patch.object(WidebandInputBufferStatus, "_compiled_decoder", None, create=True):
+            reflection_status = wideband_input_buffer.status(clear=False)
+
+        assert wideband_input_buffer.status(clear=False) == reflection_status
+        assert WidebandInputBufferStatus._compiled_decoder is not None
+
+    @pytest.mark.parametrize(
+        "properties, min_interval, max_interval",
+        [
+            ({"health_monitor_poll_interval": "3"}, 3.0, 15.0),
+            ({"health_monitor_poll_interval": "60"}, 60.0, 60.0),
+            ({"health_monitor_poll_interval": "3", "health_monitor_min_poll_interval": "1", "health_monitor_max_poll_interval": "30"}, 1.0, 30.0),
+        ],
+    )
+    def test_poll_interval_properties(self, properties: dict, min_interval: float, max_interval: float):
+        """The adaptive poll interval should default to the bounds derived from the fixed health monitor poll interval."""
+        manager = WidebandInputBufferManager(
+            ip_block_id="WidebandInputBuffer",
+            controlling_device_name="n/a",
+            bitstream_path="n/a",
+            bitstream_id="n/a",
+            bitstream_version="n/a",
+            firmware_ip_block_id="n/a",
+            update_health_state_callback=lambda *_: None,
+            create_log_file=False,
+            **properties,
+        )
+
+        poll_interval = manager.scheduled_health_monitor.poll_interval
+        assert (poll_interval.min_interval, poll_interval.max_interval) == (min_interval, max_interval)